@@ -6,6 +6,7 @@
 #           Jan 2018, SUAVE Team
 #           May 2019, T. MacDonald
 #           Mar 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -18,6 +19,14 @@ matplotlib.use('Agg')
 import SUAVE
 from SUAVE.Core.DataOrdered import DataOrdered
 import sys, os, traceback, time
+import argparse, io, json, multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import redirect_stdout, redirect_stderr
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 
 # ----------------------------------------------------------------------
@@ -29,6 +38,12 @@ import sys, os, traceback, time
 # this automatic regression script.
 #
 # For more information, see ../templates/example_test_script.py
+#
+# With --workers greater than one, the scripts are run in parallel, each in
+# a fresh process, and the peak memory of every script is measured. The
+# runtime and peak memory are appended to a JSON history and compared to a
+# stored baseline, scripts slower than the baseline by more than the
+# tolerance are flagged. Run with --help for all options.
 
 # ----------------------------------------------------------------------
 #   The Modules to Test
@@ -40,10 +55,13 @@ modules = [
     'scripts/aerodynamics/aerodynamics.py',
     'scripts/aerodynamics/all_moving_surfaces_vlm.py',
     'scripts/aerodynamics/control_surfaces_vlm.py',
+    'scripts/aerodynamics/linearized_control_surfaces_vlm.py',
+    'scripts/aerodynamics/equivalent_area_wave_drag.py',
     'scripts/aerodynamics/sears_haack.py',
     'scripts/aerodynamics/sideslip_and_rotation_vlm.py',
     'scripts/airfoil_import/airfoil_import_test.py',
     'scripts/airfoil_import/airfoil_interpolation_test.py',
+    'scripts/airfoil_import/airfoil_cache_test.py',
     'scripts/airfoil_analysis/airfoil_panel_method_test.py', 
     'scripts/atmosphere/atmosphere.py',
     'scripts/atmosphere/constant_temperature.py',
@@ -54,10 +72,12 @@ modules = [
     'scripts/cmalpha/cmalpha.py',
     'scripts/cnbeta/cnbeta.py',
     'scripts/concorde/concorde.py',
+    'scripts/configs/config_copy_test.py',
     'scripts/ducted_fan/ducted_fan_network.py',
     'scripts/ducted_fan/battery_ducted_fan_network.py',
     'scripts/ducted_fan/serial_hybrid_ducted_fan_network.py',
     'scripts/dynamic_stability/dynamicstability.py',
+    'scripts/dynamic_stability/dynamic_flight_modes.py',
     'scripts/electric_performance/propeller_single_point.py',
     'scripts/electric_performance/electric_V_h_diagram.py',
     'scripts/electric_performance/electric_payload_range.py',
@@ -81,10 +101,12 @@ modules = [
     'scripts/noise_fidelity_zero/DC_10_noise.py', 
     'scripts/noise_fidelity_one/propeller_noise.py',
     'scripts/noise_fidelity_one/aircraft_noise.py',
+    'scripts/noise_fidelity_one/noise_tone_correction_test.py',
     'scripts/nonuniform_propeller_inflow/nonuniform_propeller_inflow.py',
     'scripts/optimization_packages/optimization_packages.py',
     'scripts/payload_range/payload_range.py',
     'scripts/plots/plot_test.py',
+    'scripts/process/process_profile_test.py',
     'scripts/propeller/propeller_test.py',
     'scripts/propeller_speeds/range_endurance_speeds.py',
     'scripts/propulsion_surrogate/propulsion_surrogate.py',
@@ -95,6 +117,9 @@ modules = [
     'scripts/rocket_network/Rocketdyne_J2.py',
     'scripts/segments/segment_test.py',
     'scripts/segments/transition_segment_test.py',
+    'scripts/segments/time_marching_segment_test.py',
+    'scripts/segments/adaptive_control_points_test.py',
+    'scripts/segments/segment_store_test.py',
     'scripts/slipstream/slipstream_test.py',
     'scripts/slipstream/propeller_interactions.py',
     'scripts/solar_network/solar_network.py',
@@ -104,6 +129,7 @@ modules = [
     'scripts/sweeps/test_sweeps.py',
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',
+    'scripts/test_input_output/test_vtk_write.py',
     'scripts/turboelectric_HTS_ducted_fan_network/turboelectric_HTS_ducted_fan_network.py',
     'scripts/turboelectric_HTS_dynamo_ducted_fan_network/turboelectric_HTS_dynamo_ducted_fan_network.py',
     'scripts/variable_cruise_distance/variable_cruise_distance.py',
@@ -121,8 +147,12 @@ modules = [
 
 def main():
 
+    # command line options
+    options = parse_options()
+
     # preallocate test results
     results = DataOrdered()
+    timings = DataOrdered()
     for module in modules:
         results[module] = 'Untested'
 
@@ -134,26 +164,149 @@ def main():
 
     # run tests
     all_pass = True
-    for module in modules:
-        passed = test_module(module)
-        if passed:
+    if options.workers > 1:
+        # one BLAS thread per worker, the scripts themselves run in parallel
+        for variable in ['OMP_NUM_THREADS','OPENBLAS_NUM_THREADS','MKL_NUM_THREADS']:
+            os.environ.setdefault(variable,'1')
+        pool     = ThreadPoolExecutor(max_workers=options.workers)
+        futures  = [pool.submit(run_isolated_module,module) for module in modules]
+        outcomes = (future.result() for future in as_completed(futures))
+    else:
+        pool     = None
+        outcomes = (run_module(module,isolated=False) for module in modules)
+
+    for outcome in outcomes:
+        module = outcome['module']
+        sys.stdout.write(outcome['output'])
+        sys.stdout.flush()
+        timings[module] = outcome
+        if outcome['passed']:
             results[module] = '  Passed'
         else:
             results[module] = '* FAILED'
             all_pass = False
 
+    if pool is not None:
+        pool.shutdown()
+
+    # compare to the baseline
+    baseline = load_json(options.baseline,{})
+    slower   = check_performance(timings,baseline,options.tolerance)
+
     # final report
     sys.stdout.write('# --------------------------------------------------------------------- \n')
     sys.stdout.write('Final Results \n')
     for module,result in list(results.items()):
-        sys.stdout.write('%s - %s\n' % (result,module))
-
-    if all_pass:
+        timing = timings[module]
+        line   = '%s - %s (%.1f s' % (result,module,timing['time'])
+        if timing['peak_memory'] is not None:
+            line += ', %.0f MB' % timing['peak_memory']
+        line += ')'
+        if module in slower:
+            line += ' * SLOWER: ' + slower[module]
+        sys.stdout.write(line + '\n')
+
+    # record the timings
+    record_history(options.history,timings,options.workers)
+    if options.update_baseline:
+        for module,timing in list(timings.items()):
+            if timing['passed']:
+                baseline[module] = { 'time'        : timing['time'],
+                                     'peak_memory' : timing['peak_memory'] }
+        save_json(options.baseline,baseline)
+
+    if slower:
+        sys.stdout.write('%i scripts are slower than the baseline \n' % len(slower))
+
+    if all_pass and not (slower and options.fail_on_slow):
         sys.exit(0)
     else:
         sys.exit(1)
 
 
+# ----------------------------------------------------------------------
+#   Options
+# ----------------------------------------------------------------------
+
+def parse_options():
+
+    regression_dir = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description='Runs the SUAVE regression scripts.')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='number of scripts run in parallel, each in its own process. With one worker '
+                        'the scripts are run in this process and the peak memory is not measured')
+    parser.add_argument('--history', default=os.path.join(regression_dir,'regression_history.json'),
+                        help='JSON file the runtime and peak memory of every run are appended to')
+    parser.add_argument('--baseline', default=os.path.join(regression_dir,'regression_baseline.json'),
+                        help='JSON file with the baseline runtime and peak memory of each script')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='relative increase over the baseline that is flagged as a performance regression')
+    parser.add_argument('--update_baseline', action='store_true',
+                        help='store the results of the passing scripts as the new baseline')
+    parser.add_argument('--fail_on_slow', action='store_true',
+                        help='fail if a script is flagged as slower than the baseline')
+
+    # other arguments are left to the test runner
+    options, unknown = parser.parse_known_args()
+
+    return options
+
+# ----------------------------------------------------------------------
+#   Module Runner
+# ----------------------------------------------------------------------
+
+def run_isolated_module(module_path):
+
+    # each script runs in a fresh spawned process that is not a daemon, so the
+    # scripts can start worker processes of their own
+    context = multiprocessing.get_context('spawn')
+    tic     = time.time()
+    try:
+        with ProcessPoolExecutor(max_workers=1,mp_context=context) as executor:
+            return executor.submit(run_module,module_path).result()
+    except Exception:
+        # the worker process died, e.g. it ran out of memory
+        return { 'module'      : module_path,
+                 'passed'      : False,
+                 'time'        : time.time() - tic,
+                 'peak_memory' : None,
+                 'output'      : '# FAILED: %s \n%s\n' % (module_path,traceback.format_exc()) }
+
+def run_module(module_path,isolated=True):
+
+    # isolated scripts run in their own process, the output is returned with the results
+    output = io.StringIO()
+    tic    = time.time()
+
+    if isolated:
+        with redirect_stdout(output), redirect_stderr(output):
+            passed = test_module(module_path)
+        peak_memory = process_peak_memory()
+    else:
+        passed      = test_module(module_path)
+        peak_memory = None
+
+    outcome = { 'module'      : module_path,
+                'passed'      : passed,
+                'time'        : time.time() - tic,
+                'peak_memory' : peak_memory,
+                'output'      : output.getvalue() }
+
+    return outcome
+
+def process_peak_memory():
+
+    # peak resident memory of this process in MB, not available on all platforms
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak / 2.**20
+    else:
+        return peak / 2.**10
+
 # ----------------------------------------------------------------------
 #   Module Tester
 # ----------------------------------------------------------------------
@@ -218,6 +371,58 @@ def test_module(module_path):
 
     return passed
 
+# ----------------------------------------------------------------------
+#   Performance Records
+# ----------------------------------------------------------------------
+
+def check_performance(timings,baseline,tolerance):
+
+    # flag the passing scripts that take longer or use more memory than the baseline
+    slower = {}
+    for module,timing in list(timings.items()):
+        if not timing['passed'] or module not in baseline:
+            continue
+        reference = baseline[module]
+        flags     = []
+        if timing['time'] > reference['time'] * (1. + tolerance):
+            flags.append('%.1f s, baseline %.1f s' % (timing['time'],reference['time']))
+        if timing['peak_memory'] is not None and reference.get('peak_memory') is not None \
+           and timing['peak_memory'] > reference['peak_memory'] * (1. + tolerance):
+            flags.append('%.0f MB, baseline %.0f MB' % (timing['peak_memory'],reference['peak_memory']))
+        if flags:
+            slower[module] = ', '.join(flags)
+
+    return slower
+
+def record_history(path,timings,workers):
+
+    history = load_json(path,[])
+    run     = { 'date'    : time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()),
+                'workers' : workers,
+                'results' : {} }
+    for module,timing in list(timings.items()):
+        run['results'][module] = { 'passed'      : timing['passed'],
+                                   'time'        : timing['time'],
+                                   'peak_memory' : timing['peak_memory'] }
+    history.append(run)
+    save_json(path,history)
+
+    return
+
+def load_json(path,default):
+
+    if not os.path.isfile(path):
+        return default
+    with open(path) as json_file:
+        return json.load(json_file)
+
+def save_json(path,data):
+
+    with open(path,'w') as json_file:
+        json.dump(data,json_file,indent=2)
+
+    return
+
 # ----------------------------------------------------------------------
 #   Call Main
 # ----------------------------------------------------------------------
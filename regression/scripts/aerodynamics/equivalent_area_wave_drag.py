@@ -0,0 +1,121 @@
+# equivalent_area_wave_drag.py
+# 
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Attributes.Gases.Air import Air
+from SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag import wave_drag_volume_equivalent_area
+
+import numpy as np
+import sys
+
+sys.path.append('../Vehicles')
+from Concorde import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    # a slender Sears-Haack body has the closed form wave drag D/q = 9 pi S_max^2/(2 l^2)
+    # at all Mach numbers, as long as beta*d/l stays small (0.09 at Mach 2 for a fineness ratio of 20)
+    length   = 10.
+    radius   = 0.25
+    vehicle  = sears_haack_body(length,radius)
+    mach     = np.array([[0.9],[1.2],[2.0]])
+    CD_wave  = wave_drag_volume_equivalent_area(vehicle,mach,1.)
+    S_max    = np.pi*radius**2
+    CD_ideal = 9.*np.pi*S_max**2/(2.*length**2)/vehicle.reference_area
+    print('Sears-Haack wave drag:',CD_wave.flatten(),'ideal:',CD_ideal)
+    
+    # sonic area distribution at Mach 0.9, Mach plane cuts at Mach 1.2 and 2.0, within 2 percent
+    err = (CD_wave - CD_ideal)/CD_ideal
+    print('Sears-Haack wave drag error:',err.flatten())
+    assert np.shape(CD_wave) == np.shape(mach)
+    assert np.all(np.abs(err) < 2e-2)
+    
+    # full vehicle with the Supersonic_Zero analysis
+    vehicle = vehicle_setup()
+    
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Supersonic_Zero()      
+    aerodynamics.geometry = vehicle
+    aerodynamics.settings.drag_coefficient_increment = 0.0000
+    aerodynamics.settings.span_efficiency            = 0.95
+    aerodynamics.settings.wave_drag_type             = 'Equivalent_Area'
+    aerodynamics.settings.volume_wave_drag_scaling   = 1.
+    aerodynamics.initialize()    
+    
+    test_num         = 3
+    state            = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(test_num)    
+    
+    Mc       = np.array([[1.03],[1.5],[2.0]])
+    rho      = 0.16*np.ones_like(Mc)
+    mu       = 1.42e-05*np.ones_like(Mc)
+    T        = 217.*np.ones_like(Mc)
+    pressure = 10000.*np.ones_like(Mc)
+    a        = Air().compute_speed_of_sound(T,pressure)
+    
+    state.conditions.freestream.mach_number       = Mc
+    state.conditions.freestream.density           = rho
+    state.conditions.freestream.dynamic_viscosity = mu
+    state.conditions.freestream.temperature       = T
+    state.conditions.freestream.pressure          = pressure
+    state.conditions.freestream.reynolds_number   = rho*a*Mc/mu
+    state.conditions.aerodynamics.angle_of_attack = np.array([[0.],[1.],[2.]])*Units.deg
+    
+    results = aerodynamics.evaluate(state)
+    
+    CD_volume = state.conditions.aerodynamics.drag_breakdown.compressible.total_volume
+    CD        = results.drag.total
+    print('Volume wave drag:',CD_volume.flatten())
+    print('Total drag:',CD.flatten())
+    
+    # truth values
+    CD_volume_truth = np.array([[0.014765124031],[0.005668252676],[0.005137668378]])
+    CD_truth        = np.array([[0.023409997308],[0.013268459754],[0.013603185154]])
+    
+    err = np.max(np.abs(CD_volume - CD_volume_truth)/CD_volume_truth)
+    print('Volume wave drag error:',err)
+    assert err < 1e-6
+    err = np.max(np.abs(CD - CD_truth)/CD_truth)
+    print('Total drag error:',err)
+    assert err < 1e-6
+    
+    return
+
+def sears_haack_body(length,radius):
+    """Builds a vehicle with a single Sears-Haack fuselage"""
+    
+    vehicle                = SUAVE.Vehicle()
+    vehicle.reference_area = 1.
+    
+    fuselage               = SUAVE.Components.Fuselages.Fuselage()
+    fuselage.lengths.total = length
+    
+    x = np.linspace(0.,1.,101)
+    r = radius*(4.*x*(1.-x))**0.75
+    for i in range(len(x)):
+        segment                    = SUAVE.Components.Lofted_Body_Segment.Segment()
+        segment.tag                = 'segment_' + str(i)
+        segment.percent_x_location = x[i]
+        segment.percent_y_location = 0.
+        segment.percent_z_location = 0.
+        segment.width              = 2.*r[i]
+        segment.height             = 2.*r[i]
+        fuselage.Segments.append(segment)
+    
+    vehicle.append_component(fuselage)
+    
+    return vehicle
+
+if __name__ == '__main__':
+
+    main()
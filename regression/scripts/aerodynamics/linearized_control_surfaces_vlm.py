@@ -0,0 +1,138 @@
+# linearized_control_surfaces_vlm.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# 
+# File to test the linearized control surface deflections in VLM against the deflected panels
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+import time
+import numpy as np 
+
+import SUAVE
+from SUAVE.Core                                                     import Data, Units
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift           import VLM as VLM
+
+sys.path.append('../Vehicles')
+
+from Boeing_737           import vehicle_setup   as b737_setup
+from control_surfaces_vlm import get_settings
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    
+    # small deflections of every control surface
+    deflections = np.array([-2., -1., 0., 1., 2.]) *Units.degrees
+    
+    # deflect the panels, one VLM call per deflection
+    ti = time.time()
+    deflected      = Data()
+    deflected.CL   = np.array([])
+    deflected.CDi  = np.array([])
+    deflected.CM   = np.array([])
+    settings       = get_settings()
+    for deflection in deflections:
+        geometry   = get_deflected_b737(deflection)
+        data       = VLM(get_conditions(1), settings, geometry)
+        deflected.CL  = np.append(deflected.CL , data.CL.flatten() )
+        deflected.CDi = np.append(deflected.CDi, data.CDi.flatten())
+        deflected.CM  = np.append(deflected.CM , data.CM.flatten() )
+    tf = time.time()
+    
+    # deflect the panel normals, one VLM call with a deflection per control point
+    settings.linearized_control_surfaces = True
+    conditions = get_conditions(len(deflections))
+    conditions.aerodynamics.control_surface_deflections = get_control_surface_deflections(deflections)
+    data       = VLM(conditions, settings, get_deflected_b737(0.))
+    tl = time.time()
+    
+    linearized     = Data()
+    linearized.CL  = data.CL.flatten()
+    linearized.CDi = data.CDi.flatten()
+    linearized.CM  = data.CM.flatten()
+    
+    print('Deflected panels time    : ' + str(tf - ti))
+    print('Linearized normals time  : ' + str(tl - tf))
+    
+    # the linearized deflections match the deflected panels at small angles
+    for key in deflected.keys():
+        print('deflected.{}:'.format(key))
+        print(deflected[key])
+        print('linearized.{}:'.format(key))
+        print(linearized[key])
+        print('           ')
+    
+    assert np.max(np.abs(linearized.CL /deflected.CL  - 1.)) < 1e-2
+    assert np.max(np.abs(linearized.CDi/deflected.CDi - 1.)) < 1e-2
+    assert np.max(np.abs(linearized.CM - deflected.CM)) < 2e-3
+    
+    # without a deflection the baseline is unchanged
+    assert np.abs(linearized.CL[2]/deflected.CL[2] - 1.) < 1e-6
+    
+    # Truth values
+    CL_truth  = np.array([0.39391914240320114, 0.40465804800611427, 0.4153335376352637, 0.42594187451889143, 0.436479404195426])
+    CDi_truth = np.array([0.011179799985783554, 0.011001034574416734, 0.011251428336744338, 0.011931883789426435, 0.013041996454947418])
+    CM_truth  = np.array([-0.3884509171755404, -0.3472652157614328, -0.305913859436754, -0.2644086867028566, -0.22276183338366362])
+    
+    error     = Data()
+    error.CL  = np.max(np.abs(linearized.CL  - CL_truth )/CL_truth )
+    error.CDi = np.max(np.abs(linearized.CDi - CDi_truth)/CDi_truth)
+    error.CM  = np.max(np.abs(linearized.CM  - CM_truth )/np.abs(CM_truth) )
+    
+    print('Errors:')
+    print(error)
+    
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+    
+    return
+
+# ----------------------------------------------------------------------
+#   Setup Functions
+# ----------------------------------------------------------------------
+def get_deflected_b737(deflection):  
+    vehicle = b737_setup()
+    vehicle.wings['main_wing'            ].control_surfaces['slat'    ].deflection = deflection 
+    vehicle.wings['main_wing'            ].control_surfaces['flap'    ].deflection = deflection 
+    vehicle.wings['main_wing'            ].control_surfaces['aileron' ].deflection = deflection  
+    vehicle.wings['horizontal_stabilizer'].control_surfaces['elevator'].deflection = -deflection  
+ 
+    return vehicle
+
+def get_control_surface_deflections(deflections):
+    deflections = np.atleast_2d(deflections).T
+    
+    control_surface_deflections          = Data()
+    control_surface_deflections.slat     = deflections
+    control_surface_deflections.flap     = deflections
+    control_surface_deflections.aileron  = deflections
+    control_surface_deflections.elevator = -deflections
+    
+    return control_surface_deflections
+
+def get_conditions(n_points):
+    machs      = 0.4 *np.ones(n_points)
+    altitudes  = 5000. *np.ones(n_points) *Units.ft
+    aoas       = 2. *np.ones(n_points) *Units.degrees   
+    
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    atmosphere                              = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    speeds_of_sound                         = atmosphere.compute_values(altitudes).speed_of_sound
+    v_infs                                  = machs * speeds_of_sound.flatten()
+    conditions.freestream.velocity          = np.atleast_2d(v_infs).T
+    conditions.freestream.mach_number       = np.atleast_2d(machs).T   
+    conditions.aerodynamics.angle_of_attack = np.atleast_2d(aoas).T
+    
+    return conditions
+
+# ----------------------------------------------------------------------        
+#   Call Main
+# ----------------------------------------------------------------------    
+if __name__ == '__main__':
+    main()
+    print('linearized_control_surfaces_vlm regression test passed!')
@@ -0,0 +1,109 @@
+# airfoil_cache_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression for the on-disk cache of imported airfoil geometries and computed airfoil properties"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil import import_airfoil_geometry, compute_airfoil_properties
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.airfoil_cache import airfoil_cache_settings
+
+import numpy as np
+import tempfile
+import shutil
+import time
+import os
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    separator              = os.path.sep
+    rel_path               = os.path.dirname(os.path.abspath(__file__)) + separator + '..' + separator + 'Vehicles' + separator + 'Airfoils' + separator
+    airfoil_geometry_file  = rel_path + 'NACA_4412.txt'
+    airfoil_polar_files    = [rel_path + 'Polars' + separator + 'NACA_4412_polar_Re_50000.txt',
+                              rel_path + 'Polars' + separator + 'NACA_4412_polar_Re_100000.txt',
+                              rel_path + 'Polars' + separator + 'NACA_4412_polar_Re_200000.txt',
+                              rel_path + 'Polars' + separator + 'NACA_4412_polar_Re_500000.txt',
+                              rel_path + 'Polars' + separator + 'NACA_4412_polar_Re_1000000.txt']
+
+    # the cache is disabled by default
+    default_directory                      = airfoil_cache_settings.cache_directory
+    assert default_directory is None
+    
+    # use an empty cache of this test so that the first calls compute the results
+    cache_directory                        = tempfile.mkdtemp()
+    airfoil_cache_settings.cache_directory = cache_directory
+
+    try:
+        # cold start
+        ti            = time.time()
+        cold_geometry = import_airfoil_geometry(airfoil_geometry_file)
+        cold_data     = compute_airfoil_properties(cold_geometry,airfoil_polar_files)
+        cold_time     = time.time() - ti
+        assert len(os.listdir(cache_directory)) == 2
+
+        # warm start, the results are reloaded from the cache
+        ti            = time.time()
+        warm_geometry = import_airfoil_geometry(airfoil_geometry_file)
+        warm_data     = compute_airfoil_properties(warm_geometry,airfoil_polar_files)
+        warm_time     = time.time() - ti
+        print('cold start time : ' + str(cold_time))
+        print('warm start time : ' + str(warm_time))
+        assert len(os.listdir(cache_directory)) == 2
+        assert warm_time < 0.2*cold_time
+
+        # the reloaded results are identical to the computed ones
+        compare_data(cold_geometry,warm_geometry)
+        compare_data(cold_data,warm_data)
+
+        # a copy of the geometry file is found under its contents
+        copy_file = os.path.join(cache_directory,'NACA_4412_copy.txt')
+        shutil.copyfile(airfoil_geometry_file,copy_file)
+        compare_data(cold_geometry,import_airfoil_geometry(copy_file))
+        assert len([f for f in os.listdir(cache_directory) if f.endswith('.npz')]) == 2
+
+        # a different number of points or set of polars is a new entry
+        fine_geometry = import_airfoil_geometry(airfoil_geometry_file,npoints = 300)
+        assert len(fine_geometry.x_coordinates) == 300
+        fewer_data    = compute_airfoil_properties(warm_geometry,airfoil_polar_files[:3])
+        assert np.shape(fewer_data.lift_coefficients)[0] == 3
+        assert len([f for f in os.listdir(cache_directory) if f.endswith('.npz')]) == 4
+
+        # disabled cache
+        airfoil_cache_settings.cache_directory = None
+        number_of_files                        = len(os.listdir(cache_directory))
+        compare_data(cold_geometry,import_airfoil_geometry(airfoil_geometry_file))
+        assert len(os.listdir(cache_directory)) == number_of_files
+    finally:
+        airfoil_cache_settings.cache_directory = default_directory
+        shutil.rmtree(cache_directory)
+
+    # Truth values
+    tc_truth  = 0.12031526401402462
+    assert np.abs(warm_geometry.thickness_to_chord - tc_truth) < 1e-8
+
+    return
+
+def compare_data(data_1,data_2):
+    """Checks that two results hold the same keys and values"""
+
+    assert list(data_1.keys()) == list(data_2.keys())
+    for key in data_1.keys():
+        if isinstance(data_1[key],dict):
+            compare_data(data_1[key],data_2[key])
+        else:
+            assert np.shape(data_1[key]) == np.shape(data_2[key])
+            assert np.all(np.asarray(data_1[key]) == np.asarray(data_2[key]))
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# benchmark_aerodynamics.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" benchmarks of the vortex lattice method with a Boeing 737"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import VLM
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import generate_vortex_distribution
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import compute_wing_induced_velocity
+
+import sys
+import numpy as np
+
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Setup Functions
+# ----------------------------------------------------------------------
+
+def get_settings(number_spanwise_vortices):
+
+    settings = SUAVE.Analyses.Aerodynamics.Vortex_Lattice().settings
+    settings.number_spanwise_vortices        = number_spanwise_vortices
+    settings.number_chordwise_vortices       = 4
+    settings.propeller_wake_model            = None
+    settings.spanwise_cosine_spacing         = False
+    settings.model_fuselage                  = True
+    settings.model_nacelle                   = False
+    settings.leading_edge_suction_multiplier = 1.
+    settings.discretize_control_surfaces     = False
+    settings.use_VORLAX_matrix_calculation   = False
+    settings.show_prints                     = False
+
+    return settings
+
+def get_conditions():
+
+    machs      = np.array([0.3  ,0.5  ,0.7  ,0.8  ])
+    aoas       = np.array([-2.  ,2.   ,4.   ,6.   ]) * Units.degrees
+    altitude   = 5000. * Units.ft
+
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    speed_of_sound                          = atmosphere.compute_values(altitude).speed_of_sound[0,0]
+    conditions.freestream.velocity          = np.atleast_2d(machs * speed_of_sound).T
+    conditions.freestream.mach_number       = np.atleast_2d(machs).T
+    conditions.aerodynamics.angle_of_attack = np.atleast_2d(aoas).T
+    conditions.aerodynamics.side_slip_angle = np.zeros_like(conditions.aerodynamics.angle_of_attack)
+    conditions.stability.dynamic.pitch_rate = np.zeros_like(conditions.aerodynamics.angle_of_attack)
+    conditions.stability.dynamic.roll_rate  = np.zeros_like(conditions.aerodynamics.angle_of_attack)
+    conditions.stability.dynamic.yaw_rate   = np.zeros_like(conditions.aerodynamics.angle_of_attack)
+
+    return conditions
+
+# ----------------------------------------------------------------------
+#   Vortex Lattice
+# ----------------------------------------------------------------------
+
+def setup_VLM(number_spanwise_vortices):
+
+    geometry   = vehicle_setup()
+    settings   = get_settings(number_spanwise_vortices)
+    conditions = get_conditions()
+
+    def run():
+        VLM(conditions,settings,geometry)
+
+    return run
+
+def setup_compute_wing_induced_velocity(number_spanwise_vortices):
+
+    geometry   = vehicle_setup()
+    settings   = get_settings(number_spanwise_vortices)
+    VD         = generate_vortex_distribution(geometry,settings)
+    mach       = np.atleast_2d(np.unique(get_conditions().freestream.mach_number)).T
+
+    def run():
+        compute_wing_induced_velocity(VD,mach,compute_EW=True)
+
+    return run
+
+# ----------------------------------------------------------------------
+#   Benchmarks
+# ----------------------------------------------------------------------
+
+benchmarks = [
+    Data(name = 'VLM',                               sizes = [5,10,20],           setup = setup_VLM),
+    Data(name = 'compute_wing_induced_velocity',     sizes = [5,10,20],           setup = setup_compute_wing_induced_velocity),
+]
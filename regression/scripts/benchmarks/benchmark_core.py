@@ -0,0 +1,119 @@
+# benchmark_core.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" benchmarks of the SUAVE data structures, atmosphere and input/output"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+
+import os
+import tempfile
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Data
+# ----------------------------------------------------------------------
+
+def setup_data_attribute_access(number_of_keys):
+
+    data = Data()
+    for i in range(number_of_keys):
+        data['key_%i' % i] = Data(value = float(i))
+    keys = list(data.keys())
+
+    def run():
+        for key in keys:
+            getattr(data,key).value
+
+    return run
+
+def setup_data_pack_array(number_of_arrays):
+
+    # arrays on the control points of a segment, as in the unknowns and residuals
+    data = Data()
+    for i in range(number_of_arrays):
+        data['array_%i' % i] = np.ones((16,1)) * i
+
+    def run():
+        data.pack_array()
+
+    return run
+
+# ----------------------------------------------------------------------
+#   Process
+# ----------------------------------------------------------------------
+
+def setup_process_evaluate(number_of_steps,profiled=False):
+
+    # nested process of trivial steps so that only the process overhead is timed
+    def step(state):
+        return state
+
+    process         = SUAVE.Analyses.Process()
+    process.nested  = SUAVE.Analyses.Process()
+    for i in range(number_of_steps):
+        process['step_%i' % i]        = step
+        process.nested['step_%i' % i] = step
+    state = Data()
+
+    def run():
+        if profiled:
+            SUAVE.Analyses.Process.start_profile()
+        process(state)
+        if profiled:
+            SUAVE.Analyses.Process.stop_profile()
+
+    return run
+
+def setup_process_evaluate_profiled(number_of_steps):
+    return setup_process_evaluate(number_of_steps,profiled=True)
+
+# ----------------------------------------------------------------------
+#   Atmosphere
+# ----------------------------------------------------------------------
+
+def setup_atmosphere_compute_values(number_of_altitudes):
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    altitudes  = np.atleast_2d(np.linspace(0.,20.,number_of_altitudes)).T * Units.km
+
+    def run():
+        atmosphere.compute_values(altitudes)
+
+    return run
+
+# ----------------------------------------------------------------------
+#   Input/Output
+# ----------------------------------------------------------------------
+
+def setup_archive_load(number_of_arrays):
+
+    data = Data()
+    for i in range(number_of_arrays):
+        data['array_%i' % i] = Data(values = np.linspace(0.,1.,100), tag = 'array_%i' % i)
+
+    filename = os.path.join(tempfile.mkdtemp(),'benchmark.res')
+
+    def run():
+        SUAVE.Input_Output.SUAVE.archive(data,filename)
+        SUAVE.Input_Output.SUAVE.load(filename)
+
+    return run
+
+# ----------------------------------------------------------------------
+#   Benchmarks
+# ----------------------------------------------------------------------
+
+benchmarks = [
+    Data(name = 'Data attribute access',             sizes = [10,100,1000],       setup = setup_data_attribute_access),
+    Data(name = 'Data.pack_array',                   sizes = [10,100,1000],       setup = setup_data_pack_array),
+    Data(name = 'Process.evaluate',                  sizes = [10,100],            setup = setup_process_evaluate),
+    Data(name = 'Process.evaluate profiled',         sizes = [10,100],            setup = setup_process_evaluate_profiled),
+    Data(name = 'US_Standard_1976.compute_values',   sizes = [10,1000,100000],    setup = setup_atmosphere_compute_values),
+    Data(name = 'archive/load',                      sizes = [10,100,1000],       setup = setup_archive_load),
+]
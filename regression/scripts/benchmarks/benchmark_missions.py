@@ -0,0 +1,67 @@
+# benchmark_missions.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" benchmarks of the mission solver with a Boeing 737"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Methods.Missions.Segments import converge_root
+
+import sys
+from copy import deepcopy
+
+sys.path.append('../Vehicles')
+sys.path.append('../segments')
+
+from Boeing_737   import vehicle_setup, configs_setup
+from segment_test import analyses_setup, simple_sizing
+
+# ----------------------------------------------------------------------
+#   Converge Root
+# ----------------------------------------------------------------------
+
+def setup_converge_root(number_control_points):
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+
+    configs_analyses = analyses_setup(configs)
+
+    analyses = SUAVE.Analyses.Analysis.Container()
+    analyses.configs = configs_analyses
+
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    configs_analyses.finalize()
+
+    # a standard cruise segment
+    segment = SUAVE.Analyses.Mission.Segments.Cruise.Constant_Speed_Constant_Altitude()
+    segment.tag = "cruise"
+    segment.analyses.extend( configs_analyses.cruise )
+    segment.altitude  = 10.   * Units.km
+    segment.air_speed = 230.  * Units['m/s']
+    segment.distance  = 1000. * Units.km
+    segment.state.numerics.number_control_points = number_control_points
+
+    # every solve starts from the initial guess
+    segment.process.initialize(segment)
+    guess = deepcopy(segment.state.unknowns)
+
+    def run():
+        segment.state.unknowns = deepcopy(guess)
+        converge_root(segment)
+
+    return run
+
+# ----------------------------------------------------------------------
+#   Benchmarks
+# ----------------------------------------------------------------------
+
+benchmarks = [
+    Data(name = 'converge_root cruise segment',      sizes = [4,16,32],           setup = setup_converge_root),
+]
@@ -0,0 +1,59 @@
+# benchmark_noise.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" benchmarks of the propeller noise analysis with the F8745 D4 propeller"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Analyses.Mission.Segments.Segment import Segment
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.compute_source_coordinates import compute_point_source_coordinates
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.compute_harmonic_noise     import compute_harmonic_noise
+
+import numpy as np
+
+from benchmark_propulsion import propeller_setup
+
+# ----------------------------------------------------------------------
+#   Harmonic Noise
+# ----------------------------------------------------------------------
+
+def setup_compute_harmonic_noise(number_of_microphones):
+
+    ctrl_pts         = 3
+    prop, conditions = propeller_setup(ctrl_pts,False)
+    rotors           = Data()
+    rotors.propeller = prop
+    F, Q, P, Cp, noise_data, etap = prop.spin(conditions)
+
+    # microphones on an arc 4 m from the propeller
+    theta     = np.linspace(1.,179.,number_of_microphones) * Units.degrees
+    positions = np.stack([-4.*np.cos(theta),4.*np.sin(theta),np.zeros_like(theta)],axis=1)
+
+    conditions.noise.total_microphone_locations = np.repeat(positions[np.newaxis,:,:],ctrl_pts,axis=0)
+    conditions.noise.number_of_microphones      = number_of_microphones
+    conditions.aerodynamics.angle_of_attack     = np.zeros((ctrl_pts,1))
+    segment                                     = Segment()
+    segment.state.conditions                    = conditions
+    segment.state.conditions.expand_rows(ctrl_pts)
+
+    settings        = SUAVE.Analyses.Noise.Fidelity_One().settings
+    position_vector = compute_point_source_coordinates(conditions,rotors,conditions.noise.total_microphone_locations,settings)
+
+    def run():
+        compute_harmonic_noise(settings.harmonics,conditions.freestream,conditions.aerodynamics.angle_of_attack,position_vector,
+                               conditions.frames.inertial.velocity_vector,rotors,noise_data,settings,Data())
+
+    return run
+
+# ----------------------------------------------------------------------
+#   Benchmarks
+# ----------------------------------------------------------------------
+
+benchmarks = [
+    Data(name = 'compute_harmonic_noise',            sizes = [4,16,64],           setup = setup_compute_harmonic_noise),
+]
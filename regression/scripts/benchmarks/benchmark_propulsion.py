@@ -0,0 +1,81 @@
+# benchmark_propulsion.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" benchmarks of the rotor analysis with the F8745 D4 propeller"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics
+
+import sys
+import numpy as np
+
+sys.path.append('../Vehicles/Propellers')
+
+from F8745_D4_Propeller import F8745_D4_Propeller
+
+# ----------------------------------------------------------------------
+#   Setup Functions
+# ----------------------------------------------------------------------
+
+def propeller_setup(number_control_points,use_2d_analysis):
+
+    prop                 = F8745_D4_Propeller()
+    prop.use_2d_analysis = use_2d_analysis
+
+    # twist of the propeller noise regression
+    n                       = len(prop.twist_distribution)
+    beta_75                 = prop.twist_distribution[round(n*0.75)]
+    prop.twist_distribution = prop.twist_distribution + 21. * Units.degrees - beta_75
+
+    # sea level wind tunnel conditions of the propeller noise regression
+    ctrl_pts   = number_control_points
+    conditions = Aerodynamics()
+    conditions.freestream.density                = np.ones((ctrl_pts,1)) * 1.2250
+    conditions.freestream.dynamic_viscosity      = np.ones((ctrl_pts,1)) * 1.81E-5
+    conditions.freestream.speed_of_sound         = np.ones((ctrl_pts,1)) * 343.376
+    conditions.freestream.temperature            = np.ones((ctrl_pts,1)) * 288.16889478
+    conditions.frames.inertial.velocity_vector   = np.tile(np.array([[77.2, 0. ,0.]]),(ctrl_pts,1))
+    conditions.propulsion.throttle               = np.ones((ctrl_pts,1))
+    conditions.frames.body.transform_to_inertial = np.tile(np.eye(3)[None,:,:],(ctrl_pts,1,1))
+
+    prop.inputs.omega           = np.ones((ctrl_pts,1)) * 2500. * Units.rpm
+    prop.inputs.y_axis_rotation = np.zeros_like(prop.inputs.omega)
+
+    return prop, conditions
+
+# ----------------------------------------------------------------------
+#   Rotor Spin
+# ----------------------------------------------------------------------
+
+def setup_rotor_spin_1d(number_control_points):
+
+    prop, conditions = propeller_setup(number_control_points,False)
+
+    def run():
+        prop.spin(conditions)
+
+    return run
+
+def setup_rotor_spin_2d(number_control_points):
+
+    prop, conditions = propeller_setup(number_control_points,True)
+
+    def run():
+        prop.spin(conditions)
+
+    return run
+
+# ----------------------------------------------------------------------
+#   Benchmarks
+# ----------------------------------------------------------------------
+
+benchmarks = [
+    Data(name = 'Rotor.spin 1-D',                    sizes = [1,16,64],           setup = setup_rotor_spin_1d),
+    Data(name = 'Rotor.spin 2-D',                    sizes = [1,2,4],             setup = setup_rotor_spin_2d),
+]
@@ -0,0 +1,149 @@
+# run_benchmarks.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Runs the micro-benchmarks of the SUAVE hot paths and reports the time and peak memory of each"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import matplotlib
+matplotlib.use('Agg')
+
+import sys, time, gc, argparse, json, tracemalloc
+import numpy as np
+
+import benchmark_core
+import benchmark_missions
+import benchmark_aerodynamics
+import benchmark_propulsion
+import benchmark_noise
+
+# ----------------------------------------------------------------------
+#   How This Works
+# ----------------------------------------------------------------------
+
+# Each benchmark module has a list of benchmarks. A benchmark has a name,
+# the problem sizes it is run at and a setup function that builds the
+# problem for a size and returns the function that is timed. Setup is not
+# timed. The function is called once to warm up, then timed over enough
+# calls to take at least --min_time seconds, --repeat times. The peak
+# memory allocated by one more call is traced separately, so the tracing
+# does not slow down the timing.
+#
+# The benchmarks do not need network access. The vehicles are taken from
+# ../Vehicles, so the results track the regression workloads. Like the
+# regression scripts, run the benchmarks from this directory.
+
+modules = [
+    benchmark_core,
+    benchmark_missions,
+    benchmark_aerodynamics,
+    benchmark_propulsion,
+    benchmark_noise,
+]
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    options = parse_options()
+
+    sys.stdout.write('# --------------------------------------------------------------------- \n')
+    sys.stdout.write('#   SUAVE Benchmarks \n')
+    sys.stdout.write('#   %s \n' % time.strftime("%B %d, %Y - %H:%M:%S", time.gmtime()) )
+    sys.stdout.write('# --------------------------------------------------------------------- \n')
+    sys.stdout.write('%-40s %8s %12s %12s %12s\n' % ('Benchmark','Size','Best [ms]','Median [ms]','Peak [MB]'))
+    sys.stdout.flush()
+
+    records = []
+    for module in modules:
+        for benchmark in module.benchmarks:
+            if options.filter is not None and options.filter not in benchmark.name:
+                continue
+            for size in benchmark.sizes:
+                record = run_benchmark(benchmark,size,options.repeat,options.min_time)
+                records.append(record)
+                sys.stdout.write('%-40s %8s %12.3f %12.3f %12.3f\n' % (record['name'],record['size'],
+                                                                       record['best']*1000.,record['median']*1000.,
+                                                                       record['peak_memory']))
+                sys.stdout.flush()
+
+    if options.output is not None:
+        with open(options.output,'w') as json_file:
+            json.dump(records,json_file,indent=2)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Options
+# ----------------------------------------------------------------------
+
+def parse_options():
+
+    parser = argparse.ArgumentParser(description='Runs the SUAVE micro-benchmarks.')
+    parser.add_argument('--filter', default=None,
+                        help='only run the benchmarks with this text in their name')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of timing samples of each benchmark')
+    parser.add_argument('--min_time', type=float, default=0.1,
+                        help='minimum duration of a timing sample in seconds')
+    parser.add_argument('--output', default=None,
+                        help='JSON file the results are written to')
+
+    return parser.parse_args()
+
+# ----------------------------------------------------------------------
+#   Benchmark Runner
+# ----------------------------------------------------------------------
+
+def run_benchmark(benchmark,size,repeat,min_time):
+
+    function = benchmark.setup(size)
+
+    # warm up, this also fills any caches
+    function()
+
+    # the number of calls in a sample
+    loops = 1
+    while True:
+        elapsed = time_calls(function,loops)
+        if elapsed >= min_time:
+            break
+        loops = loops * 10
+
+    times = [elapsed/loops] + [time_calls(function,loops)/loops for i in range(repeat-1)]
+
+    # peak memory allocated by one call
+    gc.collect()
+    tracemalloc.start()
+    function()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    record = { 'name'        : benchmark.name,
+               'size'        : size,
+               'loops'       : loops,
+               'best'        : float(np.min(times)),
+               'median'      : float(np.median(times)),
+               'peak_memory' : peak / 2.**20 }
+
+    return record
+
+def time_calls(function,loops):
+
+    tic = time.perf_counter()
+    for i in range(loops):
+        function()
+
+    return time.perf_counter() - tic
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+# config_copy_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression for configurations that are copies of their base vehicle"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data, DataOrdered
+from SUAVE.Core.Diffed_Data import copy_tree
+
+import numpy as np
+from copy import deepcopy
+import time
+import sys
+
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    ti      = time.time()
+    configs = configs_setup(vehicle)
+    configs.finalize()
+    print('configuration setup time : ' + str(time.time()-ti))
+
+    base    = configs.base
+    takeoff = configs.takeoff
+
+    # a config holds the same values as a deep copy of its base
+    compare_trees(SUAVE.Components.Configs.Config(base),deepcopy(base))
+
+    # containers and mutable values are copied
+    assert takeoff.wings.main_wing is not vehicle.wings.main_wing
+    assert takeoff.networks.turbofan.fan is not vehicle.networks.turbofan.fan
+    assert takeoff.wings.main_wing.origin is not vehicle.wings.main_wing.origin
+    assert takeoff.fuselages.fuselage.mass_properties.center_of_gravity is not vehicle.fuselages.fuselage.mass_properties.center_of_gravity
+    
+    # changing a value in place in a config leaves the vehicle and the other configs unchanged
+    config_1 = SUAVE.Components.Configs.Config(vehicle)
+    config_2 = SUAVE.Components.Configs.Config(vehicle)
+    origin   = vehicle.wings.main_wing.origin[0][0]
+    config_1.wings.main_wing.origin[0][0] = origin + 1.
+    config_1.wings.main_wing.twists.root  = 1.
+    assert vehicle.wings.main_wing.origin[0][0] == origin
+    assert config_2.wings.main_wing.origin[0][0] == origin
+    assert vehicle.wings.main_wing.twists.root != 1.
+    assert_isolated(takeoff,vehicle)
+    assert_isolated(takeoff,configs.cruise)
+
+    # overrides are only held by the config and its diff
+    flap_deflection = takeoff.wings.main_wing.control_surfaces.flap.deflection
+    assert np.abs(flap_deflection - 20. * Units.deg) < 1e-12
+    assert np.abs(vehicle.wings.main_wing.control_surfaces.flap.deflection - 20. * Units.deg) > 1e-6
+    assert np.abs(takeoff._diff.wings.main_wing.control_surfaces.flap.deflection - 20. * Units.deg) < 1e-12
+    assert 'fuselages' not in takeoff._diff.keys()
+
+    # changes of the vehicle are pulled into every config, the overrides are kept
+    vehicle.wings.main_wing.areas.reference = 130.
+    vehicle.wings.main_wing.origin          = np.array([[14.,0.,-1.]])
+    configs.finalize()
+    for config in configs:
+        assert config.wings.main_wing.areas.reference == 130.
+        assert np.all(config.wings.main_wing.origin == vehicle.wings.main_wing.origin)
+        assert config.wings.main_wing.origin is not vehicle.wings.main_wing.origin
+    assert takeoff.wings.main_wing.control_surfaces.flap.deflection == flap_deflection
+    assert configs.landing.landing_gear.gear_condition == 'down'
+
+    # assigning a value in a config leaves the vehicle and the other configs unchanged
+    takeoff.wings.main_wing.areas.wetted = 1.
+    takeoff.store_diff()
+    configs.finalize()
+    assert takeoff.wings.main_wing.areas.wetted == 1.
+    assert vehicle.wings.main_wing.areas.wetted != 1.
+    assert configs.landing.wings.main_wing.areas.wetted == vehicle.wings.main_wing.areas.wetted
+    
+    # the configs stay isolated after they pulled the vehicle
+    for config in configs:
+        assert_isolated(config,vehicle)
+    assert_isolated(takeoff,configs.landing)
+    takeoff.fuselages.fuselage.mass_properties.center_of_gravity[0][0] = -1.
+    assert vehicle.fuselages.fuselage.mass_properties.center_of_gravity[0][0] != -1.
+    assert configs.landing.fuselages.fuselage.mass_properties.center_of_gravity[0][0] != -1.
+
+    # references to the same container stay shared in the copy
+    data                = Data()
+    data.propeller      = Data(tag = 'propeller', twist = np.linspace(0.,1.,5))
+    data.rotors         = SUAVE.Core.ContainerOrdered()
+    data.rotors.append(data.propeller)
+    data.rotor_list     = [data.propeller]
+    data.twist          = data.propeller.twist
+    copy                = copy_tree(data)
+    assert copy.propeller is not data.propeller
+    assert copy.rotors[0] is copy.propeller
+    assert copy.rotor_list[0] is copy.propeller
+    assert copy.propeller.twist is not data.propeller.twist
+    assert copy.twist is copy.propeller.twist
+    assert np.all(copy.twist == data.twist)
+
+    return
+
+def assert_isolated(A,B):
+    """Checks that two trees do not share any container, array or list"""
+
+    for key in A.keys():
+        if key.startswith('_') or key not in B.keys():
+            continue
+        va = A[key]
+        vb = B[key]
+        if isinstance(va,(Data,DataOrdered,np.ndarray,list)):
+            assert va is not vb, key
+        if isinstance(va,(Data,DataOrdered)) and isinstance(vb,(Data,DataOrdered)):
+            assert_isolated(va,vb)
+
+    return
+
+def compare_trees(A,B):
+    """Checks that two trees hold the same keys and values"""
+
+    assert set(A.keys()) == set(B.keys())
+    for key in A.keys():
+        if key.startswith('_'):
+            continue
+        va = A[key]
+        vb = B[key]
+        assert type(va) == type(vb)
+        if isinstance(va,(Data,DataOrdered)):
+            compare_trees(va,vb)
+        elif isinstance(va,(np.ndarray,float,int,str,bool)):
+            assert np.all(np.asarray(va) == np.asarray(vb)) or np.all(np.isnan(va) == np.isnan(vb))
+
+    return
+
+if __name__ == '__main__':
+    main()
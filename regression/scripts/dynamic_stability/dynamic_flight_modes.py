@@ -0,0 +1,131 @@
+# dynamic_flight_modes.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression for the batched eigen-analysis of the longitudinal and lateral dynamic modes"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Flight_Dynamics.Dynamic_Stability.compute_dynamic_flight_modes import compute_dynamic_flight_modes
+
+import numpy as np
+import sys
+
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    num_cases = 6
+
+    # all cases at once
+    results, vehicle, conditions, cases = stability_setup(num_cases)
+    results = compute_dynamic_flight_modes(results,vehicle,conditions,cases)
+    batch   = results.dynamic_stability
+
+    # one case at a time gives the same modes
+    for i in range(num_cases):
+        results, vehicle, conditions, cases = stability_setup(num_cases,i)
+        results = compute_dynamic_flight_modes(results,vehicle,conditions,cases)
+        single  = results.dynamic_stability
+        for modes in ['LongModes','LatModes']:
+            for key in batch[modes].keys():
+                assert np.all(batch[modes][key][i] == single[modes][key][0])
+
+    # every case has a dutch roll pair, the roll mode is faster than the spiral mode
+    LatModes = batch.LatModes
+    assert np.all(LatModes.dutchRollFreqHz > 0)
+    assert np.all(LatModes.rollSubsistenceFreqHz > LatModes.spiralFreqHz)
+    print(batch.LongModes.phugoidFreqHz.T)
+    print(batch.LongModes.shortPeriodDamp.T)
+    print(LatModes.dutchRollFreqHz.T)
+
+    # Truth values
+    phugoid_freq_truth      = 0.11157408238890727
+    short_period_damp_truth = 0.34861830828971124
+    dutch_roll_freq_truth   = 0.176260576707537
+    print('phugoid frequency error     : ' + str(batch.LongModes.phugoidFreqHz[2,0] - phugoid_freq_truth))
+    print('short period damping error  : ' + str(batch.LongModes.shortPeriodDamp[2,0] - short_period_damp_truth))
+    print('dutch roll frequency error  : ' + str(LatModes.dutchRollFreqHz[2,0] - dutch_roll_freq_truth))
+    assert np.abs(batch.LongModes.phugoidFreqHz[2,0] - phugoid_freq_truth) < 1e-8
+    assert np.abs(batch.LongModes.shortPeriodDamp[2,0] - short_period_damp_truth) < 1e-8
+    assert np.abs(LatModes.dutchRollFreqHz[2,0] - dutch_roll_freq_truth) < 1e-8
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def stability_setup(num_cases,case_index=None):
+    """Sets up the stability derivatives of a 737 over a range of speeds and angles of attack,
+    keeping only one case if case_index is given"""
+
+    vehicle = vehicle_setup()
+    vehicle.mass_properties.mass                      = 0.
+    vehicle.mass_properties.moments_of_inertia.tensor = [[3173074.17, 0 , 28752.77565],[0 , 3019041.443, 0],[0, 0, 5730017.433]]
+    for wing in vehicle.wings:
+        wing.control_surfaces = Data()
+
+    ones                                 = np.ones((num_cases,1))
+    velocity                             = np.linspace(120.,230.,num_cases)[:,None]
+    results                              = Data()
+    results.b_ref                        = vehicle.wings.main_wing.spans.projected
+    results.c_ref                        = vehicle.wings.main_wing.chords.mean_aerodynamic
+    results.S_ref                        = vehicle.reference_area
+    results.aerodynamics                 = Data()
+    results.aerodynamics.AoA             = np.linspace(6.,1.,num_cases)[:,None] * Units.degrees
+    results.aerodynamics.lift_coefficient= np.linspace(0.8,0.4,num_cases)[:,None]
+    results.aerodynamics.drag_coefficient= np.linspace(0.045,0.03,num_cases)[:,None]
+    results.aerodynamics.oswald_efficiency = 0.8 * ones
+
+    static                               = Data()
+    static.CX_u                          = -0.05 * ones
+    static.CZ_u                          = -0.2  * ones
+    static.CL_alpha                      = np.linspace(5.0,5.6,num_cases)[:,None]
+    static.CL_q                          = 8.    * ones
+    static.Cm_alpha                      = -1.2  * ones
+    static.Cm_q                          = -20.  * ones
+    static.CY_beta                       = -0.7  * ones
+    static.CY_p                          = 0.05  * ones
+    static.CY_r                          = 0.3   * ones
+    static.Cl_beta                       = -0.1  * ones
+    static.Cl_p                          = -0.45 * ones
+    static.Cl_r                          = 0.1   * ones
+    static.Cn_beta                       = 0.15  * ones
+    static.Cn_p                          = -0.03 * ones
+    static.Cn_r                          = -0.15 * ones
+    results.stability                    = Data()
+    results.stability.static             = static
+    results.stability.dynamic            = Data()
+
+    conditions                           = Data()
+    conditions.freestream                = Data()
+    conditions.freestream.gravity        = 9.81
+    conditions.freestream.density        = np.linspace(1.0,0.45,num_cases)[:,None]
+    conditions.freestream.velocity       = velocity
+    conditions.freestream.mach_number    = velocity / 320.
+
+    cases = [Data(tag = 'case_' + str(i)) for i in range(num_cases)]
+
+    # keep a single case
+    if case_index is not None:
+        select = lambda value: value[case_index:case_index+1] if isinstance(value,np.ndarray) else value
+        for data in [results.aerodynamics,static,conditions.freestream]:
+            for key in data.keys():
+                data[key] = select(data[key])
+        cases = cases[case_index:case_index+1]
+
+    return results, vehicle, conditions, cases
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@
 # 
 # Created:  Feb 2015, A. Variyar
 # Modified: Sep 2018, W. Maier
+#           Oct 2026, SUAVE Team
 #        
 
 """ create and evaluate a gas turbine network
@@ -319,6 +320,22 @@ def energy_network():
     
     for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)    
+        
+    # evaluate the same points from a tabulated engine deck
+    turbofan.use_engine_deck                      = True
+    turbofan.engine_deck_settings.cache_directory = None
+    results_deck_design     = turbofan(state_sizing)
+    results_deck_off_design = turbofan(state_off_design)
+    
+    deck_error                 = Data()
+    deck_error.thrust          = (results_deck_design.thrust_force_vector[0][0] - F[0][0])/F[0][0]
+    deck_error.mdot            = (results_deck_design.vehicle_mass_rate[0][0] - mdot[0][0])/mdot[0][0]
+    deck_error.thrust_off      = (results_deck_off_design.thrust_force_vector[0][0] - F_off_design[0][0])/F_off_design[0][0]
+    deck_error.mdot_off        = (results_deck_off_design.vehicle_mass_rate[0][0] - mdot_off_design[0][0])/mdot_off_design[0][0]
+    print(deck_error)
+    
+    for k,v in list(deck_error.items()):
+        assert(np.abs(v)<1e-2)
     
     return
     
@@ -1,7 +1,7 @@
 # lifting_line.py
 # 
 # Created:  Nov 2017, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 #
 
 # ----------------------------------------------------------------------
@@ -165,6 +165,27 @@ def main():
     #print lift_test
         
     assert(np.max(lift_test)<1e-4), 'Aero regression failed at compute lift test'    
+    
+    # --------------------------------------------------------------------
+    # Test the wing specific training data
+    # -------------------------------------------------------------------- 
+    lifting_line = aerodynamics.process.compute.lift.inviscid_wings
+    training     = lifting_line.training
+    wing_sum     = 0.
+    for wing in vehicle.wings:
+        wing_sum += training.wing_lift_coefficients[wing.tag]*wing.areas.reference/vehicle.reference_area
+    
+    wing_test = np.abs((wing_sum-training.lift_coefficient)/training.lift_coefficient)
+    print('Wing sum lift error = ', np.max(wing_test))
+    assert(np.max(wing_test)<1e-10), 'Aero regression failed at wing lift test'
+    
+    # the batched solve matches single angle of attack solves
+    konditions = Data()
+    konditions.aerodynamics = Data()
+    for i, AoA in enumerate(training.angle_of_attack):
+        konditions.aerodynamics.angle_of_attack = AoA
+        CL, CD = SUAVE.Methods.Aerodynamics.Lifting_Line.lifting_line(konditions,lifting_line.settings,vehicle.wings.main_wing)
+        assert(np.abs(CL[0]-training.wing_lift_coefficients.main_wing[i])<1e-10), 'Aero regression failed at batched lift test'
 
 if __name__ == '__main__':
 
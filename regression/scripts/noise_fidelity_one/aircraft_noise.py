@@ -16,7 +16,7 @@ from SUAVE.Core import Data
 from SUAVE.Plots.Performance.Mission_Plots import *   
 from SUAVE.Methods.Performance.estimate_stall_speed import estimate_stall_speed
 from SUAVE.Methods.Geometry.Two_Dimensional.Planform import wing_planform
-from SUAVE.Methods.Noise.Certification import sideline_noise, flyover_noise, approach_noise
+from SUAVE.Methods.Noise.Certification import certification_noise
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.generate_microphone_points import generate_building_microphone_points 
 import matplotlib.pyplot as plt 
 
@@ -75,10 +75,14 @@ def main():
     mission       = analyses.missions.base
     B737_results  = mission.evaluate()  
     
-    # certification calculations  
-    sideline_SPL  = sideline_noise(analyses,configs) 
-    flyover_SPL   = flyover_noise(analyses,configs)  
-    approach_SPL  = approach_noise(analyses,configs) 
+    # certification calculations, the three procedures are evaluated in worker processes
+    certification = certification_noise(analyses,configs,number_of_workers=3) 
+    
+    # cumulative certification noise check
+    cumulative_EPNL      = certification.cumulative
+    cumulative_EPNL_true = 246.42265750663313
+    print(cumulative_EPNL)
+    assert np.abs((cumulative_EPNL - cumulative_EPNL_true)/cumulative_EPNL_true) < 1e-6
     
     # SPL of rotor check during hover
     print('\n\n SAE Turbofan Aircraft Noise Model')
@@ -0,0 +1,61 @@
+# noise_tone_correction_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression for the tone corrected perceived noise level and the EPNL of a time history"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise, noise_tone_correction, epnl_noise
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # Time history of spectra that are silent except for a tone in the 800 Hz band (index 12).
+    # The first spectrum is silent, the tone appears after it.
+    tone_level = np.array([0.,60.,80.,75.,60.,0.])
+    SPL        = np.zeros((len(tone_level),24))
+    SPL[:,12]  = tone_level
+
+    PNL             = pnl_noise(SPL)
+    tone_correction = noise_tone_correction(SPL)
+    PNLT            = PNL + tone_correction
+    EPNL            = epnl_noise(PNLT)
+
+    # Hand computed values
+    # PNL  : above 40 dB the 800 Hz band has 10**(0.030103*(SPL-40)) noys, which is the only
+    #        contribution, and a silent spectrum has the minimum of 0.0625 noys (0 PNdB)
+    # tone : the tone is 'encircled' (steps 1-3) and the background is silent, so the
+    #        difference of step 8 is the tone level itself. That is above 20 dB in the
+    #        mid frequency bands, so the correction is 6+2/3 dB
+    # EPNL : PNLT_max = PNLT[2], PNLT[3] is within 10 dB of it and PNLT[4] is not, so the
+    #        duration sums the steps from one before t1 = 2 up to t2 = 3
+    tone           = tone_level > 0.
+    PNL_truth      = np.where(tone,40. + (10./np.log10(2.))*0.030103*(tone_level - 40.),0.)
+    tone_truth     = np.where(tone,6. + 2./3.,0.)
+    PNLT_truth     = PNL_truth + tone_truth
+    EPNL_truth     = 10.*np.log10(10**(PNLT_truth[1]/10.) + 10**(PNLT_truth[2]/10.) + 10**(PNLT_truth[3]/10.)) - 13.
+
+    print('PNLT : ' + str(PNLT))
+    print('EPNL : ' + str(EPNL))
+
+    assert np.all(np.abs(tone_correction - tone_truth) < 1e-12)
+    assert np.all(np.abs(PNLT - PNLT_truth) < 1e-9)
+    assert np.abs(EPNL - EPNL_truth) < 1e-9
+
+    # several histories, one per microphone, are integrated along the time axis
+    PNLT_mics = np.stack([PNLT,PNLT[::-1],np.zeros_like(PNLT)],axis=1)
+    EPNL_mics = epnl_noise(PNLT_mics)
+    assert np.all(np.abs(EPNL_mics - np.array([EPNL_truth,EPNL_truth,0.])) < 1e-9)
+
+    return
+
+if __name__ == '__main__':
+    main()
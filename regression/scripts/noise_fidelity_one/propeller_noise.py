@@ -138,7 +138,17 @@ def Hararmonic_Noise_Validation(PP):
     F8745D4_SPL                           = propeller_noise.SPL     
     F8745D4_SPL_harmonic                  = propeller_noise.SPL_harmonic 
     F8745D4_SPL_broadband                 = propeller_noise.SPL_broadband  
-    F8745D4_SPL_harmonic_bpf_spectrum     = propeller_noise.SPL_harmonic_bpf_spectrum      
+    F8745D4_SPL_harmonic_bpf_spectrum     = propeller_noise.SPL_harmonic_bpf_spectrum
+
+    # Evaluating the microphones in chunks gives the same results
+    settings.microphone_chunk_size        = 4
+    settings.record_chunk_peak_memory     = True
+    chunked_propeller_noise               = propeller_mid_fidelity(net.propellers,noise_data,segment,settings )
+    settings.microphone_chunk_size        = None
+    settings.record_chunk_peak_memory     = False
+    assert(np.max(np.abs(chunked_propeller_noise.SPL_1_3_spectrum - propeller_noise.SPL_1_3_spectrum)) < 1E-8)
+    assert(chunked_propeller_noise.chunk_peak_memory > 0)
+    assert('chunk_peak_memory' not in propeller_noise)
 
     # ----------------------------------------------------------------------------------------------------------------------------------------
     #  Experimental Data
@@ -2,6 +2,7 @@
 # Created: Sep. 2019, M. Clarke
 #          Mar 2020, M. Clarke
 #          Jul 2020, M. Clarke
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -13,6 +14,7 @@ import vehicle_opt_pack
 import procedure_opt_pack 
 from SUAVE.Optimization import Nexus, carpet_plot 
 import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
+from SUAVE.Optimization.Package_Setups.particle_swarm_optimization import particle_swarm_optimization
 import SUAVE.Optimization.write_optimization_outputs as write_optimization_outputs
 import os , sys
 # ----------------------------------------------------------------------        
@@ -95,7 +97,7 @@ def main():
     print('\n\n Checking particle swarm optimization algorithm')
     # suppress iteration printout 
     sys.stdout = open(os.devnull,'w')      
-    outputs = scipy_setup.SciPy_Solve(problem, solver='particle_swarm_optimization' , sense_step = 1.4901161193847656e-08, pop_size =  100 , prob_seed = seed )  
+    outputs = scipy_setup.SciPy_Solve(problem, solver='particle_swarm_optimization' , sense_step = 1.4901161193847656e-08, pop_size =  100 , prob_seed = seed, number_of_workers = 1 )  
     # end suppression of interation printout
     sys.stdout = sys.__stdout__  
     print(outputs)   
@@ -108,9 +110,53 @@ def main():
     assert( np.isclose(x1 ,  0, atol=1e-1) )
     assert( np.isclose(x2 ,  1, atol=1e-1) )     
     
+    # ------------------------------------------------------------------
+    #   Particle Swarm Optimization, synchronous swarm
+    # ------------------------------------------------------------------     
+    print('\n\n Checking particle swarm optimization with a batch objective and a process pool')
+    lb = np.array([-2.,-2.])
+    ub = np.array([ 2., 2.])
+    
+    # serial, the batch objective evaluates the whole swarm in this process
+    np.random.seed(2)
+    batch_outputs = particle_swarm_optimization(paraboloid, lb, ub, ieqcons=[paraboloid_constraint], batch_func=batch_paraboloid, \
+                                                number_of_workers=1, swarmsize=40, maxiter=200, minstep=1e-6, minfunc=1e-10)
+    np.random.seed(2)
+    f_ieqcons_outputs = particle_swarm_optimization(paraboloid, lb, ub, f_ieqcons=paraboloid_constraints, batch_func=batch_paraboloid, \
+                                                number_of_workers=1, swarmsize=40, maxiter=200, minstep=1e-6, minfunc=1e-10)
+    
+    # the only case that starts worker processes
+    np.random.seed(2)
+    pool_outputs  = particle_swarm_optimization(paraboloid, lb, ub, ieqcons=[paraboloid_constraint], number_of_workers=2, \
+                                                swarmsize=40, maxiter=200, minstep=1e-6, minfunc=1e-10)
+    
+    #   Check Results, the same seed gives the same swarm in every mode
+    assert( np.all(batch_outputs[0] == pool_outputs[0]) )
+    assert( batch_outputs[1] == pool_outputs[1] )
+    assert( np.all(batch_outputs[0] == f_ieqcons_outputs[0]) )
+    assert( batch_outputs[1] == f_ieqcons_outputs[1] )
+    assert( np.isclose(batch_outputs[1]   , 0.125, atol=1e-2) )
+    assert( np.isclose(batch_outputs[0][0], 1.25 , atol=1e-1) )
+    assert( np.isclose(batch_outputs[0][1],-0.25 , atol=1e-1) )
      
     return
 
+# ----------------------------------------------------------------------        
+#   Paraboloid for the synchronous particle swarm
+# ----------------------------------------------------------------------  
+
+def paraboloid(x):
+    return (x[0] - 1.)**2 + (x[1] + 0.5)**2
+
+def batch_paraboloid(X):
+    return (X[:,0] - 1.)**2 + (X[:,1] + 0.5)**2
+
+def paraboloid_constraint(x):
+    return x[0] + x[1] - 1.
+
+def paraboloid_constraints(x):
+    return np.array([paraboloid_constraint(x)])
+
 # ----------------------------------------------------------------------        
 #   Inputs, Objective, & Constraints
 # ----------------------------------------------------------------------  
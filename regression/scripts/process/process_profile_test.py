@@ -0,0 +1,126 @@
+# process_profile_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression for the step timing and call count profile of nested processes"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Analyses import Process
+
+import numpy as np
+import tempfile
+import os
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    analysis = analysis_setup()
+
+    # unprofiled evaluation
+    assert Process.profile is None
+    state    = Data(count = 0)
+    results  = analysis.process(analysis,state)
+    assert state.count == 5
+
+    # profiled evaluation
+    profile  = Process.start_profile()
+    for i in range(3):
+        profiled_results = analysis.process(analysis,state)
+    assert Process.stop_profile() is profile
+    assert Process.profile is None
+    assert state.count == 20
+    assert profiled_results.iterate.lift == results.iterate.lift
+
+    # every step is recorded under its nested path, the analysis process under the analysis tag
+    calls_truth = Data()
+    calls_truth['wing_analysis']                          = 3
+    calls_truth['wing_analysis;initialize']               = 3
+    calls_truth['wing_analysis;iterate']                  = 3
+    calls_truth['wing_analysis;iterate;lift']             = 9
+    calls_truth['wing_analysis;iterate;drag']             = 9
+    calls_truth['wing_analysis;finalize']                 = 3
+    assert sorted(profile.calls.keys()) == sorted(calls_truth.keys())
+    for path in calls_truth.keys():
+        assert profile.calls[path] == calls_truth[path]
+    assert profile.stack == []
+
+    # the times of nested steps add up to the time of their parent
+    self_times = profile.self_times()
+    total_time = np.sum([self_times[path] for path in self_times.keys()])
+    assert np.abs(total_time - profile.times.wing_analysis) < 1e-12 + 1e-9*profile.times.wing_analysis
+    profile.print_summary(5)
+
+    # folded stacks for flame graph tools
+    filename = os.path.join(tempfile.mkdtemp(),'wing_analysis.folded')
+    profile.write_folded_stacks(filename)
+    with open(filename) as f:
+        lines = f.read().splitlines()
+    os.remove(filename)
+    os.rmdir(os.path.dirname(filename))
+    assert len(lines) == len(calls_truth.keys())
+    for line in lines:
+        path, value = line.rsplit(' ',1)
+        assert path in calls_truth
+        assert int(value) >= 0
+
+    # a failing step leaves the profile in a consistent state
+    profile = Process.start_profile()
+    analysis.conditions.drag = failing_step
+    try:
+        analysis.process(analysis,state)
+    except RuntimeError:
+        pass
+    Process.stop_profile()
+    assert profile.stack == []
+    assert profile.calls['wing_analysis;iterate;drag'] == 1
+    assert profile.calls['wing_analysis'] == 1
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def analysis_setup():
+    """Builds an analysis with a nested process of simple steps"""
+
+    analysis                            = Data()
+    analysis.tag                        = 'wing_analysis'
+    analysis.process                    = Process()
+    analysis.process.initialize         = count_step
+    analysis.process.iterate            = iterate_conditions
+    analysis.process.finalize           = count_step
+    analysis.conditions                 = Process()
+    analysis.conditions.lift            = lift_step
+    analysis.conditions.drag            = count_step
+
+    return analysis
+
+def iterate_conditions(analysis,state):
+    """Evaluates the condition steps three times like a converging solver"""
+
+    for i in range(3):
+        results = analysis.conditions(analysis,state)
+
+    return results
+
+def count_step(analysis,state):
+    state.count += 1
+    return state.count
+
+def lift_step(analysis,state):
+    return np.sum(np.linspace(0,1,1000)**2)
+
+def failing_step(analysis,state):
+    raise RuntimeError('failing step')
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@
 # Created:  Sep 2014, E. Botero
 # Modified: Feb 2020, M. Clarke  
 #           Sep 2020, M. Clarke 
+#           Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -225,10 +226,10 @@ def main():
     Cplast_truth    = 0.08591914
      
     # Truth values for rotor with airfoil geometry defined 
-    Fr_a_truth      = 1266.0906132241278
-    Qr_a_truth      = 107.01068456
-    Pr_a_truth      = 22168.50514504
-    Cplastr_a_truth = 0.03486995
+    Fr_a_truth      = 1269.2903878792258
+    Qr_a_truth      = 107.26308016
+    Pr_a_truth      = 22220.79182124
+    Cplastr_a_truth = 0.0349522
     
     # Truth values for rotor without airfoil geometry defined 
     Fr_truth        = 1276.4378657580712
@@ -2,6 +2,7 @@
 #
 # Created:  Jun 2017, E. Botero
 # Modified: Jan 2020, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -54,11 +55,38 @@ def main():
     F_gaussian = results_gaussian.thrust_force_vector[:,0] + 1 
     mdot_gaussian = results_gaussian.vehicle_mass_rate[:,0] + 1
     
+    # Get gridded interpolation results with surrogate extension
+    propulsion = Propulsor_Surrogate()
+    propulsion.input_file = 'deck.csv'
+    propulsion.number_of_engines = 1.
+    propulsion.surrogate_type = 'grid_linear'
+    propulsion.use_extended_surrogate = True
+    propulsion.build_surrogate()
+    results_grid_linear = propulsion.evaluate_thrust(state)    
+    
+    F_grid_linear = results_grid_linear.thrust_force_vector[:,0] + 1 
+    mdot_grid_linear = results_grid_linear.vehicle_mass_rate[:,0] + 1
+    
+    propulsion = Propulsor_Surrogate()
+    propulsion.input_file = 'deck.csv'
+    propulsion.number_of_engines = 1.
+    propulsion.surrogate_type = 'grid_cubic'
+    propulsion.use_extended_surrogate = True
+    propulsion.build_surrogate()
+    results_grid_cubic = propulsion.evaluate_thrust(state)    
+    
+    F_grid_cubic = results_grid_cubic.thrust_force_vector[:,0] + 1 
+    mdot_grid_cubic = results_grid_cubic.vehicle_mass_rate[:,0] + 1    
+    
     # Truth values
     F_linear_true      = np.array([0.0,  7965.14481619, 12770.34030835, 14350.57238295, 17607.78543469]) + 1
     mdot_linear_true   = np.array([0.0,   0.1231387392, 0.2151082426, 0.2482609107, 0.3211364166]) + 1
     F_gaussian_true    = np.array([0.0,  9427.23973454, 11508.48532115, 10255.76061835, 10676.15981316]) + 1
     mdot_gaussian_true = np.array([0.0,    0.083640387, 0.1928480953, 0.1626323538, 0.1691090013]) + 1
+    F_grid_linear_true    = np.array([0.0,  9350.19350881, 11757.30360947, 12169.63754592, 13618.68136070]) + 1
+    mdot_grid_linear_true = np.array([0.0,   0.1041834900, 0.1878455041, 0.2089017830, 0.2339386339]) + 1
+    F_grid_cubic_true     = np.array([0.0,  9537.07280086, 11378.99449748, 11936.37682444, 13176.19192582]) + 1
+    mdot_grid_cubic_true  = np.array([0.0,   0.1060861847, 0.1822696764, 0.2048067993, 0.2262290879]) + 1
 
     # Error check
     error = Data()
@@ -66,6 +94,10 @@ def main():
     error.mdot_linear = np.max(np.abs((mdot_linear-mdot_linear_true)/mdot_linear))
     error.thrust_gaussian = np.max(np.abs((F_gaussian-F_gaussian_true)/F_gaussian))
     error.mdot_gaussian = np.max(np.abs((mdot_gaussian-mdot_gaussian_true)/mdot_gaussian))
+    error.thrust_grid_linear = np.max(np.abs((F_grid_linear-F_grid_linear_true)/F_grid_linear))
+    error.mdot_grid_linear = np.max(np.abs((mdot_grid_linear-mdot_grid_linear_true)/mdot_grid_linear))
+    error.thrust_grid_cubic = np.max(np.abs((F_grid_cubic-F_grid_cubic_true)/F_grid_cubic))
+    error.mdot_grid_cubic = np.max(np.abs((mdot_grid_cubic-mdot_grid_cubic_true)/mdot_grid_cubic))
     
     print('Errors:')
     print(error)
@@ -0,0 +1,105 @@
+# adaptive_control_points_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" setup file for the adaptive control point refinement regression with a Boeing 737"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+import time
+
+import sys
+
+sys.path.append('../Vehicles')
+# the analysis functions
+
+from Boeing_737 import vehicle_setup, configs_setup
+from segment_test import analyses_setup, simple_sizing
+from time_marching_segment_test import mission_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # solve every segment on a fixed number of control points and refine a coarse grid where needed
+    ti = time.time()
+    fixed_results    = evaluate_mission(16,None)
+    tf = time.time()
+    adaptive_results = evaluate_mission(4,1e-5)
+    ta = time.time()
+    print('Fixed control points time    : ' + str(tf - ti))
+    print('Adaptive control points time : ' + str(ta - tf))
+
+    # the refined segments converge to the same trajectory
+    for tag in ['climb','cruise','descent']:
+        fixed    = fixed_results.segments[tag].conditions
+        adaptive = adaptive_results.segments[tag].conditions
+        print(tag + ' control points : ' + str(adaptive_results.segments[tag].state.numerics.number_control_points))
+        assert adaptive_results.segments[tag].state.numerics.converged
+        assert np.abs(adaptive.frames.inertial.time[-1,0]/fixed.frames.inertial.time[-1,0] - 1.) < 1e-5
+        assert np.abs(adaptive.weights.total_mass[-1,0]/fixed.weights.total_mass[-1,0] - 1.) < 1e-6
+
+    # the segments are refined independently
+    control_points = [adaptive_results.segments[tag].state.numerics.number_control_points for tag in ['climb','cruise','descent']]
+    assert control_points == [13,7,7]
+
+    # Extract sample values from computation
+    climb_time      = adaptive_results.segments.climb.conditions.frames.inertial.time[-1,0]
+    descent_mass    = adaptive_results.segments.descent.conditions.weights.total_mass[-1,0]
+    print(climb_time)
+    print(descent_mass)
+
+    # Truth values
+    climb_time_truth   = 1035.6048639791586
+    descent_mass_truth = 76232.28160011521
+
+    # Store errors
+    error = Data()
+    error.climb_time   = np.abs(climb_time   - climb_time_truth)/climb_time_truth
+    error.descent_mass = np.abs(descent_mass - descent_mass_truth)/descent_mass_truth
+
+    print('Errors:')
+    print(error)
+
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Evaluate the Mission
+# ----------------------------------------------------------------------
+
+def evaluate_mission(number_control_points,tolerance):
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+
+    configs_analyses = analyses_setup(configs)
+
+    analyses = SUAVE.Analyses.Analysis.Container()
+    analyses.configs = configs_analyses
+
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    configs_analyses.finalize()
+
+    mission = mission_setup(configs_analyses,None)
+    for segment in mission.segments:
+        segment.state.numerics.number_control_points      = number_control_points
+        segment.settings.adaptive_control_points_tolerance = tolerance
+
+    results = mission.evaluate()
+
+    return results
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+# segment_store_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression for streaming the segment conditions of a mission to disk"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Input_Output.SUAVE import Segment_Store, load_segment_store
+
+import numpy as np
+import shutil
+import sys
+import os
+
+sys.path.append('../B737')
+sys.path.append('../Vehicles')
+
+from mission_B737 import full_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # mission kept in memory
+    configs, analyses = full_setup()
+    configs.finalize()
+    analyses.finalize()
+    results           = analyses.missions.base.evaluate()
+    owned_bytes       = array_bytes(results)
+    assert owned_bytes > 0
+
+    # same mission streamed to disk, the arrays are released as soon as a segment is written
+    configs, analyses = full_setup()
+    configs.finalize()
+    analyses.finalize()
+    mission           = analyses.missions.base
+    store             = Segment_Store()
+    store.release_conditions       = True
+    mission.settings.segment_store = store
+
+    try:
+        streamed_results = mission.evaluate()
+        print('conditions in memory : ' + str(owned_bytes) + ' bytes, streamed : ' + str(array_bytes(streamed_results)) + ' bytes')
+        assert array_bytes(streamed_results) == 0
+
+        # the streamed results are identical and accessed in the same way
+        assert list(streamed_results.segments.keys()) == list(results.segments.keys())
+        for segment, streamed_segment in zip(results.segments,streamed_results.segments):
+            compare_conditions(segment.conditions,streamed_segment.conditions)
+
+        # lazy read back from the store
+        loaded_results = load_segment_store(store.directory)
+        assert list(loaded_results.segments.keys()) == list(results.segments.keys())
+        for segment, loaded_segment in zip(results.segments,loaded_results.segments):
+            compare_conditions(segment.conditions,loaded_segment.conditions)
+        assert loaded_results.segments['cruise'].conditions.weights.has_additional_fuel == False
+        loaded_final_mass = loaded_results.segments[-1].conditions.weights.total_mass[-1,0]
+
+        # repeated missions overwrite their segments and stay out of memory
+        mission_directory = os.path.join(store.directory,mission.tag)
+        number_of_files   = len(os.listdir(mission_directory))
+        for i in range(2):
+            streamed_results = mission.evaluate()
+            assert array_bytes(streamed_results) == 0
+            assert len(os.listdir(mission_directory)) == number_of_files
+        assert number_of_files == len(results.segments)
+
+        # released arrays are copies on write, changing them leaves the store unchanged
+        time = streamed_results.segments.cruise.conditions.frames.inertial.time
+        time_truth = np.array(time)
+        time[:,0] = 0.
+        loaded_results = load_segment_store(store.directory)
+        assert np.all(loaded_results.segments.cruise.conditions.frames.inertial.time == time_truth)
+
+        # releasing the arrays of a mission after the fact
+        store.release_conditions = False
+        streamed_results = mission.evaluate()
+        assert array_bytes(streamed_results) > 0
+        store.release(streamed_results)
+        assert array_bytes(streamed_results) == 0
+    finally:
+        shutil.rmtree(store.directory)
+
+    # Truth values
+    final_mass       = results.segments[-1].conditions.weights.total_mass[-1,0]
+    final_mass_truth = 60435.050553251895
+    print('final mass : ' + str(final_mass))
+    assert np.abs(final_mass - final_mass_truth) / final_mass_truth < 1e-6
+
+    # the stored mission round trips
+    assert loaded_final_mass == final_mass
+
+    return
+
+def array_bytes(results):
+    """Adds up the bytes of the condition arrays that are held in memory"""
+
+    def tree_bytes(data):
+        total = 0
+        for key, value in data.items():
+            if isinstance(value,dict):
+                total += tree_bytes(value)
+            elif isinstance(value,np.ndarray) and value.base is None:
+                total += value.nbytes
+        return total
+
+    return sum([tree_bytes(segment.conditions) for segment in results.segments])
+
+def compare_conditions(conditions_1,conditions_2):
+    """Checks that the arrays of two conditions trees are identical"""
+
+    for key in conditions_1.keys():
+        value = conditions_1[key]
+        if isinstance(value,dict):
+            compare_conditions(value,conditions_2[key])
+        elif isinstance(value,np.ndarray) and value.size > 0:
+            assert np.shape(value) == np.shape(conditions_2[key])
+            assert np.all(value == conditions_2[key])
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+# time_marching_segment_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" setup file for the time marching segment solver regression with a Boeing 737"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+import time
+
+import sys
+
+sys.path.append('../Vehicles')
+# the analysis functions
+
+from Boeing_737 import vehicle_setup, configs_setup
+from segment_test import analyses_setup, simple_sizing
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # solve all control points of each segment at once and march the same segments over sub-intervals
+    ti = time.time()
+    full_results    = evaluate_mission(None)
+    tf = time.time()
+    marched_results = evaluate_mission(6)
+    tm = time.time()
+    print('Full solve time     : ' + str(tf - ti))
+    print('Time marching time  : ' + str(tm - tf))
+
+    # the marched segments converge to the same trajectory
+    for tag in ['climb','cruise','descent']:
+        full    = full_results.segments[tag].conditions
+        marched = marched_results.segments[tag].conditions
+        assert marched_results.segments[tag].state.numerics.converged
+        assert np.abs(marched.frames.inertial.time[-1,0]/full.frames.inertial.time[-1,0] - 1.) < 1e-3
+        assert np.abs(marched.weights.total_mass[-1,0]/full.weights.total_mass[-1,0] - 1.) < 1e-4
+        assert np.abs(marched.freestream.altitude[-1,0] - full.freestream.altitude[-1,0]) < 1e-6
+
+        # the stitched solution satisfies the residuals on every control point
+        assert np.max(np.abs(marched_results.segments[tag].state.residuals.pack_array())) < 1e-6
+
+    # Extract sample values from computation
+    climb_time      = marched_results.segments.climb.conditions.frames.inertial.time[-1,0]
+    descent_mass    = marched_results.segments.descent.conditions.weights.total_mass[-1,0]
+    print(climb_time)
+    print(descent_mass)
+
+    # Truth values
+    climb_time_truth   = 1035.6059010420931
+    descent_mass_truth = 76232.28045463166
+
+    # Store errors
+    error = Data()
+    error.climb_time   = np.abs(climb_time   - climb_time_truth)/climb_time_truth
+    error.descent_mass = np.abs(descent_mass - descent_mass_truth)/descent_mass_truth
+
+    print('Errors:')
+    print(error)
+
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Evaluate the Mission
+# ----------------------------------------------------------------------
+
+def evaluate_mission(time_marching_control_points):
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+
+    configs_analyses = analyses_setup(configs)
+
+    analyses = SUAVE.Analyses.Analysis.Container()
+    analyses.configs = configs_analyses
+
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    configs_analyses.finalize()
+
+    mission = mission_setup(configs_analyses,time_marching_control_points)
+    results = mission.evaluate()
+
+    return results
+
+# ----------------------------------------------------------------------
+#   Define the Mission
+# ----------------------------------------------------------------------
+
+def mission_setup(analyses,time_marching_control_points):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+
+    mission = SUAVE.Analyses.Mission.Sequential_Segments()
+    mission.tag = 'the_mission'
+
+    #airport
+    airport = SUAVE.Attributes.Airports.Airport()
+    airport.altitude   =  0.0  * Units.ft
+    airport.delta_isa  =  0.0
+    airport.atmosphere = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
+
+    mission.airport = airport
+
+    # unpack Segments module
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    # base segment, densely sampled
+    base_segment = Segments.Segment()
+    base_segment.state.numerics.number_control_points      = 31
+    base_segment.settings.time_marching_control_points     = time_marching_control_points
+
+    # ------------------------------------------------------------------
+    #   Climb : Constant Throttle Constant Speed
+    # ------------------------------------------------------------------
+
+    segment = Segments.Climb.Constant_Throttle_Constant_Speed(base_segment)
+    segment.tag = "climb"
+
+    segment.analyses.extend( analyses.takeoff )
+    segment.altitude_start = 35.   * Units.fts
+    segment.altitude_end   = 3.0   * Units.km
+    segment.air_speed      = 150.  * Units.knots
+    segment.throttle       = 1.0
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Cruise : Constant Speed Constant Altitude
+    # ------------------------------------------------------------------
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+
+    segment.analyses.extend( analyses.cruise )
+    segment.air_speed  = 200.  * Units['m/s']
+    segment.distance   = 200.  * Units.km
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Descent : Constant Speed Constant Rate
+    # ------------------------------------------------------------------
+
+    segment = Segments.Descent.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "descent"
+
+    segment.analyses.extend( analyses.landing )
+    segment.altitude_end = 0.5   * Units.km
+    segment.air_speed    = 150.  * Units['m/s']
+    segment.descent_rate = 5.0   * Units['m/s']
+
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
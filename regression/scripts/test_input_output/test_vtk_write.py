@@ -0,0 +1,215 @@
+# test_vtk_write.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression for the legacy ascii, legacy binary and xml VTK writers of a rotor wake evolution"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Input_Output.VTK.store_wake_evolution_vtks import store_wake_evolution_vtks
+from SUAVE.Input_Output.VTK.save_vehicle_vtk import save_vehicle_vtks
+
+import numpy as np
+import xml.etree.ElementTree as ET
+import shutil
+import time
+import os
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../slipstream')
+sys.path.append('../Vehicles/Propellers')
+
+from Boeing_737 import vehicle_setup as b737_setup
+from propeller_interactions import vehicle_setup, simulation_conditions
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # rotor with a converged wake
+    vehicle = vehicle_setup()
+    prop    = vehicle.networks.prop_net.propeller
+    prop.Wake.wake_settings.number_rotor_rotations    = 1
+    prop.Wake.wake_settings.number_steps_per_rotation = 24
+    conditions  = simulation_conditions(prop)
+    prop.origin = np.array([[0.,0.,0.]])
+    prop.spin(conditions)
+
+    b737 = b737_setup()
+
+    sizes = Data()
+    grids = Data()
+    for file_format in ['ascii','binary','xml']:
+        save_loc = 'wake_vtks_' + file_format + '/'
+        if os.path.exists(save_loc):
+            shutil.rmtree(save_loc)
+
+        ti = time.time()
+        store_wake_evolution_vtks(prop.Wake,prop,save_loc=save_loc,file_format=file_format)
+        files = save_vehicle_vtks(b737,save_loc=save_loc,file_format=file_format)
+        print(file_format + ' write time : ' + str(time.time()-ti))
+
+        # every file of each time step is in the collection
+        collection = ET.parse(save_loc + 'wake_evolution.pvd').getroot()
+        datasets   = collection.findall('Collection/DataSet')
+        assert len(datasets) == 24*6
+        extension  = '.vtu' if file_format == 'xml' else '.vtk'
+        for dataset in datasets:
+            assert dataset.get('file').endswith(extension)
+            assert os.path.exists(save_loc + dataset.get('file'))
+        assert len(files) == 8
+
+        grids[file_format] = [read_vtk(save_loc + dataset.get('file')) for dataset in datasets] + [read_vtk(file) for file in files]
+        sizes[file_format] = sum([os.path.getsize(save_loc + f) for f in os.listdir(save_loc)])
+        shutil.rmtree(save_loc)
+
+    # the binary and xml files hold the ascii data in single precision
+    for file_format in ['binary','xml']:
+        for ascii_grid, grid in zip(grids.ascii,grids[file_format]):
+            assert np.allclose(ascii_grid.points,grid.points,rtol=1e-6,atol=1e-6)
+            assert np.all(ascii_grid.cells == grid.cells)
+            assert np.all(ascii_grid.cell_types == grid.cell_types)
+            for data in ['cell_data','point_data']:
+                assert list(ascii_grid[data].keys()) == list(grid[data].keys())
+                for name in ascii_grid[data].keys():
+                    assert np.allclose(ascii_grid[data][name],grid[data][name],rtol=1e-6,atol=1e-6)
+        print(file_format + ' size relative to ascii : ' + str(sizes[file_format]/sizes.ascii))
+        assert sizes[file_format] < 0.75*sizes.ascii
+
+    # Extract sample values from computation
+    wake       = grids.ascii[2]
+    n_cells    = len(wake.cells)
+    gamma_sum  = np.sum(wake.cell_data.gamma)
+    wing       = np.concatenate([grids.ascii[-8].points,grids.ascii[-7].points])
+    wing_span  = np.max(wing[:,1]) - np.min(wing[:,1])
+    print(n_cells)
+    print(gamma_sum)
+    print(wing_span)
+
+    # Truth values
+    n_cells_truth   = 768
+    gamma_sum_truth = 331.80915439631565
+    wing_span_truth = 34.32
+
+    # Store errors
+    error = Data()
+    error.gamma_sum  = np.abs(gamma_sum - gamma_sum_truth)/gamma_sum_truth
+    error.wing_span  = np.abs(wing_span - wing_span_truth)/wing_span_truth
+
+    print('Errors:')
+    print(error)
+
+    assert n_cells == n_cells_truth
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   VTK Readers
+# ----------------------------------------------------------------------
+
+def read_vtk(filename):
+    """Reads an unstructured grid written by the SUAVE VTK writers"""
+
+    if filename.endswith('.vtu'):
+        return read_vtu(filename)
+
+    with open(filename,'rb') as f:
+        content = f.read()
+    if content.split(b'\n')[2].strip() == b'ASCII':
+        return read_legacy(content,binary=False)
+    return read_legacy(content,binary=True)
+
+def read_legacy(content,binary):
+    """Reads a legacy ascii or binary VTK file of a single cell type"""
+
+    grid            = Data()
+    grid.cell_data  = Data()
+    grid.point_data = Data()
+
+    position = 0
+    def next_line():
+        nonlocal position
+        while position < len(content):
+            end  = content.find(b'\n',position)
+            end  = len(content) if end < 0 else end
+            line = content[position:end].decode().strip()
+            position = end + 1
+            if line:
+                return line.split()
+        return None
+
+    def next_values(n,dtype):
+        nonlocal position
+        if binary:
+            values    = np.frombuffer(content[position:position+4*n],dtype=dtype)
+            position += 4*n
+            return values.astype(float if dtype[-2] == 'f' else int)
+        values = []
+        while len(values) < n:
+            values += next_line()
+        return np.array(values,dtype=float)
+
+    data = None
+    for i in range(4):
+        next_line()
+    line = next_line()
+    while line is not None:
+        if line[0] == 'POINTS':
+            grid.points = next_values(3*int(line[1]),'>f4').reshape(-1,3)
+        elif line[0] == 'CELLS':
+            cells      = next_values(int(line[2]),'>i4').astype(int).reshape(int(line[1]),-1)
+            grid.cells = cells[:,1:]
+        elif line[0] == 'CELL_TYPES':
+            grid.cell_types = next_values(int(line[1]),'>i4').astype(int)
+        elif line[0] in ['CELL_DATA','POINT_DATA']:
+            data = grid.cell_data if line[0] == 'CELL_DATA' else grid.point_data
+            n    = int(line[1])
+        elif line[0] == 'SCALARS':
+            next_line() # lookup table
+            data[line[1]] = next_values(n,'>f4')
+        line = next_line()
+
+    return grid
+
+def read_vtu(filename):
+    """Reads an xml VTK file with raw appended data"""
+
+    with open(filename,'rb') as f:
+        content = f.read()
+    start    = content.index(b'<AppendedData encoding="raw">')
+    appended = content[content.index(b'_',start)+1:]
+    root     = ET.fromstring(content[:start].decode() + '</VTKFile>')
+
+    def array(element):
+        offset = int(element.get('offset'))
+        size   = int(np.frombuffer(appended[offset:offset+8],dtype='<u8')[0])
+        dtype  = {'Float32':'<f4','Int64':'<i8','UInt8':'u1'}[element.get('type')]
+        return np.frombuffer(appended[offset+8:offset+8+size],dtype=dtype)
+
+    piece           = root.find('UnstructuredGrid/Piece')
+    grid            = Data()
+    grid.points     = array(piece.find('Points/DataArray')).reshape(-1,3).astype(float)
+    cells           = Data()
+    for element in piece.findall('Cells/DataArray'):
+        cells[element.get('Name')] = array(element)
+    grid.cells      = cells.connectivity.reshape(len(cells.offsets),-1).astype(int)
+    grid.cell_types = cells.types.astype(int)
+    grid.cell_data  = Data()
+    grid.point_data = Data()
+    for tag, data in [('CellData',grid.cell_data),('PointData',grid.point_data)]:
+        for element in piece.findall(tag + '/DataArray'):
+            data[element.get('Name')] = array(element).astype(float)
+
+    return grid
+
+if __name__ == '__main__':
+    main()
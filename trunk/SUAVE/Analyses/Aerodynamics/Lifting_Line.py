@@ -4,6 +4,7 @@
 # Created:  Aug 2017, E. Botero
 #           Apr 2020, M. Clarke
 #           Jun 2021, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,7 @@
 import numpy as np
 from SUAVE.Core import Data, Units
 from SUAVE.Methods.Aerodynamics.Lifting_Line import lifting_line as LL
+from SUAVE.Methods.Aerodynamics.Lifting_Line import lifting_line_system
 from .Aerodynamics import Aerodynamics
 
 # ----------------------------------------------------------------------
@@ -70,6 +72,9 @@ class Lifting_Line(Aerodynamics):
         self.surrogates = Data()
         self.surrogates.lift_coefficient = None
         self.surrogates.drag_coefficient = None
+        
+        # spanwise systems of the wings, solved once per initialization
+        self.wing_systems = Data()
  
         
     def initialize(self,use_surrogate,n_sw,n_cw ,propeller_wake_model,mf,mn ,dcs):
@@ -95,6 +100,12 @@ class Lifting_Line(Aerodynamics):
         if n_sw is not None:
             settings.number_of_stations  = n_sw
             
+        # the geometry may have changed since the last initialization
+        self.wing_systems = Data()
+        for wing in self.geometry.wings.values():
+            if not wing.vertical:
+                self.wing_systems[wing.tag] = lifting_line_system(settings,wing)
+            
         # sample training data
         self.sample_training()
                     
@@ -197,6 +208,7 @@ class Lifting_Line(Aerodynamics):
         self.geometry.wings.*.tag
         self.settings                 (passed to calculate vortex lattice)
         self.training.angle_of_attack [radians]
+        self.wing_systems             (passed to the lifting line)
         """        
         # unpack
         geometry = self.geometry
@@ -204,27 +216,14 @@ class Lifting_Line(Aerodynamics):
         training = self.training
         
         AoA = training.angle_of_attack
-        CL  = np.zeros_like(AoA)
-        CDi = np.zeros_like(AoA)
         
-        wing_CLs = Data.fromkeys(geometry.wings.keys(), np.zeros_like(AoA))
-        wing_CDis = Data.fromkeys(geometry.wings.keys(), np.zeros_like(AoA)) 
-
         # condition input, local, do not keep
         konditions              = Data()
         konditions.aerodynamics = Data()
+        konditions.aerodynamics.angle_of_attack = AoA
 
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
-            
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i], wing_lifts , CDi[i], wing_drags  = calculate_lift_lifting_line(konditions, settings, geometry)
-            for wing in geometry.wings.values():
-                wing_CLs[wing.tag][i] = wing_lifts[wing.tag]
-                wing_CDis[wing.tag][i] = wing_drags[wing.tag]
+        # calculate aerodynamics for the whole table at once
+        CL, wing_CLs , CDi, wing_CDis = calculate_lift_lifting_line(konditions, settings, geometry, self.wing_systems)
 
         # store training data
         training.lift_coefficient       = CL
@@ -281,7 +280,7 @@ class Lifting_Line(Aerodynamics):
         
         for wing in wing_CL_data.keys():
             wing_cl_surrogates[wing]  = np.poly1d(np.polyfit(X_data, wing_CL_data[wing] ,1))
-            wing_cdi_surrogates[wing] = np.poly1d(np.polyfit(X_data, wing_CL_data[wing] ,2))
+            wing_cdi_surrogates[wing] = np.poly1d(np.polyfit(X_data, wing_CDi_data[wing] ,2))
 
         self.surrogates.lift_coefficient       = cl_surrogate
         self.surrogates.drag_coefficient       = cdi_surrogate
@@ -297,9 +296,9 @@ class Lifting_Line(Aerodynamics):
 # ----------------------------------------------------------------------
 
 
-def calculate_lift_lifting_line(conditions,settings,geometry):
+def calculate_lift_lifting_line(conditions,settings,geometry,wing_systems=None):
     """Calculate the total vehicle lift coefficient and specific wing coefficients (with specific wing reference areas)
-    using a vortex lattice method.
+    using a lifting line method.
 
     Assumptions:
     None
@@ -308,13 +307,17 @@ def calculate_lift_lifting_line(conditions,settings,geometry):
     N/A
 
     Inputs:
-    conditions                      (passed to vortex lattice method)
-    settings                        (passed to vortex lattice method)
+    conditions                      (passed to lifting line method)
+    settings                        (passed to lifting line method)
     geometry.reference_area         [m^2]
-    geometry.wings.*.reference_area (each wing is also passed to the vortex lattice method)
+    geometry.wings.*.reference_area (each wing is also passed to the lifting line method)
+    wing_systems                    (optional) lifting line systems by wing tag
 
     Outputs:
-    
+    total_lift_coeff                [-] one entry per angle of attack
+    wing_lifts                      [-] (wing specific)
+    total_drag_coeff                [-] one entry per angle of attack
+    wing_drags                      [-] (wing specific)
 
     Properties Used:
     
@@ -322,6 +325,8 @@ def calculate_lift_lifting_line(conditions,settings,geometry):
 
     # unpack
     vehicle_reference_area = geometry.reference_area
+    if wing_systems is None:
+        wing_systems = Data()
 
     # iterate over wings
     total_lift_coeff = 0.0
@@ -330,7 +335,8 @@ def calculate_lift_lifting_line(conditions,settings,geometry):
     wing_drags = Data()
     for wing in geometry.wings.values():
 
-        [wing_lift_coeff,wing_drag_coeff] = LL(conditions,settings,wing)
+        system = wing_systems.get(wing.tag,None)
+        [wing_lift_coeff,wing_drag_coeff] = LL(conditions,settings,wing,system)
         total_lift_coeff += wing_lift_coeff * wing.areas.reference / vehicle_reference_area
         total_drag_coeff += wing_drag_coeff * wing.areas.reference / vehicle_reference_area
         wing_lifts[wing.tag] = wing_lift_coeff
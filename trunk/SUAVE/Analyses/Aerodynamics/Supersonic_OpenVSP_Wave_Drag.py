@@ -5,6 +5,7 @@
 # Modified: Apr 2017, T. MacDonald
 #           Apr 2019, T. MacDonald
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -70,6 +71,9 @@ class Supersonic_OpenVSP_Wave_Drag(Markup):
         settings.maximum_lift_coefficient           = np.inf
         settings.number_slices                      = 20
         settings.number_rotations                   = 10
+        # 'OpenVSP' runs the OpenVSP wave drag analysis, 'Equivalent_Area' uses the native
+        # area rule method and does not need OpenVSP or the volume drag data files
+        settings.volume_wave_drag_engine            = 'OpenVSP'
         
         # vortex lattice configurations
         settings.number_spanwise_vortices = 5
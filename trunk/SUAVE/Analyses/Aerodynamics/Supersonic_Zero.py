@@ -6,6 +6,7 @@
 #           Apr 2019, T. MacDonald
 #           Apr 2020, M. Clarke
 #           Jun 2021, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -89,6 +90,8 @@ class Supersonic_Zero(Markup):
         # be used
         # 'OpenVSP' is a desired future possibility. This would allow the cross sectional area to vary with Mach number, but is 
         # much more computationally intensive.     
+        # 'Raymer' and 'Sears-Haack' scale an ideal body by the maximum cross sectional area, 'Equivalent_Area'
+        # applies the supersonic area rule to the vehicle geometry
         settings.wave_drag_type              = 'Raymer'
         settings.volume_wave_drag_scaling    = 3.2 # 1.8-2.2 are given as typical for an SST, but 3.2 was found to be more accurate 
         # This may be due to added propulsion effects
@@ -158,5 +161,8 @@ class Supersonic_Zero(Markup):
 
         self.process.compute.lift.inviscid_wings.geometry = self.geometry 
         self.process.compute.lift.inviscid_wings.initialize(use_surrogate,n_sw,n_cw,propeller_wake_model,mf,mn,dcs)
+        
+        # wing properties for the compressibility drag of this configuration
+        self.settings.wing_compressibility_table = Methods.Drag.wing_compressibility_table(self.geometry)
                 
     finalize = initialize        
@@ -13,6 +13,7 @@
 #           May 2021, E. Botero
 #           Jun 2021, R. Erhard
 #           Nov 2022, D. Enriquez
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -83,6 +84,7 @@ class Vortex_Lattice(Aerodynamics):
         self.settings.leading_edge_suction_multiplier = 1.0
         self.settings.propeller_wake_model            = False
         self.settings.discretize_control_surfaces     = False
+        self.settings.linearized_control_surfaces     = False
         self.settings.use_VORLAX_matrix_calculation   = False
         self.settings.floating_point_precision        = np.float32
         self.settings.use_surrogate                   = True
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -70,3 +71,8 @@ class All_At_Once(Mission):
         self.process.iterate.unpack                   = Methods.Segments.Common.Sub_Segments.unpack_subsegments
         self.process.iterate.sub_segments             = Methods.Segments.Common.Sub_Segments.update_sub_segments
         self.process.iterate.merge_sub_segment_states = Methods.Segments.Common.Sub_Segments.merge_sub_segment_states
+
+        # --------------------------------------------------------------
+        #   Finalize
+        # --------------------------------------------------------------        
+        self.process.finalize.stream_sub_segments     = Methods.Segments.Common.Sub_Segments.stream_sub_segments
@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Sep 2016, E. Botero
 #           Oct 2021, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -51,6 +52,9 @@ class Segment(Analysis):
         """          
         
         self.settings = Settings()
+        self.settings.time_marching_control_points      = None # control points of each time marching sub-interval, None to solve all points at once
+        self.settings.adaptive_control_points_tolerance = None # truncation error of the unknowns, None to keep the number of control points fixed
+        self.settings.maximum_control_points            = 65   # limit of the adaptive refinement
         
         self.state = State()
 
@@ -251,6 +255,8 @@ class Container(Segment):
         self.segments = Process()
         
         self.state = State.Container()
+
+        self.settings.segment_store = None # SUAVE.Input_Output.SUAVE.Segment_Store that receives the finalized segments
         
     def append_segment(self,segment):
         """ Add a SubSegment
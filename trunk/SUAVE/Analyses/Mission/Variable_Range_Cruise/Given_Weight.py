@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -92,7 +93,8 @@ class Given_Weight(All_At_Once):
         # Run the Segments
         iterate.unpack                       = Methods.Segments.Common.Sub_Segments.unpack_subsegments
         iterate.sub_segments                 = Methods.Segments.Common.Sub_Segments.update_sub_segments
-        iterate.merge_sub_segment_states     = Methods.Segments.Common.Sub_Segments.merge_sub_segment_states
+        # only the residuals are merged while converging, the states are merged in finalize
+        iterate.merge_sub_segment_residuals  = Methods.Segments.Common.Sub_Segments.merge_sub_segment_residuals
         
         # Solve Residuals
         self.process.iterate.residual_weight = Methods.Segments.Cruise.Variable_Cruise_Distance.residual_landing_weight
@@ -102,4 +104,5 @@ class Given_Weight(All_At_Once):
         #   Finalize
         # --------------------------------------------------------------        
         self.process.finalize.sub_segments          = Methods.Segments.Common.Sub_Segments.finalize_sub_segments
+        self.process.finalize.merge_sub_segment_states = Methods.Segments.Common.Sub_Segments.merge_sub_segment_states
         
\ No newline at end of file
@@ -6,6 +6,7 @@
 # Modified: Apr 2021, M. Clarke
 #           Jul 2021, E. Botero
 #           Feb 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -89,6 +90,9 @@ class Fidelity_One(Noise):
         settings.level_ground_microphone_max_y        = 450   # sideline microphone distance
         settings.level_ground_microphone_x_resolution = 5
         settings.level_ground_microphone_y_resolution = 5
+        settings.microphone_chunk_size                = None  # number of microphones per propeller noise evaluation, None for all 
+        settings.number_of_multiprocessing_workers    = 1
+        settings.record_chunk_peak_memory             = False # trace the peak memory of each microphone chunk
         settings.center_frequencies                   = np.array([16,20,25,31.5,40, 50, 63, 80, 100, 125, 160, 200, 250, 315, 400, \
                                                                   500, 630, 800, 1000, 1250, 1600, 2000, 2500, 3150,
                                                                   4000, 5000, 6300, 8000, 10000])        
@@ -3,12 +3,14 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core import ContainerOrdered, DataOrdered, Data
+import time
 
 # ----------------------------------------------------------------------
 #  Process
@@ -28,6 +30,9 @@ class Process(ContainerOrdered):
     """    
     
     verbose = False
+
+    # active Process_Profile, shared by all processes, None when not profiling
+    profile = None
     
     def evaluate(self,*args,**kwarg):
         """This is used to execute the evaluate functions of the analyses
@@ -49,6 +54,9 @@ class Process(ContainerOrdered):
                 N/A
             """        
         
+        if Process.profile is not None:
+            return self.evaluate_profiled(Process.profile,*args,**kwarg)
+
         results = Data()
         
         if self.verbose:
@@ -75,6 +83,109 @@ class Process(ContainerOrdered):
         
         return results
         
+    def evaluate_profiled(self,profile,*args,**kwarg):
+        """This executes the steps of the process like evaluate while recording the wall
+            time and number of calls of each step in the profile under its nested path.
+
+                Assumptions:
+                A process that is the process of the analysis it is evaluated on, such as
+                a mission segment, is recorded under the tag of that analysis.
+
+                Source:
+                N/A
+
+                Inputs:
+                profile     [Process_Profile]
+
+                Outputs:
+                Results of the Evaluate Functions
+
+                Properties Used:
+                N/A
+            """
+
+        results = Data()
+
+        if self.verbose:
+            print('process start')
+
+        analysis = args[0] if (len(args) > 0 and isinstance(args[0],dict)) else None
+        labeled  = (analysis is not None) and (analysis.get('process',None) is self)
+        if labeled:
+            profile.stack.append(str(analysis.get('tag','')))
+            t_start = time.perf_counter()
+
+        try:
+            for tag,step in self.items():
+
+                if self.verbose:
+                    print('step :' , tag)
+
+                profile.stack.append(tag)
+                t0 = time.perf_counter()
+                try:
+                    if hasattr(step,'evaluate'):
+                        result = step.evaluate(*args,**kwarg)
+                    else:
+                        result = step(*args,**kwarg)
+                finally:
+                    profile.record(time.perf_counter() - t0)
+
+                results[tag] = result
+        finally:
+            if labeled:
+                profile.record(time.perf_counter() - t_start)
+
+        if self.verbose:
+            print('process end')
+
+        return results
+
+    @staticmethod
+    def start_profile():
+        """Starts recording the steps of all processes in a new profile.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                profile     [Process_Profile]
+
+                Properties Used:
+                N/A
+            """
+        Process.profile = Process_Profile()
+        return Process.profile
+
+    @staticmethod
+    def stop_profile():
+        """Stops recording the steps of all processes.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                profile     [Process_Profile]
+
+                Properties Used:
+                N/A
+            """
+        profile         = Process.profile
+        Process.profile = None
+        return profile
+
     def __call__(self,*args,**kwarg):
         """This is used to set the class' call behavior to the evaluate functions.
         
@@ -93,5 +204,150 @@ class Process(ContainerOrdered):
                 Properties Used:
                 N/A
             """                        
-        return self.evaluate(*args,**kwarg) 
-    
+        return self.evaluate(*args,**kwarg)
+
+# ----------------------------------------------------------------------
+#  Process Profile
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses
+class Process_Profile(Data):
+    """ SUAVE.Analyses.Process_Profile()
+
+        Wall time and number of calls of the process steps, keyed by the path of step
+        tags joined with ';'. The time of a step includes the time of its nested steps.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        self.tag   = 'process_profile'
+        self.calls = Data()
+        self.times = Data()
+        self.stack = []
+
+    def record(self,elapsed_time):
+        """Adds a call of the innermost step on the stack and removes it from the stack.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                elapsed_time     [s]
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        path = ';'.join(self.stack)
+        self.stack.pop()
+        if path in self.times:
+            self.calls[path] += 1
+            self.times[path] += elapsed_time
+        else:
+            self.calls[path] = 1
+            self.times[path] = elapsed_time
+
+    def self_times(self):
+        """Computes the time spent in each step outside of its nested steps.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                None
+
+                Outputs:
+                self_times       [s]
+
+                Properties Used:
+                N/A
+            """
+        self_times = Data()
+        for path in self.times.keys():
+            self_times[path] = self.times[path]
+        for path in self.times.keys():
+            parent = path.rpartition(';')[0]
+            if parent in self_times:
+                self_times[parent] -= self.times[path]
+        for path in self_times.keys():
+            self_times[path] = max(self_times[path],0.)
+
+        return self_times
+
+    def write_folded_stacks(self,filename):
+        """Writes the profile in the folded stack format read by flame graph tools, one
+            line per step with its path and its self time in microseconds.
+
+                Assumptions:
+                None
+
+                Source:
+                Gregg, B., "The Flame Graph", Communications of the ACM, 2016
+
+                Inputs:
+                filename         [string]
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        self_times = self.self_times()
+        lines      = [path + ' ' + str(int(round(self_times[path]*1E6))) for path in self_times.keys()]
+        with open(filename,'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def print_summary(self,number_of_steps=20):
+        """Prints the steps with the largest total time.
+
+                Assumptions:
+                None
+
+                Source:
+                N/A
+
+                Inputs:
+                number_of_steps  [int]
+
+                Outputs:
+                None
+
+                Properties Used:
+                N/A
+            """
+        self_times = self.self_times()
+        paths      = sorted(self.times.keys(),key=lambda path: -self.times[path])[:number_of_steps]
+        print('{:>12} {:>12} {:>10}  {}'.format('total [s]','self [s]','calls','step'))
+        for path in paths:
+            print('{:12.4f} {:12.4f} {:10d}  {}'.format(self.times[path],self_times[path],self.calls[path],path))
@@ -5,6 +5,7 @@
 # Modified: Jan 2020, T. MacDonald
 #           May 2021, E. Botero
 #           Feb 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,7 @@
 from SUAVE.Core import Data
 from .Network   import Network
 from SUAVE.Methods.Utilities.Cubic_Spline_Blender import Cubic_Spline_Blender
+from SUAVE.Methods.Utilities.grid_interpolation   import Grid_Surrogate, resample_to_grid
 from SUAVE.Methods.Geometry.Three_Dimensional     import  orientation_product, orientation_transpose
 
 # package imports
@@ -79,6 +81,7 @@ class Propulsor_Surrogate(Network):
         self.use_extended_surrogate   = False
         self.sealevel_static_thrust   = 0.0
         self.negative_throttle_values = False
+        self.grid_resolution          = 20
    
     # manage process with a driver function
     def evaluate_thrust(self,state):
@@ -155,9 +158,13 @@ class Propulsor_Surrogate(Network):
             -Gaussian Processes
             -KNN
             -SVR
+            -Linear regression
+            -Linear or cubic interpolation on a grid ('grid_linear', 'grid_cubic')
             
             Assumptions:
-            None
+            Data that does not fill a regular grid is resampled onto one. Each grid axis
+            uses the unique data values, or grid_resolution evenly spaced points when 
+            there are more unique values than that.
             
             Source:
             N/A
@@ -229,6 +236,18 @@ class Propulsor_Surrogate(Network):
             sfc_surrogate  = regr_sfc.fit(xy, sfc)
             thr_surrogate  = regr_thr.fit(xy, thr)
             
+        elif self.surrogate_type in ['grid_linear','grid_cubic']:
+            axes = []
+            for d in range(xy.shape[1]):
+                axis = np.unique(xy[:,d])
+                if len(axis) > self.grid_resolution:
+                    axis = np.linspace(axis[0],axis[-1],self.grid_resolution)
+                axes.append(axis)
+            table         = resample_to_grid(xy, np.hstack([thr,sfc]), axes)
+            method        = self.surrogate_type.split('_')[1]
+            thr_surrogate = Grid_Surrogate(axes, table[...,0:1], method)
+            sfc_surrogate = Grid_Surrogate(axes, table[...,1:2], method)
+            
         else:
             raise NotImplementedError('Selected surrogate method has not been implemented')
        
@@ -8,6 +8,7 @@
 #           Oct 2017, E. Botero
 #           Nov 2018, T. MacDonald
 #           Apr 2021, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,10 +16,14 @@
 
 # package imports
 import numpy as np
+import tempfile
+import os
 
 from SUAVE.Core import Data
 from .Network import Network
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+from SUAVE.Methods.Utilities.grid_interpolation import grid_interpolation
+from SUAVE.Methods.Propulsion.turbofan_engine_deck import build_turbofan_engine_deck
 # ----------------------------------------------------------------------
 #  Turbofan Network
 # ----------------------------------------------------------------------
@@ -75,9 +80,48 @@ class Turbofan(Network):
         self.generative_design_char_min_bounds = [1000.,2.,0.1,0.,-0.7,-0.7]   
         self.generative_design_char_max_bounds = [np.inf,2,np.inf,0.7,0.7,0.7]    
         
-    # linking the different network components
+        # tabulated evaluation of the cycle
+        self.use_engine_deck                             = False
+        self.engine_deck                                 = None
+        self.engine_deck_settings                        = Data()
+        self.engine_deck_settings.altitudes              = np.linspace(0.,14000.,15)
+        self.engine_deck_settings.mach_numbers           = np.linspace(0.01,0.96,20)
+        self.engine_deck_settings.throttles              = np.array([0.,1.])
+        self.engine_deck_settings.temperature_deviation  = 0.0
+        self.engine_deck_settings.cache_directory        = os.path.join(tempfile.gettempdir(),'SUAVE_engine_decks')
+        
     def evaluate_thrust(self,state):
-        """ Calculate thrust given the current state of the vehicle
+        """ Calculate thrust given the current state of the vehicle. The full cycle
+            is marched unless use_engine_deck is set, in which case the results are
+            interpolated from the engine deck.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            state [state()]
+    
+            Outputs:
+            results.thrust_force_vector [newtons]
+            results.vehicle_mass_rate   [kg/s]
+            conditions.noise.sources.turbofan [Conditions]
+    
+            Properties Used:
+            Defaulted values
+        """   
+        
+        if self.use_engine_deck:
+            return self.evaluate_engine_deck(state)
+        
+        return self.evaluate_cycle(state)
+        
+    # linking the different network components
+    def evaluate_cycle(self,state):
+        """ Calculate thrust given the current state of the vehicle by marching
+            through every component of the cycle
     
             Assumptions:
             None
@@ -297,6 +341,106 @@ class Turbofan(Network):
 
         return results
     
+    def build_engine_deck(self):
+        """ Tabulates the cycle over the altitude, Mach number and throttle grid in
+            engine_deck_settings. A deck already on disk for the same engine is reused.
+    
+            Assumptions:
+            The turbofan has been sized
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            self.engine_deck [Data]
+    
+            Properties Used:
+            self.engine_deck_settings
+        """          
+        
+        self.engine_deck = build_turbofan_engine_deck(self)
+        
+        return self.engine_deck
+    
+    def evaluate_engine_deck(self,state):
+        """ Calculate thrust given the current state of the vehicle by interpolating
+            the engine deck. The deck is built the first time it is needed.
+    
+            Assumptions:
+            The freestream matches the atmosphere used to build the deck
+            Thrust and fuel flow are linear in throttle, as in the cycle model
+    
+            Source:
+            N/A
+    
+            Inputs:
+            state [state()]
+    
+            Outputs:
+            results.thrust_force_vector [newtons]
+            results.vehicle_mass_rate   [kg/s]
+            conditions.noise.sources.turbofan [Conditions]
+    
+            Properties Used:
+            self.engine_deck
+        """         
+        
+        #Unpack
+        conditions = state.conditions
+        altitude   = conditions.freestream.altitude
+        mach       = conditions.freestream.mach_number
+        throttle   = conditions.propulsion.throttle
+        
+        deck = self.engine_deck
+        if deck is None:
+            deck = self.build_engine_deck()
+            
+        # interpolate every tabulated quantity at once
+        points = np.hstack([altitude*np.ones_like(throttle),mach*np.ones_like(throttle),throttle])
+        axes   = [deck.altitudes,deck.mach_numbers,deck.throttles]
+        values = grid_interpolation(axes,deck.table,points)
+        index  = deck.quantities.index
+        
+        def column(key):
+            return np.atleast_2d(values[:,index(key)]).T
+        
+        #getting the network outputs from the tabulated values
+        F            = conditions.ones_row(3) * 0.0
+        F[:,0]       = values[:,index('thrust')]
+        mdot         = np.fmax(column('fuel_flow_rate'),0.)
+        y_rot        = conditions.ones_row(1) * 0.0
+        
+        results = Data()
+        results.thrust_force_vector        = F
+        results.vehicle_mass_rate          = mdot
+        results.network_y_axis_rotation    = y_rot
+        
+        # store data
+        core_outputs = Data(
+            exit_static_temperature             = column('core_exit_static_temperature'),
+            exit_static_pressure                = column('core_exit_static_pressure'),
+            exit_stagnation_temperature         = column('core_exit_stagnation_temperature'),
+            exit_stagnation_pressure            = column('core_exit_static_pressure'),
+            exit_velocity                       = column('core_exit_velocity')
+            )
+        
+        fan_outputs = Data(
+            exit_static_temperature             = column('fan_exit_static_temperature'),
+            exit_static_pressure                = column('fan_exit_static_pressure'),
+            exit_stagnation_temperature         = column('fan_exit_stagnation_temperature'),
+            exit_stagnation_pressure            = column('fan_exit_static_pressure'),
+            exit_velocity                       = column('fan_exit_velocity')
+            )
+        
+        conditions.noise.sources.turbofan       = Conditions()        
+        conditions.noise.sources.turbofan.fan   = fan_outputs
+        conditions.noise.sources.turbofan.core  = core_outputs
+        
+        return results
+    
     def size(self,state):  
         """ Size the turbofan
     
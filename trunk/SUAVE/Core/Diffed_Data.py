@@ -4,6 +4,7 @@
 # Created:  Feb 2015, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
 #           Jun 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,6 +16,9 @@ from .Data import Data
 from .DataOrdered import DataOrdered
 import numpy as np
 
+# values that are shared between a copy and its original
+immutable_types = (str, bytes, int, float, complex, bool, type(None), np.generic, type)
+
 # ----------------------------------------------------------------------
 #  Config
 # ----------------------------------------------------------------------
@@ -55,10 +59,11 @@ class Diffed_Data(Data):
         self._diff  = Data()
         
     def __init__(self,base=None):
-        """ Initializes the new Diffed_Data() class through a deepcopy
+        """ Initializes the new Diffed_Data() class through a copy of the base
     
             Assumptions:
-            N/A
+            Arrays, lists and other mutable values are copied, numbers and strings
+            are shared with the base.
     
             Source:
             N/A
@@ -74,8 +79,7 @@ class Diffed_Data(Data):
         """  
         if base is None: base = Data()
         self._base = base
-        this = deepcopy(base) # deepcopy is needed here to build configs - Feb 2016, T. MacDonald
-        Data.__init__(self,this)
+        update_tree(self,base) # configs need their own copy, changing it in place leaves the base unchanged
         
     def store_diff(self):
         """ Finds the differences and saves them
@@ -102,7 +106,8 @@ class Diffed_Data(Data):
         """ Updates the differences
     
             Assumptions:
-            N/A
+            Values that this copy already holds, the same object or an equal array or list,
+            are kept. All other values are copied from the base and the diff.
     
             Source:
             N/A
@@ -118,8 +123,8 @@ class Diffed_Data(Data):
         """          
         try: self._base.pull_base()
         except AttributeError: pass
-        self.update(self._base)
-        self.update(self._diff)
+        update_tree(self,self._base)
+        update_tree(self,self._diff)
     
     def __str__(self,indent=''):
         """ This function is used for printing the class.
@@ -312,13 +317,22 @@ def diff(A,B):
         keys.remove('_base')
         keys.remove('_diff')
 
-    result = type(A)()
-    result.clear()
+    if isinstance(A,Data):
+        # empty container of the same type, the class defaults would be cleared anyway
+        result = dict.__new__(type(A))
+    else:
+        result = type(A)()
+        result.clear()
 
+    get_A = A.get
+    get_B = B.get
     for key in keys:
-        va = A.get(key,None)
-        vb = B.get(key,None)
-        if isinstance(va,Data) and isinstance(vb,Data):
+        va = get_A(key,None)
+        vb = get_B(key,None)
+        if va is vb:
+            continue
+        
+        elif isinstance(va,Data) and isinstance(vb,Data):
             sub_diff = diff(va,vb)
             if sub_diff:
                 result[key] = sub_diff
@@ -337,4 +351,144 @@ def diff(A,B):
         elif not np.all(va == vb):
             result[key] = va
 
-    return result    
\ No newline at end of file
+    return result
+
+# ------------------------------------------------------------
+#  Copying and Updating Functions
+# ------------------------------------------------------------
+
+def copy_tree(data,memo=None):
+    """ Copies a tree of Data. The Data and DataOrdered containers are copied without
+        filling in their class defaults, arrays are copied directly and other mutable
+        values are deep copied. Numbers and strings are shared with the original.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        data
+        memo       copies of the values already visited, keeps shared references shared
+
+        Outputs:
+        result
+
+        Properties Used:
+        N/A    
+    """  
+    if memo is None:
+        memo = {}
+    if id(data) in memo:
+        return memo[id(data)]
+
+    if isinstance(data,immutable_types):
+        result = data
+
+    elif isinstance(data,Data):
+        # build the container without filling in the class defaults, they are overwritten anyway
+        result = dict.__new__(type(data))
+        memo[id(data)] = result
+        result.__dict__.update(vars(data))
+        for key, value in dict.items(data):
+            dict.__setitem__(result,key,copy_tree(value,memo))
+
+    elif isinstance(data,DataOrdered):
+        reconstructor, args, state = data.__reduce__()
+        items  = [(key, copy_tree(value,memo)) for key, value in args[1]]
+        result = reconstructor(args[0],items)
+        result.__dict__.update([(key, copy_tree(value,memo)) for key, value in state.items()])
+        memo[id(data)] = result
+
+    elif isinstance(data,list) and any([isinstance(value,(Data,DataOrdered)) for value in data]):
+        result = [copy_tree(value,memo) for value in data]
+        memo[id(data)] = result
+
+    elif isinstance(data,np.ndarray) and data.dtype != object:
+        result = data.copy()
+        memo[id(data)] = result
+
+    else:
+        result = deepcopy(data,memo)
+
+    return result
+
+def update_tree(A,B,memo=None):
+    """ Updates A with the values of B like Data.update, the values of B are copied
+        into A. Values that A already holds, the same object or an equal array or list,
+        are kept, so A never shares a mutable value with B.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        A
+        B
+        memo       containers of A that receive the containers of B, see copy_tree
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A    
+    """  
+    if memo is None:
+        memo = {}
+    memo[id(B)] = A
+
+    # bound once, attribute lookups on Data try the keys first
+    get     = A.get
+    missing = object()
+    for key, vb in B.items():
+        if key.startswith('_'):
+            continue
+
+        va = get(key,missing)
+        if va is vb or same_value(va,vb):
+            continue
+
+        elif isinstance(va,(Data,DataOrdered)) and isinstance(vb,dict):
+            update_tree(va,vb,memo)
+
+        else:
+            A[key] = copy_tree(vb,memo)
+
+    return
+
+def same_value(A,B):
+    """ Checks if A is an array or a list that is equal to B.
+
+        Assumptions:
+        Arrays holding NaN are never equal.
+
+        Source:
+        N/A
+
+        Inputs:
+        A
+        B
+
+        Outputs:
+        result     [boolean]
+
+        Properties Used:
+        N/A    
+    """  
+    if type(A) is not type(B):
+        return False
+
+    if isinstance(A,np.ndarray):
+        return A.dtype == B.dtype and A.dtype != object and A.shape == B.shape and np.array_equal(A,B)
+
+    elif isinstance(A,list):
+        try:
+            return bool(A == B)
+        except ValueError:
+            # lists of arrays
+            return False
+
+    return False
@@ -2,6 +2,7 @@
 # Utilities.py
 #
 # Created:  Oct 2022, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -18,9 +19,11 @@ def interp2d(x,y,xp,yp,zp,fill_value= None):
         xp, yp: 1D arrays of points specifying grid points where function values
             are provided.
         zp: 2D array of function values. For a function `f(x, y)` this must
-            satisfy `zp[i, j] = f(xp[i], yp[j])`
+            satisfy `zp[i, j] = f(xp[i], yp[j])`. Any trailing dimensions of
+            `zp` are stacked tables that are interpolated together.
     Returns:
-        1D array `z` satisfying `z[i] = f(x[i], y[i])`.
+        1D array `z` satisfying `z[i] = f(x[i], y[i])`, followed by the trailing
+        dimensions of `zp`.
     """
     #if xp.ndim != 1 or yp.ndim != 1:
         #raise ValueError("xp and yp must be 1D arrays")
@@ -36,6 +39,14 @@ def interp2d(x,y,xp,yp,zp,fill_value= None):
     z_12 = zp[ix - 1, iy]
     z_22 = zp[ix, iy]
 
+    # the weights broadcast against the trailing dimensions of stacked tables
+    if np.ndim(zp) > 2:
+        trailing = (1,)*(np.ndim(zp) - 2)
+        x        = np.reshape(x,np.shape(x) + trailing)
+        y        = np.reshape(y,np.shape(y) + trailing)
+        ix       = np.reshape(ix,np.shape(ix) + trailing)
+        iy       = np.reshape(iy,np.shape(iy) + trailing)
+
     z_xy1 = (xp[ix] - x) / (xp[ix] - xp[ix - 1]) * z_11 + (x - xp[ix - 1]) / (
         xp[ix] - xp[ix - 1]
     ) * z_21
@@ -2,4 +2,5 @@
 # Functions needed to save SUAVE data structures in JSON form
 # @ingroup Input_Output
 from .load import load
-from .archive import archive
\ No newline at end of file
+from .archive import archive
+from .segment_store import Segment_Store, load_segment_store
\ No newline at end of file
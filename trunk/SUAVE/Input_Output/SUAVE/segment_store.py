@@ -0,0 +1,337 @@
+## @ingroup Input_Output-SUAVE
+# segment_store.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data, DataOrdered
+import numpy as np
+
+import os
+import json
+import struct
+import tempfile
+
+# ----------------------------------------------------------------------
+#  Segment Store
+# ----------------------------------------------------------------------
+
+# header of a segment file: magic, length of the json header
+_magic     = b'SUAVESEG'
+_alignment = 64
+
+## @ingroup Input_Output-SUAVE
+class Segment_Store(Data):
+    """Writes the conditions of each segment of a mission to disk as soon as they are
+    final, one binary file per segment. The in-memory arrays of a written segment can be
+    released, they are then replaced by copy-on-write views of the file that the
+    operating system pages in when they are read.
+
+    Assumptions:
+    Only numerical arrays are moved to disk, other values stay in memory. Sequential
+    missions write a segment once the next segment is evaluated, all at once missions
+    write every segment after convergence.
+
+    Source:
+    N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.tag                = 'segment_store'
+        self.directory          = None  # created in the temporary directory on the first write
+        self.release_conditions = False # replace the arrays of written segments by views of their files
+
+    def write(self,mission_tag,index,segment):
+        """Writes the conditions of a finalized segment and releases them if requested.
+        A segment that was written before is overwritten.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        mission_tag   tag of the mission the segment belongs to    [string]
+        index         position of the segment in the mission       [int]
+        segment       finalized segment                            [Segment]
+
+        Outputs:
+        filename      file holding the segment conditions          [string]
+
+        Properties Used:
+        self.directory
+        self.release_conditions
+        """
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix='SUAVE_segments_')
+
+        directory = os.path.join(self.directory,mission_tag)
+        if not os.path.isdir(directory):
+            os.makedirs(directory,exist_ok=True)
+
+        filename = os.path.join(directory,'{:04d}_{}.seg'.format(index,segment.tag))
+        write_segment_conditions(filename,segment.tag,segment.state.conditions)
+
+        if self.release_conditions:
+            release_segment_conditions(filename,segment.state.conditions)
+
+        return filename
+
+    def release(self,results):
+        """Replaces the arrays of all written segments of a mission by views of their files.
+
+        Assumptions:
+        The segments were written by this store and are unchanged since.
+
+        Source:
+        N/A
+
+        Inputs:
+        results       evaluated mission                            [Segment]
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.directory
+        """
+        directory = os.path.join(self.directory,results.tag)
+        for index,(tag,segment) in enumerate(results.segments.items()):
+            filename = os.path.join(directory,'{:04d}_{}.seg'.format(index,segment.tag))
+            if os.path.isfile(filename):
+                release_segment_conditions(filename,segment.state.conditions)
+
+        return
+
+## @ingroup Input_Output-SUAVE
+def load_segment_store(directory,mission_tag=None):
+    """Reads the segments of a mission back from a segment store. The conditions are views
+    of the segment files, so nothing is read until it is accessed.
+
+    Assumptions:
+    Values that were not arrays are restored if they are numbers, strings or None.
+
+    Source:
+    N/A
+
+    Inputs:
+    directory     directory of the segment store                  [string]
+    mission_tag   tag of the mission, optional if only one mission was stored  [string]
+
+    Outputs:
+    results.segments[tag].conditions                              [Data]
+
+    Properties Used:
+    N/A
+    """
+    if mission_tag is None:
+        missions = sorted(os.listdir(directory))
+        if len(missions) != 1:
+            raise ValueError('Specify the mission tag, the store holds ' + str(missions))
+        mission_tag = missions[0]
+
+    directory        = os.path.join(directory,mission_tag)
+    results          = Data()
+    results.tag      = mission_tag
+    results.segments = DataOrdered()
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith('.seg'):
+            continue
+        header, buffer      = _map_segment_file(os.path.join(directory,file_name))
+        segment             = Data()
+        segment.tag         = header['tag']
+        segment.conditions  = Data()
+        for path in header['nodes']:
+            _set_path(segment.conditions,path,Data())
+        for path, value in header['values']:
+            _set_path(segment.conditions,path,value)
+        for path, dtype, shape, offset in header['arrays']:
+            _set_path(segment.conditions,path,_array_view(buffer,dtype,shape,offset))
+        results.segments[segment.tag] = segment
+
+    return results
+
+## @ingroup Input_Output-SUAVE
+def write_segment_conditions(filename,tag,conditions):
+    """Writes a conditions tree to a segment file: a json header describing the tree
+    followed by the aligned bytes of every array. The file is moved into place once
+    it is complete.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename      [string]
+    tag           segment tag                                     [string]
+    conditions    [Data]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    nodes  = []
+    values = []
+    arrays = []
+    _collect_leaves(conditions,[],nodes,values,arrays)
+
+    # lay out the arrays behind the header
+    entries = []
+    offset  = 0
+    for path, array in arrays:
+        entries.append([path,array.dtype.str,list(array.shape),offset])
+        offset = _align(offset + array.nbytes)
+    header = json.dumps(dict(tag=tag,nodes=nodes,values=values,arrays=entries)).encode()
+    start  = _align(len(_magic) + 8 + len(header))
+
+    directory         = os.path.dirname(os.path.abspath(filename))
+    handle, temp_file = tempfile.mkstemp(dir=directory,suffix='.tmp')
+    with os.fdopen(handle,'wb') as f:
+        f.write(_magic)
+        f.write(struct.pack('<Q',len(header)))
+        f.write(header)
+        f.write(b'\0'*(start - len(_magic) - 8 - len(header)))
+        position = 0
+        for (path, array), entry in zip(arrays,entries):
+            f.write(b'\0'*(entry[3] - position))
+            f.write(np.ascontiguousarray(array).tobytes())
+            position = entry[3] + array.nbytes
+        f.write(b'\0'*(offset - position))
+    os.replace(temp_file,filename)
+
+    return
+
+## @ingroup Input_Output-SUAVE
+def release_segment_conditions(filename,conditions):
+    """Replaces the arrays of a conditions tree by copy-on-write views of its segment file.
+    Changing a released array later only changes the copy in memory.
+
+    Assumptions:
+    The file was written from this conditions tree.
+
+    Source:
+    N/A
+
+    Inputs:
+    filename      [string]
+    conditions    [Data]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    header, buffer = _map_segment_file(filename)
+    for path, dtype, shape, offset in header['arrays']:
+        _set_path(conditions,path,_array_view(buffer,dtype,shape,offset))
+
+    return
+
+def _collect_leaves(data,path,nodes,values,arrays):
+    """Sorts the leaves of a conditions tree into the arrays that are written as bytes and
+    the values that are written in the header.
+
+    Assumptions:
+    Values that cannot be written to json are skipped.
+
+    Source:
+    N/A
+
+    Inputs:
+    data          [Data]
+    path          keys leading to data                            [list]
+
+    Outputs:
+    nodes         paths of the containers                         [list]
+    values        paths and values of the header leaves           [list]
+    arrays        paths and numerical arrays                      [list]
+
+    Properties Used:
+    N/A
+    """
+    for key, value in data.items():
+        key_path = path + [key]
+        if isinstance(value,dict):
+            nodes.append(key_path)
+            _collect_leaves(value,key_path,nodes,values,arrays)
+        elif isinstance(value,np.ndarray) and value.dtype.kind in 'biufc' and value.size > 0:
+            arrays.append((key_path,value))
+        elif isinstance(value,np.generic) and value.dtype.kind in 'biuf':
+            values.append([key_path,value.item()])
+        elif value is None or isinstance(value,(bool,int,float,str)):
+            values.append([key_path,value])
+
+    return
+
+def _map_segment_file(filename):
+    """Reads the header of a segment file and maps its contents copy-on-write.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename      [string]
+
+    Outputs:
+    header        [dict]
+    buffer        mapped file                                     [np.memmap]
+
+    Properties Used:
+    N/A
+    """
+    with open(filename,'rb') as f:
+        if f.read(len(_magic)) != _magic:
+            raise IOError(filename + ' is not a segment file')
+        length = struct.unpack('<Q',f.read(8))[0]
+        header = json.loads(f.read(length).decode())
+
+    header['start'] = _align(len(_magic) + 8 + length)
+    if len(header['arrays']):
+        buffer = np.memmap(filename,dtype=np.uint8,mode='c',offset=header['start'])
+    else:
+        buffer = None
+
+    return header, buffer
+
+def _array_view(buffer,dtype,shape,offset):
+    """Builds an array on the mapped bytes of a segment file."""
+    return np.ndarray(shape=tuple(shape),dtype=np.dtype(dtype),buffer=buffer,offset=offset)
+
+def _set_path(data,path,value):
+    """Sets a value in a tree of Data by its list of keys."""
+    for key in path[:-1]:
+        data = data[key]
+    data[path[-1]] = value
+
+def _align(position):
+    """Rounds a byte position up to the alignment of the arrays."""
+    return -(-position//_alignment)*_alignment
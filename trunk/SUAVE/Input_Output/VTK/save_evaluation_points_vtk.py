@@ -2,22 +2,26 @@
 # save_evaluation_points_vtk.py
 # 
 # Created:    Jun 2021, R. Erhard
-# Modified: 
+# Modified:   Oct 2026, SUAVE Team
 #           
+from SUAVE.Core import Data
+from SUAVE.Input_Output.VTK.write_unstructured_grid import write_unstructured_grid
+import numpy as np
 
 ## @ingroup Input_Output-VTK
-def save_evaluation_points_vtk(points,filename="eval_pts.vtk",time_step=0):
+def save_evaluation_points_vtk(points,filename="eval_pts.vtk",time_step=0,file_format='ascii'):
     """
-    Saves a SUAVE propeller wake as a VTK in legacy format.
+    Saves the points at which the induced velocities of a SUAVE propeller wake are evaluated
+    as a VTK in legacy or xml format.
 
     Inputs:
-       wVD           Vortex distribution of propeller wake          [Unitless]  
+       points        Evaluation points and induced velocities       [Unitless]  
        filename      Name of vtk file to save                       [Unitless]  
-       Results       Data structure of wing and propeller results   [Unitless]  
-       i_prop        ith propeller to evaluate wake of              [Unitless]
+       time_step     Simulation time step                           [Unitless]
+       file_format   'ascii', 'binary' or 'xml'                     [String]
        
     Outputs:                                   
-       N/A
+       file          Name of the file written                       [String]
 
     Properties Used:
        N/A 
@@ -52,66 +56,25 @@ def save_evaluation_points_vtk(points,filename="eval_pts.vtk",time_step=0):
     # Create file
     sep  = filename.rfind('.')
     file = filename[0:sep]+"."+str(time_step)+filename[sep:]
-    with open(file, 'w') as f:
-    
-        #---------------------
-        # Write header
-        #---------------------
-        header = ["# vtk DataFile Version 4.0" ,     # File version and identifier
-                  "\nEvaluation points " ,           # Title
-                  "\nASCII"              ,           # Data type
-                  "\nDATASET POLYDATA"             ] # Dataset structure / topology
-        f.writelines(header)   
-        
-        # --------------------
-        # Write Points
-        # --------------------   
-        n_pts = len(xp)    # total number of node vertices
-        points_header = "\n\nPOINTS "+str(n_pts) +" float"
-        f.write(points_header)
-        
-        for i in range(len(xp)):       
-            new_point = "\n"+str(xp[i])+" "+str(yp[i])+" "+str(zp[i])
-            f.write(new_point)                
-        
-        #--------------------------        
-        # Write Scalar Point Data:
-        #--------------------------
-        cell_data_header  = "\n\nPOINT_DATA "+str(n_pts)
-        f.write(cell_data_header)      
-        
-        # First scalar value
-        f.write("\nSCALARS i float")
-        f.write("\nLOOKUP_TABLE default")   
-        
-        for i in range(len(xp)):
-            f.write("\n"+str(i))      
-            
-        
-        if wake:
-            # Second scalar value
-            f.write("\nSCALARS vt float")
-            f.write("\nLOOKUP_TABLE default")   
-            
-            for i in range(len(xp)):
-                f.write("\n"+str(vt[i]))     
-            
-            # Third scalar value
-            f.write("\nSCALARS va float")
-            f.write("\nLOOKUP_TABLE default")   
-            
-            for i in range(len(xp)):
-                f.write("\n"+str(va[i]))     
-                
-            # Fourth scalar value
-            f.write("\nSCALARS vr float")
-            f.write("\nLOOKUP_TABLE default")   
-            
-            for i in range(len(xp)):
-                f.write("\n"+str(vr[i]))                  
-        
-                       
-    f.close()
-        
-        
-    return
\ No newline at end of file
+
+    # --------------------
+    # Points, each is a vertex cell
+    # --------------------
+    points = np.stack([xp,yp,zp],axis=-1)
+    n_pts  = len(points)    # total number of node vertices
+    cells  = np.arange(n_pts).reshape(-1,1)
+
+    #--------------------------
+    # Scalar Point Data:
+    #--------------------------
+    point_data   = Data()
+    point_data.i = np.arange(n_pts)
+
+    if wake:
+        point_data.vt = vt[:n_pts]
+        point_data.va = va[:n_pts]
+        point_data.vr = vr[:n_pts]
+
+    file = write_unstructured_grid(file, "Evaluation points ", points, cells, 1, point_data=point_data, file_format=file_format)
+
+    return file
@@ -2,14 +2,16 @@
 # save_fuselage_vtk.py
 #
 # Created:    Jun 2021, R. Erhard
-# Modified:
+# Modified:   Oct 2026, SUAVE Team
 #
 
 #------------------------------
 # Imports
 #------------------------------
 
-from SUAVE.Input_Output.VTK.write_azimuthal_cell_values import write_azimuthal_cell_values
+from SUAVE.Core import Data
+from SUAVE.Input_Output.VTK.write_azimuthal_cell_values import azimuthal_cell_values
+from SUAVE.Input_Output.VTK.write_unstructured_grid import write_unstructured_grid
 import numpy as np
 
 
@@ -17,17 +19,18 @@ import numpy as np
 # Fuselage VTK generation
 #------------------------------
 ## @ingroup Input_Output-VTK
-def save_fuselage_vtk(vehicle, filename, Results, origin_offset):
+def save_fuselage_vtk(vehicle, filename, Results, origin_offset, file_format='ascii'):
     """
-    Saves a SUAVE fuselage object as a VTK in legacy format.
+    Saves a SUAVE fuselage object as a VTK in legacy or xml format.
 
     Inputs:
        vehicle        Data structure of SUAVE vehicle                [Unitless]
        filename       Name of vtk file to save                       [String]
        Results        Data structure of wing and propeller results   [Unitless]
+       file_format    'ascii', 'binary' or 'xml'                     [String]
 
     Outputs:
-       N/A
+       files          Names of the files written                     [List]
 
     Properties Used:
        N/A
@@ -39,15 +42,16 @@ def save_fuselage_vtk(vehicle, filename, Results, origin_offset):
        None
 
     """
+    files = []
     for fuselage in vehicle.fuselages:
         fus_pts = generate_fuselage_points(fuselage)
         num_fus_segs = np.shape(fus_pts)[0]
         if num_fus_segs == 0:
             print("No fuselage segments found!")
         else:
-            write_fuselage_data(fus_pts,filename,origin_offset)
+            files.append(write_fuselage_data(fus_pts,filename,origin_offset,file_format))
 
-    return
+    return files
 
 ## @ingroup Input_Output-VTK
 def generate_fuselage_points(fus ,tessellation = 24 ):
@@ -86,16 +90,17 @@ def generate_fuselage_points(fus ,tessellation = 24 ):
 # Writing fuselage data
 #------------------------------
 ## @ingroup Input_Output-VTK
-def write_fuselage_data(fus_pts,filename,origin_offset):
+def write_fuselage_data(fus_pts,filename,origin_offset,file_format='ascii'):
     """
-    Writes data for a SUAVE fuselage object as a VTK in legacy format.
+    Writes data for a SUAVE fuselage object as a VTK in legacy or xml format.
 
     Inputs:
        fus_pts        Array of nodes making up the fuselage          [Unitless]
        filename       Name of vtk file to save                       [String]
+       file_format    'ascii', 'binary' or 'xml'                     [String]
 
     Outputs:
-       N/A
+       filename       Name of the file written                       [String]
 
     Properties Used:
        N/A
@@ -107,71 +112,25 @@ def write_fuselage_data(fus_pts,filename,origin_offset):
        None
 
     """
-    # Create file
-    with open(filename, 'w') as f:
-
-        #---------------------
-        # Write header
-        #---------------------
-        header = ["# vtk DataFile Version 4.0"  ,     # File version and identifier
-                  "\nSUAVE Model of Fuselage"   ,     # Title
-                  "\nASCII"                     ,     # Data type
-                  "\nDATASET UNSTRUCTURED_GRID" ]     # Dataset structure / topology
-
-        f.writelines(header)
-
-        #---------------------
-        # Write Points:
-        #---------------------
-        fuse_size = np.shape(fus_pts)
-        n_r       = fuse_size[0]
-        n_a       = fuse_size[1]
-        n_indices = (n_r)*(n_a)    # total number of cell vertices
-        points_header = "\n\nPOINTS "+str(n_indices) +" float"
-        f.write(points_header)
-
-        for r in range(n_r):
-            for a in range(n_a):
-
-                xp = round(fus_pts[r,a,0],4) + origin_offset[0]
-                yp = round(fus_pts[r,a,1],4) + origin_offset[1]
-                zp = round(fus_pts[r,a,2],4) + origin_offset[2]
-
-                new_point = "\n"+str(xp)+" "+str(yp)+" "+str(zp)
-                f.write(new_point)
-
-        #---------------------
-        # Write Cells:
-        #---------------------
-        n            = n_a*(n_r-1) # total number of cells
-        v_per_cell   = 4 # quad cells
-        size         = n*(1+v_per_cell) # total number of integer values required to represent the list
-        cell_header  = "\n\nCELLS "+str(n)+" "+str(size)
-        f.write(cell_header)
-
-        write_azimuthal_cell_values(f,n,n_a)
-
-        #---------------------
-        # Write Cell Types:
-        #---------------------
-        cell_type_header  = "\n\nCELL_TYPES "+str(n)
-        f.write(cell_type_header)
-        for i in range(n):
-            f.write("\n9")
-
-        #--------------------------
-        # Write Scalar Cell Data:
-        #--------------------------
-        cell_data_header  = "\n\nCELL_DATA "+str(n)
-        f.write(cell_data_header)
-
-        # First scalar value
-        f.write("\nSCALARS i float 1")
-        f.write("\nLOOKUP_TABLE default")
-        for i in range(n):
-            new_idx = str(i)
-            f.write("\n"+new_idx)
-
-
-    f.close()
-    return
+    #---------------------
+    # Points:
+    #---------------------
+    n_r       = np.shape(fus_pts)[0]
+    n_a       = np.shape(fus_pts)[1]
+    points    = np.round(fus_pts,4).reshape(-1,3) + origin_offset[0:3]
+
+    #---------------------
+    # Cells:
+    #---------------------
+    n         = n_a*(n_r-1) # total number of cells
+    cells     = azimuthal_cell_values(n,n_a)
+
+    #--------------------------
+    # Scalar Cell Data:
+    #--------------------------
+    cell_data   = Data()
+    cell_data.i = np.arange(n)
+
+    filename = write_unstructured_grid(filename, "SUAVE Model of Fuselage", points, cells, 9, cell_data, file_format=file_format)
+
+    return filename
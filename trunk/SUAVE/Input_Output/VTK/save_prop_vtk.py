@@ -3,12 +3,14 @@
 #
 # Created:    Jun 2021, R. Erhard
 # Modified:   Jul 2022, R. Erhard
+#             Oct 2026, SUAVE Team
 #
 
 #----------------------------------
 # Imports
 #----------------------------------
-from SUAVE.Input_Output.VTK.write_azimuthal_cell_values import write_azimuthal_cell_values
+from SUAVE.Input_Output.VTK.write_azimuthal_cell_values import azimuthal_cell_values
+from SUAVE.Input_Output.VTK.write_unstructured_grid import write_unstructured_grid
 from SUAVE.Core import Data
 import numpy as np
 import copy
@@ -16,18 +18,19 @@ import copy
 from SUAVE.Plots.Geometry.plot_vehicle import get_blade_coordinates
 
 ## @ingroup Input_Output-VTK
-def save_prop_vtk(prop, filename, Results, time_step, origin_offset=np.array([0,0,0]), aircraftReferenceFrame=True):
+def save_prop_vtk(prop, filename, Results, time_step, origin_offset=np.array([0,0,0]), aircraftReferenceFrame=True, file_format='ascii'):
     """
-    Saves a SUAVE propeller object as a VTK in legacy format.
+    Saves a SUAVE propeller object as a VTK in legacy or xml format.
 
     Inputs:
        prop          Data structure of SUAVE propeller                  [Unitless]
        filename      Name of vtk file to save                           [String]
        Results       Data structure of wing and propeller results       [Unitless]
        time_step     Simulation time step                               [Unitless]
+       file_format   'ascii', 'binary' or 'xml'                         [String]
 
     Outputs:
-       N/A
+       files         Names of the files written, one per blade          [List]
 
     Properties Used:
        N/A
@@ -67,6 +70,10 @@ def save_prop_vtk(prop, filename, Results, time_step, origin_offset=np.array([0,
         n_af     = prop.vtk_airfoil_points
         wake     = False
 
+    cells_per_blade = n_af*(n_r-1)
+    cells           = azimuthal_cell_values(cells_per_blade, n_af)
+
+    files = []
     for B_idx in range(n_blades):
         # Get geometry of blade for current propeller instance
         G = Gprops[B_idx]
@@ -74,224 +81,54 @@ def save_prop_vtk(prop, filename, Results, time_step, origin_offset=np.array([0,
         sep  = filename.rfind('.')
         file = filename[0:sep]+"_blade"+str(B_idx)+"_t."+str(time_step)+filename[sep:]
 
-        # Create file for each blade
-        with open(file, 'w') as f:
-            #---------------------
-            # Write header
-            #---------------------
-            header = ["# vtk DataFile Version 4.0"                ,   # File version and identifier
-                      "\nSUAVE Model of PROWIM Propeller Blade "  ,   # Title
-                      "\nASCII"                                   ,   # Data type
-                      "\nDATASET UNSTRUCTURED_GRID"               ]   # Dataset structure / topology
-
-            f.writelines(header)
-
-            # --------------------
-            # Write Points
-            # --------------------
-            n_vertices    = (n_r)*(n_af)    # total number of node vertices per blade
-            points_header = "\n\nPOINTS "+str(n_vertices) +" float"
-            f.write(points_header)
-
-            # Loop over all nodes
-            for r_idx in range(n_r):
-                for c_idx in range(n_af):
-                    xp = round(G.X[0,r_idx,c_idx],4) + origin_offset[0]
-                    yp = round(G.Y[0,r_idx,c_idx],4) + origin_offset[1]
-                    zp = round(G.Z[0,r_idx,c_idx],4) + origin_offset[2]
-
-                    new_point = "\n"+str(xp)+" "+str(yp)+" "+str(zp)
-                    f.write(new_point)
-
-            #---------------------
-            # Write Cells:
-            #---------------------
-            cells_per_blade = n_af*(n_r-1)
-            v_per_cell      = 4    # quad cells
-            size            = cells_per_blade*(1+v_per_cell) # total number of integer values required to represent the list
-            cell_header     = "\n\nCELLS "+str(cells_per_blade)+" "+str(size)
-            f.write(cell_header)
-
-            write_azimuthal_cell_values(f, cells_per_blade, n_af)
-
-
-            #---------------------
-            # Write Cell Types:
-            #---------------------
-            cell_type_header  = "\n\nCELL_TYPES "+str(cells_per_blade)
-            f.write(cell_type_header)
-            for i in range(cells_per_blade):
-                f.write("\n9")
-
-            #--------------------------
-            # Write Scalar Cell Data:
-            #--------------------------
-            cell_data_header  = "\n\nCELL_DATA "+str(cells_per_blade)
-            f.write(cell_data_header)
-
-            # First scalar value
-            f.write("\nSCALARS i float 1")
-            f.write("\nLOOKUP_TABLE default")
-            for i in range(cells_per_blade):
-                new_idx = str(i)
-                f.write("\n"+new_idx)
-
-            if wake:
-                # Second scalar value
-                f.write("\nSCALARS vt float")
-                f.write("\nLOOKUP_TABLE default")
-
-                for i in range(n_r-1):
-                    for j in range(n_af):
-                        # v shape: (n_r,n_af,n_blades)
-                        # cells indexed along airfoil then radially, starting at inboard TE
-                        v_i_j   = vt[i][j][B_idx]
-                        v_ip_j  = vt[i+1][j][B_idx]
-                        if j == n_af-1:
-                            # last airfoil point connects bast to first
-                            v_i_jp  = vt[i][0][B_idx]
-                            v_ip_jp = vt[i+1][0][B_idx]
-                        else:
-                            v_i_jp  = vt[i][j+1][B_idx]
-                            v_ip_jp = vt[i+1][j+1][B_idx]
-
-                        vtavg = (v_i_j + v_ip_j + v_i_jp + v_ip_jp)/4
-
-                        f.write("\n"+str(vtavg))
-
-                # Third scalar value
-                f.write("\nSCALARS va float")
-                f.write("\nLOOKUP_TABLE default")
-
-                for i in range(n_r-1):
-                    for j in range(n_af):
-                        # v shape: (n_r,n_af,n_blades)
-                        # cells indexed along airfoil then radially, starting at inboard TE
-                        v_i_j   = va[i][j][B_idx]
-                        v_ip_j  = va[i+1][j][B_idx]
-                        if j == n_af-1:
-                            # last airfoil point connects bast to first
-                            v_i_jp  = va[i][0][B_idx]
-                            v_ip_jp = va[i+1][0][B_idx]
-                        else:
-                            v_i_jp  = va[i][j+1][B_idx]
-                            v_ip_jp = va[i+1][j+1][B_idx]
-
-                        vaavg = (v_i_j + v_ip_j + v_i_jp + v_ip_jp)/4
-
-                        f.write("\n"+str(vaavg))
-
-                # Fourth scalar value
-                f.write("\nSCALARS vr float")
-                f.write("\nLOOKUP_TABLE default")
-
-                for i in range(n_r-1):
-                    for j in range(n_af):
-                        # v shape: (n_r,n_af,n_blades)
-                        # cells indexed along airfoil then radially, starting at inboard TE
-                        v_i_j   = vr[i][j][B_idx]
-                        v_ip_j  = vr[i+1][j][B_idx]
-                        if j == n_af-1:
-                            # last airfoil point connects bast to first
-                            v_i_jp  = vr[i][0][B_idx]
-                            v_ip_jp = vr[i+1][0][B_idx]
-                        else:
-                            v_i_jp  = vr[i][j+1][B_idx]
-                            v_ip_jp = vr[i+1][j+1][B_idx]
-
-                        vravg = (v_i_j + v_ip_j + v_i_jp + v_ip_jp)/4
-
-                        f.write("\n"+str(vravg))
-                # Second scalar value
-                f.write("\nSCALARS u float")
-                f.write("\nLOOKUP_TABLE default")
-
-                for i in range(n_r-1):
-                    for j in range(n_af):
-                        # v shape: (n_r,n_af,n_blades)
-                        # cells indexed along airfoil then radially, starting at inboard TE
-                        v_i_j   = u[i][j][B_idx]
-                        v_ip_j  = u[i+1][j][B_idx]
-                        if j == n_af-1:
-                            # last airfoil point connects bast to first
-                            v_i_jp  = u[i][0][B_idx]
-                            v_ip_jp = u[i+1][0][B_idx]
-                        else:
-                            v_i_jp  = u[i][j+1][B_idx]
-                            v_ip_jp = u[i+1][j+1][B_idx]
-
-                        uavg = (v_i_j + v_ip_j + v_i_jp + v_ip_jp)/4
-
-                        f.write("\n"+str(uavg))
-
-                # Third scalar value
-                f.write("\nSCALARS v float")
-                f.write("\nLOOKUP_TABLE default")
-
-                for i in range(n_r-1):
-                    for j in range(n_af):
-                        # v shape: (n_r,n_af,n_blades)
-                        # cells indexed along airfoil then radially, starting at inboard TE
-                        v_i_j   = v[i][j][B_idx]
-                        v_ip_j  = v[i+1][j][B_idx]
-                        if j == n_af-1:
-                            # last airfoil point connects bast to first
-                            v_i_jp  = v[i][0][B_idx]
-                            v_ip_jp = v[i+1][0][B_idx]
-                        else:
-                            v_i_jp  = v[i][j+1][B_idx]
-                            v_ip_jp = v[i+1][j+1][B_idx]
-
-                        vavg = (v_i_j + v_ip_j + v_i_jp + v_ip_jp)/4
-
-                        f.write("\n"+str(vavg))
-
-                # Fourth scalar value
-                f.write("\nSCALARS w float")
-                f.write("\nLOOKUP_TABLE default")
-
-                for i in range(n_r-1):
-                    for j in range(n_af):
-                        # v shape: (n_r,n_af,n_blades)
-                        # cells indexed along airfoil then radially, starting at inboard TE
-                        v_i_j   = w[i][j][B_idx]
-                        v_ip_j  = w[i+1][j][B_idx]
-                        if j == n_af-1:
-                            # last airfoil point connects bast to first
-                            v_i_jp  = w[i][0][B_idx]
-                            v_ip_jp = w[i+1][0][B_idx]
-                        else:
-                            v_i_jp  = w[i][j+1][B_idx]
-                            v_ip_jp = w[i+1][j+1][B_idx]
-
-                        wavg = (v_i_j + v_ip_j + v_i_jp + v_ip_jp)/4
-
-                        f.write("\n"+str(wavg))
-                # Fourth scalar value
-                f.write("\nSCALARS Cp float")
-                f.write("\nLOOKUP_TABLE default")
-
-                for i in range(n_r-1):
-                    for j in range(n_af):
-                        # v shape: (n_r,n_af,n_blades)
-                        # cells indexed along airfoil then radially, starting at inboard TE
-                        v_i_j   = Cp[i][j][B_idx]
-                        v_ip_j  = Cp[i+1][j][B_idx]
-                        if j == n_af-1:
-                            # last airfoil point connects bast to first
-                            v_i_jp  = Cp[i][0][B_idx]
-                            v_ip_jp = Cp[i+1][0][B_idx]
-                        else:
-                            v_i_jp  = Cp[i][j+1][B_idx]
-                            v_ip_jp = Cp[i+1][j+1][B_idx]
-
-                        Cp_avg = (v_i_j + v_ip_j + v_i_jp + v_ip_jp)/4
-
-                        f.write("\n"+str(Cp_avg))
-        f.close()
-
-
-    return
+        # --------------------
+        # Points
+        # --------------------
+        points = np.stack([np.round(G.X[0],4) + origin_offset[0],
+                           np.round(G.Y[0],4) + origin_offset[1],
+                           np.round(G.Z[0],4) + origin_offset[2]],axis=-1).reshape(-1,3)
+
+        #--------------------------
+        # Scalar Cell Data:
+        #--------------------------
+        cell_data   = Data()
+        cell_data.i = np.arange(cells_per_blade)
+
+        if wake:
+            # cells indexed along airfoil then radially, starting at inboard TE
+            for name, values in [('vt',vt),('va',va),('vr',vr),('u',u),('v',v),('w',w),('Cp',Cp)]:
+                cell_data[name] = azimuthal_cell_average(np.asarray(values)[:,:,B_idx])
+
+        files.append(write_unstructured_grid(file, "SUAVE Model of PROWIM Propeller Blade ", points, cells, 9, cell_data, file_format=file_format))
+
+
+    return files
+
+## @ingroup Input_Output-VTK
+def azimuthal_cell_average(values):
+    """
+    Averages a nodal quantity on the lofted blade over the four nodes of each cell.
+
+    Inputs:
+       values        Nodal values, (n_r,n_af)                           [Unitless]
+
+    Outputs:
+       cell_values   Cell values, indexed along airfoil then radially   [Unitless]
+
+    Properties Used:
+       N/A
+
+    Assumptions:
+       The last airfoil point connects back to the first
+
+    Source:
+       None
+
+    """
+    values_jp   = np.roll(values,-1,axis=1)
+    cell_values = (values[:-1] + values[1:] + values_jp[:-1] + values_jp[1:])/4
+
+    return cell_values.ravel()
 
 ## @ingroup Input_Output-VTK
 def generate_lofted_propeller_points(prop,aircraftReferenceFrame):
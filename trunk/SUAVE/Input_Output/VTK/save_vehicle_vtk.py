@@ -3,6 +3,7 @@
 #
 # Created:    Jun 2021, R. Erhard
 # Modified:   Jul 2022, R. Erhard
+#             Oct 2026, SUAVE Team
 #
 
 #----------------------------
@@ -17,6 +18,7 @@ from SUAVE.Input_Output.VTK.save_nacelle_vtk import save_nacelle_vtk
 from SUAVE.Input_Output.VTK.save_vortex_distribution_vtk import save_vortex_distribution_vtk
 
 from SUAVE.Analyses.Aerodynamics import Vortex_Lattice
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
 
 from SUAVE.Core import Data
 import numpy as np
@@ -27,9 +29,9 @@ def save_vehicle_vtks(vehicle, conditions=None, Results=Data(),
                       time_step=0,origin_offset=np.array([0.,0.,0.]),VLM_settings=None, aircraftReferenceFrame=True,
                       prop_filename="propeller.vtk", rot_filename="rotor.vtk",
                       wake_filename="prop_wake.vtk", wing_vlm_filename="wing_vlm_horseshoes.vtk",wing_filename="wing_vlm.vtk",
-                      fuselage_filename="fuselage.vtk", nacelle_filename="nacelle.vtk", save_loc=None):
+                      fuselage_filename="fuselage.vtk", nacelle_filename="nacelle.vtk", save_loc=None, file_format='ascii'):
     """
-    Saves SUAVE vehicle components as VTK files in legacy format.
+    Saves SUAVE vehicle components as VTK files in legacy or xml format.
 
     Inputs:
        vehicle                Data structure of SUAVE vehicle                    [Unitless]
@@ -42,9 +44,11 @@ def save_vehicle_vtks(vehicle, conditions=None, Results=Data(),
        wing_filename          Name of vtk file to save                           [String]
        fuselage_filename      Name of vtk file to save                           [String]
        save_loc               Location at which to save vtk files                [String]
+       file_format            'ascii' or 'binary' legacy VTK (.vtk),             [String]
+                              or 'xml' VTK with raw appended data (.vtu)
 
     Outputs:
-       N/A
+       files                  Names of the files written                         [List]
 
     Properties Used:
        N/A
@@ -68,6 +72,7 @@ def save_vehicle_vtks(vehicle, conditions=None, Results=Data(),
         VLM_settings.model_fuselage            = False
         VLM_settings.model_nacelle             = False
 
+    files = []
 
     #---------------------------
     # Save propellers and rotors to vtk
@@ -103,7 +108,7 @@ def save_vehicle_vtks(vehicle, conditions=None, Results=Data(),
                 sep  = filename.rfind('.')
                 file = filename[0:sep]+str(i)+filename[sep:]
 
-                save_prop_vtk(propi, file, Results, time_step, origin_offset, aircraftReferenceFrame=aircraftReferenceFrame)
+                files += save_prop_vtk(propi, file, Results, time_step, origin_offset, aircraftReferenceFrame=aircraftReferenceFrame, file_format=file_format)
 
                 try:
                     # check if rotor has wake present
@@ -129,7 +134,7 @@ def save_vehicle_vtks(vehicle, conditions=None, Results=Data(),
                     Results['prop_outputs'] = propi.outputs
 
                     # save prop wake
-                    save_prop_wake_vtk(propi, wVD, gamma, file, Results,start_angle_idx,origin_offset,rot=propi.rotation, aircraftReferenceFrame=aircraftReferenceFrame)
+                    files += save_prop_wake_vtk(propi, wVD, gamma, file, Results,start_angle_idx,origin_offset,rot=propi.rotation, aircraftReferenceFrame=aircraftReferenceFrame, file_format=file_format)
 
 
         try:
@@ -163,7 +168,7 @@ def save_vehicle_vtks(vehicle, conditions=None, Results=Data(),
                 sep  = filename.rfind('.')
                 file = filename[0:sep]+str(i)+filename[sep:]
 
-                save_prop_vtk(roti, file, Results,i,time_step, origin_offset, aircraftReferenceFrame=aircraftReferenceFrame)
+                files += save_prop_vtk(roti, file, Results, time_step, origin_offset, aircraftReferenceFrame=aircraftReferenceFrame, file_format=file_format)
 
                 try:
                     # check if rotor has wake present
@@ -190,7 +195,7 @@ def save_vehicle_vtks(vehicle, conditions=None, Results=Data(),
                     Results['prop_outputs'] = Results['all_prop_outputs'][roti_key]
 
                     # save prop wake
-                    save_prop_wake_vtk(propi, wVD, gamma, file, Results,origin_offset,rot=roti.rotation,aircraftReferenceFrame=aircraftReferenceFrame)
+                    files += save_prop_wake_vtk(propi, wVD, gamma, file, Results,origin_offset,rot=roti.rotation,aircraftReferenceFrame=aircraftReferenceFrame, file_format=file_format)
 
 
     #---------------------------
@@ -210,13 +215,14 @@ def save_vehicle_vtks(vehicle, conditions=None, Results=Data(),
         sep  = filename.rfind('.')
         file = filename[0:sep]+str(wing_names[i])+filename[sep:]
         file2 = filename2[0:sep]+str(wing_names[i])+filename2[sep:]
-        save_wing_vtk(vehicle, vehicle.wings[wing_names[i]], VLM_settings, file, Results,time_step,origin_offset)
+        files += save_wing_vtk(vehicle, vehicle.wings[wing_names[i]], VLM_settings, file, Results,time_step,origin_offset,file_format)
 
         if conditions != None:
             # evaluate vortex strengths and same vortex distribution
             VLM_outputs   = VLM(conditions, VLM_settings, vehicle)
             gamma         = VLM_outputs.gamma
-            save_vortex_distribution_vtk(vehicle,conditions,VD,gamma,vehicle.wings[wing_names[i]], file2, time_step)
+            VD            = VLM_outputs.VD
+            files        += save_vortex_distribution_vtk(vehicle,conditions,VD,gamma,vehicle.wings[wing_names[i]], file2, time_step, file_format=file_format)
 
     #------------------------------
     # Save fuselage results to vtk
@@ -231,7 +237,7 @@ def save_vehicle_vtks(vehicle, conditions=None, Results=Data(),
         sep  = filename.rfind('.')
         file = filename[0:sep]+str(i)+"_t"+str(time_step)+filename[sep:]
 
-        save_fuselage_vtk(vehicle, file, Results, origin_offset)
+        files += save_fuselage_vtk(vehicle, file, Results, origin_offset, file_format)
 
 
     #------------------------------
@@ -246,5 +252,5 @@ def save_vehicle_vtks(vehicle, conditions=None, Results=Data(),
         sep  = filename.rfind('.')
         file = filename[0:sep]+str(i)+"_t"+str(time_step)+filename[sep:]
 
-        save_nacelle_vtk(nacelle, file, Results, origin_offset)
-    return
+        files += save_nacelle_vtk(nacelle, file, Results, origin_offset, file_format)
+    return files
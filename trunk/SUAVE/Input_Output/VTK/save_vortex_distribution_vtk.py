@@ -2,23 +2,26 @@
 # save_vortex_distribution_vtk.py
 # 
 # Created:    Jun 2021, R. Erhard
-# Modified: 
+# Modified:   Oct 2026, SUAVE Team
 #           
 from SUAVE.Core import Data
+from SUAVE.Input_Output.VTK.write_unstructured_grid import write_unstructured_grid
 import numpy as np
 
-def save_vortex_distribution_vtk(vehicle,conditions,VD,gamma,wing_instance,filename, time_step,separate_wing_and_wake_VD=True):
+## @ingroup Input_Output-VTK
+def save_vortex_distribution_vtk(vehicle,conditions,VD,gamma,wing_instance,filename, time_step,separate_wing_and_wake_VD=True,file_format='ascii'):
     """
-    Saves a SUAVE propeller wake as a VTK in legacy format.
+    Saves the vortex distribution of a SUAVE wing as a VTK in legacy or xml format.
 
     Inputs:
        VD           Vortex distribution of propeller wake          [Unitless]  
        filename      Name of vtk file to save                       [Unitless]  
        Results       Data structure of wing and propeller results   [Unitless]  
        i_prop        ith propeller to evaluate wake of              [Unitless]
+       file_format   'ascii', 'binary' or 'xml'                     [String]
        
     Outputs:                                   
-       N/A
+       files         Names of the files written                     [List]
 
     Properties Used:
        N/A 
@@ -84,8 +87,8 @@ def save_vortex_distribution_vtk(vehicle,conditions,VD,gamma,wing_instance,filen
         Lfile = filename[0:sep]+"_L"+filename[sep:]
         Rfile = filename[0:sep]+"_R"+filename[sep:]
                 
-        write_vortex_distribution_vtk(R,alpha,VD,Rfile,time_step,separate_wing_and_wake_VD)
-        write_vortex_distribution_vtk(L,alpha,VD,Lfile,time_step,separate_wing_and_wake_VD)
+        files  = write_vortex_distribution_vtk(R,alpha,VD,Rfile,time_step,separate_wing_and_wake_VD,file_format)
+        files += write_vortex_distribution_vtk(L,alpha,VD,Lfile,time_step,separate_wing_and_wake_VD,file_format)
     else:
         wing = Data()
         wing.XAH = VD.XAH
@@ -110,12 +113,13 @@ def save_vortex_distribution_vtk(vehicle,conditions,VD,gamma,wing_instance,filen
 
         file = filename
         
-        write_vortex_distribution_vtk(wing,alpha,VD,file,time_step,separate_wing_and_wake_VD)
+        files = write_vortex_distribution_vtk(wing,alpha,VD,file,time_step,separate_wing_and_wake_VD,file_format)
         
         
-    return
+    return files
 
-def write_vortex_distribution_vtk(wing,alpha,VD,filename,time_step, separate_wing_and_wake_VD=True):
+## @ingroup Input_Output-VTK
+def write_vortex_distribution_vtk(wing,alpha,VD,filename,time_step, separate_wing_and_wake_VD=True,file_format='ascii'):
  
     
     n_sw = VD.n_sw[0]
@@ -133,394 +137,144 @@ def write_vortex_distribution_vtk(wing,alpha,VD,filename,time_step, separate_win
     
     if separate_wing_and_wake_VD:
         # Write vortex distribution on wing panels
-        wing_VD(wingVDfile,n_sw,n_cp,bound_vortices, right_trailing_vortices)
+        files = [wing_VD(wingVDfile,n_sw,n_cp,bound_vortices, right_trailing_vortices,file_format)]
         
         # Write vortex distribution of infinite trailing vortices
-        wake_VD(wakeVDfile,n_cp,n_sw,inf_trailing_vortices)
+        files.append(wake_VD(wakeVDfile,n_cp,n_sw,inf_trailing_vortices,file_format))
     else:
-        full_VD(fullVDfile, n_cp, n_sw, bound_vortices, right_trailing_vortices, inf_trailing_vortices)
+        files = [full_VD(fullVDfile, n_cp, n_sw, bound_vortices, right_trailing_vortices, inf_trailing_vortices,file_format)]
     
     
 
-    return
+    return files
 
 
+## @ingroup Input_Output-VTK
 def process_VD(wing, n_sw, n_cw):
+    """
+    Splits the horseshoe vortices of the wing panels into bound, trailing and infinite
+    trailing vortex filaments.
+
+    Inputs:
+       wing          Horseshoe vortex distribution and circulation of the wing    [Unitless]
+       n_sw          Number of spanwise panels                                    [Unitless]
+       n_cw          Number of chordwise panels                                   [Unitless]
+
+    Outputs:
+       right_trailing_vortices, bound_vortices, inf_trailing_vortices.
+         coordinates       End points of each filament, (2*n_filaments,3)         [m]
+         vortex_strengths  Circulation of each filament, (n_filaments)            [m^2/s]
+
+    Properties Used:
+       N/A
+
+    Assumptions:
+       The left trailing vortex is 0 at symmetry and equals the right trailing vortex of the
+       neighbouring panel elsewhere, so only right trailing vortices are kept.
+
+    Source:
+       None
+    """
+    n_cp = n_sw*n_cw
 
     # --------------------
     # Process VD strengths
-    # --------------------   
-    bound_vortices = Data()
-    bound_vortices.coordinates = []
-    bound_vortices.vortex_strengths = []
+    # --------------------
+    g_c_s  = np.asarray(wing.gamma)[:n_cp].reshape(n_sw,n_cw)
+    g_c_sp = np.zeros_like(g_c_s)
+    g_c_sp[:-1] = g_c_s[1:]   # panel at the wing tip has no neighbour
 
-    left_trailing_vortices = Data()
-    left_trailing_vortices.coordinates = []
-    left_trailing_vortices.vortex_strengths =[]  
-    
-    right_trailing_vortices = Data()
-    right_trailing_vortices.coordinates = []
-    right_trailing_vortices.vortex_strengths =[]      
-    
-    inf_trailing_vortices = Data()
-    inf_trailing_vortices.coordinates = []
-    inf_trailing_vortices.vortex_strengths = []
-    
-    
-    # Loop over each panel
-    for s in range(n_sw):
-        rtv_strength = 0
-        
-        for c in range(n_cw):
-            i = c + s*(n_cw) # Panel number
-            
-            if s==n_sw-1:
-                # Panel is at the wing tip
-                g_c_s = wing.gamma[i]
-                rtv_strength += g_c_s
-            else:
-                g_c_s = wing.gamma[i]
-                g_c_sp = wing.gamma[i+n_cw]
-                rtv_strength += g_c_s - g_c_sp
-                
-            if c==n_cw-1:
-                # right trailing vortex goes back farther
-                rtv = np.array([wing.XB_TE[i], wing.YB_TE[i], wing.ZB_TE[i]])   # right bound vortex of next chordwise panel 
-                
-                # extend one spanwise distance downstream
-                x     = np.abs(wing.YB2[0::n_cw][-1]) # one span distance
-                rinf  = np.array([rtv[0]+x, rtv[1], rtv[2]])
-                
-                ## TO DO: rotate to leave trailing edge at freestream
-                #rot_mat = np.array([[np.cos(alpha), 0, np.sin(alpha)], [0,1,0], [-np.sin(alpha), 0, np.cos(alpha)]])
-                #rinf = np.matmul(rot_mat,rinf)
-                
-                # save trailing infinite vortices (shortened after 1 spanwise downstream distance)
-                inf_trailing_vortices.coordinates.append(rtv)
-                inf_trailing_vortices.coordinates.append(rinf)
-                inf_trailing_vortices.vortex_strengths.append(rtv_strength)
-                
-            else:
-                rtv = np.array([wing.XBH[i+1], wing.YBH[i+1], wing.ZBH[i+1]])   # right bound vortex of next chordwise panel 
-            
-            # coordinates for bound vortex and right trailing vortex (left trailing vortex is 0 at symmetry, equals rtv of (c,s+1) panel elsewhere)
-            lbv = np.array([wing.XAH[i], wing.YAH[i], wing.ZAH[i]])         # left bound vortex of current panel
-            rbv = np.array([wing.XBH[i], wing.YBH[i], wing.ZBH[i]])         # right bound vortex of current panel
-              
-            
-            bound_vortices.coordinates.append(lbv)
-            bound_vortices.coordinates.append(rbv)
-            bound_vortices.vortex_strengths.append(g_c_s) # bound vortex strength is the vortex strength associated with current panel
-            
-            right_trailing_vortices.coordinates.append(rbv)
-            right_trailing_vortices.coordinates.append(rtv)                   
-            right_trailing_vortices.vortex_strengths.append( rtv_strength ) # right trailing vortex strength is zero (symmetry plane)
-    
-    return right_trailing_vortices, bound_vortices, inf_trailing_vortices
+    # right trailing vortex strength accumulates along the chord
+    rtv_strength = np.cumsum(g_c_s - g_c_sp,axis=1,dtype=float)
+
+    # coordinates for bound vortex and right trailing vortex of each panel
+    lbv  = np.stack([wing.XAH,wing.YAH,wing.ZAH],axis=-1)[:n_cp].reshape(n_sw,n_cw,3)     # left bound vortex of current panel
+    rbv  = np.stack([wing.XBH,wing.YBH,wing.ZBH],axis=-1)[:n_cp].reshape(n_sw,n_cw,3)     # right bound vortex of current panel
+    B_TE = np.stack([wing.XB_TE,wing.YB_TE,wing.ZB_TE],axis=-1)[:n_cp].reshape(n_sw,n_cw,3)
+
+    rtv         = np.zeros_like(rbv)
+    rtv[:,:-1]  = rbv[:,1:]       # right bound vortex of next chordwise panel
+    rtv[:,-1]   = B_TE[:,-1]      # right trailing vortex goes back farther
 
+    # extend one spanwise distance downstream
+    x     = np.abs(wing.YB2[0::n_cw][-1]) # one span distance
+    rinf  = rtv[:,-1] + np.array([x,0.,0.],dtype=rtv.dtype)
 
+    ## TO DO: rotate to leave trailing edge at freestream
+    #rot_mat = np.array([[np.cos(alpha), 0, np.sin(alpha)], [0,1,0], [-np.sin(alpha), 0, np.cos(alpha)]])
+    #rinf = np.matmul(rot_mat,rinf)
+
+    bound_vortices = Data()
+    bound_vortices.coordinates      = np.stack([lbv,rbv],axis=2).reshape(-1,3)
+    bound_vortices.vortex_strengths = g_c_s.ravel() # bound vortex strength is the vortex strength associated with current panel
+
+    right_trailing_vortices = Data()
+    right_trailing_vortices.coordinates      = np.stack([rbv,rtv],axis=2).reshape(-1,3)
+    right_trailing_vortices.vortex_strengths = rtv_strength.ravel()
 
+    # save trailing infinite vortices (shortened after 1 spanwise downstream distance)
+    inf_trailing_vortices = Data()
+    inf_trailing_vortices.coordinates      = np.stack([rtv[:,-1],rinf],axis=1).reshape(-1,3)
+    inf_trailing_vortices.vortex_strengths = rtv_strength[:,-1]
 
+    return right_trailing_vortices, bound_vortices, inf_trailing_vortices
 
 
-def wake_VD(filename,n_cp,n_sw,inf_trailing_vortices):
+## @ingroup Input_Output-VTK
+def wake_VD(filename,n_cp,n_sw,inf_trailing_vortices,file_format='ascii'):
     """
     Print and save VTK file for the vortex filaments in the wake of the lifting surface (keeps
     trailing vortices separate from lifting surface filaments)
-    """        
-    with open(filename, 'w') as f:
-        
-        #---------------------
-        # Write header
-        #---------------------
-        header = ["# vtk DataFile Version 4.0" ,     # File version and identifier
-                  "\nVortex distribution " ,         # Title
-                  "\nASCII"              ,           # Data type
-                  "\nDATASET UNSTRUCTURED_GRID"    ] # Dataset structure / topology
-        f.writelines(header)   
-        
-        # --------------------
-        # Write Points
-        # --------------------   
-        n_pts = 2*n_sw  # total number of node vertices 
-        points_header = "\n\nPOINTS "+str(n_pts) +" float"
-        f.write(points_header)     
-
-        for i in range(n_sw):
-            # append trailing vortex lines
-            p1 = inf_trailing_vortices.coordinates[2*i]
-            p2 = inf_trailing_vortices.coordinates[2*i+1]
-            f.write("\n"+str(p1[0])+" "+str(p1[1])+" "+str(p1[2]))
-            f.write("\n"+str(p2[0])+" "+str(p2[1])+" "+str(p2[2]))
-            
-        #---------------------    
-        # Write Cells:
-        #---------------------     
-        n          = n_sw
-        v_per_cell = 2
-        size       = n*(1+v_per_cell)
-        
-        cell_header  = "\n\nCELLS "+str(n)+" "+str(size)
-        f.write(cell_header)         
-           
-        for i in range(n_sw):
-            # write the cells for the inf vortices for each panel
-            base_node = i*2
-            new_poly_line = "\n2 "+str(base_node)+" "+str(base_node+1)
-            f.write(new_poly_line )
-            
-        #---------------------        
-        # Write Cell Types:
-        #---------------------
-        cell_type_header  = "\n\nCELL_TYPES "+str(n)
-        f.write(cell_type_header)        
-        
-        for i in range(n_sw):
-            # inf vortex cell type
-            f.write("\n4")
-        #--------------------------        
-        # Write VTK Poly Line Data:
-        #--------------------------
-        cell_data_header  = "\n\nCELL_DATA "+str(n)
-        f.write(cell_data_header)      
-        
-        # First scalar value
-        f.write("\nSCALARS i float 1")
-        f.write("\nLOOKUP_TABLE default")   
-
-        for i in range(n_sw):
-            # inf trailing vortex scalar i
-            f.write("\n"+str(i))   
-            
-        # Second scalar value
-        f.write("\nSCALARS circulation float 1")
-        f.write("\nLOOKUP_TABLE default")   
-        
-        for i in range(n_sw):
-            # inf trailing vortex circulation
-            f.write("\n"+str(inf_trailing_vortices.vortex_strengths[i]))        
-            
-    f.close()
-    return
-
-def wing_VD(filename,n_sw,n_cp,bound_vortices, right_trailing_vortices):
+    """
+    points = inf_trailing_vortices.coordinates[:2*n_sw]
+    cells  = np.arange(2*n_sw).reshape(-1,2)
+
+    cell_data             = Data()
+    cell_data.i           = np.arange(n_sw)
+    cell_data.circulation = inf_trailing_vortices.vortex_strengths[:n_sw]
+
+    return write_unstructured_grid(filename, "Vortex distribution ", points, cells, 4, cell_data, file_format=file_format)
+
+## @ingroup Input_Output-VTK
+def wing_VD(filename,n_sw,n_cp,bound_vortices, right_trailing_vortices,file_format='ascii'):
     """
     Print and save VTK file for the vortex filaments on the lifting surface (keeps
     trailing vortices separate)
-    """    
-    with open(filename, 'w') as f:
-        #---------------------
-        # Write header
-        #---------------------
-        header = ["# vtk DataFile Version 4.0" ,     # File version and identifier
-                  "\nWing panel vortex distribution " ,         # Title
-                  "\nASCII"              ,           # Data type
-                  "\nDATASET UNSTRUCTURED_GRID"    ] # Dataset structure / topology
-        f.writelines(header)   
-        
-        # --------------------
-        # Write Points
-        # --------------------   
-        pts_per_panel = 4
-        n_pts = n_cp*pts_per_panel  # total number of node vertices 
-        points_header = "\n\nPOINTS "+str(n_pts) +" float"
-        f.write(points_header)     
-        for i in range(n_cp):
-            # write the bound vortices for each panel
-            p1 = bound_vortices.coordinates[2*i]
-            p2 = bound_vortices.coordinates[2*i+1]
-            f.write("\n"+str(p1[0])+" "+str(p1[1])+" "+str(p1[2]))
-            f.write("\n"+str(p2[0])+" "+str(p2[1])+" "+str(p2[2]))
-            
-            # write the right trailing edge vortex for each panel
-            p1 = right_trailing_vortices.coordinates[2*i]
-            p2 = right_trailing_vortices.coordinates[2*i+1]
-            f.write("\n"+str(p1[0])+" "+str(p1[1])+" "+str(p1[2]))
-            f.write("\n"+str(p2[0])+" "+str(p2[1])+" "+str(p2[2]))
-            
-        #---------------------    
-        # Write Cells:
-        #---------------------     
-        n          = 2*n_cp
-        v_per_cell = 2
-        size       = n*(1+v_per_cell)
-        
-        cell_header  = "\n\nCELLS "+str(n)+" "+str(size)
-        f.write(cell_header)
-        for i in range(n_cp):
-            # write the cells for the bound vortices for each panel
-            base_node = i*pts_per_panel
-            new_poly_line = "\n2 "+str(base_node)+" "+str(base_node+1)
-            f.write(new_poly_line )
-            
-            # write the cells for the right trailing edge vortex for each panel
-            base_node = i*pts_per_panel +2
-            new_poly_line = "\n2 "+str(base_node)+" "+str(base_node+1)
-            f.write(new_poly_line )            
-           
-            
-        #---------------------        
-        # Write Cell Types:
-        #---------------------
-        cell_type_header  = "\n\nCELL_TYPES "+str(n)
-        f.write(cell_type_header)        
-        for i in range(n_cp):
-            # bound vortex cell type
-            f.write("\n4")
-            # right trailing vortex cell type
-            f.write("\n4")
-        
-        #--------------------------        
-        # Write VTK Poly Line Data:
-        #--------------------------
-        cell_data_header  = "\n\nCELL_DATA "+str(n)
-        f.write(cell_data_header)      
-        
-        # First scalar value
-        f.write("\nSCALARS i float 1")
-        f.write("\nLOOKUP_TABLE default")   
-        
-        for i in range(n_cp):
-            # bound vortex scalar i
-            f.write("\n"+str(i))   
-    
-            # right trailing vortex scalar i
-            f.write("\n"+str(i))         
-            
-        # Second scalar value
-        f.write("\nSCALARS circulation float 1")
-        f.write("\nLOOKUP_TABLE default")   
-        
-        for i in range(n_cp):
-            # bound vortex scalar circulation
-            f.write("\n"+str(bound_vortices.vortex_strengths[i])) 
-            
-            # right trailing vortex circulation
-            f.write("\n"+str(right_trailing_vortices.vortex_strengths[i]))        
-            
-    f.close()
-    return    
+    """
+    points, cells, cell_data = panel_filaments(n_cp, bound_vortices, right_trailing_vortices)
 
+    return write_unstructured_grid(filename, "Wing panel vortex distribution ", points, cells, 4, cell_data, file_format=file_format)
 
 
-def full_VD(filename, n_cp, n_sw, bound_vortices, right_trailing_vortices, inf_trailing_vortices):
+## @ingroup Input_Output-VTK
+def full_VD(filename, n_cp, n_sw, bound_vortices, right_trailing_vortices, inf_trailing_vortices,file_format='ascii'):
     """
     Print and save VTK file for the entire vortex distribution (including filaments on wing and 
     trailing vortices)
     """
-    with open(filename, 'w') as f:
-
-        #---------------------
-        # Write header
-        #---------------------
-        header = ["# vtk DataFile Version 4.0" ,     # File version and identifier
-                  "\nVortex distribution " ,         # Title
-                  "\nASCII"              ,           # Data type
-                  "\nDATASET UNSTRUCTURED_GRID"    ] # Dataset structure / topology
-        f.writelines(header)   
-        
-        # --------------------
-        # Write Points
-        # --------------------   
-        pts_per_panel = 4
-        n_pts = n_cp*pts_per_panel + 2*n_sw  # total number of node vertices 
-        points_header = "\n\nPOINTS "+str(n_pts) +" float"
-        f.write(points_header)     
-        for i in range(n_cp):
-            # write the bound vortices for each panel
-            p1 = bound_vortices.coordinates[2*i]
-            p2 = bound_vortices.coordinates[2*i+1]
-            f.write("\n"+str(p1[0])+" "+str(p1[1])+" "+str(p1[2]))
-            f.write("\n"+str(p2[0])+" "+str(p2[1])+" "+str(p2[2]))
-            
-            # write the right trailing edge vortex for each panel
-            p1 = right_trailing_vortices.coordinates[2*i]
-            p2 = right_trailing_vortices.coordinates[2*i+1]
-            f.write("\n"+str(p1[0])+" "+str(p1[1])+" "+str(p1[2]))
-            f.write("\n"+str(p2[0])+" "+str(p2[1])+" "+str(p2[2]))
-        
-        for i in range(n_sw):
-            # append trailing vortex lines
-            p1 = inf_trailing_vortices.coordinates[2*i]
-            p2 = inf_trailing_vortices.coordinates[2*i+1]
-            f.write("\n"+str(p1[0])+" "+str(p1[1])+" "+str(p1[2]))
-            f.write("\n"+str(p2[0])+" "+str(p2[1])+" "+str(p2[2]))
-            
-        #---------------------    
-        # Write Cells:
-        #---------------------     
-        n          = 2*n_cp+n_sw
-        v_per_cell = 2
-        size       = n*(1+v_per_cell)
-        
-        cell_header  = "\n\nCELLS "+str(n)+" "+str(size)
-        f.write(cell_header)
-        for i in range(n_cp):
-            # write the cells for the bound vortices for each panel
-            base_node = i*pts_per_panel
-            new_poly_line = "\n2 "+str(base_node)+" "+str(base_node+1)
-            f.write(new_poly_line )
-            
-            # write the cells for the right trailing edge vortex for each panel
-            base_node = i*pts_per_panel +2
-            new_poly_line = "\n2 "+str(base_node)+" "+str(base_node+1)
-            f.write(new_poly_line )            
-           
-        for i in range(n_sw):
-            # write the cells for the inf vortices for each panel
-            base_node = 4*n_cp + i*2
-            new_poly_line = "\n2 "+str(base_node)+" "+str(base_node+1)
-            f.write(new_poly_line )
-            
-        #---------------------        
-        # Write Cell Types:
-        #---------------------
-        cell_type_header  = "\n\nCELL_TYPES "+str(n)
-        f.write(cell_type_header)        
-        for i in range(n_cp):
-            # bound vortex cell type
-            f.write("\n4")
-            # right trailing vortex cell type
-            f.write("\n4")
-        
-        for i in range(n_sw):
-            # inf vortex cell type
-            f.write("\n4")
-        #--------------------------        
-        # Write VTK Poly Line Data:
-        #--------------------------
-        cell_data_header  = "\n\nCELL_DATA "+str(n)
-        f.write(cell_data_header)      
-        
-        # First scalar value
-        f.write("\nSCALARS i float 1")
-        f.write("\nLOOKUP_TABLE default")   
-        
-        for i in range(n_cp):
-            # bound vortex scalar i
-            f.write("\n"+str(i))   
-    
-            # right trailing vortex scalar i
-            f.write("\n"+str(i))            
-            
-        for i in range(n_sw):
-            # inf trailing vortex scalar i
-            f.write("\n"+str(i))   
-            
-        # Second scalar value
-        f.write("\nSCALARS circulation float 1")
-        f.write("\nLOOKUP_TABLE default")   
-        
-        for i in range(n_cp):
-            # bound vortex scalar circulation
-            f.write("\n"+str(bound_vortices.vortex_strengths[i])) 
-            
-            # right trailing vortex circulation
-            f.write("\n"+str(right_trailing_vortices.vortex_strengths[i]))  
-            
-        for i in range(n_sw):
-            # inf trailing vortex circulation
-            f.write("\n"+str(inf_trailing_vortices.vortex_strengths[i]))        
-            
-    f.close()
-    return
\ No newline at end of file
+    points, cells, cell_data = panel_filaments(n_cp, bound_vortices, right_trailing_vortices)
+
+    # append trailing vortex lines
+    points = np.concatenate((points, inf_trailing_vortices.coordinates[:2*n_sw]))
+    cells  = np.arange(len(points)).reshape(-1,2)
+    cell_data.i           = np.concatenate((cell_data.i, np.arange(n_sw)))
+    cell_data.circulation = np.concatenate((cell_data.circulation, inf_trailing_vortices.vortex_strengths[:n_sw]))
+
+    return write_unstructured_grid(filename, "Vortex distribution ", points, cells, 4, cell_data, file_format=file_format)
+
+## @ingroup Input_Output-VTK
+def panel_filaments(n_cp, bound_vortices, right_trailing_vortices):
+    """
+    Collects the bound and right trailing vortex filaments of each panel, in order of the panels.
+    """
+    pts_per_panel = 4
+    points = np.concatenate((bound_vortices.coordinates[:2*n_cp].reshape(n_cp,2,3),
+                             right_trailing_vortices.coordinates[:2*n_cp].reshape(n_cp,2,3)),axis=1).reshape(-1,3)
+    cells  = np.arange(n_cp*pts_per_panel).reshape(-1,2)
+
+    cell_data             = Data()
+    cell_data.i           = np.repeat(np.arange(n_cp),2)
+    cell_data.circulation = np.stack([bound_vortices.vortex_strengths[:n_cp],
+                                      right_trailing_vortices.vortex_strengths[:n_cp]],axis=-1).ravel()
+
+    return points, cells, cell_data
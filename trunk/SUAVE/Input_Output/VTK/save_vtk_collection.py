@@ -0,0 +1,59 @@
+## @ingroup Input_Output-VTK
+# save_vtk_collection.py
+#
+# Created:    Oct 2026, SUAVE Team
+# Modified:
+#
+
+#------------------------------
+# Imports
+#------------------------------
+import numpy as np
+import os
+
+#------------------------------
+# VTK collection
+#------------------------------
+## @ingroup Input_Output-VTK
+def save_vtk_collection(filename, files, times):
+    """
+    Saves a ParaView collection file (.pvd) that groups the VTK files of several time steps,
+    so that a time history can be opened and animated as a single data set.
+
+    Inputs:
+       filename       Name of pvd file to save                                    [String]
+       files          Files of each time step, each entry is a file name or a     [List]
+                      list of file names (one per part)
+       times          Physical time of each time step                             [s]
+
+    Outputs:
+       N/A
+
+    Properties Used:
+       N/A
+
+    Assumptions:
+       The parts are numbered by their position in the list of files of each time step.
+       File names are stored relative to the location of the collection file.
+
+    Source:
+       ParaView Data (PVD) File Format, Kitware
+    """
+    base_dir = os.path.dirname(os.path.abspath(filename))
+
+    lines = ['<?xml version="1.0"?>',
+             '<VTKFile type="Collection" version="0.1" byte_order="LittleEndian">',
+             '<Collection>']
+    for time, step_files in zip(np.ravel(times), files):
+        if isinstance(step_files,str):
+            step_files = [step_files]
+        for part, file in enumerate(step_files):
+            file = os.path.relpath(os.path.abspath(file),base_dir)
+            lines.append('<DataSet timestep="' + repr(float(time)) + '" group="" part="' + str(part) + '" file="' + file + '"/>')
+    lines += ['</Collection>',
+              '</VTKFile>']
+
+    with open(filename, 'w') as f:
+        f.write("\n".join(lines) + "\n")
+
+    return
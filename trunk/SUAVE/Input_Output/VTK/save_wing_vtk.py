@@ -2,7 +2,7 @@
 # save_wing_vtk.py
 #
 # Created:    Jun 2021, R. Erhard
-# Modified:
+# Modified:   Oct 2026, SUAVE Team
 #
 import SUAVE
 from SUAVE.Core import Data
@@ -11,20 +11,22 @@ from copy import deepcopy
 import numpy as np
 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.extract_wing_VD import extract_wing_collocation_points
+from SUAVE.Input_Output.VTK.write_unstructured_grid import write_unstructured_grid
 
 ## @ingroup Input_Output-VTK
-def save_wing_vtk(vehicle, wing_instance, settings, filename, Results,time_step,origin_offset):
+def save_wing_vtk(vehicle, wing_instance, settings, filename, Results,time_step,origin_offset,file_format='ascii'):
     """
-    Saves a SUAVE wing object as a VTK in legacy format.
+    Saves a SUAVE wing object as a VTK in legacy or xml format.
 
     Inputs:
        vehicle        Data structure of SUAVE vehicle                [Unitless]
        wing_instance  Data structure of SUAVE wing                   [Unitless]
        filename       Name of vtk file to save                       [String]
        Results        Data structure of wing and propeller results   [Unitless]
+       file_format    'ascii', 'binary' or 'xml'                     [String]
 
     Outputs:
-       N/A
+       files          Names of the files written                     [List]
 
     Properties Used:
        N/A
@@ -109,8 +111,8 @@ def save_wing_vtk(vehicle, wing_instance, settings, filename, Results,time_step,
         Rfile = filename[0:sep]+"_R"+"_t"+str(time_step)+filename[sep:]
 
         # write vtks for each half wing
-        write_wing_vtk(Lwing,n_cw_L,n_sw_L,n_cp_L,L_Results,Lfile)
-        write_wing_vtk(Rwing,n_cw_R,n_sw_R,n_cp_R,R_Results,Rfile)        
+        files = [write_wing_vtk(Lwing,n_cw_L,n_sw_L,n_cp_L,L_Results,Lfile,file_format),
+                 write_wing_vtk(Rwing,n_cw_R,n_sw_R,n_cp_R,R_Results,Rfile,file_format)]
     else:
         n_cw = VD.n_cw[0]
         n_sw = VD.n_sw[0]
@@ -135,172 +137,93 @@ def save_wing_vtk(vehicle, wing_instance, settings, filename, Results,time_step,
         if 'vlm_results' in Results.keys():
             Results.vlm_results.CP = Results.vlm_results.CP[0]
 
-        write_wing_vtk(VD_wing,n_cw,n_sw,n_cp,Results,file)    
+        files = [write_wing_vtk(VD_wing,n_cw,n_sw,n_cp,Results,file,file_format)]
     
     
-    return
+    return files
 
 ## @ingroup Input_Output-VTK
-def write_wing_vtk(wing,n_cw,n_sw,n_cp,Results,filename):
-    # Create file
-    with open(filename, 'w') as f:
-
-        #---------------------
-        # Write header
-        #---------------------
-        l1 = "# vtk DataFile Version 4.0"     # File version and identifier
-        l2 = "\nSUAVE Model of PROWIM Wing "  # Title
-        l3 = "\nASCII"                        # Data type
-        l4 = "\nDATASET UNSTRUCTURED_GRID"    # Dataset structure / topology
-
-        header = [l1, l2, l3, l4]
-        f.writelines(header)
-
-        #---------------------
-        # Write Points:
-        #---------------------
-        n_indices = (n_cw+1)*(n_sw+1)    # total number of cell vertices
-        points_header = "\n\nPOINTS "+str(n_indices) +" float"
-        f.write(points_header)
-
-        cw_laps =0
-        for i in range(n_indices):
-
-            if i == n_indices-1:
-                # Last index; use B2 to get rightmost TE node
-                xp = round(wing.XB2[i-cw_laps-n_cw-1],4)
-                yp = round(wing.YB2[i-cw_laps-n_cw-1],4)
-                zp = round(wing.ZB2[i-cw_laps-n_cw-1],4)
-            elif i > (n_indices-1-(n_cw+1)):
-                # Last spanwise set; use B1 to get rightmost node indices
-                xp = round(wing.XB1[i-cw_laps-n_cw],4)
-                yp = round(wing.YB1[i-cw_laps-n_cw],4)
-                zp = round(wing.ZB1[i-cw_laps-n_cw],4)
-            elif i==0:
-                # first point
-                xp = round(wing.XA1[i],4)
-                yp = round(wing.YA1[i],4)
-                zp = round(wing.ZA1[i],4)
-
-            elif i//(n_cw+cw_laps*(n_cw+1))==1:
-                # Last chordwise station for this spanwise location; use A2 to get left TE node
-                cw_laps = cw_laps +1
-                xp = round(wing.XA2[i-cw_laps],4)
-                yp = round(wing.YA2[i-cw_laps],4)
-                zp = round(wing.ZA2[i-cw_laps],4)
-
-
-            else:
-                # print the point index (Left LE --> Left TE --> Right LE --> Right TE)
-                xp = round(wing.XA1[i-cw_laps],4)
-                yp = round(wing.YA1[i-cw_laps],4)
-                zp = round(wing.ZA1[i-cw_laps],4)
-
-            new_point = "\n"+str(xp)+" "+str(yp)+" "+str(zp)
-            f.write(new_point)
-        
-        #---------------------
-        # Write Cells:
-        #---------------------
-        n            = n_cp # total number of cells
-        v_per_cell   = 4 # quad cells
-        size         = n*(1+v_per_cell) # total number of integer values required to represent the list
-        cell_header  = "\n\nCELLS "+str(n)+" "+str(size)
-        f.write(cell_header)
-
-
-        for i in range(n_cp):
-            if i==0:
-                node = i
-            elif i%n_cw ==0:
-                node = node+1
-            new_cell = "\n4 "+str(node)+" "+str(node+1)+" "+str(node+n_cw+2)+" "+str(node+n_cw+1)
-            f.write(new_cell)
-
-            # update node:
-            node = node+1
-
-        #---------------------
-        # Write Cell Types:
-        #---------------------
-        cell_type_header  = "\n\nCELL_TYPES "+str(n)
-        f.write(cell_type_header)
-        for i in range(n_cp):
-            f.write("\n9")
-
-        #--------------------------
-        # Write Scalar Cell Data:
-        #--------------------------
-        cell_data_header  = "\n\nCELL_DATA "+str(n)
-        f.write(cell_data_header)
-
-        # First scalar value
-        f.write("\nSCALARS i float 1")
-        f.write("\nLOOKUP_TABLE default")
-        for i in range(n_cp):
-            new_idx = str(i)
-            f.write("\n"+new_idx)
-        
-        if Results is not None:
-            if 'vlm_results' in Results.keys():
-                # Check for results
-                try:
-                    cl = Results.vlm_results.cl_y[0]
-                    f.write("\nSCALARS cl float 1")
-                    f.write("\nLOOKUP_TABLE default")
-                    for i in range(n_cp):
-                        new_cl = str(cl[int(i/n_cw)])
-                        f.write("\n"+new_cl)
-                except:
-                    print("No 'cl_y_DVE' in results. Skipping this scalar output.")
-    
-                try:
-                    cl = Results.vlm_results.cl_y[0]
-                    CL = Results.vlm_results.CL[0][0]
-                    f.write("\nSCALARS Cl/CL float 1")
-                    f.write("\nLOOKUP_TABLE default")
-    
-                    for i in range(n_cp):
-                        new_cl_CL = str(cl[int(i/n_cw)]/CL)
-                        f.write("\n"+new_cl_CL)
-                except:
-                    print("No 'CL' in Results.vlm_results. Skipping this scalar output.")
-    
-                try:
-                    cd = Results.vlm_results.cdi_y[0]
-                    f.write("\nSCALARS cdi float 1")
-                    f.write("\nLOOKUP_TABLE default")
-    
-                    for i in range(n_cp):
-                        new_cd = str(cd[int(i/n_cw)])
-                        f.write("\n"+new_cd)
-                except:
-                    print("No 'cdi_y' in Results.vlm_results. Skipping this scalar output.")
-    
-                try:
-                    cd = Results.vlm_results.cdi_y[0]
-                    CD = Results.vlm_results.CDi[0][0]
-    
-                    f.write("\nSCALARS cd_CD float 1")
-                    f.write("\nLOOKUP_TABLE default")
-    
-                    for i in range(n_cp):
-                        new_cd_CD = str(cd[int(i/n_cw)]/CD)
-                        f.write("\n"+new_cd_CD)
-                except:
-                    print("No 'CDi_wing_DVE' in results. Skipping this scalar output.")
-    
-                try:
-                    CP = Results.vlm_results.CP
-    
-                    f.write("\nSCALARS CP float 1")
-                    f.write("\nLOOKUP_TABLE default")
-    
-                    for i in range(n_cp):
-                        new_CP = str(CP[i])
-                        f.write("\n"+new_CP)
-                except:
-                    print("No 'CP' in results. Skipping this scalar output.")
-
-    f.close()
-    return
+def write_wing_vtk(wing,n_cw,n_sw,n_cp,Results,filename,file_format='ascii'):
+    """
+    Writes the panels of a SUAVE wing to a VTK file.
+
+    Inputs:
+       wing           Vortex distribution of the wing panels             [Unitless]
+       n_cw           Number of chordwise panels                         [Unitless]
+       n_sw           Number of spanwise panels                          [Unitless]
+       n_cp           Number of panels                                   [Unitless]
+       Results        Data structure of wing and propeller results       [Unitless]
+       filename       Name of vtk file to save                           [String]
+       file_format    'ascii', 'binary' or 'xml'                         [String]
+
+    Outputs:
+       filename       Name of the file written                           [String]
+
+    Properties Used:
+       N/A
+
+    Assumptions:
+       Quad cell structures for mesh
+
+    Source:
+       None
+
+    """
+    #---------------------
+    # Points:
+    #---------------------
+    # each spanwise strip contributes its left edge (Left LE --> Left TE), the last strip also its right edge
+    A1 = np.stack([wing.XA1,wing.YA1,wing.ZA1],axis=-1)[:n_cp].reshape(n_sw,n_cw,3)
+    A2 = np.stack([wing.XA2,wing.YA2,wing.ZA2],axis=-1)[:n_cp].reshape(n_sw,n_cw,3)
+    B1 = np.stack([wing.XB1,wing.YB1,wing.ZB1],axis=-1)[:n_cp].reshape(n_sw,n_cw,3)
+    B2 = np.stack([wing.XB2,wing.YB2,wing.ZB2],axis=-1)[:n_cp].reshape(n_sw,n_cw,3)
+
+    left_edges  = np.concatenate((A1,A2[:,-1:]),axis=1)
+    right_edge  = np.concatenate((B1[-1],B2[-1,-1:]),axis=0)
+    points      = np.round(np.concatenate((left_edges.reshape(-1,3),right_edge)),4)
+
+    #---------------------
+    # Cells:
+    #---------------------
+    i     = np.arange(n_cp)
+    node  = i + i//n_cw
+    cells = np.stack([node,node+1,node+n_cw+2,node+n_cw+1],axis=-1)
+
+    #--------------------------
+    # Scalar Cell Data:
+    #--------------------------
+    cell_data   = Data()
+    cell_data.i = i
+    strip       = i//n_cw
+
+    if Results is not None:
+        if 'vlm_results' in Results.keys():
+            # Check for results
+            try:
+                cell_data['cl'] = Results.vlm_results.cl_y[0][strip]
+            except:
+                print("No 'cl_y_DVE' in results. Skipping this scalar output.")
+
+            try:
+                cell_data['Cl/CL'] = Results.vlm_results.cl_y[0][strip]/Results.vlm_results.CL[0][0]
+            except:
+                print("No 'CL' in Results.vlm_results. Skipping this scalar output.")
+
+            try:
+                cell_data['cdi'] = Results.vlm_results.cdi_y[0][strip]
+            except:
+                print("No 'cdi_y' in Results.vlm_results. Skipping this scalar output.")
+
+            try:
+                cell_data['cd_CD'] = Results.vlm_results.cdi_y[0][strip]/Results.vlm_results.CDi[0][0]
+            except:
+                print("No 'CDi_wing_DVE' in results. Skipping this scalar output.")
+
+            try:
+                cell_data['CP'] = np.asarray(Results.vlm_results.CP)[i]
+            except:
+                print("No 'CP' in results. Skipping this scalar output.")
+
+    filename = write_unstructured_grid(filename, "SUAVE Model of PROWIM Wing ", points, cells, 9, cell_data, file_format=file_format)
+
+    return filename
@@ -2,7 +2,7 @@
 # store_wake_evolution_vtks.py
 #
 # Created:  Feb 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,17 +11,21 @@ import SUAVE
 from SUAVE.Core import Data
 from SUAVE.Input_Output.VTK.save_vehicle_vtk import save_vehicle_vtks
 from SUAVE.Input_Output.VTK.save_evaluation_points_vtk import save_evaluation_points_vtk
+from SUAVE.Input_Output.VTK.save_vtk_collection import save_vtk_collection
 
 import numpy as np
 
 ## @ingroup Input_Output-VTK
-def store_wake_evolution_vtks(wake,rotor,save_loc=None):
+def store_wake_evolution_vtks(wake,rotor,save_loc=None,file_format='ascii'):
     """
-    Saves evolution of rotor wake over single rotation. Outputs VTK files in legacy format.
+    Saves evolution of rotor wake over single rotation. Outputs VTK files in legacy or xml format,
+    and a collection file (wake_evolution.pvd) that steps through them in time.
 
     Inputs:
        wake                SUAVE Fidelity One rotor wake
        rotor               SUAVE rotor                
+       save_loc            Location at which to save vtk files                [String]
+       file_format         'ascii', 'binary' or 'xml'                         [String]
 
     Outputs:
        N/A
@@ -57,6 +61,7 @@ def store_wake_evolution_vtks(wake,rotor,save_loc=None):
         pass
     else:
         # after converged, store vtks for final wake shape for each of Na starting positions
+        files = []
         for i in range(Na):
             # increment blade angle to new azimuthal position
             blade_angle       = (omega[0][0]*t0 + i*(2*np.pi/(Na))) * rotor.rotation  # Positive rotation, positive blade angle
@@ -72,7 +77,7 @@ def store_wake_evolution_vtks(wake,rotor,save_loc=None):
             net.propellers.append(rotor)
             vehicle.append_component(net) 
 
-            save_vehicle_vtks(vehicle, Results=Data(), time_step=i,save_loc=save_loc)  
+            step_files = save_vehicle_vtks(vehicle, Results=Data(), time_step=i,save_loc=save_loc,file_format=file_format)  
 
             Yb   = wake.vortex_distribution.reshaped_wake.Yblades_cp[i,0,0,:,0] 
             Zb   = wake.vortex_distribution.reshaped_wake.Zblades_cp[i,0,0,:,0] 
@@ -89,5 +94,9 @@ def store_wake_evolution_vtks(wake,rotor,save_loc=None):
             points.induced_velocities = Data()
             points.induced_velocities.va = rotor_outputs.disc_axial_induced_velocity[0,:,i]
             points.induced_velocities.vt = rotor_outputs.disc_tangential_induced_velocity[0,:,i]
-            save_evaluation_points_vtk(points,filename=save_loc+"/eval_pts.vtk", time_step=i)
+            step_files.append(save_evaluation_points_vtk(points,filename=save_loc+"/eval_pts.vtk", time_step=i, file_format=file_format))
+            files.append(step_files)
+
+        # group the time steps into a single collection
+        save_vtk_collection(save_loc+"/wake_evolution.pvd", files, t0 + dt*np.arange(Na))
     return
\ No newline at end of file
@@ -2,9 +2,10 @@
 # write_azimuthal_cell_values.py
 # 
 # Created:    Jun 2021, R. Erhard
-# Modified: 
+# Modified:   Oct 2026, SUAVE Team
 #  
 
+import numpy as np
 
 def write_azimuthal_cell_values(f, n_cells, n_a):
     """
@@ -28,20 +29,38 @@ def write_azimuthal_cell_values(f, n_cells, n_a):
     Source:  
        None
     """
-    rlap=0
-    for i in range(n_cells): # loop over all nodes in blade
-        if i==(n_a-1+n_a*rlap):
-            # last airfoil face connects back to first node
-            b    = i-(n_a-1)
-            c    = i+1
-            rlap = rlap+1
-        else:
-            b = i+1
-            c = i+n_a+1
-            
-        a        = i
-        d        = i+n_a
-        new_cell = "\n4 "+str(a)+" "+str(b)+" "+str(c)+" "+str(d)
-        
-        f.write(new_cell)
+    cells = azimuthal_cell_values(n_cells, n_a)
+    f.write("".join(["\n4 "+" ".join(map(str,cell)) for cell in cells.tolist()]))
     return
+
+def azimuthal_cell_values(n_cells, n_a):
+    """
+    Computes the node indices of the quad cells around the azimuth of
+    a component, for nodes stored ring by ring.
+
+    Inputs:
+       n_cells      Total number of cells in component    [Unitless]
+       n_a          Total number of azimuthal nodes       [Unitless]
+
+    Outputs:
+       cells        Node indices of each cell, (n_cells,4) [Unitless]
+
+    Properties Used:
+       N/A
+
+    Assumptions:
+       N/A
+
+    Source:
+       None
+    """
+    i    = np.arange(n_cells)
+
+    # last airfoil face connects back to first node
+    last = (i % n_a) == (n_a-1)
+    a    = i
+    b    = np.where(last, i-(n_a-1), i+1)
+    c    = np.where(last, i+1, i+n_a+1)
+    d    = i+n_a
+
+    return np.stack([a,b,c,d],axis=-1)
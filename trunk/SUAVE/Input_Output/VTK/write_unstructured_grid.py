@@ -0,0 +1,246 @@
+## @ingroup Input_Output-VTK
+# write_unstructured_grid.py
+#
+# Created:    Oct 2026, SUAVE Team
+# Modified:
+#
+
+#------------------------------
+# Imports
+#------------------------------
+from SUAVE.Core import Data
+import numpy as np
+
+#------------------------------
+# Unstructured grid writer
+#------------------------------
+## @ingroup Input_Output-VTK
+def write_unstructured_grid(filename, title, points, cells, cell_type, cell_data=None, point_data=None, file_format='ascii'):
+    """
+    Writes an unstructured grid of a single cell type to a VTK file. The points, cells and scalars
+    are passed as arrays and each block is written from its numpy buffer in a single call.
+
+    Inputs:
+       filename       Name of vtk file to save                                    [String]
+       title          Title line of the file                                      [String]
+       points         Coordinates of the nodes, (n_points,3)                      [Unitless]
+       cells          Node indices of each cell, (n_cells,n_vertices_per_cell)    [Unitless]
+       cell_type      VTK cell type (1 vertex, 4 poly line, 9 quad)               [Unitless]
+       cell_data      Scalars of each cell, in order of writing                   [Data]
+       point_data     Scalars of each node, in order of writing                   [Data]
+       file_format    'ascii' or 'binary' legacy VTK (.vtk),                      [String]
+                      or 'xml' VTK with raw appended data (.vtu)
+
+    Outputs:
+       filename       Name of the file written                                    [String]
+
+    Properties Used:
+       N/A
+
+    Assumptions:
+       Legacy binary files are big endian, xml files are little endian with 64 bit headers.
+       Binary and xml data are stored in single precision.
+
+    Source:
+       VTK File Formats, VTK User's Guide, Kitware
+    """
+    points     = np.reshape(np.asarray(points),(-1,3))
+    cells      = np.atleast_2d(np.asarray(cells,dtype=int))
+    cell_data  = Data() if cell_data is None else cell_data
+    point_data = Data() if point_data is None else point_data
+
+    if file_format == 'ascii':
+        write_legacy_ascii(filename, title, points, cells, cell_type, cell_data, point_data)
+    elif file_format == 'binary':
+        write_legacy_binary(filename, title, points, cells, cell_type, cell_data, point_data)
+    elif file_format == 'xml':
+        filename = filename[0:filename.rfind('.')] + '.vtu'
+        write_xml_appended(filename, points, cells, cell_type, cell_data, point_data)
+    else:
+        raise ValueError("Unknown VTK file format '" + str(file_format) + "', use 'ascii', 'binary' or 'xml'.")
+
+    return filename
+
+## @ingroup Input_Output-VTK
+def write_legacy_ascii(filename, title, points, cells, cell_type, cell_data, point_data):
+    """
+    Writes an unstructured grid as a VTK file in legacy ASCII format.
+
+    Inputs:
+       See write_unstructured_grid
+
+    Outputs:
+       N/A
+
+    Properties Used:
+       N/A
+
+    Assumptions:
+       N/A
+
+    Source:
+       None
+    """
+    n_points   = len(points)
+    n_cells    = len(cells)
+    v_per_cell = np.shape(cells)[1]
+
+    cell_list  = np.hstack((np.full((n_cells,1),v_per_cell),cells))
+
+    blocks = ["# vtk DataFile Version 4.0\n" + title + "\nASCII\nDATASET UNSTRUCTURED_GRID",
+              "\n\nPOINTS " + str(n_points) + " float",
+              ascii_rows(points),
+              "\n\nCELLS " + str(n_cells) + " " + str(cell_list.size),
+              ascii_rows(cell_list),
+              "\n\nCELL_TYPES " + str(n_cells),
+              ascii_rows(np.full((n_cells,1),cell_type))]
+
+    for header, n, data in [("\n\nCELL_DATA ",n_cells,cell_data),("\n\nPOINT_DATA ",n_points,point_data)]:
+        if len(data.keys()) == 0:
+            continue
+        blocks.append(header + str(n))
+        for name, values in data.items():
+            blocks.append("\nSCALARS " + name + " float 1\nLOOKUP_TABLE default")
+            blocks.append(ascii_rows(np.reshape(values,(n,1))))
+
+    with open(filename, 'w') as f:
+        f.write("".join(blocks))
+
+    return
+
+## @ingroup Input_Output-VTK
+def write_legacy_binary(filename, title, points, cells, cell_type, cell_data, point_data):
+    """
+    Writes an unstructured grid as a VTK file in legacy binary format.
+
+    Inputs:
+       See write_unstructured_grid
+
+    Outputs:
+       N/A
+
+    Properties Used:
+       N/A
+
+    Assumptions:
+       N/A
+
+    Source:
+       None
+    """
+    n_points   = len(points)
+    n_cells    = len(cells)
+    v_per_cell = np.shape(cells)[1]
+
+    cell_list  = np.hstack((np.full((n_cells,1),v_per_cell),cells))
+
+    blocks = [("# vtk DataFile Version 4.0\n" + title + "\nBINARY\nDATASET UNSTRUCTURED_GRID\n").encode(),
+              ("POINTS " + str(n_points) + " float\n").encode(),
+              points.astype('>f4').tobytes(),
+              ("\nCELLS " + str(n_cells) + " " + str(cell_list.size) + "\n").encode(),
+              cell_list.astype('>i4').tobytes(),
+              ("\nCELL_TYPES " + str(n_cells) + "\n").encode(),
+              np.full(n_cells,cell_type,dtype='>i4').tobytes()]
+
+    for header, n, data in [("\nCELL_DATA ",n_cells,cell_data),("\nPOINT_DATA ",n_points,point_data)]:
+        if len(data.keys()) == 0:
+            continue
+        blocks.append((header + str(n)).encode())
+        for name, values in data.items():
+            blocks.append(("\nSCALARS " + name + " float 1\nLOOKUP_TABLE default\n").encode())
+            blocks.append(np.asarray(values,dtype='>f4').tobytes())
+    blocks.append(b"\n")
+
+    with open(filename, 'wb') as f:
+        f.write(b"".join(blocks))
+
+    return
+
+## @ingroup Input_Output-VTK
+def write_xml_appended(filename, points, cells, cell_type, cell_data, point_data):
+    """
+    Writes an unstructured grid as a VTK XML file (.vtu) with all arrays stored as raw
+    appended data.
+
+    Inputs:
+       See write_unstructured_grid
+
+    Outputs:
+       N/A
+
+    Properties Used:
+       N/A
+
+    Assumptions:
+       N/A
+
+    Source:
+       None
+    """
+    n_points   = len(points)
+    n_cells    = len(cells)
+    v_per_cell = np.shape(cells)[1]
+
+    arrays = []
+    def append_array(values, dtype, vtk_type, attributes):
+        # each appended block is preceded by its size in bytes, the offset counts from the first block
+        offset = sum([len(a) for a in arrays])
+        buffer = np.ascontiguousarray(values,dtype=dtype).tobytes()
+        arrays.append(np.array([len(buffer)],dtype='<u8').tobytes() + buffer)
+        return '<DataArray type="' + vtk_type + '"' + attributes + ' format="appended" offset="' + str(offset) + '"/>'
+
+    xml  = ['<?xml version="1.0"?>',
+            '<VTKFile type="UnstructuredGrid" version="1.0" byte_order="LittleEndian" header_type="UInt64">',
+            '<UnstructuredGrid>',
+            '<Piece NumberOfPoints="' + str(n_points) + '" NumberOfCells="' + str(n_cells) + '">',
+            '<Points>',
+            append_array(points,'<f4','Float32',' NumberOfComponents="3"'),
+            '</Points>',
+            '<Cells>',
+            append_array(cells.ravel(),'<i8','Int64',' Name="connectivity"'),
+            append_array(v_per_cell*np.arange(1,n_cells+1),'<i8','Int64',' Name="offsets"'),
+            append_array(np.full(n_cells,cell_type),'u1','UInt8',' Name="types"'),
+            '</Cells>']
+
+    for tag, data in [('CellData',cell_data),('PointData',point_data)]:
+        if len(data.keys()) == 0:
+            continue
+        xml.append('<' + tag + ' Scalars="' + list(data.keys())[0] + '">')
+        for name, values in data.items():
+            xml.append(append_array(values,'<f4','Float32',' Name="' + name + '"'))
+        xml.append('</' + tag + '>')
+
+    xml += ['</Piece>',
+            '</UnstructuredGrid>',
+            '<AppendedData encoding="raw">']
+
+    with open(filename, 'wb') as f:
+        f.write(("\n".join(xml) + "\n_").encode())
+        f.write(b"".join(arrays))
+        f.write(b"\n</AppendedData>\n</VTKFile>\n")
+
+    return
+
+## @ingroup Input_Output-VTK
+def ascii_rows(values):
+    """
+    Formats the rows of a 2D array as lines of space separated values, each starting with a
+    newline. Values are written with the shortest representation of their own precision.
+
+    Inputs:
+       values         Array to format                                             [Unitless]
+
+    Outputs:
+       text           Formatted values                                            [String]
+
+    Properties Used:
+       N/A
+
+    Assumptions:
+       N/A
+
+    Source:
+       None
+    """
+    rows = np.asarray(values).astype(str).tolist()
+    return "".join(["\n" + " ".join(row) for row in rows])
@@ -3,6 +3,7 @@
 
 # Created:  Mar 2021, M. Clarke
 # Modified: Sep 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -514,12 +515,10 @@ def concatenate_surfaces(X_BOT,X_TOP,FUNC_BOT_SURF,FUNC_TOP_SURF,npanel,ncases,n
     Properties Used:
     N/A  
     '''  
-    FUNC = np.zeros((npanel,ncases,ncpts))  
-    
-    for case in range(ncases):
-        for cpt in range(ncpts):   
-            top_func          = FUNC_TOP_SURF[:,case,cpt][X_TOP[:,case,cpt].mask == False] 
-            bot_func          = FUNC_BOT_SURF[:,case,cpt][X_BOT[:,case,cpt].mask == False]                  
-            FUNC[:,case,cpt]  = np.concatenate([bot_func[::-1],top_func])
+    FUNC_BOT   = np.ma.array(FUNC_BOT_SURF, mask = np.ma.getmaskarray(X_BOT))
+    FUNC_TOP   = np.ma.array(FUNC_TOP_SURF, mask = np.ma.getmaskarray(X_TOP))
+    FUNC_VALS  = np.ma.concatenate([np.flip(FUNC_BOT,axis = 0),FUNC_TOP], axis = 0)
+    FUNC_VALS_1= FUNC_VALS.flatten('F')
+    FUNC_VALS_2= FUNC_VALS_1.data[~FUNC_VALS_1.mask]
+    FUNC       = FUNC_VALS_2.reshape((npanel,ncases,ncpts),order = 'F')
     return FUNC
-    
\ No newline at end of file
@@ -3,14 +3,15 @@
 
 # Created:  Mar 2021, M. Clarke
 # Modified: Sep 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from SUAVE.Core import Data 
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.integrate import odeint  
+
+from .surface_points import gather_surface_points, scatter_surface_points, replace_unconverged_points
 # ----------------------------------------------------------------------
 # heads_method.py 
 # ----------------------------------------------------------------------   
@@ -25,7 +26,7 @@ def heads_method(npanel,ncases,ncpts,DEL_0,THETA_0,DELTA_STAR_0, TURBULENT_SURF,
     Journal of fluid mechanics 107 (1981): 297-338.
 
     Assumptions:
-    None  
+    All cases and control points are marched at once with an adaptive Runge-Kutta scheme  
 
     Inputs: 
     ncases         - number of cases                                                             [unitless]
@@ -56,103 +57,73 @@ def heads_method(npanel,ncases,ncpts,DEL_0,THETA_0,DELTA_STAR_0, TURBULENT_SURF,
     N/A
     """   
      
-    # Initialize vectors 
-    X_H          = np.zeros((npanel,ncases,ncpts))
-    THETA_H      = np.zeros_like(X_H)
-    DELTA_STAR_H = np.zeros_like(X_H)
-    H_H          = np.zeros_like(X_H)
-    CF_H         = np.zeros_like(X_H) 
-    RE_THETA_H   = np.zeros_like(X_H)
-    RE_X_H       = np.zeros_like(X_H)
-    DELTA_H      = np.zeros_like(X_H)       
- 
-          
-    for case in range(ncases):
-        for cpt in range(ncpts):  
-            # length of tubulent surface  
-            l = TURBULENT_SURF[case,cpt] 
-            if l == 0.0:
-                pass
-            else: 
-                theta_0      = THETA_0[case,cpt] 
-                Re_L         = RE_L[case,cpt] 
-                nu           = l/Re_L    
-                x_i          = TURBULENT_COORD.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False] 
-                Ve_i         = VE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                dVe_i        = DVE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]  
-                del_0        = DEL_0[case,cpt]
-                del_star_0   = DELTA_STAR_0[case,cpt]
-                H_0          = del_star_0 / theta_0
-                H1_0         = getH1(np.atleast_1d(H_0))[0]
-                if np.isnan(H1_0):
-                    H1_0     = (del_0 - del_star_0) / theta_0 
-                y0           = [theta_0, getVe(0,x_i,Ve_i)*theta_0*H1_0]     
-                y            = odeint(odefcn,y0,x_i,args=(Re_L/l, x_i, Ve_i, dVe_i))  
-                
-                # Compute momentum thickness, theta 
-                theta            = y[:,0]  
-                ind              = np.where(~np.isnan(theta))[0]
-                first, last      = ind[0], ind[-1]
-                theta[:first]    = theta[first]
-                dtheta_dx        = (theta[last]-theta[last-1])/(x_i[last]-x_i[last-1])
-                theta[last + 1:] = theta[last] + dtheta_dx*(x_i[last + 1:]-x_i[last])
-                
-                Ve_theta_H1            = y[:,1]  
-                ind                    = np.where(~np.isnan(Ve_theta_H1))[0]
-                first, last            = ind[0], ind[-1]
-                Ve_theta_H1[:first]    = Ve_theta_H1[first]
-                dVe_theta_H1_dx        = (Ve_theta_H1[last]-Ve_theta_H1[last-1])/(x_i[last]-x_i[last-1])
-                Ve_theta_H1[last + 1:] = Ve_theta_H1[last] + dVe_theta_H1_dx*(x_i[last + 1:]-x_i[last])
-                
-                # find theta values that do not converge and replace them with neighbor
-                idx1         = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol )[0]
-                if len(idx1)> 1: 
-                    np.put(theta,idx1 + 1, theta[idx1])    
-                idx1         = np.where(abs((Ve_theta_H1[1:] - Ve_theta_H1[:-1])/Ve_theta_H1[:-1]) >tol)[0]
-                if len(idx1)> 1: 
-                    np.put(Ve_theta_H1,idx1 + 1, Ve_theta_H1[idx1])    
-                  
-                # Compute mass flow shape factor, H1
-                H1           = Ve_theta_H1/(theta*Ve_i)
-                
-                # Compute H 
-                H            = getH(np.atleast_1d(H1)) 
-                H[H<0]       = 1E-6    # H cannot be negative 
-                # find H values that do not converge and replace them with neighbor
-                idx1               = np.where(abs((H[1:] - H[:-1])/H[:-1]) >tol)[0]
-                if len(idx1)> 1: 
-                    np.put(H,idx1 + 1, H[idx1])     
-                
-                # Compute Reynolds numbers based on momentum thickness  
-                Re_theta     = Re_L/l * Ve_i*theta 
-                
-                # Compute Reynolds numbers based on distance along airfoil
-                Re_x         = Ve_i* x_i / nu
-                
-                # Compute skin friction 
-                cf           = abs( getcf(np.atleast_1d(Re_theta),np.atleast_1d(H))) 
-                
-                # Compute displacement thickness
-                del_star     = H*theta   
-                
-                # Compute boundary layer thickness 
-                delta        = theta*H1 + del_star 
-                
-                # Reynolds number at x=0 cannot be negative (give nans)
-                Re_x[0]      = 1E-5                
+    shape        = (npanel,ncases,ncpts)
+    
+    # gather the points of every surface so that all cases and control points are marched at once 
+    src, n_pts   = gather_surface_points(np.ma.getmaskarray(TURBULENT_COORD))
+    x_i          = np.take_along_axis(np.reshape(TURBULENT_COORD.data,(npanel,-1)),src,axis = 0)
+    Ve_i         = np.take_along_axis(np.reshape(VE_I.data,(npanel,-1)),src,axis = 0)
+    dVe_i        = np.take_along_axis(np.reshape(DVE_I.data,(npanel,-1)),src,axis = 0)
+    
+    # surfaces without a turbulent length are not computed  
+    l            = np.reshape(TURBULENT_SURF,-1)
+    n_pts[l == 0]= 0 
+    l            = np.where(l == 0,1.,l)
+    Re_L         = np.reshape(RE_L,-1)
+    nu           = l/Re_L   
+    theta_0      = np.reshape(THETA_0,-1)
+    del_0        = np.reshape(DEL_0,-1)
+    del_star_0   = np.reshape(DELTA_STAR_0,-1)
+    H_0          = del_star_0 / theta_0
+    H1_0         = getH1(np.atleast_1d(H_0))
+    H1_0         = np.where(np.isnan(H1_0),(del_0 - del_star_0) / theta_0,H1_0)
+    y0           = np.array([theta_0, getVe(0,x_i,Ve_i)*theta_0*H1_0])     
+    y            = march_boundary_layer(y0,x_i,Ve_i,dVe_i,Re_L/l,n_pts)
+    
+    # Compute momentum thickness, theta and extrapolate over points where the march failed 
+    theta        = extrapolate_nans(y[0],x_i,n_pts)
+    Ve_theta_H1  = extrapolate_nans(y[1],x_i,n_pts)
+    
+    # find theta values that do not converge and replace them with neighbor
+    theta        = replace_unconverged_points(theta,n_pts,tol)
+    Ve_theta_H1  = replace_unconverged_points(Ve_theta_H1,n_pts,tol)
+      
+    # Compute mass flow shape factor, H1
+    H1           = Ve_theta_H1/(theta*Ve_i)
+    
+    # Compute H 
+    H            = getH(H1) 
+    H[H<0]       = 1E-6    # H cannot be negative 
+    # find H values that do not converge and replace them with neighbor
+    H            = replace_unconverged_points(H,n_pts,tol)
+    
+    # Compute Reynolds numbers based on momentum thickness  
+    Re_theta     = Re_L/l * Ve_i*theta 
+    
+    # Compute Reynolds numbers based on distance along airfoil
+    Re_x         = Ve_i* x_i / nu
     
-                # Find where matrices are not masked 
-                indices = np.where(TURBULENT_COORD.mask[:,case,cpt] == False)
-                
-                # Store results 
-                np.put(X_H[:,case,cpt],indices,x_i )
-                np.put(THETA_H[:,case,cpt],indices,theta)
-                np.put(DELTA_STAR_H[:,case,cpt],indices,del_star)
-                np.put(H_H[:,case,cpt],indices,H)
-                np.put(CF_H[:,case,cpt],indices ,cf)
-                np.put(RE_THETA_H[:,case,cpt],indices,Re_theta)
-                np.put(RE_X_H[:,case,cpt],indices,Re_x)
-                np.put(DELTA_H[:,case,cpt],indices,delta) 
+    # Compute skin friction 
+    cf           = abs( getcf(Re_theta,H)) 
+    
+    # Compute displacement thickness
+    del_star     = H*theta   
+    
+    # Compute boundary layer thickness 
+    delta        = theta*H1 + del_star 
+    
+    # Reynolds number at x=0 cannot be negative (give nans)
+    Re_x[0]      = 1E-5                
+
+    # Store results at the unmasked locations 
+    X_H          = scatter_surface_points(x_i,src,n_pts,shape)
+    THETA_H      = scatter_surface_points(theta,src,n_pts,shape)
+    DELTA_STAR_H = scatter_surface_points(del_star,src,n_pts,shape)
+    H_H          = scatter_surface_points(H,src,n_pts,shape)
+    CF_H         = scatter_surface_points(cf,src,n_pts,shape)
+    RE_THETA_H   = scatter_surface_points(Re_theta,src,n_pts,shape)
+    RE_X_H       = scatter_surface_points(Re_x,src,n_pts,shape)
+    DELTA_H      = scatter_surface_points(delta,src,n_pts,shape)
 
     RESULTS = Data(
         X_H          = X_H,      
@@ -205,19 +176,115 @@ def getH1(H) :
     H1[idx1] = 3.3 + 1.5501*(H[idx1] - 0.6778)**-3.064
     return H1 
 
-def odefcn(y,x,ReL_div_L, x_i, Ve_i, dVe_i): 
-    """ Computes boundary layer functions using SciPy ODE solver 
+def march_boundary_layer(y0,x_i,Ve_i,dVe_i,ReL_div_L,n_pts,rtol=1E-8,atol=1E-12):
+    """ Integrates the boundary layer equations of all surfaces at once with an adaptive
+    Dormand-Prince 5(4) Runge-Kutta scheme. Every surface keeps its own step size and the
+    surfaces are advanced together, a step never crosses a point of the surface so that the
+    interpolated velocities are smooth within each step. Surfaces whose step size collapses 
+    (e.g. the mass flow shape factor drops below its singular value) are stopped and return 
+    nans for the remaining points.
+    
+    Assumptions:
+    Boundary layer velocity and its derivative are linear between points
+    
+    Source:
+    Dormand, J. R., and P. J. Prince. "A family of embedded Runge-Kutta formulae." 
+    Journal of computational and applied mathematics 6.1 (1980): 19-26.
+    
+    Inputs:  
+    y0          - initial momentum thickness and the product of the velocity, momentum 
+                  thickness and mass flow shape factor, (2,nsurf)    [unitless]
+    x_i         - x coordinates of points, (npanel,nsurf)             [unitless]
+    Ve_i        - boundary layer velocity, (npanel,nsurf)             [m/s]
+    dVe_i       - derivative of bounday layer velocity                [m/s-m]
+    ReL_div_L   - ratio of Reynolds number to length of surface       [unitless]
+    n_pts       - number of points on each surface                    [unitless]
+    rtol        - relative error tolerance                            [unitless]
+    atol        - absolute error tolerance                            [unitless]
+
+    Outputs:  
+    Y           - solution at each point, (2,npanel,nsurf)            [unitless]
+    
+    Properties Used:
+    N/A 
+    """    
+    # Dormand-Prince coefficients 
+    C      = np.array([0., 1/5, 3/10, 4/5, 8/9, 1., 1.])
+    A      = [[],
+              [1/5],
+              [3/40, 9/40],
+              [44/45, -56/15, 32/9],
+              [19372/6561, -25360/2187, 64448/6561, -212/729],
+              [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+              [35/384, 0., 500/1113, 125/192, -2187/6784, 11/84]]
+    B      = np.array([35/384, 0., 500/1113, 125/192, -2187/6784, 11/84, 0.])
+    E      = B - np.array([5179/57600, 0., 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+    
+    npanel, nsurf = np.shape(x_i)
+    surfs  = np.arange(nsurf)
+    Y      = np.full((2,npanel,nsurf),np.nan)
+    Y[:,0] = y0
+    y      = np.array(y0,dtype = float)
+    k      = np.zeros(nsurf,dtype = int)           # panel of current step 
+    x      = np.copy(x_i[0])                       # location of current step 
+    h      = x_i[min(1,npanel-1)] - x_i[0]         # step size 
+    h[h<=0]= 1.0
+    h_min  = 1E-12*np.maximum(abs(x_i[-1]),1.0)
+    active = n_pts > 1 
+    
+    while np.any(active):
+        s      = surfs[active]
+        ks     = k[s] 
+        x0     = x_i[ks,s]
+        dx     = x_i[ks+1,s] - x0  
+        dx_pos = np.where(dx > 0,dx,1.) 
+        dVe    = np.where(dx > 0,(Ve_i[ks+1,s] - Ve_i[ks,s])/dx_pos,0.)
+        ddVe   = np.where(dx > 0,(dVe_i[ks+1,s] - dVe_i[ks,s])/dx_pos,0.)
+        x_end  = x0 + dx
+        hs     = np.minimum(h[s],x_end - x[s])
+        to_end = hs >= x_end - x[s]
+        ys     = y[:,s]
+        
+        # stages 
+        K = []
+        for i in range(7):
+            y_stage = ys + hs*sum([A[i][j]*K[j] for j in range(i)]) if i > 0 else ys 
+            x_stage = x[s] + C[i]*hs - x0
+            K.append(odefcn(y_stage,Ve_i[ks,s] + x_stage*dVe,dVe_i[ks,s] + x_stage*ddVe,ReL_div_L[s]))
+        y_new  = ys + hs*sum([B[j]*K[j] for j in range(6)])
+        error  = hs*sum([E[j]*K[j] for j in range(7)]) 
+        scale  = atol + rtol*np.maximum(abs(ys),abs(y_new))
+        e_norm = np.max(abs(error)/scale,axis = 0)
+        accept = ((e_norm <= 1.) & np.all(np.isfinite(y_new),axis = 0)) | (hs <= 0)
+        factor = np.clip(0.9*np.maximum(e_norm,1E-10)**-0.2,0.2,5.)
+        factor[~np.isfinite(e_norm)] = 0.25 
+        
+        # advance accepted steps and store the solution at the end of each panel
+        a          = s[accept] 
+        y[:,a]     = y_new[:,accept]
+        x[a]       = np.where(to_end[accept],x_end[accept],x[a] + hs[accept])
+        done       = s[accept & to_end]
+        k[done]   += 1
+        Y[:,k[done],done] = y[:,done]
+        
+        # a step shortened to reach the end of a panel does not limit the next step 
+        h[s]       = np.where(accept & to_end & (hs < h[s]),h[s],hs*factor) 
+        active[s]  = (k[s] < n_pts[s] - 1) & (h[s] >= h_min[s])
+        
+    return Y 
+
+def odefcn(y,Ve,dVe,ReL_div_L): 
+    """ Computes the derivatives of the boundary layer functions 
     Assumptions:
     None
     Source:
     None
     Inputs:  
-    y           - initial conditions of functions               [unitless]
-    x           - new x values at which to solve ODE            [unitless]
+    y           - momentum thickness and the product of the velocity, momentum 
+                  thickness and the mass flow shape factor      [unitless]
+    Ve          - boundary layer velocity                       [m/s]
+    dVe         - derivative of bounday layer velocity          [m/s-m]
     ReL_div_L   - ratio of Reynolds number to length of surface [unitless]
-    x_i         - intial array of x values                      [unitless]
-    Ve_i        - intial boundary layer velocity                [m/s]
-    dVe_i       - initial derivative of bounday layer velocity  [m/s-m]
 
     Outputs:  
     f           - 2D function of momentum thickness and the product of 
@@ -227,29 +294,25 @@ def odefcn(y,x,ReL_div_L, x_i, Ve_i, dVe_i):
     """    
     theta       = y[0]
     Ve_theta_H1 = y[1]  
-
-    if theta == 0:
-        H1 = Ve_theta_H1 / (theta + 1e-6) / getVe(x,x_i,Ve_i)
-    else:
-        H1 = Ve_theta_H1 / theta / getVe(x,x_i,Ve_i)
-
+    H1          = Ve_theta_H1 / np.where(theta == 0,theta + 1e-6,theta) / Ve
     H           = getH(np.atleast_1d(H1))
     Re_theta    = ReL_div_L * theta
     cf          = getcf(np.atleast_1d(Re_theta),np.atleast_1d(H))
-    dydx_1      = 0.5*cf-(theta/getVe(x,x_i,Ve_i))*(2+H)*getdVe(x, x_i, dVe_i)
-    dydx_2      = getVe(x,x_i,Ve_i)*0.0306*(H1 - 3)**-0.6169 
-    f           = [dydx_1,dydx_2] 
+    dydx_1      = 0.5*cf-(theta/Ve)*(2+H)*dVe
+    dydx_2      = Ve*0.0306*(H1 - 3)**-0.6169 
+    f           = np.array([dydx_1,dydx_2])
     return f 
 
 def getVe(x,x_i,Ve_i):
-    """ Interpolates the bounday layer velocity over a new dimension of x 
+    """ Linearly inter- or extrapolates the bounday layer velocity of each surface to x 
+    from the velocities at the first two points
     Assumptions:
     None
     Source:
     None
     Inputs: 
-    x         - new x dimension                    [unitless]
-    x_i       - old x dimension                    [unitless]
+    x         - new x value                        [unitless]
+    x_i       - old x dimension, (npanel,nsurf)    [unitless]
     Ve_i      - old boundary layer velocity values [m/s] 
 
     Outputs:  
@@ -257,30 +320,44 @@ def getVe(x,x_i,Ve_i):
     Properties Used:
     N/A 
     """    
-    Ve_func = interp1d(x_i,Ve_i,fill_value = "extrapolate")
-    Ve      = Ve_func(x)
+    if len(x_i) < 2:
+        return Ve_i[0]
+    dx      = x_i[1] - x_i[0]
+    slope   = np.divide(Ve_i[1] - Ve_i[0],dx,out = np.zeros_like(dx),where = dx != 0)
+    Ve      = Ve_i[0] + (x - x_i[0])*slope
     return Ve 
 
-def getdVe(x,x_i,dVe_i):
-    """ Interpolates the derivatives of the bounday layer velocity over a new dimension of x
-
+def extrapolate_nans(values,x_i,n_pts):
+    """ Replaces nans before the first valid point of each surface with the first valid value
+    and linearly extrapolates the last two valid values over the nans after the last valid point
     Assumptions:
     None
     Source:
     None
     Inputs: 
-    x         - new x dimension                                  [unitless]
-    x_i       - old x dimension                                  [unitless]
-    dVe_i     - old derivative of boundary layer velocity values [m/s-m] 
+    values    - values at points, (npanel,nsurf)   [unitless]
+    x_i       - x coordinates of points            [unitless]
+    n_pts     - number of points on each surface   [unitless]
 
     Outputs:  
-    dVe       - new derivative of boundary layer velocity values [m/s-m]
+    values    - values without nans                [unitless]
     Properties Used:
     N/A 
-    """        
-    dVe_func = interp1d(x_i,dVe_i,fill_value = "extrapolate")
-    dVe      = dVe_func(x)
-    return dVe  
+    """  
+    npanel  = len(values)
+    idx     = np.arange(npanel)[:,None]
+    valid   = ~np.isnan(values) & (idx < n_pts)
+    if np.all(valid | (idx >= n_pts)):
+        return values
+    surfs   = np.arange(np.shape(values)[1])
+    first   = np.argmax(valid,axis = 0)
+    last    = npanel - 1 - np.argmax(valid[::-1],axis = 0)
+    prev    = np.maximum(last - 1,0)
+    dx      = x_i[last,surfs] - x_i[prev,surfs]
+    slope   = np.divide(values[last,surfs] - values[prev,surfs],dx,out = np.zeros_like(dx),where = dx != 0)
+    values  = np.where(idx < first,values[first,surfs],values)
+    values  = np.where(idx > last,values[last,surfs] + slope*(x_i - x_i[last,surfs]),values)
+    return values 
 
 def getcf(Re_theta,H): 
     """ Computes the skin friction coefficient, cf
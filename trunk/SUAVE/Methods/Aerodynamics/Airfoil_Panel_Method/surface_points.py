@@ -0,0 +1,101 @@
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+# surface_points.py
+
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+import numpy as np
+
+# ----------------------------------------------------------------------
+# gather_surface_points
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def gather_surface_points(mask):
+    """ Computes the indices that gather the unmasked points of every surface
+    (case and control point) to the front of the point axis so that all surfaces
+    can be marched together. Surfaces with fewer points are padded with their last point.
+
+    Source:
+    None
+
+    Assumptions:
+    None
+
+    Inputs:
+    mask           - mask of points that are not on the surface, (npanel,ncases,ncpts)  [boolean]
+
+    Outputs:
+    src            - index of each gathered point on the panel axis, (npanel,ncases*ncpts) [unitless]
+    n_points       - number of points on each surface, (ncases*ncpts)                   [unitless]
+
+    Properties Used:
+    N/A
+    """
+    npanel   = np.shape(mask)[0]
+    mask     = np.reshape(mask,(npanel,-1))
+    order    = np.argsort(mask,axis = 0,kind = 'stable')
+    n_points = np.sum(~mask,axis = 0)
+    last     = np.maximum(n_points - 1,0)
+    src      = np.take_along_axis(order,np.minimum(np.arange(npanel)[:,None],last[None,:]),axis = 0)
+    return src, n_points
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def scatter_surface_points(values,src,n_points,shape):
+    """ Places values of gathered surface points back at their original locations on
+    the panel axis. Locations that are not on the surface are set to zero.
+
+    Source:
+    None
+
+    Assumptions:
+    None
+
+    Inputs:
+    values         - values at gathered surface points, (npanel,ncases*ncpts)           [multiple units]
+    src            - index of each gathered point on the panel axis                     [unitless]
+    n_points       - number of points on each surface                                   [unitless]
+    shape          - shape of the output, (npanel,ncases,ncpts)                         [unitless]
+
+    Outputs:
+    FUNC           - values at the original locations, (npanel,ncases,ncpts)            [multiple units]
+
+    Properties Used:
+    N/A
+    """
+    on_surf  = np.arange(shape[0])[:,None] < n_points[None,:]
+    cols     = np.broadcast_to(np.arange(np.shape(src)[1])[None,:],np.shape(src))
+    FUNC     = np.zeros((shape[0],np.shape(src)[1]))
+    FUNC[src[on_surf],cols[on_surf]] = values[on_surf]
+    return FUNC.reshape(shape)
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def replace_unconverged_points(values,n_points,tol):
+    """ Replaces values that jump by more than the tolerance relative to the previous
+    point on the surface with the previous value. As in the per surface correction,
+    a surface is only corrected when more than one of its points jump.
+
+    Source:
+    None
+
+    Assumptions:
+    None
+
+    Inputs:
+    values         - values at gathered surface points, (npanel,ncases*ncpts)           [multiple units]
+    n_points       - number of points on each surface                                   [unitless]
+    tol            - boundary layer error correction tolerance                          [unitless]
+
+    Outputs:
+    values         - corrected values                                                   [multiple units]
+
+    Properties Used:
+    N/A
+    """
+    on_surf  = np.arange(1,np.shape(values)[0])[:,None] < n_points[None,:]
+    jump     = (abs((values[1:] - values[:-1])/values[:-1]) > tol) & on_surf
+    jump    &= np.sum(jump,axis = 0) > 1
+    new      = np.copy(values)
+    new[1:][jump] = values[:-1][jump]
+    return new
@@ -3,14 +3,15 @@
 
 # Created:  Mar 2021, M. Clarke
 # Modified: Sep 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from SUAVE.Core import Data 
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.integrate import odeint 
+
+from .surface_points import gather_surface_points, scatter_surface_points, replace_unconverged_points
 
 # ----------------------------------------------------------------------
 # thwaites_method
@@ -25,7 +26,8 @@ def thwaites_method(npanel,ncases,ncpts,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
     Aeronautical Quarterly 1.3 (1949): 245-280.
     
     Assumptions:
-    None  
+    The momentum integral is evaluated in closed form by cumulative quadrature of the boundary 
+    layer velocity, which varies linearly between points, for all cases and control points at once   
 
     Inputs:  
     npanel         - number of points on surface                                                 [unitless]
@@ -55,79 +57,62 @@ def thwaites_method(npanel,ncases,ncpts,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
     N/A
     """
     
-    # Initialize vectors 
-    X_T          = np.zeros((npanel,ncases,ncpts))
-    THETA_T      = np.zeros_like(X_T)
-    DELTA_STAR_T = np.zeros_like(X_T)
-    H_T          = np.zeros_like(X_T)
-    CF_T         = np.zeros_like(X_T)
-    RE_THETA_T   = np.zeros_like(X_T)
-    RE_X_T       = np.zeros_like(X_T)
-    DELTA_T      = np.zeros_like(X_T)  
-      
-    for case in range(ncases):
-        for cpt in range(ncpts):    
-            # compute laminar boundary layer properties  
-            l           = L[case,cpt]
-            theta_0     = THETA_0 
-            Re_L        = RE_L[case,cpt]
-            nu          = l/Re_L    
-            x_i         = X_I.data[:,case,cpt][X_I.mask[:,case,cpt] ==False]
-            Ve_i        = VE_I.data[:,case,cpt][VE_I.mask[:,case,cpt] ==False]
-            dVe_i       = DVE_I.data[:,case,cpt][DVE_I.mask[:,case,cpt] ==False] 
-            y0          = theta_0**2 * getVe(0,x_i,Ve_i)**6   
-            theta2_Ve6  = odeint(odefcn, y0,x_i , args=(nu, x_i, Ve_i))  
-            
-            # Compute momentum thickness, theta 
-            theta       = np.sqrt(theta2_Ve6[:,0]/ Ve_i**6)
-            
-            # find theta values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol)[0] 
-            if len(idx1)> 1:  
-                np.put(theta,idx1 + 1, theta[idx1])
-            
-            # Thwaites separation criteria 
-            lambda_val  = theta**2 * dVe_i / nu 
-            
-            # Compute H 
-            H           = getH(lambda_val)
-            H[H<0]      = 1E-6   # H cannot be negative 
-            # find H values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((H[1:] - H[:-1])/H[:-1]) >tol)[0]
-            if len(idx1)> 1: 
-                np.put(H,idx1 + 1, H[idx1]) 
-            
-            # Compute Reynolds numbers based on momentum thickness  
-            Re_theta    = Ve_i * theta / nu
-            
-            # Compute Reynolds numbers based on distance along airfoil
-            Re_x        = Ve_i * x_i/ nu
-            
-            # Compute skin friction 
-            cf          = abs(getcf(lambda_val ,Re_theta)) 
-            
-            # Compute displacement thickness
-            del_star    = H*theta   
-            
-            # Compute boundary layer thickness 
-            delta       = 5.2*x_i/np.sqrt(Re_x)
-            delta[0]    = 0   
-            
-            # Reynolds number at x=0 cannot be negative 
-            Re_x[0]     = 1E-5
-            
-            # Find where matrices are not masked 
-            indices = np.where(X_I.mask[:,case,cpt] == False)
-            
-            # Store results 
-            np.put(X_T[:,case,cpt],indices,x_i)
-            np.put(THETA_T[:,case,cpt],indices,theta)
-            np.put(DELTA_STAR_T[:,case,cpt],indices,del_star)
-            np.put(H_T[:,case,cpt],indices,H)
-            np.put(CF_T[:,case,cpt],indices ,cf)
-            np.put(RE_THETA_T[:,case,cpt],indices,Re_theta)
-            np.put(RE_X_T[:,case,cpt],indices,Re_x)
-            np.put(DELTA_T[:,case,cpt],indices,delta)
+    shape        = (npanel,ncases,ncpts)
+    
+    # gather the points of every surface so that all cases and control points are integrated at once 
+    src, n_pts   = gather_surface_points(X_I.mask)
+    x_i          = np.take_along_axis(np.reshape(X_I.data,(npanel,-1)),src,axis = 0)
+    Ve_i         = np.take_along_axis(np.reshape(VE_I.data,(npanel,-1)),src,axis = 0)
+    dVe_i        = np.take_along_axis(np.reshape(DVE_I.data,(npanel,-1)),src,axis = 0)
+    nu           = np.reshape(L/RE_L,-1) 
+    
+    # compute laminar boundary layer properties   
+    y0           = THETA_0**2 * getVe(0,x_i,Ve_i)**6   
+    theta2_Ve6   = y0 + 0.45*nu*cumulative_Ve5_integral(x_i,Ve_i) 
+    
+    # Compute momentum thickness, theta 
+    theta        = np.sqrt(theta2_Ve6/ Ve_i**6)
+    
+    # find theta values that do not converge and replace them with neighbor
+    theta        = replace_unconverged_points(theta,n_pts,tol)
+    
+    # Thwaites separation criteria 
+    lambda_val   = theta**2 * dVe_i / nu 
+    
+    # Compute H 
+    H            = getH(lambda_val)
+    H[H<0]       = 1E-6   # H cannot be negative 
+    # find H values that do not converge and replace them with neighbor
+    H            = replace_unconverged_points(H,n_pts,tol)
+    
+    # Compute Reynolds numbers based on momentum thickness  
+    Re_theta     = Ve_i * theta / nu
+    
+    # Compute Reynolds numbers based on distance along airfoil
+    Re_x         = Ve_i * x_i/ nu
+    
+    # Compute skin friction 
+    cf           = abs(getcf(lambda_val ,Re_theta)) 
+    
+    # Compute displacement thickness
+    del_star     = H*theta   
+    
+    # Compute boundary layer thickness 
+    delta        = 5.2*x_i/np.sqrt(Re_x)
+    delta[0]     = 0   
+    
+    # Reynolds number at x=0 cannot be negative 
+    Re_x[0]      = 1E-5
+    
+    # Store results at the unmasked locations 
+    X_T          = scatter_surface_points(x_i,src,n_pts,shape)
+    THETA_T      = scatter_surface_points(theta,src,n_pts,shape)
+    DELTA_STAR_T = scatter_surface_points(del_star,src,n_pts,shape)
+    H_T          = scatter_surface_points(H,src,n_pts,shape)
+    CF_T         = scatter_surface_points(cf,src,n_pts,shape)
+    RE_THETA_T   = scatter_surface_points(Re_theta,src,n_pts,shape)
+    RE_X_T       = scatter_surface_points(Re_x,src,n_pts,shape)
+    DELTA_T      = scatter_surface_points(delta,src,n_pts,shape)
     
     RESULTS = Data(
         X_T          = X_T,      
@@ -165,33 +150,36 @@ def getH(lambda_val ):
     H[idx1] = 2.61 - 3.75*lambda_val[idx1]  + 5.24*lambda_val[idx1]**2   
     return H 
     
-def odefcn(y,x, nu,x_i,Ve_i):
-    """ Computes boundary layer functions using SciPy ODE solver 
+def cumulative_Ve5_integral(x_i,Ve_i):
+    """ Integrates the fifth power of the boundary layer velocity along the surface. The 
+    velocity varies linearly between points, so the integral over each panel is exact.
 
     Assumptions:
-    None
+    Boundary layer velocity is linear between points
 
     Source:
     None
 
     Inputs: 
-    y           - initial conditions of functions    [unitless]
-    x           - new x values at which to solve ODE [unitless]
-    nu          - kinematic viscosity                [m^2/s]
-    x_i         - intial array of x values           [unitless]
-    Ve_i        - intial boundary layer velocity     [m/s]
+    x_i         - x coordinates of points, (npanel,nsurf)  [unitless]
+    Ve_i        - boundary layer velocity, (npanel,nsurf)  [m/s]
     
     Outputs:  
-    dydx        - expression for the momentum thickness and velocity (theta**2/Ve**6)
+    I           - integral of Ve**5 from the first point    [unitless]
 
     Properties Used:
     N/A 
     """        
-    dydx = 0.45*getVe(x,x_i,Ve_i)**5*nu
-    return dydx 
+    a     = Ve_i[:-1]
+    b     = Ve_i[1:] 
+    dI    = np.diff(x_i,axis = 0)*(a**5 + a**4*b + a**3*b**2 + a**2*b**3 + a*b**4 + b**5)/6
+    I     = np.zeros_like(x_i)
+    I[1:] = np.cumsum(dI,axis = 0)
+    return I 
     
 def getVe(x,x_i,Ve_i):
-    """ Interpolates the bounday layer velocity over a new dimension of x 
+    """ Linearly inter- or extrapolates the bounday layer velocity of each surface to x 
+    from the velocities at the first two points
 
     Assumptions:
     None
@@ -200,8 +188,8 @@ def getVe(x,x_i,Ve_i):
     None
 
     Inputs: 
-    x         - new x dimension                    [unitless]
-    x_i       - old x dimension                    [unitless]
+    x         - new x value                        [unitless]
+    x_i       - old x dimension, (npanel,nsurf)    [unitless]
     Ve_i      - old boundary layer velocity values [m/s] 
     
     Outputs:  
@@ -210,34 +198,13 @@ def getVe(x,x_i,Ve_i):
     Properties Used:
     N/A 
     """
-    Ve_func = interp1d(x_i,Ve_i, axis=0,fill_value = "extrapolate")
-    Ve      = Ve_func(x)
+    if len(x_i) < 2:
+        return Ve_i[0]
+    dx      = x_i[1] - x_i[0]
+    slope   = np.divide(Ve_i[1] - Ve_i[0],dx,out = np.zeros_like(dx),where = dx != 0)
+    Ve      = Ve_i[0] + (x - x_i[0])*slope
     return Ve  
 
-def getdVe(x,x_i,dVe_i):
-    """ Interpolates the derivatives of the bounday layer velocity over a new dimension of x 
-
-    Assumptions:
-    None
-
-    Source:
-    None
-
-    Inputs: 
-    x         - new x dimension                                   [unitless]
-    x_i       - old x dimension                                   [unitless]
-    dVe_i     - old derivative of boundary layer velocity values  [m/s-m]
-    
-    Outputs:  
-    dVe       - new derivative of boundary layer velocity values  [m/s-m]
-
-    Properties Used:
-    N/A 
-    """
-    dVe_func = interp1d(x_i,dVe_i,fill_value = "extrapolate")
-    dVe      = dVe_func(x)
-    return dVe 
-
 def getcf(lambda_val , Re_theta):
     """ Computes the skin friction coefficient, cf
 
@@ -4,6 +4,7 @@
 # Created:  Oct 2020, E. Botero
 # Modified: May 2021, E. Botero   
 #           Jul 2021, A. Blaufox     
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -31,6 +32,10 @@ def VLM(conditions,settings,geometry):
     The user has the option to use the boundary conditions and induced velocities from either SUAVE
     or VORLAX. See build_RHS in compute_RHS_matrix.py for more details.
     
+    With settings.linearized_control_surfaces, small control surface deflections are modelled by rotating the
+    normals of the undeflected control surface panels. The influence matrix does not change with the deflection,
+    so a deflection may be given for every control point in conditions.aerodynamics.control_surface_deflections.
+    
     By default in Vortex_Lattice, VLM performs calculations based on panel coordinates with float32 precision. 
     The user may also choose to use float16 or float64, but be warned that the latter can be memory intensive.
     
@@ -91,6 +96,7 @@ def VLM(conditions,settings,geometry):
     settings.use_surrogate                     [Unitless]
     settings.propeller_wake_model              [Unitless]
     settings.discretize_control_surfaces       [Boolean], set to True to generate control surface panels
+    settings.linearized_control_surfaces       [Boolean], set to True to deflect the panel normals only
     settings.use_VORLAX_matrix_calculation     [boolean]
     settings.floating_point_precision          [np.float16/32/64]
        
@@ -101,6 +107,7 @@ def VLM(conditions,settings,geometry):
     conditions.stability.dynamic.pitch_rate    [radians/s]
     conditions.stability.dynamic.roll_rate     [radians/s]
     conditions.stability.dynamic.yaw_rate      [radians/s]
+    conditions.aerodynamics.control_surface_deflections.<tag> [radians], optional with linearized_control_surfaces
        
     
     Outputs:    
@@ -222,7 +229,6 @@ def VLM(conditions,settings,geometry):
     ZA_TE =  VD.ZA_TE
     ZB_TE =  VD.ZB_TE     
      
-    SLOPE = VD.SLOPE
     SLE   = VD.SLE
     D     = VD.D
     
@@ -243,6 +249,7 @@ def VLM(conditions,settings,geometry):
     rhs = compute_RHS_matrix(delta,phi,conditions,settings,geometry,pwm) 
     RHS     = rhs.RHS*1
     ONSET   = rhs.ONSET*1
+    SLOPE   = rhs.SLOPE # deflected by linearized control surfaces
 
     # Build induced velocity matrix, C_mn
     # This is not affected by AoA, so we can use unique mach numbers only
@@ -423,7 +430,7 @@ def VLM(conditions,settings,geometry):
     # TFX AND TFZ ARE THE COMPONENTS OF LEADING EDGE FORCE VECTOR ALONG
     # ALONG THE X AND Z BODY AXES.   
     
-    SLE  = SLOPE[LE_ind]
+    SLE  = SLOPE[...,LE_ind]
     ZETA = ZETA[LE_ind]
     XCOS = np.broadcast_to(np.cos(SLE-ZETA),np.shape(DCP_LE))
     XSIN = np.broadcast_to(np.sin(SLE-ZETA),np.shape(DCP_LE))
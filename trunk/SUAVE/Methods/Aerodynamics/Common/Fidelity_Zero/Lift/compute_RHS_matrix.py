@@ -8,6 +8,7 @@
 #           Jul 2021, E. Botero
 #           Jul 2021, R. Erhard
 #           Feb 2022, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,6 +17,7 @@
 # package imports
 import numpy as np
 from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.deflect_control_surface import deflect_control_surface_normals
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
 def compute_RHS_matrix(delta,phi,conditions,settings,geometry,propeller_wake_model):
@@ -57,6 +59,7 @@ def compute_RHS_matrix(delta,phi,conditions,settings,geometry,propeller_wake_mod
         YGIRO
         ZGIRO
         VX
+        SLOPE
         SCNTL
         CCNTL
         COD
@@ -139,6 +142,10 @@ def build_RHS(VD, conditions, settings, aoa_distribution, delta, phi, PSI_distri
     VORLAX uses the camber, twist, and dihedral values of a strip's leading
     edge panel for every panel in that strip when calculating panel normals.
 
+    If settings.linearized_control_surfaces is set, the control surface panels
+    are not deflected. Their normals are rotated about the hinges instead, so a
+    deflection only changes the RHS and may differ between control points.
+
     Source:
     1. Low-Speed Aerodynamics, Second Edition by Joseph Katz, Allen Plotkin Pgs. 331-338
 
@@ -146,6 +153,8 @@ def build_RHS(VD, conditions, settings, aoa_distribution, delta, phi, PSI_distri
 
     Inputs:
     settings.use_VORLAX_matrix_calculation  - RHS equation switch               [boolean]
+    settings.linearized_control_surfaces    - deflect the panel normals only    [boolean]
+    conditions.aerodynamics.control_surface_deflections.<tag>                   [radians]
     conditions.stability.dynamic.pitch_rate -                                   [radians/s]
     conditions.stability.dynamic.roll_rate  -                                   [radians/s]
     conditions.stability.dynamic.yaw_rate   -                                   [radians/s]
@@ -207,11 +216,23 @@ def build_RHS(VD, conditions, settings, aoa_distribution, delta, phi, PSI_distri
     VZ = (SINALF - ROLL *YGIRO + PITCH*XGIRO)
     
     #COMPUTE DIRECTION COSINES.
-    SCNTL  = VD.SLOPE/np.sqrt(1. + VD.SLOPE **2)
+    SLOPE  = VD.SLOPE
+    SCNTL  = SLOPE/np.sqrt(1. + SLOPE **2)
     CCNTL  = 1. / np.sqrt(1.0 + SCNTL**2)
     phi_LE = np.repeat(phi[:,LE_ind]  , RNMAX[LE_ind], axis=1)
     COD    = np.cos(phi_LE)
     SID    = np.sin(phi_LE)
+    
+    # linearized control surfaces deflect the normals of the undeflected panels,
+    # the camber slope follows the deflected normal
+    linearized_cs  = settings.linearized_control_surfaces if ('linearized_control_surfaces' in settings.keys()) else False
+    if linearized_cs:
+        deflections = conditions.aerodynamics.control_surface_deflections if ('control_surface_deflections' in conditions.aerodynamics.keys()) else Data()
+        N_VORLAX    = np.array(np.broadcast_arrays(SCNTL, CCNTL *SID, - CCNTL *COD)).transpose(1,2,0)
+        N_VORLAX    = deflect_control_surface_normals(VD, N_VORLAX, deflections, len(VINF))
+        SCNTL       = N_VORLAX[:,:,0]
+        SLOPE       = SCNTL/np.sqrt(1. - SCNTL **2)
+        CCNTL       = 1. / np.sqrt(1.0 + SCNTL**2)
 
     # COMPUTE ONSET FLOW COMPONENT ALONG THE OUTWARD NORMAL TO
     # THE SURFACE AT THE CONTROL POINT, ALOC.
@@ -236,11 +257,14 @@ def build_RHS(VD, conditions, settings, aoa_distribution, delta, phi, PSI_distri
 
     # compute RHS: dot(v, panel_normals)
     V_unit_vector    = (np.array([Vx,Vy,Vz])/V_distribution).T
-    panel_normals    = VD.normals[:,np.newaxis,:]
+    use_VORLAX_RHS   = settings.use_VORLAX_matrix_calculation
+    if linearized_cs and not use_VORLAX_RHS:
+        panel_normals = np.swapaxes(deflect_control_surface_normals(VD, VD.normals, deflections, len(VINF)),0,1)
+    else:
+        panel_normals = VD.normals[:,np.newaxis,:]
     RHS_from_normals = np.sum(V_unit_vector*panel_normals, axis=2).T    
 
     #pack values--------------------------------------------------------------------------
-    use_VORLAX_RHS = settings.use_VORLAX_matrix_calculation
 
     rhs = Data()
     rhs.RHS            = RHS_from_normals if not use_VORLAX_RHS else ALOC
@@ -254,6 +278,7 @@ def build_RHS(VD, conditions, settings, aoa_distribution, delta, phi, PSI_distri
     rhs.YGIRO  = YGIRO
     rhs.ZGIRO  = ZGIRO
     rhs.VX     = VX
+    rhs.SLOPE  = SLOPE
     rhs.SCNTL  = SCNTL
     rhs.CCNTL  = CCNTL
     rhs.COD    = COD
@@ -2,7 +2,7 @@
 # deflect_control_surface.py
 # 
 # Created:  Jul 2022, A. Blaufox & E. Botero
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 #           
 
 # ----------------------------------------------------------------------
@@ -80,6 +80,7 @@ def deflect_control_surface(VD,wing):
     Outputs:      
     VD       - vehicle vortex distribution                    [Unitless] 
     wing     - VLM_wing object                                [Unitless] 
+    wing.hinge_vectors - hinge vector of each side            [Unitless] 
 
 
     Properties Used:
@@ -95,6 +96,7 @@ def deflect_control_surface(VD,wing):
     # Symmetry loop
     signs         = np.array([1, -1], dtype=int) # acts as a multiplier for symmetry. -1 is only ever used for symmetric wings
     symmetry_mask = [True,sym_para]
+    hinge_vectors = []
     for sym_sign in signs[symmetry_mask]:    
         
         # Pull out initial VD data points of surface
@@ -254,7 +256,10 @@ def deflect_control_surface(VD,wing):
         VD.Y[condition_full] = np.append(Y_as, Y_last_bs)
         VD.Z[condition_full] = np.append(Z_as, Z_last_bs)
         
+        # the hinge is found again for the symmetric side
+        hinge_vectors.append(wing.hinge_vector*1.)
         
+    wing.hinge_vectors   = np.array(hinge_vectors)
     wing.deflection_last = wing.deflection*1.
     
     VD.is_postprocessed = False
@@ -394,11 +399,7 @@ def deflect_control_surface_strip(wing, raw_VD, is_first_strip, sym_sign):
     
     # get deflection angle
     ddeflection      = wing.deflection      - wing.deflection_last               # This is a delta deflection
-    slat_multiplier  = (1 - wing.is_slat)   - wing.is_slat                       # Flip signs if it's a slat
-    sym_multiplier   = (1 - (sym_sign==-1)) - wing.sign_duplicate*(sym_sign==-1) # If it's the symmetric side
-    ver_multiplier   = (1 - vertical_wing)-1*vertical_wing                       # Vertical multiplier
-
-    delta_deflection = slat_multiplier*sym_multiplier*ver_multiplier*ddeflection
+    delta_deflection = deflection_multiplier(wing, sym_sign)*ddeflection
         
     # make quaternion rotation matrix
     quaternion   = make_hinge_quaternion(wing.hinge_root_point, wing.hinge_vector, delta_deflection)
@@ -467,6 +468,103 @@ def deflect_control_surface_strip(wing, raw_VD, is_first_strip, sym_sign):
     
     return raw_VD    
 
+# ----------------------------------------------------------------------
+#  Deflect Control Surface Normals
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def deflect_control_surface_normals(VD,normals,deflections,n_ctrl_pts):
+    """ 
+    Rotates the panel normals of the control surfaces and all-moving surfaces about their hinges
+    without moving the panels. This is the linearized form of deflect_control_surface: the flow 
+    tangency condition sees the deflection, but the influence matrix of the undeflected panels can be
+    reused. The deflection may be different at every control point.
+    
+    Assumptions: 
+    Small deflections. The panels of the VD are at wing.deflection_last, which is zero when the VD is
+    generated with settings.linearized_control_surfaces
+    
+    Source:  
+    1. Low-Speed Aerodynamics, Second Edition by Joseph Katz, Allen Plotkin Pgs. 331-338
+    
+    Inputs: 
+    VD                   - vehicle vortex distribution                    [Unitless] 
+    normals              - panel normals, (n_cp,3) or (n_ctrl_pts,n_cp,3) [Unitless] 
+    deflections.<tag>    - deflection at each control point, by control   [radians] 
+                           surface tag or all-moving surface tag. 
+                           wing.deflection is used for the missing tags
+    n_ctrl_pts           - number of control points                       [Unitless] 
+    
+    Outputs:      
+    normals              - deflected panel normals, (n_ctrl_pts,n_cp,3)   [Unitless] 
+    
+    Properties Used:
+    N/A
+    """     
+    normals = np.array(np.broadcast_to(normals,(n_ctrl_pts,)+np.shape(normals)[-2:]))
+    
+    for wing in VD.VLM_wings:
+        wing_is_all_moving = (not wing.is_a_control_surface) and issubclass(wing.wing_type, All_Moving_Surface)        
+        if not (wing.is_a_control_surface or wing_is_all_moving):
+            continue
+        
+        # deflection of this surface at each control point
+        tag         = wing.control_surface_tag if wing.is_a_control_surface else wing.tag
+        deflection  = deflections[tag] if tag in deflections.keys() else wing.deflection
+        ddeflection = np.broadcast_to(np.ravel(deflection),(n_ctrl_pts,)) - wing.deflection_last
+        if not ddeflection.any():
+            continue
+        
+        signs         = np.array([1, -1], dtype=int)
+        symmetry_mask = [True,wing.symmetric]
+        for sym_sign, hinge_vector in zip(signs[symmetry_mask], wing.hinge_vectors):
+            condition = VD.surface_ID == wing.surface_ID*sym_sign
+            
+            # flip over y = z for a vertical wing since the hinge vector assumes a horizontal wing
+            n_x      = normals[:,condition,0]
+            n_y, n_z = flip_1(normals[:,condition,1], normals[:,condition,2], wing.vertical, wing.inverted_wing)
+            
+            # rotate the normals of each control point, a direction does not depend on the hinge root point
+            delta_deflection = deflection_multiplier(wing, sym_sign)*ddeflection
+            rotations        = np.array([make_hinge_quaternion(wing.hinge_root_point, hinge_vector, d)[:3,:3] for d in delta_deflection])
+            rotated          = np.einsum('kij,jkp->kip', rotations, np.array([n_x,n_y,n_z]))
+            
+            # flip over y = z again after deflecting
+            n_y, n_z = flip_2(rotated[:,1], rotated[:,2], wing.vertical, wing.inverted_wing)
+            normals[:,condition,0] = rotated[:,0]
+            normals[:,condition,1] = n_y
+            normals[:,condition,2] = n_z
+    
+    return normals
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def deflection_multiplier(wing, sym_sign):
+    """ This finds the sign of a deflection about the hinge vector of a VLM_wing
+    
+    Assumptions: 
+    "positve" deflection corresponds to the RH rule where the axis of rotation is the OUTBOARD-pointing hinge vector
+    symmetry: the LH rule is applied to the reflected surface for non-ailerons. Ailerons follow a RH rule for both sides
+    
+    Source:   
+    N/A
+    
+    Inputs:   
+    wing.is_slat                                             [Boolean]
+    wing.sign_duplicate                                      [Unitless]
+    wing.vertical                                            [Boolean]
+    sym_sign  - 1 for original side, -1 for symmetric side   [Unitless]
+    
+    Outputs:
+    multiplier                                               [Unitless]
+    
+    Properties Used:
+    N/A
+    """
+    slat_multiplier  = (1 - wing.is_slat)   - wing.is_slat                       # Flip signs if it's a slat
+    sym_multiplier   = (1 - (sym_sign==-1)) - wing.sign_duplicate*(sym_sign==-1) # If it's the symmetric side
+    ver_multiplier   = (1 - wing.vertical)-1*wing.vertical                       # Vertical multiplier
+    
+    return slat_multiplier*sym_multiplier*ver_multiplier
+
 # ----------------------------------------------------------------------
 #  Make Hinge Quaternion
 # ----------------------------------------------------------------------
@@ -4,6 +4,7 @@
 # Created:  May 2018, M. Clarke
 # Modified: Apr 2020, M. Clarke
 #           Jun 2021, A. Blaufox
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -70,6 +71,7 @@ def generate_vortex_distribution(geometry,settings):
     Inputs:
     geometry.wings                                [Unitless]  
     settings.floating_point_precision             [np.dtype]
+    settings.linearized_control_surfaces          [Boolean], set to True to keep the control surface panels undeflected
     
     Of the following settings, the user should define either the number_ atrributes or the wing_ and fuse_ attributes.
     settings.number_spanwise_vortices             - a base number of vortices to be applied to both wings and fuselages
@@ -249,11 +251,19 @@ def generate_vortex_distribution(geometry,settings):
     # ---------------------------------------------------------------------------------------
     # STEP 10: Deflect Control Surfaces
     # ---------------------------------------------------------------------------------------      
+    linearized_cs = settings.linearized_control_surfaces if ('linearized_control_surfaces' in settings.keys()) else False
     for wing in VD.VLM_wings:
         wing_is_all_moving = (not wing.is_a_control_surface) and issubclass(wing.wing_type, All_Moving_Surface)        
         if wing.is_a_control_surface or wing_is_all_moving:
-            # Deflect the control surface
-            VD, wing = deflect_control_surface(VD, wing)
+            if linearized_cs:
+                # Keep the undeflected panels and only find the hinge, the VLM deflects the panel normals
+                deflection      = wing.deflection
+                wing.deflection = wing.deflection_last
+                VD, wing        = deflect_control_surface(VD, wing)
+                wing.deflection = deflection
+            else:
+                # Deflect the control surface
+                VD, wing = deflect_control_surface(VD, wing)
             
     # ---------------------------------------------------------------------------------------
     # STEP 11: Postprocess VD information
@@ -2,21 +2,21 @@
 # Lifting_Line.py
 # 
 # Created:  Aug 2017, E. Botero
-# Modified: 
-#           
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
+from SUAVE.Core import Data
 
 # ----------------------------------------------------------------------
 #  The Function
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Aerodynamics-Lifting_line
-def lifting_line(conditions,settings,geometry):
+def lifting_line(conditions,settings,geometry,system=None):
     """
 
     Assumptions:
@@ -38,11 +38,12 @@ def lifting_line(conditions,settings,geometry):
       vertical                              [Boolean]
 
     settings.number_of_stations             [int]
-    conditions.aerodynamics.angle_of_attack [radians]
+    conditions.aerodynamics.angle_of_attack [radians] (any number of angles)
+    system                                  (optional) output of lifting_line_system for this wing
 
     Outputs:
-    CL                                      [Unitless]
-    CD                                      [Unitless]
+    CL                                      [Unitless] one entry per angle of attack
+    CD                                      [Unitless] one entry per angle of attack
 
     Properties Used:
     N/A
@@ -50,33 +51,108 @@ def lifting_line(conditions,settings,geometry):
     
     # Unpack first round:
     wing        = geometry
-    orientation = wing.vertical    
+    orientation = wing.vertical
+    alpha       = conditions.aerodynamics.angle_of_attack
+    
+    # Every angle of attack is solved at once
+    alpha = np.atleast_2d(alpha).reshape((-1,1))
     
     # Don't bother doing the calculation if it is a vertical tail
     if orientation == True:
-        CL = 0.0
-        CD = 0.0
+        CL = np.zeros(len(alpha))
+        CD = np.zeros(len(alpha))
         return CL, CD
     else:
         pass
         
     # Unpack fo'real
-    b           = wing.spans.projected
-    S           = wing.areas.reference
     AR          = wing.aspect_ratio
     MAC         = wing.chords.mean_aerodynamic
+    b           = wing.spans.projected
+    
+    # The spanwise system only depends on the geometry
+    if system is None:
+        system = lifting_line_system(settings,wing)
+    n      = system.n
+    thetan = system.thetan
+    etam   = system.etam
+    c      = system.chords
+    
+    # The Fourier coefficients are linear in the angle of attack
+    A = system.A_0 + alpha*system.A_alpha
+    
+    # The 3-D Coefficient of lift
+    CL = A[:,0]*np.pi*AR
+    
+    # Find the sectional coefficients of lift
+    Cl = b*np.cumsum(4*A*np.sin(n*thetan),axis=1)/c
+    
+    # induced alpha
+    alpha_i = np.cumsum(n*A*np.sin(n*A)/np.sin(thetan),axis=1)
+    
+    # Sectional vortex drag
+    Cdv = Cl*alpha_i
+    
+    # Total vortex drag
+    CDv = np.sum(Cdv*AR*etam,axis=1)
+    
+    #############
+    # Profile drag of a 2-D section
+    # This is currently stubbed out. If the 2-D sectional data is known it can be added to get viscous drag
+    Cdn = 0.00
+    #############
+    
+    # Find the profile drag
+    CDp = np.sum(Cdn*c*etam)/MAC
+    
+    CD  = CDv + CDp
+   
+    return CL, CD
+
+## @ingroup Methods-Aerodynamics-Lifting_line
+def lifting_line_system(settings,geometry):
+    """Sets up the spanwise stations of a wing and solves the lifting line system for the
+    Fourier coefficients. The coefficients are split into a part from the twist and a part
+    per radian of angle of attack, so a single solve covers any number of angles of attack.
+
+    Assumptions:
+    subsonic and unswept
+
+    Source:
+    Traub, L. W., Botero, E., Waghela, R., Callahan, R., & Watson, A. (2015). Effect of Taper Ratio at Low Reynolds Number. Journal of Aircraft.
+
+    Inputs:
+    wing.
+      spans.projected                       [m]
+      chords.root                           [m]
+      chords.tip                            [m]
+      twists.root                           [radians]
+      twists.tip                            [radians]
+      taper                                 [Unitless]
+      Segments                              (optional)
+    settings.number_of_stations             [int]
+
+    Outputs:
+    system.
+      n                                     [Unitless] harmonic numbers
+      thetan                                [radians]  angular stations
+      etam                                  [Unitless] spanwise integration weights
+      chords                                [m]
+      A_0                                   [Unitless] Fourier coefficients at zero angle of attack
+      A_alpha                               [1/radians] Fourier coefficients per radian of angle of attack
+
+    Properties Used:
+    N/A
+    """
+    
+    wing        = geometry
+    b           = wing.spans.projected
     taper       = wing.taper
     tip_twist   = wing.twists.root
     root_twist  = wing.twists.tip 
     root_chord  = wing.chords.root
     tip_chord   = wing.chords.tip      
     r           = settings.number_of_stations # Number of divisions
-    alpha       = conditions.aerodynamics.angle_of_attack
-    
-    # Make sure alpha is 2D
-    alpha = np.atleast_2d(alpha)
-    
-    repeats = np.size(alpha)
     
     # Need to set to something
     cla   = 2 * np.pi # 2-D lift curve slope
@@ -95,30 +171,17 @@ def lifting_line(conditions,settings,geometry):
     n_segments   = len(segment_keys)
     # If spanwise stations are setup
     if n_segments>0:
-        c    = np.ones_like(etan) * wing.chords.root
-        ageo = np.ones_like(etan) * wing.twists.root 
-        for i_seg in range(n_segments):
-            
-            # Figure out where the segment starts
-            X1 = wing.Segments[segment_keys[i_seg]].percent_span_location
-            L1 = wing.Segments[segment_keys[i_seg]].root_chord_percent
-            T1 = wing.Segments[segment_keys[i_seg]].twist 
-
-            if i_seg == n_segments-1 and X1 == 1.0:
-                X2 = 1.0
-                L2 = wing.chords.tip/wing.chords.root
-                T2 = wing.twists.tip
-            else:
-                X2 = wing.Segments[segment_keys[i_seg+1]].percent_span_location
-                L2 = wing.Segments[segment_keys[i_seg+1]].root_chord_percent
-                T2 = wing.Segments[segment_keys[i_seg+1]].twist
-                
-                
-            bools  =  np.logical_and(etan>X1,etan<X2)
-                
-            c[bools]    = (L1 + (etan[bools]-X1)*(L2-L1)/(X2-X1)) * root_chord
-            ageo[bools] = (T1 + (etan[bools]-X1)*(T2-T1)/(X2-X1))
-                
+        X = np.array([wing.Segments[key].percent_span_location for key in segment_keys])
+        L = np.array([wing.Segments[key].root_chord_percent for key in segment_keys])
+        T = np.array([wing.Segments[key].twist for key in segment_keys])
+        
+        # Interpolate within the segments, stations on a segment break keep the root values
+        c      = np.ones_like(etan) * root_chord
+        ageo   = np.ones_like(etan) * wing.twists.root 
+        inside = np.logical_and(etan>X[0],etan<X[-1])
+        inside = np.logical_and(inside,np.logical_not(np.isin(etan,X)))
+        c[inside]    = np.interp(etan[inside],X,L) * root_chord
+        ageo[inside] = np.interp(etan[inside],X,T)
 
     # Spanwise stations are not setup
     else:
@@ -130,46 +193,25 @@ def lifting_line(conditions,settings,geometry):
         ageo = (tip_twist-root_twist)*etan+root_twist
 
     k = c*cla/(4.*b) # Grouped term 
-
     
     n_trans = np.atleast_2d(n).T
         
     # Right hand side matrix
     RHS = (np.sin(n_trans*thetan)*(np.sin(thetan)+n_trans*k))
-    
-    # Expand out for all the angles of attack
-    RHS2 = np.tile(RHS.T, (repeats,1,1))
 
-    # Left hand side vector    
-    LHS = k*np.sin(thetan)*(alpha+ageo-azl)
+    # Left hand side vectors, from the twist and per unit angle of attack
+    LHS = np.vstack([k*np.sin(thetan)*(ageo-azl),k*np.sin(thetan)]).T
         
     # The Fourier Coefficients
-    A = np.linalg.solve(RHS2,LHS)
-    
-    # The 3-D Coefficient of lift
-    CL = A[:,0]*np.pi*AR
-    
-    # Find the sectional coefficients of lift
-    Cl = b*np.cumsum(4*A*np.sin(n*thetan),axis=1)/c
-    
-    # induced alpha
-    alpha_i = np.cumsum(n*A*np.sin(n*A)/np.sin(thetan),axis=1)
-    
-    # Sectional vortex drag
-    Cdv = Cl*alpha_i
-    
-    # Total vortex drag
-    CDv = np.sum(Cdv*AR*etam,axis=1)
-    
-    #############
-    # Profile drag of a 2-D section
-    # This is currently stubbed out. If the 2-D sectional data is known it can be added to get viscous drag
-    Cdn = 0.00
-    #############
-    
-    # Find the profile drag
-    CDp = np.sum(Cdn*c*etam)/MAC
-    
-    CD  = CDv + CDp
-   
-    return CL, CD
\ No newline at end of file
+    A = np.linalg.solve(RHS.T,LHS)
+    
+    # Pack
+    system         = Data()
+    system.n       = n
+    system.thetan  = thetan
+    system.etam    = etam
+    system.chords  = c
+    system.A_0     = A[:,0]
+    system.A_alpha = A[:,1]
+    
+    return system
@@ -2,4 +2,4 @@
 # Functions to perform lifting line calculations
 # @ingroup Methods-Aerodynamics
 
-from .Lifting_Line import lifting_line
\ No newline at end of file
+from .Lifting_Line import lifting_line, lifting_line_system
\ No newline at end of file
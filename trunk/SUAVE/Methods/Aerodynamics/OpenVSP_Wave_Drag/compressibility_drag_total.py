@@ -3,6 +3,7 @@
 # 
 # Created:  Aug 2014, T. MacDonald
 # Modified: Jun 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,6 +14,7 @@ from SUAVE.Core import Data
 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions import wave_drag_lift
 from SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag.compressibility_drag_total import drag_div
+from SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag.wave_drag_volume_equivalent_area import wave_drag_volume_equivalent_area
 from .wave_drag_volume import wave_drag_volume
 
 import copy
@@ -36,6 +38,7 @@ def compressibility_drag_total(state,settings,geometry):
     Inputs:
     settings.number_slices
     settings.number_rotations
+    settings.volume_wave_drag_engine         <string> 'OpenVSP' or 'Equivalent_Area'
     state.conditions.aerodynamics.
       lift_breakdown.compressible_wings      [-]
     state.conditions.freestream.mach_number  [-]
@@ -58,6 +61,7 @@ def compressibility_drag_total(state,settings,geometry):
     configuration    = settings
     number_slices    = settings.number_slices
     number_rotations = settings.number_rotations
+    volume_engine    = settings.volume_wave_drag_engine
     
     wings          = geometry.wings
 
@@ -99,23 +103,28 @@ def compressibility_drag_total(state,settings,geometry):
         drag99_total  = drag99_total + drag99
         drag105_total = drag105_total + cdc_l
         
-    try:
-        old_array = np.load('volume_drag_data_' + geometry.tag + '.npy')
-        file_exists = True
-    except:
-        file_exists = False
-        old_array = np.array([[-1,-1]]) 
-          
-    if np.any(old_array[:,0]==1.05):
-        cd_c_v = np.array([[float(old_array[old_array[:,0]==1.05,1])]])
-    else:    
-        cd_c_v = wave_drag_volume(conditions,geometry, True)
-    
-    if file_exists:
-        pass
+    if volume_engine == 'Equivalent_Area':
+        cd_c_v = wave_drag_volume_equivalent_area(geometry,np.array([[1.05]]),1.,num_rots=number_rotations)
+    elif volume_engine == 'OpenVSP':
+        try:
+            old_array = np.load('volume_drag_data_' + geometry.tag + '.npy')
+            file_exists = True
+        except:
+            file_exists = False
+            old_array = np.array([[-1,-1]]) 
+              
+        if np.any(old_array[:,0]==1.05):
+            cd_c_v = np.array([[float(old_array[old_array[:,0]==1.05,1])]])
+        else:    
+            cd_c_v = wave_drag_volume(conditions,geometry, True)
+        
+        if file_exists:
+            pass
+        else:
+            new_save_row = np.array([[1.05,cd_c_v]])
+            np.save('volume_drag_data_' + geometry.tag + '.npy', new_save_row)    
     else:
-        new_save_row = np.array([[1.05,cd_c_v]])
-        np.save('volume_drag_data_' + geometry.tag + '.npy', new_save_row)    
+        raise ValueError("Unknown volume_wave_drag_engine '" + str(volume_engine) + "', use 'OpenVSP' or 'Equivalent_Area'")
     
 
     drag105 = drag105_total + cd_c_v*np.ones(np.shape(Mc))
@@ -143,7 +152,11 @@ def compressibility_drag_total(state,settings,geometry):
     # Only the supsonic results are returned with nonzero values
 
         
-    cd_c_v = wave_drag_volume(conditions, geometry, False,num_slices=number_slices,num_rots=number_rotations)
+    if volume_engine == 'Equivalent_Area':
+        cd_c_v = np.zeros(np.shape(Mc))
+        cd_c_v[Mc >= 1.05] = wave_drag_volume_equivalent_area(geometry,Mc[Mc >= 1.05],1.,num_rots=number_rotations)
+    else:
+        cd_c_v = wave_drag_volume(conditions, geometry, False,num_slices=number_slices,num_rots=number_rotations)
         
     cd_c[Mc >= 1.05] = cd_c_l[Mc >= 1.05] + cd_c_v[Mc >= 1.05]
 
@@ -4,7 +4,8 @@
 
 from .wave_drag_volume_raymer      import wave_drag_volume_raymer
 from .wave_drag_volume_sears_haack import wave_drag_volume_sears_haack
-from .compressibility_drag_total   import compressibility_drag_total
+from .wave_drag_volume_equivalent_area import wave_drag_volume_equivalent_area
+from .compressibility_drag_total   import compressibility_drag_total, wing_compressibility_table
 from .parasite_drag_nacelle        import parasite_drag_nacelle
 from .wave_drag_lift               import wave_drag_lift
 from .parasite_drag_fuselage       import parasite_drag_fuselage
@@ -4,6 +4,7 @@
 # Created:  Jan 2019, T. MacDonald
 # Modified: Jan 2020, T. MacDonald
 #           May 2021, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -16,11 +17,10 @@ from SUAVE.Core import Data
 from .wave_drag_lift import wave_drag_lift
 from .wave_drag_volume_raymer import wave_drag_volume_raymer
 from .wave_drag_volume_sears_haack import wave_drag_volume_sears_haack
+from .wave_drag_volume_equivalent_area import wave_drag_volume_equivalent_area
 from SUAVE.Methods.Utilities.Cubic_Spline_Blender import Cubic_Spline_Blender
 from SUAVE.Components.Wings import Main_Wing
 
-import copy
-
 # package imports
 import numpy as np
 
@@ -44,6 +44,8 @@ def compressibility_drag_total(state,settings,geometry):
       peak_mach_number                                               [Unitless]
       transonic_drag_multiplier                                      [Unitless]
       volume_wave_drag_scaling                                       [Unitless]
+      wave_drag_type                                                 <string>
+      wing_compressibility_table                                     (optional, see wing_compressibility_table)
     state.conditions.aerodynamics.lift_breakdown.compressible_wings  [Unitless]
     state.conditions.freestream.mach_number                          [Unitless]
     geometry.maximum_cross_sectional_area                            [m^2] (used in subfunctions)
@@ -71,13 +73,19 @@ def compressibility_drag_total(state,settings,geometry):
         wave_drag_volume = wave_drag_volume_raymer
     elif settings.wave_drag_type == 'Sears-Haack':
         wave_drag_volume = wave_drag_volume_sears_haack
+    elif settings.wave_drag_type == 'Equivalent_Area':
+        wave_drag_volume = wave_drag_volume_equivalent_area
     else:
         raise NotImplementedError    
     
     if settings.cross_sectional_area_calculation_type != 'Fixed':
         raise NotImplementedError
     
-    wings          = geometry.wings
+    # Use the wing table of this configuration if it has been built
+    table = settings.get('wing_compressibility_table',None)
+    if table is None:
+        table = wing_compressibility_table(geometry)
+    
     Mc             = conditions.freestream.mach_number
     drag_breakdown = conditions.aerodynamics.drag_breakdown
 
@@ -87,16 +95,21 @@ def compressibility_drag_total(state,settings,geometry):
     # Use vehicle reference area for drag coefficients
     Sref_main = geometry.reference_area
     
-
-    low_cutoff_volume_total  = np.zeros_like(Mc)
-    high_cutoff_volume_total = np.zeros_like(Mc)
-    
-    # Get the lift coefficient
+    # Get the lift coefficient of every wing, only main wings are assumed to carry lift
     cl = conditions.aerodynamics.lift_breakdown.compressible_wings    
+    cl_wings = np.zeros((len(Mc),len(table.tags)))
+    for i_wing, tag in enumerate(table.tags):
+        if table.main_wing[i_wing]:
+            cl_wings[:,i_wing] = cl[tag][:,0]
+    
+    low_cutoff_volume_total = np.sum(drag_div_wings(low_mach_cutoff*np.ones_like(Mc),table,cl_wings,Sref_main),axis=1,keepdims=True)
     
-    for wing in geometry.wings:
-        low_cutoff_volume_total += drag_div(low_mach_cutoff*np.ones([1]), wing, cl[wing.tag], Sref_main)[0]
-    high_cutoff_volume_total = wave_drag_volume(geometry,low_mach_cutoff*np.ones([1]),scaling_factor)
+    # The volume drag at the cutoff only depends on the geometry
+    cutoff_key = (settings.wave_drag_type,low_mach_cutoff,scaling_factor)
+    if table.cutoff_volume_key != cutoff_key:
+        table.cutoff_volume     = wave_drag_volume(geometry,low_mach_cutoff*np.ones([1]),scaling_factor)
+        table.cutoff_volume_key = cutoff_key
+    high_cutoff_volume_total = table.cutoff_volume
     
     peak_volume_total = high_cutoff_volume_total*peak_factor
     
@@ -113,31 +126,33 @@ def compressibility_drag_total(state,settings,geometry):
         ret = ret.reshape(np.shape(M))
         return ret
     
-    # Shorten cubic Hermite spline
-    sub_spline = Cubic_Spline_Blender(low_mach_cutoff, peak_mach-(peak_mach-low_mach_cutoff)*3/4)
-    sup_spline = Cubic_Spline_Blender(peak_mach,high_mach_cutoff)
-    sub_h00 = lambda M:sub_spline.compute(M)
-    sup_h00 = lambda M:sup_spline.compute(M)
+    # Shorten cubic Hermite spline, the blenders are kept with the wing table
+    blender_key = (low_mach_cutoff,peak_mach,high_mach_cutoff)
+    if table.blender_key != blender_key:
+        table.sub_spline  = Cubic_Spline_Blender(low_mach_cutoff, peak_mach-(peak_mach-low_mach_cutoff)*3/4)
+        table.sup_spline  = Cubic_Spline_Blender(peak_mach,high_mach_cutoff)
+        table.blender_key = blender_key
+    sub_h00 = table.sub_spline.compute(Mc)
+    sup_h00 = table.sup_spline.compute(Mc)
     
     cd_c_v_base = np.zeros_like(Mc)
     
     low_inds = Mc[:,0]<peak_mach
     hi_inds  = Mc[:,0]>=peak_mach
     
-    for wing in geometry.wings:
-        cd_c_v_base[low_inds] += drag_div(Mc[low_inds], wing, cl[wing.tag][low_inds], Sref_main)[0]
+    cd_c_v_base[low_inds] = np.sum(drag_div_wings(Mc[low_inds],table,cl_wings[low_inds],Sref_main),axis=1,keepdims=True)
     cd_c_v_base[Mc>=peak_mach] = wave_drag_volume(geometry, Mc[Mc>=peak_mach], scaling_factor)
     
     cd_c_l_base = lift_wave_drag(conditions, configuration, geometry.wings.main_wing, Sref_main)
     
     cd_c_v = np.zeros_like(Mc)
     
-    cd_c_v[low_inds] = cd_c_v_base[low_inds]*(sub_h00(Mc[low_inds])) + CD_v_para(Mc[low_inds],a1[low_inds])*(1-sub_h00(Mc[low_inds]))
-    cd_c_v[hi_inds]  = CD_v_para(Mc[hi_inds],a2)*(sup_h00(Mc[hi_inds])) + cd_c_v_base[hi_inds]*(1-sup_h00(Mc[hi_inds]))
+    cd_c_v[low_inds] = cd_c_v_base[low_inds]*(sub_h00[low_inds]) + CD_v_para(Mc[low_inds],a1[low_inds])*(1-sub_h00[low_inds])
+    cd_c_v[hi_inds]  = CD_v_para(Mc[hi_inds],a2)*(sup_h00[hi_inds]) + cd_c_v_base[hi_inds]*(1-sup_h00[hi_inds])
 
     if peak_mach<1.01:
         print('Warning: a peak mach number of less than 1.01 will cause a small discontinuity in lift wave drag')
-    cd_c_l           = cd_c_l_base*(1-sup_h00(Mc))
+    cd_c_l           = cd_c_l_base*(1-sup_h00)
     
     cd_c = cd_c_v + cd_c_l
 
@@ -149,6 +164,113 @@ def compressibility_drag_total(state,settings,geometry):
     drag_breakdown.compressible.total_lift   = cd_c_l
     
 
+    return cd_c
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def wing_compressibility_table(geometry):
+    """Collects the wing properties used by the drag divergence correlation into arrays so
+    that all of the wings can be evaluated together. The table is built once per
+    configuration when the aerodynamics analysis is initialized.
+
+    Assumptions:
+    Wings that are not main wings carry no lift
+
+    Source:
+    N/A
+
+    Inputs:
+    geometry.wings.*.
+      tag                      <string>
+      thickness_to_chord       [-]
+      sweeps.quarter_chord     [radians]
+      high_mach                [Boolean]
+      areas.reference          [m^2]
+
+    Outputs:
+    table.
+      tags                     <list of strings>
+      main_wing                [Boolean]
+      high_mach                [Boolean]
+      thickness_to_chord       [-]
+      cos_sweep                [-]
+      reference_area           [m^2]
+      cutoff_volume_key        cached volume drag at the drag rise cutoff
+      blender_key              cached transonic blenders
+
+    Properties Used:
+    N/A
+    """
+    
+    wings = geometry.wings
+    
+    table                    = Data()
+    table.tags               = [wing.tag for wing in wings]
+    table.main_wing          = np.array([isinstance(wing,Main_Wing) for wing in wings],dtype=bool)
+    table.high_mach          = np.array([wing.high_mach is True for wing in wings],dtype=bool)
+    table.thickness_to_chord = np.array([wing.thickness_to_chord for wing in wings],dtype=float)
+    table.cos_sweep          = np.cos(np.array([wing.sweeps.quarter_chord for wing in wings],dtype=float))
+    table.reference_area     = np.array([wing.areas.reference for wing in wings],dtype=float)
+    table.cutoff_volume_key  = None
+    table.cutoff_volume      = None
+    table.blender_key        = None
+    table.sub_spline         = None
+    table.sup_spline         = None
+    
+    return table
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def drag_div_wings(Mc,table,cl,Sref_main):
+    """Use drag divergence mach number to determine drag for subsonic speeds, evaluated for
+    all wings of a wing table at once. This is the same correlation as drag_div.
+
+    Assumptions:
+    Basic fit, subsonic
+
+    Source:
+    http://aerodesign.stanford.edu/aircraftdesign/aircraftdesign.html (Stanford AA241 A/B Course Notes)
+    Concorde data can be found in "Supersonic drag reduction technology in the scaled supersonic 
+    experimental airplane project by JAXA" by Kenji Yoshida
+
+    Inputs:
+    Mc                      [-]   shape (n_points,1)
+    table                   (see wing_compressibility_table)
+    cl                      [-]   wing lift coefficients, shape (n_points,n_wings)
+    Sref_main               [m^2]
+
+    Outputs:
+    cd_c                    [-]   shape (n_points,n_wings)
+
+    Properties Used:
+    N/A
+    """
+    
+    cos_sweep = table.cos_sweep
+    high_mach = table.high_mach
+    
+    # Get effective Cl and t/c
+    tc = table.thickness_to_chord / cos_sweep
+    cl = cl / (cos_sweep*cos_sweep)
+
+    # Compressibility drag based on regressed fits from AA241
+    mcc_cos_ws = 0.922321524499352       \
+        - 1.153885166170620*tc    \
+        - 0.304541067183461*cl    \
+        + 0.332881324404729*tc*tc \
+        + 0.467317361111105*tc*cl \
+        + 0.087490431201549*cl*cl
+
+    # Crest-critical mach number, corrected for wing sweep
+    # Wings designed for high subsonic cruise use a point fit to Concorde data
+    mcc = np.where(high_mach,0.95,mcc_cos_ws / cos_sweep)
+
+    # Compressibility correlation, Shevell
+    dcdc_cos3g = 0.0019*(Mc/mcc)**14.641
+
+    # Sweep correlation cannot be used if the wing has a high mach design
+    cd_c = np.where(high_mach,dcdc_cos3g,dcdc_cos3g * cos_sweep**3)
+        
+    cd_c = cd_c*table.reference_area/Sref_main
+    
     return cd_c
 
 ## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
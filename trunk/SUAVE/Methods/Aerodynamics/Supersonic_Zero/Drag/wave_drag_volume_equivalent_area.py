@@ -0,0 +1,501 @@
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+# wave_drag_volume_equivalent_area.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import hashlib
+
+# sampled volume elements, stored by geometry fingerprint
+volume_element_cache = {}
+maximum_cache_size   = 16
+
+# ----------------------------------------------------------------------
+#  Wave Drag Volume
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def wave_drag_volume_equivalent_area(vehicle,mach,scaling_factor,num_rots=16,num_harmonics=20):
+    """Computes the volume wave drag with the supersonic area rule. The vehicle is cut by
+    Mach planes at a set of roll angles, the equivalent body of each cut family is
+    expanded in a Fourier sine series and the von Karman slender body drag is averaged
+    over the roll angles. No external geometry tools are needed.
+
+    Assumptions:
+    Linearized supersonic flow
+    The vehicle closes at both ends of every equivalent body
+    Mach numbers below 1 use the sonic (normal cut) area distribution
+    Wings have a biconvex thickness distribution, fuselages and nacelles have
+    elliptical cross sections
+
+    Source:
+    Harris, R. V., "An Analysis and Correlation of Aircraft Wave Drag", NASA TM X-947, 1964
+    Ashley, H., Landahl, M., "Aerodynamics of Wings and Bodies", 1965, Sec. 9.3
+
+    Inputs:
+    vehicle.
+      reference_area                      [m^2]
+      wings, fuselages, nacelles          (see volume_elements)
+    mach                                  [Unitless]
+    scaling_factor                        [Unitless]
+    num_rots                              [Unitless] Roll angles of the cutting planes
+    num_harmonics                         [Unitless] Terms kept in the Fourier series
+
+    Outputs:
+    vehicle_wave_drag                     [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    S      = vehicle.reference_area
+    mach   = np.asarray(mach,dtype=float)
+    shape  = mach.shape
+    mach   = np.atleast_1d(mach).flatten()
+
+    # volume elements of the vehicle
+    xyz, dV = volume_elements(vehicle)
+
+    # Mach plane families, machs x rotations
+    beta  = np.sqrt(np.fmax(mach*mach - 1.,0.))
+    theta = np.linspace(0.,2*np.pi,num_rots,endpoint=False)
+    shift = np.cos(theta)[:,None]*xyz[None,:,1] + np.sin(theta)[:,None]*xyz[None,:,2]
+    Dq    = np.zeros(len(mach))
+
+    for i in range(len(mach)):
+        # position of every element along each equivalent body
+        xi     = xyz[None,:,0] - beta[i]*shift
+        xi_min = np.min(xi,axis=1)[:,None]
+        L      = np.max(xi,axis=1)[:,None] - xi_min
+        u      = 1. - 2.*(xi - xi_min)/L
+
+        # Fourier coefficients of S'(x) from the Chebyshev polynomials of the second kind
+        U_prev  = np.ones_like(u)
+        U       = 2.*u
+        dU_prev = np.zeros_like(u)
+        dU      = 2.*np.ones_like(u)
+        Dq_rot  = np.zeros(len(theta))
+        for n in range(2,num_harmonics+1):
+            # n-th coefficient uses the derivative of U_(n-1)
+            A_n     = 8./(np.pi*L[:,0]**2)*np.dot(dU,dV)
+            Dq_rot += np.pi/4.*n*A_n*A_n
+            U, U_prev, dU, dU_prev = 2.*u*U - U_prev, U, 2.*U + 2.*u*dU - dU_prev, dU
+
+        Dq[i] = np.mean(Dq_rot)
+
+    CD_c_vehicle = scaling_factor*Dq/S
+
+    return np.reshape(CD_c_vehicle,shape)
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def volume_elements(vehicle):
+    """Represents the volume of the vehicle by a cloud of point volumes. The sampling is
+    cached under a fingerprint of the geometry so repeated calls for the same vehicle
+    only pay for the lookup.
+
+    Assumptions:
+    See wave_drag_volume_equivalent_area
+
+    Source:
+    N/A
+
+    Inputs:
+    vehicle.
+      wings.*.
+        origin                            [m]
+        spans.projected                   [m]
+        chords.root, chords.tip           [m]
+        sweeps.quarter_chord              [radians] (or sweeps.leading_edge)
+        dihedral                          [radians]
+        thickness_to_chord                [Unitless]
+        symmetric, vertical               <boolean>
+        Segments                          (optional)
+      fuselages.*.
+        origin                            [m]
+        lengths.total, nose, tail         [m]
+        width, heights.maximum            [m]
+        Segments                          (optional)
+      nacelles.*.
+        origin                            [m]
+        length, diameter, inlet_diameter  [m]
+        flow_through                      <boolean>
+
+    Outputs:
+    xyz                                   [m]   element centroids, shape (n_elements,3)
+    dV                                    [m^3] element volumes, shape (n_elements,)
+
+    Properties Used:
+    N/A
+    """
+
+    descriptions = []
+    for wing in vehicle.wings:
+        descriptions.append(('wing',wing_description(wing)))
+    for fuselage in vehicle.get('fuselages',[]):
+        descriptions.append(('body',fuselage_description(fuselage)))
+    for nacelle in vehicle.get('nacelles',[]):
+        descriptions.append(('body',nacelle_description(nacelle)))
+
+    # look for the same geometry first
+    sha = hashlib.sha1()
+    for kind, description in descriptions:
+        sha.update(kind.encode())
+        sha.update(np.ascontiguousarray(description).tobytes())
+    fingerprint = sha.hexdigest()
+    if fingerprint in volume_element_cache:
+        return volume_element_cache[fingerprint]
+
+    xyz = [np.zeros((0,3))]
+    dV  = [np.zeros(0)]
+    for kind, description in descriptions:
+        if kind == 'wing':
+            points, volumes = wing_volume_elements(description)
+        else:
+            points, volumes = body_volume_elements(description)
+        xyz.append(points)
+        dV.append(volumes)
+
+    elements = (np.vstack(xyz),np.hstack(dV))
+
+    if len(volume_element_cache) >= maximum_cache_size:
+        volume_element_cache.pop(next(iter(volume_element_cache)))
+    volume_element_cache[fingerprint] = elements
+
+    return elements
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def wing_description(wing):
+    """Tabulates the stations of a wing. Each row holds the spanwise fraction, leading edge
+    position, chord and thickness to chord ratio of a station, followed by the symmetry
+    and orientation flags.
+
+    Assumptions:
+    Twist is neglected
+
+    Source:
+    N/A
+
+    Inputs:
+    wing                                  (see volume_elements)
+
+    Outputs:
+    description                           [array] shape (n_stations,9)
+
+    Properties Used:
+    N/A
+    """
+
+    origin = np.array(wing.origin,dtype=float).flatten()
+    span   = wing.spans.projected
+    c_root = wing.chords.root
+    if wing.symmetric:
+        semispan = span/2.
+    else:
+        semispan = span
+
+    segments = wing.get('Segments',[])
+    if len(segments) > 1:
+        eta   = np.array([seg.percent_span_location for seg in segments])
+        chord = np.array([seg.root_chord_percent for seg in segments])*c_root
+        tc    = np.array([seg.thickness_to_chord for seg in segments])
+        dihed = np.array([seg.dihedral_outboard for seg in segments])
+        sweep = []
+        for seg in segments:
+            if seg.sweeps.leading_edge is not None:
+                sweep.append([seg.sweeps.leading_edge,0.])
+            else:
+                sweep.append([seg.sweeps.quarter_chord,0.25])
+        sweep = np.array(sweep)
+    else:
+        eta   = np.array([0.,1.])
+        chord = np.array([c_root,wing.chords.tip])
+        tc    = np.array([wing.thickness_to_chord]*2)
+        dihed = np.array([wing.dihedral]*2)
+        if wing.sweeps.leading_edge is not None:
+            sweep = np.array([[wing.sweeps.leading_edge,0.]]*2)
+        else:
+            sweep = np.array([[wing.sweeps.quarter_chord,0.25]]*2)
+
+    # march the reference lines out along the span
+    x_le = np.zeros_like(eta)
+    h    = np.zeros_like(eta)
+    for i in range(1,len(eta)):
+        dy      = (eta[i] - eta[i-1])*semispan
+        angle   = sweep[i-1,0]
+        frac    = sweep[i-1,1]
+        x_ref   = x_le[i-1] + frac*chord[i-1] + dy*np.tan(angle)
+        x_le[i] = x_ref - frac*chord[i]
+        h[i]    = h[i-1] + dy*np.tan(dihed[i-1])
+
+    n = len(eta)
+    description = np.zeros((n,9))
+    description[:,0] = eta*semispan
+    description[:,1] = x_le + origin[0]
+    description[:,2] = h
+    description[:,3] = chord
+    description[:,4] = tc
+    description[:,5] = origin[1]
+    description[:,6] = origin[2]
+    description[:,7] = float(wing.symmetric)
+    description[:,8] = float(wing.vertical)
+
+    return description
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def fuselage_description(fuselage):
+    """Tabulates the cross sections of a fuselage. Each row holds the axial position, width,
+    height, lateral and vertical position of the section and the inner (duct) radius.
+
+    Assumptions:
+    Without segments the nose and tail are parabolic and the midsection is constant
+
+    Source:
+    N/A
+
+    Inputs:
+    fuselage                              (see volume_elements)
+
+    Outputs:
+    description                           [array] shape (n_sections,6)
+
+    Properties Used:
+    N/A
+    """
+
+    origin = np.array(fuselage.origin,dtype=float).flatten()
+    length = fuselage.lengths.total
+
+    segments = fuselage.get('Segments',[])
+    if len(segments) > 1:
+        x = np.array([seg.percent_x_location for seg in segments])*length
+        w = np.array([seg.width for seg in segments])
+        t = np.array([seg.height for seg in segments])
+        y = np.array([seg.percent_y_location for seg in segments])*length
+        z = np.array([seg.percent_z_location for seg in segments])*length
+    else:
+        width  = fuselage.width
+        height = fuselage.heights.maximum
+        if width == 0. or height == 0.:
+            width  = fuselage.effective_diameter
+            height = fuselage.effective_diameter
+        diameter = np.sqrt(width*height)
+        nose = fuselage.lengths.nose
+        tail = fuselage.lengths.tail
+        if nose == 0.:
+            nose = fuselage.fineness.nose*diameter
+        if tail == 0.:
+            tail = fuselage.fineness.tail*diameter
+        nose  = min(nose,0.5*length)
+        tail  = min(tail,0.5*length)
+        s     = np.linspace(0.,1.,9)
+        shape = np.hstack([1.-(1.-s)**2,1.-s**2])
+        x     = np.hstack([s*nose,length - tail + s*tail])
+        w     = shape*width
+        t     = shape*height
+        y     = np.zeros_like(x)
+        z     = np.zeros_like(x)
+
+    description = np.zeros((len(x),6))
+    description[:,0] = x + origin[0]
+    description[:,1] = w
+    description[:,2] = t
+    description[:,3] = y + origin[1]
+    description[:,4] = z + origin[2]
+
+    return description
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def nacelle_description(nacelle):
+    """Tabulates the cross sections of a nacelle in the same format as fuselage_description.
+    Flow through nacelles keep a duct of the inlet diameter.
+
+    Assumptions:
+    The nacelle is aligned with the x axis
+    Without segments the outer surface fairs smoothly into the inlet and exit lips
+
+    Source:
+    N/A
+
+    Inputs:
+    nacelle                               (see volume_elements)
+
+    Outputs:
+    description                           [array] shape (n_sections,6)
+
+    Properties Used:
+    N/A
+    """
+
+    origin = np.array(nacelle.origin,dtype=float).flatten()
+    length = nacelle.length
+
+    if nacelle.flow_through:
+        inner = nacelle.inlet_diameter/2.
+    else:
+        inner = 0.
+
+    segments = nacelle.get('Segments',[])
+    if len(segments) > 1:
+        x = np.array([seg.percent_x_location for seg in segments])*length
+        w = np.array([seg.width for seg in segments])
+        t = np.array([seg.height for seg in segments])
+        y = np.array([seg.percent_y_location for seg in segments])*length
+        z = np.array([seg.percent_z_location for seg in segments])*length
+    else:
+        s = np.linspace(0.,1.,17)
+        f = 1. - (1. - 2.*s)**4
+        x = s*length
+        w = 2*inner + f*(nacelle.diameter - 2*inner)
+        t = w*1.
+        y = np.zeros_like(x)
+        z = np.zeros_like(x)
+
+    description = np.zeros((len(x),6))
+    description[:,0] = x + origin[0]
+    description[:,1] = w
+    description[:,2] = t
+    description[:,3] = y + origin[1]
+    description[:,4] = z + origin[2]
+    description[:,5] = np.fmin(inner,np.fmin(w,t)/2.)
+
+    return description
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def wing_volume_elements(description,number_spanwise=40,number_chordwise=20):
+    """Samples the volume of a wing.
+
+    Assumptions:
+    Biconvex sections, the volume of a chordwise strip is placed on the mean surface
+
+    Source:
+    N/A
+
+    Inputs:
+    description                           [array] see wing_description
+    number_spanwise                       [Unitless]
+    number_chordwise                      [Unitless]
+
+    Outputs:
+    xyz                                   [m]
+    dV                                    [m^3]
+
+    Properties Used:
+    N/A
+    """
+
+    y_stations = description[:,0]
+    semispan   = y_stations[-1] - y_stations[0]
+    if semispan <= 0.:
+        return np.zeros((0,3)), np.zeros(0)
+
+    # spanwise strip centers and widths
+    edges = np.linspace(y_stations[0],y_stations[-1],number_spanwise+1)
+    y     = 0.5*(edges[1:] + edges[:-1])
+    dy    = np.diff(edges)
+    x_le  = np.interp(y,y_stations,description[:,1])
+    h     = np.interp(y,y_stations,description[:,2])
+    c     = np.interp(y,y_stations,description[:,3])
+    tc    = np.interp(y,y_stations,description[:,4])
+
+    # chordwise midpoints with the biconvex thickness
+    s     = (np.arange(number_chordwise) + 0.5)/number_chordwise
+    ds    = 1./number_chordwise
+    x     = x_le[:,None] + s[None,:]*c[:,None]
+    dV    = (4.*tc*c*c*dy)[:,None]*(s*(1.-s)*ds)[None,:]
+    y     = np.broadcast_to(y[:,None],x.shape)
+    h     = np.broadcast_to(h[:,None],x.shape)
+
+    # empty elements at the root and tip corners mark the extent of the wing
+    x_edge = np.hstack([np.interp(y_stations[[0,-1]],y_stations,description[:,1])]*2)
+    x_edge = x_edge + np.hstack([[0.,0.],np.interp(y_stations[[0,-1]],y_stations,description[:,3])])
+    y_edge = np.hstack([y_stations[[0,-1]]]*2)
+    h_edge = np.hstack([np.interp(y_stations[[0,-1]],y_stations,description[:,2])]*2)
+
+    x  = np.hstack([x.flatten(),x_edge])
+    y  = np.hstack([y.flatten(),y_edge])
+    h  = np.hstack([h.flatten(),h_edge])
+    dV = np.hstack([dV.flatten(),np.zeros(4)])
+
+    y0, z0, symmetric, vertical = description[0,5:9]
+    if vertical:
+        points = np.vstack([x,y0 + h,z0 + y]).T
+    else:
+        points = np.vstack([x,y0 + y,z0 + h]).T
+
+    if symmetric:
+        mirror       = points*1.
+        mirror[:,1]  = 2*y0 - mirror[:,1]
+        points       = np.vstack([points,mirror])
+        dV           = np.hstack([dV,dV])
+
+    return points, dV
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def body_volume_elements(description,number_axial=60,number_radial=4,number_azimuthal=12):
+    """Samples the volume of a fuselage or nacelle.
+
+    Assumptions:
+    Elliptical sections, annular when the description has an inner radius
+
+    Source:
+    N/A
+
+    Inputs:
+    description                           [array] see fuselage_description
+    number_axial                          [Unitless]
+    number_radial                         [Unitless]
+    number_azimuthal                      [Unitless]
+
+    Outputs:
+    xyz                                   [m]
+    dV                                    [m^3]
+
+    Properties Used:
+    N/A
+    """
+
+    x_stations = description[:,0]
+    length     = x_stations[-1] - x_stations[0]
+    if length <= 0.:
+        return np.zeros((0,3)), np.zeros(0)
+
+    edges = np.linspace(x_stations[0],x_stations[-1],number_axial+1)
+    x     = 0.5*(edges[1:] + edges[:-1])
+    dx    = np.diff(edges)
+    a     = np.interp(x,x_stations,description[:,1])/2.
+    b     = np.interp(x,x_stations,description[:,2])/2.
+    y0    = np.interp(x,x_stations,description[:,3])
+    z0    = np.interp(x,x_stations,description[:,4])
+    ri    = np.interp(x,x_stations,description[:,5])
+
+    # rings of equal area between the duct and the outer surface
+    rho_in  = np.where(np.fmin(a,b) > 0.,ri/np.fmax(np.fmin(a,b),1e-12),0.)
+    k       = np.arange(number_radial+1)/number_radial
+    rho2    = rho_in[:,None]**2 + k[None,:]*(1. - rho_in[:,None]**2)
+    rho_mid = np.sqrt(0.5*(rho2[:,1:] + rho2[:,:-1]))
+    phi     = 2*np.pi*(np.arange(number_azimuthal) + 0.5)/number_azimuthal
+    dA      = np.pi*a*b*(1. - rho_in**2)/(number_radial*number_azimuthal)
+
+    X  = np.broadcast_to(x[:,None,None],(number_axial,number_radial,number_azimuthal))
+    Y  = y0[:,None,None] + a[:,None,None]*rho_mid[:,:,None]*np.cos(phi)[None,None,:]
+    Z  = z0[:,None,None] + b[:,None,None]*rho_mid[:,:,None]*np.sin(phi)[None,None,:]
+    dV = np.broadcast_to((dA*dx)[:,None,None],X.shape)
+
+    # empty elements on the end sections mark the extent of the body
+    ends    = x_stations[[0,-1]]
+    a_end   = description[[0,-1],1]/2.
+    b_end   = description[[0,-1],2]/2.
+    psi     = np.pi*np.arange(4)/2.
+    X_end   = np.repeat(ends,4)
+    Y_end   = np.repeat(description[[0,-1],3],4) + np.repeat(a_end,4)*np.tile(np.cos(psi),2)
+    Z_end   = np.repeat(description[[0,-1],4],4) + np.repeat(b_end,4)*np.tile(np.sin(psi),2)
+
+    points = np.vstack([np.hstack([X.flatten(),X_end]),
+                        np.hstack([Y.flatten(),Y_end]),
+                        np.hstack([Z.flatten(),Z_end])]).T
+
+    return points, np.hstack([dV.flatten(),np.zeros(8)])
@@ -6,9 +6,9 @@
 #           Jan 2020, T. MacDonald
 #           Apr 2020, M. Clarke
 #           Feb 2021, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 import numpy as np
-from SUAVE.Core import Units
 from SUAVE.Methods.Utilities.Cubic_Spline_Blender import Cubic_Spline_Blender
 from SUAVE.Methods.Flight_Dynamics.Static_Stability.Approximations.Supporting_Functions.convert_sweep import convert_sweep
 from SUAVE.Components.Wings import Main_Wing
@@ -50,7 +50,7 @@ def wave_drag_volume_raymer(vehicle,mach,scaling_factor):
     if main_wing.sweeps.leading_edge == None:                           
         main_wing.sweeps.leading_edge  = convert_sweep(main_wing,old_ref_chord_fraction = 0.25 ,new_ref_chord_fraction = 0.0) 
         
-    LE_sweep = main_wing.sweeps.leading_edge / Units.deg
+    LE_sweep = np.degrees(main_wing.sweeps.leading_edge) # avoids a unit registry lookup on every call
     L        = vehicle.total_length
     Ae       = vehicle.maximum_cross_sectional_area
     S        = vehicle.reference_area
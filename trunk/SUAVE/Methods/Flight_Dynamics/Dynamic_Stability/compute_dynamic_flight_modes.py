@@ -2,6 +2,7 @@
 # compute_dynamic_flight_modes.py
 # 
 # Created:  Jun 2019, M. Clarke, UAM Vehicle Convergence Aerodynamics Team 
+# Modified: Oct 2026, SUAVE Team
 # Adapted from: 
 # ----------------------------------------------------------------------
 #  Imports
@@ -22,6 +23,8 @@ def compute_dynamic_flight_modes(results,aircraft,flight_conditions,cases):
     
     Assumptions:
        Linerarized Equations are used following the reference below
+       The state matrices of all cases are stacked and decomposed together. The control 
+       derivatives of the last case are used for the control matrices of all cases
 
     Source:
       Automatic Control of Aircraft and Missiles by J. Blakelock Pg 23 and 117 
@@ -86,9 +89,7 @@ def compute_dynamic_flight_modes(results,aircraft,flight_conditions,cases):
     ## Build longitudinal EOM A Matrix (stability axis)
     ALon = np.zeros((num_cases,4,4))
     BLon = np.zeros((num_cases,4,1)) 
-    CLon = np.zeros((num_cases,4,4))
-    for i in range(num_cases): 
-        CLon[i,:,:] = np.eye(4)       
+    CLon = np.tile(np.eye(4),(num_cases,1,1))
     DLon = np.zeros((num_cases,4,1))
     
     Cw         = m * g / (qDyn0 * S_ref) 
@@ -125,10 +126,9 @@ def compute_dynamic_flight_modes(results,aircraft,flight_conditions,cases):
     # Elevator effectiveness 
     for wing in aircraft.wings:
         if wing.control_surfaces :
-            for cs in wing.control_surfaces:
-                ctrl_surf =  cs
+            for ctrl_surf in wing.control_surfaces:
                 if (type(ctrl_surf) ==  Elevator):
-                    ele = st.control_surfaces_cases[cases[i].tag].control_surfaces[cs.tag]
+                    ele = st.control_surfaces_cases[cases[-1].tag].control_surfaces[ctrl_surf.tag]
                     Xe  = 0 # Neglect
                     Ze  = 0.5 * rho * u0 * u0 * S_ref * ele.CL
                     Me  = 0.5 * rho * u0 * u0 * S_ref * c_ref * ele.Cm
@@ -156,54 +156,48 @@ def compute_dynamic_flight_modes(results,aircraft,flight_conditions,cases):
     ALon[:,3,2] = 1
     ALon[:,3,3] = 0
      
-    # Look at eigenvalues and eigenvectors
-    LonModes                  = np.zeros((num_cases,4), dtype = complex)
-    phugoidFreqHz             = np.zeros((num_cases,1))
-    phugoidDamping            = np.zeros((num_cases,1))
-    phugoidTimeDoubleHalf     = np.zeros((num_cases,1))
-    shortPeriodFreqHz         = np.zeros((num_cases,1))
-    shortPeriodDamping        = np.zeros((num_cases,1))
-    shortPeriodTimeDoubleHalf = np.zeros((num_cases,1))
+    # Look at eigenvalues and eigenvectors of all cases, the magnitudes of single modes are
+    # computed with hypot which matches abs of a complex scalar to the bit
+    LonModes , V = np.linalg.eig(ALon) # State order: u, w, q, theta
+    LonModes     = LonModes.astype(complex)
+    case_ind     = np.arange(num_cases)
     
-    for i in range(num_cases):
-        D  , V = np.linalg.eig(ALon[i,:,:]) # State order: u, w, q, theta
-        LonModes[i,:] = D
-        
-        # Find phugoid
-        phugoidInd               = np.argmax(V[0,:]) # u is the primary state involved
-        phugoidFreqHz[i]         = abs(LonModes[i,phugoidInd]) / 2 / np.pi
-        phugoidDamping[i]        = -np.cos(np.angle(LonModes[i,phugoidInd]))
-        phugoidTimeDoubleHalf[i] = np.log(2) / abs(2 * np.pi * phugoidFreqHz[i] * phugoidDamping[i])
-        
-        # Find short period
-        shortPeriodInd               = np.argmax(V[1,:]) # w is the primary state involved
-        shortPeriodFreqHz[i]         = abs(LonModes[i, shortPeriodInd]) / 2 / np.pi
-        shortPeriodDamping[i]        = -np.cos(np.angle(LonModes[i, shortPeriodInd ]))
-        shortPeriodTimeDoubleHalf[i] = np.log(2) / abs(2 * np.pi * shortPeriodFreqHz[i] * shortPeriodDamping[i]) 
+    # Find phugoid
+    phugoidInd                = np.argmax(V[:,0,:],axis=1) # u is the primary state involved
+    phugoidMode               = LonModes[case_ind,phugoidInd][:,None]
+    phugoidFreqHz             = np.hypot(phugoidMode.real,phugoidMode.imag) / 2 / np.pi
+    phugoidDamping            = -np.cos(np.angle(phugoidMode))
+    phugoidTimeDoubleHalf     = np.log(2) / abs(2 * np.pi * phugoidFreqHz * phugoidDamping)
+    
+    # Find short period
+    shortPeriodInd            = np.argmax(V[:,1,:],axis=1) # w is the primary state involved
+    shortPeriodMode           = LonModes[case_ind,shortPeriodInd][:,None]
+    shortPeriodFreqHz         = np.hypot(shortPeriodMode.real,shortPeriodMode.imag) / 2 / np.pi
+    shortPeriodDamping        = -np.cos(np.angle(shortPeriodMode))
+    shortPeriodTimeDoubleHalf = np.log(2) / abs(2 * np.pi * shortPeriodFreqHz * shortPeriodDamping) 
     
     ## Build lateral EOM A Matrix (stability axis)
     ALat = np.zeros((num_cases,4,4))
     BLat = np.zeros((num_cases,4,1))
-    CLat = np.zeros((num_cases,4,4))
-    for i in range(num_cases): 
-        CLat[i,:,:] = np.eye(4) 
+    CLat = np.tile(np.eye(4),(num_cases,1,1))
     DLat = np.zeros((num_cases,4,1))
     
     # Need to compute Ixx, Izz, and Ixz as a function of alpha
-    Ixp  = np.zeros((num_cases,1))
-    Izp  = np.zeros((num_cases,1))
-    Ixzp = np.zeros((num_cases,1))
-    
-    for i in range(num_cases): 
-        R       = np.array( [[np.cos(AoA[i][0]*Units.degrees) ,  - np.sin(AoA[i][0]*Units.degrees) ], [ np.sin( AoA[i][0]*Units.degrees) , np.cos(AoA[i][0]*Units.degrees)]])
-        modI    = np.array([[moments_of_inertia[0][0],moments_of_inertia[0][2]],[moments_of_inertia[2][0],moments_of_inertia[2][2]]] ) 
-        INew    = R * modI  * np.transpose(R)
-        IxxStab =  INew[0,0]
-        IxzStab = -INew[0,1]
-        IzzStab =  INew[1,1]
-        Ixp[i]  = (IxxStab * IzzStab - IxzStab**2) / IzzStab
-        Izp[i]  = (IxxStab * IzzStab - IxzStab**2) / IxxStab
-        Ixzp[i] = IxzStab / (IxxStab * IzzStab - IxzStab**2) 
+    cos_a   = np.cos(AoA[:,0]*Units.degrees)
+    sin_a   = np.sin(AoA[:,0]*Units.degrees)
+    R       = np.zeros((num_cases,2,2))
+    R[:,0,0]=  cos_a
+    R[:,0,1]= -sin_a
+    R[:,1,0]=  sin_a
+    R[:,1,1]=  cos_a
+    modI    = np.array([[moments_of_inertia[0][0],moments_of_inertia[0][2]],[moments_of_inertia[2][0],moments_of_inertia[2][2]]] ) 
+    INew    = R * modI  * np.transpose(R,(0,2,1))
+    IxxStab =  INew[:,0,0][:,None]
+    IxzStab = -INew[:,0,1][:,None]
+    IzzStab =  INew[:,1,1][:,None]
+    Ixp     = (IxxStab * IzzStab - IxzStab**2) / IzzStab
+    Izp     = (IxxStab * IzzStab - IxzStab**2) / IxxStab
+    Ixzp    = IxzStab / (IxxStab * IzzStab - IxzStab**2) 
         
     Yv = 0.5 * rho * u0 * S_ref * st.CY_beta
     Yp = 0.25 * rho * u0 * b_ref * S_ref * st.CY_p
@@ -220,7 +214,7 @@ def compute_dynamic_flight_modes(results,aircraft,flight_conditions,cases):
         if wing.control_surfaces :
             for ctrl_surf in wing.control_surfaces:
                 if (type(ctrl_surf) ==  Aileron): 
-                    ail = st.control_surfaces_cases[cases[i].tag].control_surfaces[cs.tag]                      
+                    ail = st.control_surfaces_cases[cases[-1].tag].control_surfaces[ctrl_surf.tag]                      
                     Ya = 0.5 * rho * u0 * u0 * S_ref * ail.CY 
                     La = 0.5 * rho * u0 * u0 * S_ref * b_ref * ail.Cl 
                     Na = 0.5 * rho * u0 * u0 * S_ref * b_ref * ail.Cn  
@@ -247,50 +241,39 @@ def compute_dynamic_flight_modes(results,aircraft,flight_conditions,cases):
     ALat[:,3,2] = (np.tan(theta0)).T[0] 
     ALat[:,3,3] = 0
                                 
-    LatModes                    = np.zeros((num_cases,4),dtype=complex)
+    LatModes                    = np.linalg.eig(ALat)[0].astype(complex) # State order: v, p, r, phi
     dutchRollFreqHz             = np.zeros((num_cases,1))
     dutchRollDamping            = np.zeros((num_cases,1))
     dutchRollTimeDoubleHalf     = np.zeros((num_cases,1))
-    rollSubsistenceFreqHz       = np.zeros((num_cases,1))
-    rollSubsistenceTimeConstant = np.zeros((num_cases,1))
-    rollSubsistenceDamping      = np.zeros((num_cases,1))
-    spiralFreqHz                = np.zeros((num_cases,1))
-    spiralTimeDoubleHalf        = np.zeros((num_cases,1))
-    spiralDamping               = np.zeros((num_cases,1))
     dutchRoll_mode_real         = np.zeros((num_cases,1))
     
-    for i in range(num_cases):        
-        D  , V = np.linalg.eig(ALat[i,:,:]) # State order: u, w, q, theta
-        LatModes[i,:] = D  
-        
-        # Find dutch roll (complex pair)
-        done = 0
-        for j in range(3):
-            for k in range(j+1,4):
-                if LatModes[i,j].real ==  LatModes[i,k].real:
-                    dutchRollFreqHz[i] = abs(LatModes[i,j]) / 2 / np.pi
-                    dutchRollDamping[i] = -np.cos(np.angle(LatModes[i,j]))
-                    dutchRollTimeDoubleHalf[i] = np.log(2) / abs(2 * np.pi * dutchRollFreqHz[i] * dutchRollDamping[i])
-                    dutchRoll_mode_real[i] = LatModes[i,j].real /  2 / np.pi
-                    done = 1
-                    break  
-            if done:
-                break  
-        
-        # Find roll mode
-        diff_vec = np.arange(0,4)
-        tmpInd   = np.setdiff1d(diff_vec , [j,k])
-        rollInd  = np.argmax(abs(LatModes[i,tmpInd])) # higher frequency than spiral
-        rollInd  = tmpInd[rollInd]
-        rollSubsistenceFreqHz[i]       = abs(LatModes[i,rollInd]) / 2 / np.pi
-        rollSubsistenceDamping[i]      = - np.sign(LatModes[i,rollInd].real)
-        rollSubsistenceTimeConstant[i] = 1 / (2 * np.pi * rollSubsistenceFreqHz[i] * rollSubsistenceDamping[i])
-        
-        # Find spiral mode
-        spiralInd               = np.setdiff1d(diff_vec,[j,k,rollInd])
-        spiralFreqHz[i]         = abs(LatModes[i,spiralInd]) / 2 / np.pi
-        spiralDamping[i]        = - np.sign(LatModes[i,spiralInd].real)
-        spiralTimeDoubleHalf[i] = np.log(2) / abs(2 * np.pi * spiralFreqHz[i] * spiralDamping[i])
+    # Find dutch roll (complex pair), the first pair of modes with equal real parts. When
+    # there is no pair the last pair is taken out of the roll and spiral mode search
+    pairs        = np.array([[0,1],[0,2],[0,3],[1,2],[1,3],[2,3]])
+    other_modes  = np.array([[2,3],[1,3],[1,2],[0,3],[0,2],[0,1]])
+    equal_real   = LatModes.real[:,pairs[:,0]] == LatModes.real[:,pairs[:,1]]
+    found        = np.any(equal_real,axis=1)
+    pairInd      = np.where(found,np.argmax(equal_real,axis=1),len(pairs)-1)
+    
+    dutchRollMode                  = LatModes[case_ind[found],pairs[pairInd[found],0]][:,None]
+    dutchRollFreqHz[found]         = np.hypot(dutchRollMode.real,dutchRollMode.imag) / 2 / np.pi
+    dutchRollDamping[found]        = -np.cos(np.angle(dutchRollMode))
+    dutchRollTimeDoubleHalf[found] = np.log(2) / abs(2 * np.pi * dutchRollFreqHz[found] * dutchRollDamping[found])
+    dutchRoll_mode_real[found]     = dutchRollMode.real /  2 / np.pi
+    
+    # Find roll mode
+    tmpInd                      = other_modes[pairInd]
+    rollSel                     = np.argmax(abs(LatModes[case_ind[:,None],tmpInd]),axis=1) # higher frequency than spiral
+    rollMode                    = LatModes[case_ind,tmpInd[case_ind,rollSel]][:,None]
+    rollSubsistenceFreqHz       = np.hypot(rollMode.real,rollMode.imag) / 2 / np.pi
+    rollSubsistenceDamping      = - np.sign(rollMode.real)
+    rollSubsistenceTimeConstant = 1 / (2 * np.pi * rollSubsistenceFreqHz * rollSubsistenceDamping)
+    
+    # Find spiral mode
+    spiralMode                  = LatModes[case_ind,tmpInd[case_ind,1-rollSel]][:,None]
+    spiralFreqHz                = abs(spiralMode) / 2 / np.pi
+    spiralDamping               = - np.sign(spiralMode.real)
+    spiralTimeDoubleHalf        = np.log(2) / abs(2 * np.pi * spiralFreqHz * spiralDamping)
          
     ## Build longitudinal and lateral state space system. Requires additional toolbox 
     #from control.matlab import ss  # control toolbox needed in python. Run "pip (or pip3) install control"    
@@ -0,0 +1,273 @@
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+# airfoil_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.version import version as SUAVE_version
+import numpy as np
+import scipy
+
+import os
+import hashlib
+import tempfile
+
+# ----------------------------------------------------------------------
+#  Settings
+# ----------------------------------------------------------------------
+
+# directory of the airfoil cache, the disk cache is disabled unless a directory is set
+airfoil_cache_settings                 = Data()
+airfoil_cache_settings.cache_directory = None
+
+# the whole SUAVE source tree defines the cached results
+source_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','..','..','..','..')
+
+source_fingerprint = []
+
+# ----------------------------------------------------------------------
+#  Airfoil Cache
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def airfoil_cache_fingerprint(function_name,*inputs):
+    """ Hashes the inputs of a cached airfoil function. Files enter the hash through
+    their contents, so renamed or moved files hit the same entry. The SUAVE version
+    and the source of the whole SUAVE package are part of the hash so that entries
+    written by other code are not reused.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    function_name           name of the cached function                    [string]
+    inputs                  file contents, geometries and settings         [multiple]
+
+    Outputs:
+    fingerprint             None when the cache is disabled                [string]
+
+    Properties Used:
+    airfoil_cache_settings.cache_directory
+    """
+    if airfoil_cache_settings.cache_directory is None:
+        return None
+
+    if len(source_fingerprint) == 0:
+        sha = hashlib.sha1()
+        for directory, sub_directories, file_names in os.walk(source_directory):
+            sub_directories.sort()
+            for file_name in sorted(file_names):
+                if file_name.endswith('.py'):
+                    file_path = os.path.join(directory,file_name)
+                    sha.update(os.path.relpath(file_path,source_directory).encode())
+                    sha.update(read_airfoil_files(file_path))
+        source_fingerprint.append(sha.hexdigest())
+
+    sha = hashlib.sha1()
+    sha.update(function_name.encode())
+    sha.update(SUAVE_version.encode())
+    sha.update(source_fingerprint[0].encode())
+    sha.update(np.__version__.encode())
+    sha.update(scipy.__version__.encode())
+    for value in inputs:
+        _hash_value(value,sha)
+
+    return sha.hexdigest()
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def read_airfoil_files(airfoil_files):
+    """ Reads the raw contents of airfoil geometry or polar files for hashing.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    airfoil_files           file name or list of file names                [string]
+
+    Outputs:
+    contents                file contents, in the order given              [bytes]
+
+    Properties Used:
+    N/A
+    """
+    if airfoil_files is None:
+        return None
+    if isinstance(airfoil_files,(list,tuple)):
+        return [read_airfoil_files(file_name) for file_name in airfoil_files]
+
+    with open(airfoil_files,'rb') as f:
+        contents = f.read()
+
+    return contents
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def load_airfoil_cache(function_name,fingerprint):
+    """ Reads the result of a cached airfoil function. A missing or unreadable
+    entry returns None so that the caller computes the result again.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    function_name           name of the cached function                    [string]
+    fingerprint             hash of the function inputs                    [string]
+
+    Outputs:
+    data                    cached result or None                          [Data]
+
+    Properties Used:
+    airfoil_cache_settings.cache_directory
+    """
+    if fingerprint is None:
+        return None
+
+    cache_file = os.path.join(airfoil_cache_settings.cache_directory,function_name + '_' + fingerprint + '.npz')
+    if not os.path.isfile(cache_file):
+        return None
+
+    try:
+        with np.load(cache_file) as arrays:
+            data = Data()
+            for path in arrays.files:
+                keys  = path.split('/')
+                value = arrays[path]
+                if value.ndim == 0:
+                    value = str(value) if value.dtype.kind == 'U' else value[()]
+                level = data
+                for key in keys[:-1]:
+                    if key not in level.keys():
+                        level[key] = Data()
+                    level = level[key]
+                level[keys[-1]] = value
+    except Exception:
+        return None
+
+    return data
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def save_airfoil_cache(function_name,fingerprint,data):
+    """ Writes the result of a cached airfoil function to a binary .npz file. The file
+    is moved into place once it is complete so that concurrent processes never read a
+    partial entry. Results holding values that are not arrays, numbers or strings are
+    not cached.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    function_name           name of the cached function                    [string]
+    fingerprint             hash of the function inputs                    [string]
+    data                    result of the function                         [Data]
+
+    Outputs:
+    None
+
+    Properties Used:
+    airfoil_cache_settings.cache_directory
+    """
+    if fingerprint is None:
+        return
+
+    arrays = Data()
+    if not _flatten_data(data,'',arrays):
+        return
+
+    directory = airfoil_cache_settings.cache_directory
+    if not os.path.isdir(directory):
+        os.makedirs(directory,exist_ok=True)
+
+    cache_file        = os.path.join(directory,function_name + '_' + fingerprint + '.npz')
+    handle, temp_file = tempfile.mkstemp(dir=directory,suffix='.tmp')
+    with os.fdopen(handle,'wb') as f:
+        np.savez(f,**arrays)
+    os.replace(temp_file,cache_file)
+
+    return
+
+def _flatten_data(data,prefix,arrays):
+    """ Collects the leaves of a Data tree as arrays keyed by their '/' separated path.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    data                    [Data]
+    prefix                  path of data in the tree                       [string]
+    arrays                  flattened leaves                               [Data]
+
+    Outputs:
+    supported               False if a leaf cannot be stored              [boolean]
+
+    Properties Used:
+    N/A
+    """
+    for key, value in data.items():
+        if isinstance(value,dict):
+            if not _flatten_data(value,prefix + key + '/',arrays):
+                return False
+            continue
+        value = np.asarray(value)
+        if value.dtype.kind not in 'biufcU':
+            return False
+        arrays[prefix + key] = value
+
+    return True
+
+def _hash_value(value,sha):
+    """ Recursively feeds a function input into a hash.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    value                   [multiple]
+    sha                     [hashlib hash]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    sha.update(type(value).__name__.encode())
+    if isinstance(value,dict):
+        for key in sorted(value.keys()):
+            sha.update(str(key).encode())
+            _hash_value(value[key],sha)
+    elif isinstance(value,(list,tuple)):
+        sha.update(str(len(value)).encode())
+        for item in value:
+            _hash_value(item,sha)
+    elif isinstance(value,np.ndarray):
+        sha.update(str(value.shape).encode())
+        sha.update(value.dtype.str.encode())
+        sha.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value,bytes):
+        sha.update(str(len(value)).encode())
+        sha.update(value)
+    else:
+        sha.update(repr(value).encode())
+
+    return
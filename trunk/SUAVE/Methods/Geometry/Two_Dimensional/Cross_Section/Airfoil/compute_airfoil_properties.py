@@ -6,6 +6,7 @@
 #           Jan 2021, E. Botero
 #           Jan 2021, R. Erhard
 #           Nov 2021, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,6 +19,8 @@ from SUAVE.Methods.Aerodynamics.AERODAS.post_stall_coefficients
 from SUAVE.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis                    import airfoil_analysis
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_polars  import import_airfoil_polars 
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_naca_4series   import compute_naca_4series   
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.airfoil_cache          import airfoil_cache_fingerprint, read_airfoil_files, \
+     load_airfoil_cache, save_airfoil_cache
 import numpy as np
 
 ## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
@@ -28,7 +31,8 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     are obtained in the form of a text file of airfoil polar data obtained from airfoiltools.com
     
     Assumptions:
-        None 
+        If airfoil_cache_settings.cache_directory is set, the properties are stored in the airfoil cache
+        under the geometry and polar file contents and reloaded on later calls.
         
     Source
         None
@@ -67,6 +71,12 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     Properties Used:
     N/A
     """     
+    # reload the properties if this airfoil has been computed before
+    fingerprint    = airfoil_cache_fingerprint('compute_airfoil_properties',airfoil_geometry,read_airfoil_files(airfoil_polar_files),use_pre_stall_data)
+    Airfoil_Data   = load_airfoil_cache('compute_airfoil_properties',fingerprint)
+    if Airfoil_Data is not None:
+        return Airfoil_Data
+    
     Airfoil_Data   = Data()  
    
     # ----------------------------------------------------------------------------------------
@@ -120,6 +130,8 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     Airfoil_Data.angle_of_attacks    = AoA_sweep_rad 
     Airfoil_Data.lift_coefficients   = CL 
     Airfoil_Data.drag_coefficients   = CD    
+    
+    save_airfoil_cache('compute_airfoil_properties',fingerprint,Airfoil_Data)
         
     return Airfoil_Data
  
@@ -280,6 +292,9 @@ def compute_boundary_layer_properties(airfoil_geometry,Airfoil_Data):
     
     Outputs:
     Airfoil_Data       <data_structure>
+      boundary_layer.trailing_edge_properties - theta, delta, delta_star, Ue_Vinf, cf and dcp_dx at the
+                                                lower and upper surface trailing edge, 
+                                                [Reynolds number, angle of attack, surface, property]
     
     Properties Used:
     N/A
@@ -319,4 +334,10 @@ def compute_boundary_layer_properties(airfoil_geometry,Airfoil_Data):
     Airfoil_Data.boundary_layer.cf_upper_surface                    = af_res.cf   
     Airfoil_Data.boundary_layer.dcp_dx_upper_surface                = af_res.dcp_dx   
     
+    # stacked table of the trailing edge properties so that they are interpolated with a single index computation 
+    te_index = [1,-1] # lower and upper surface trailing edge indices
+    Airfoil_Data.boundary_layer.trailing_edge_properties            = np.stack([af_res.theta[:,:,te_index],af_res.delta[:,:,te_index],
+                                                                                af_res.delta_star[:,:,te_index],af_res.Ue_Vinf[:,:,te_index],
+                                                                                af_res.cf[:,:,te_index],af_res.dcp_dx[:,:,te_index]],axis=-1)
+    
     return Airfoil_Data
\ No newline at end of file
@@ -11,11 +11,14 @@
 #           May 2021, R. Erhard
 #           Jun 2021, E. Botero
 #           Aug 2021, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ---------------------------------------------------------------------- 
 from SUAVE.Core import Data  
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.airfoil_cache import airfoil_cache_fingerprint, read_airfoil_files, \
+     load_airfoil_cache, save_airfoil_cache
 import numpy as np
 from scipy import interpolate
 
@@ -27,6 +30,7 @@ def import_airfoil_geometry(airfoil_geometry_file, npoints = 200,surface_interpo
     
     Assumptions:
     Works for Selig and Lednicer airfoil formats. Automatically detects which format based off first line of data. Assumes it is one of those two.
+    If airfoil_cache_settings.cache_directory is set, the geometry is stored in the airfoil cache under the file contents and number of points and reloaded on later calls.
     Source:
     airfoiltools.com/airfoil/index - method for determining format and basic error checking
     Inputs:
@@ -47,6 +51,12 @@ def import_airfoil_geometry(airfoil_geometry_file, npoints = 200,surface_interpo
     Properties Used:
     N/A
     """  
+    # reload the geometry if this file has been imported before
+    fingerprint  = airfoil_cache_fingerprint('import_airfoil_geometry',read_airfoil_files(airfoil_geometry_file),npoints,surface_interpolation)
+    geometry     = load_airfoil_cache('import_airfoil_geometry',fingerprint)
+    if geometry is not None:
+        return geometry
+    
     geometry     = Data()
     half_npoints = npoints//2         
  
@@ -234,5 +244,7 @@ def import_airfoil_geometry(airfoil_geometry_file, npoints = 200,surface_interpo
     geometry.y_upper_surface    = y_up_surf_new 
     geometry.y_lower_surface    = y_lo_surf_new              
     geometry.camber_coordinates = camber
+    
+    save_airfoil_cache('import_airfoil_geometry',fingerprint,geometry)
          
     return geometry
\ No newline at end of file
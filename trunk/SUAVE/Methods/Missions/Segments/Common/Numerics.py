@@ -3,11 +3,14 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
+import numpy as np
+from numpy.polynomial.chebyshev import chebfit, chebval
 from SUAVE.Core.Arrays import atleast_2d_col 
 
 # ----------------------------------------------------------------------
@@ -104,4 +107,131 @@ def update_differentials_time(segment):
     numerics.time.integrate      = I
 
     return
-    
\ No newline at end of file
+    
+
+# ----------------------------------------------------------------------
+#  Refine Control Points
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def refine_control_points(segment,number_control_points):
+    """ Changes the number of control points of a solved segment. The converged unknowns are 
+        interpolated onto the new control points so that they are the initial guess of the next solve.
+        Unknowns on Chebyshev points are interpolated with their Chebyshev series, otherwise linearly.
+    
+        Assumptions:
+        The segment has been evaluated
+    
+        Inputs:
+            number_control_points                 [int]
+            state.numerics:
+                discretization_method             [function]
+                dimensionless.control_points      [array]
+            state.unknowns                        [array]
+    
+        Outputs:
+            state.numerics.number_control_points  [int]
+            state.unknowns                        [array]
+            state                                 resized to the new number of control points
+    
+        Properties Used:
+        N/A
+    """
+    
+    # unpack
+    numerics   = segment.state.numerics
+    unknowns   = segment.state.unknowns
+    x_solved   = numerics.dimensionless.control_points[:,0]
+    
+    # the new control points
+    x,D,I = numerics.discretization_method(number_control_points,**numerics)
+    x     = atleast_2d_col(x)[:,0]
+    
+    # interpolate every column of the solved unknowns
+    spectral = chebyshev_points(x_solved)
+    for key in unknowns.keys():
+        unknown = unknowns[key]
+        if np.ndim(unknown) == 2 and unknown.shape[0] == len(x_solved):
+            if spectral:
+                coefficients  = chebfit(2.*x_solved-1.,unknown,len(x_solved)-1)
+                unknowns[key] = np.atleast_2d(chebval(2.*x-1.,coefficients)).T
+            else:
+                unknowns[key] = np.stack([np.interp(x,x_solved,column) for column in unknown.T],axis=1)
+    
+    # pack and force the state to the new number of points
+    numerics.number_control_points = number_control_points
+    segment.state.expand_rows(number_control_points,override=True)
+    
+    return
+
+
+# ----------------------------------------------------------------------
+#  Truncation Error
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def truncation_error(segment):
+    """ Estimates how well the control points resolve a solved segment from the decay of the Chebyshev
+        coefficients of the unknowns. The magnitude of the two highest coefficients, relative to the
+        largest coefficient, is taken for every column of the unknowns.
+    
+        Assumptions:
+        The segment has been evaluated on Chebyshev control points
+    
+        Source:
+        Trefethen, L. N., "Approximation Theory and Approximation Practice", SIAM, 2013
+    
+        Inputs:
+            state.numerics.dimensionless.control_points  [array]
+            state.unknowns                               [array]
+    
+        Outputs:
+            error                                        [Unitless], None if the control points are not Chebyshev points
+    
+        Properties Used:
+        N/A
+    """
+    
+    # unpack
+    x        = segment.state.numerics.dimensionless.control_points[:,0]
+    unknowns = segment.state.unknowns
+    
+    if not chebyshev_points(x):
+        return None
+    
+    error = 0.
+    for key in unknowns.keys():
+        unknown = unknowns[key]
+        if np.ndim(unknown) != 2 or unknown.shape[0] != len(x):
+            continue
+        coefficients = np.abs(chebfit(2.*x-1.,unknown,len(x)-1))
+        scale        = np.max(coefficients,axis=0)
+        tail         = np.max(coefficients[-2:],axis=0)
+        resolved     = scale > 0.
+        if np.any(resolved):
+            error = max(error,np.max(tail[resolved]/scale[resolved]))
+    
+    return error
+
+## @ingroup Methods-Missions-Segments-Common
+def chebyshev_points(x):
+    """ Checks if the dimensionless control points of a segment are the cosine spaced points of chebyshev_data
+    
+        Assumptions:
+        N/A
+    
+        Inputs:
+            x   [array]
+    
+        Outputs:
+            <boolean>
+    
+        Properties Used:
+        N/A
+    """
+    
+    N = len(x)
+    if N < 3:
+        return False
+    
+    return np.allclose(x,0.5*(1 - np.cos(np.pi*np.arange(0,N)/(N-1))),rtol=0.,atol=1e-12)
@@ -6,6 +6,7 @@
 #           Mar 2016, E. Botero
 #           Jul 2017, E. Botero
 #           Oct 2021, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -16,6 +17,8 @@ from SUAVE.Analyses import Process
 from SUAVE.Core import Data
 from SUAVE.Methods.skip import skip
 
+from copy import deepcopy
+
 # ----------------------------------------------------------------------
 #  Expand Sub Segments
 # ----------------------------------------------------------------------
@@ -117,10 +120,12 @@ def finalize_sub_segments(segment):
 ## @ingroup Methods-Missions-Segments-Common
 def sequential_sub_segments(segment):
     
-    """ Evaluates all the segments in a mission one by one
+    """ Evaluates all the segments in a mission one by one, each segment is written to the 
+        segment store of the mission as soon as its conditions are final
     
         Assumptions:
-        N/A
+        A segment sets the final position of the segment before it, so a segment is
+        written once the next segment is evaluated
         
         Inputs:
         N/A
@@ -129,12 +134,51 @@ def sequential_sub_segments(segment):
         N/A
 
         Properties Used:
-        N/A
+        segment.settings.segment_store
                                 
     """       
 
-    for tag,sub_segment in segment.segments.items():
+    store = segment.settings.get('segment_store',None)
+
+    for index,(tag,sub_segment) in enumerate(segment.segments.items()):
         sub_segment.evaluate()
+        if store is not None and index > 0:
+            store.write(segment.tag,index-1,previous_segment)
+        previous_segment = sub_segment
+        
+    if store is not None and len(segment.segments):
+        store.write(segment.tag,len(segment.segments)-1,previous_segment)
+
+
+# ----------------------------------------------------------------------
+#  Stream Sub Segments
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def stream_sub_segments(segment):
+    
+    """ Writes all the segments of a converged mission to the segment store of the mission
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        N/A
+            
+        Outputs:
+        N/A
+
+        Properties Used:
+        segment.settings.segment_store
+                                
+    """       
+
+    store = segment.settings.get('segment_store',None)
+    if store is None:
+        return
+
+    for index,(tag,sub_segment) in enumerate(segment.segments.items()):
+        store.write(segment.tag,index,sub_segment)
 
 
 # ----------------------------------------------------------------------
@@ -161,6 +205,39 @@ def merge_sub_segment_states(segment):
     """       
 
     segment.state.update(segment.merged())
+    
+# ----------------------------------------------------------------------
+#  Merge Sub Segment Residuals
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def merge_sub_segment_residuals(segment):
+    
+    """ Merges only the sub segment residuals back into the main state, this is all the 
+        solver needs in each iteration. The conditions are merged once the mission is converged.
+    
+        Assumptions:
+        The residuals of the main state are only computed from the sub segment states
+        
+        Inputs:
+        N/A
+            
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+                                
+    """       
+
+    residuals = None
+    for tag,sub_segment in segment.segments.items():
+        if residuals is None:
+            residuals = deepcopy(sub_segment.state.residuals)
+        else:
+            residuals.append_or_update(sub_segment.state.residuals)
+            
+    segment.state.residuals.update(residuals)
 
 # ----------------------------------------------------------------------
 #  Sequential Sub Segments
@@ -3,6 +3,7 @@
 # @ingroup Methods-Missions
 
 from .converge_root import converge_root
+from .converge_time_march import converge_time_march
 from .expand_state  import expand_state
 from .optimize      import converge_opt
 
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,6 +14,9 @@ import numpy as np
 
 from SUAVE.Core.Arrays import array_type
 
+from .converge_time_march import converge_time_march
+from .Common.Numerics     import refine_control_points, truncation_error
+
 # ----------------------------------------------------------------------
 #  Converge Root
 # ----------------------------------------------------------------------
@@ -20,6 +24,8 @@ from SUAVE.Core.Arrays import array_type
 ## @ingroup Methods-Missions-Segments
 def converge_root(segment):
     """Interfaces the mission to a numerical solver. The solver may be changed by using root_finder.
+    With an adaptive tolerance, segments whose unknowns are not resolved by the control points are
+    solved again on more control points, starting from the interpolated solution.
 
     Assumptions:
     N/A
@@ -30,6 +36,9 @@ def converge_root(segment):
     Inputs:
     segment                            [Data]
     segment.settings.root_finder       [Data]
+    segment.settings.time_marching_control_points [int]
+    segment.settings.adaptive_control_points_tolerance [Unitless]
+    segment.settings.maximum_control_points       [int]
     state.numerics.tolerance_solution  [Unitless]
 
     Outputs:
@@ -40,6 +49,11 @@ def converge_root(segment):
     N/A
     """       
     
+    # long segments may be marched over short sub-intervals
+    if segment.settings.get('time_marching_control_points',None) is not None:
+        if converge_time_march(segment):
+            return
+    
     unknowns = segment.state.unknowns.pack_array()
     
     try:
@@ -63,6 +77,17 @@ def converge_root(segment):
     else:
         segment.state.numerics.converged = True
         segment.converged = True
+        
+    # segments that are not resolved are solved again with more control points
+    tolerance = segment.settings.get('adaptive_control_points_tolerance',None)
+    if tolerance is not None and segment.converged:
+        n_points   = int(segment.state.numerics.number_control_points)
+        max_points = segment.settings.get('maximum_control_points',65)
+        error      = truncation_error(segment)
+        if error is not None and error > tolerance and n_points < max_points:
+            refine_control_points(segment,min(2*n_points-1,max_points))
+            segment.process.initialize(segment)
+            converge_root(segment)
                             
     return
     
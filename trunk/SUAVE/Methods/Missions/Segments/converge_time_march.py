@@ -0,0 +1,366 @@
+## @ingroup Methods-Missions-Segments
+# converge_time_march.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import scipy.optimize
+import numpy as np
+from copy import deepcopy
+
+from SUAVE.Core        import Data
+from SUAVE.Core.Arrays import atleast_2d_col
+
+# ----------------------------------------------------------------------
+#  Converge Time March
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def converge_time_march(segment):
+    """Solves a segment with many control points as a sequence of short sub-intervals. Each sub-interval
+    is solved on its own Chebyshev points, starting from the end of the previous one, in the same way
+    that sequential segments are chained. The cost grows linearly with the number of control points
+    instead of solving one dense system for all of them. The sub-interval solutions are stitched together
+    onto the control points of the segment with piecewise differentiation and integration operators.
+
+    Assumptions:
+    The segment unknowns and residuals are defined at every control point. The segment is bounded by
+    start/end (or initial/final) pairs, a distance or a time that vary linearly over the segment.
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.settings.time_marching_control_points  [int]
+    state.numerics.number_control_points           [int]
+    state.numerics.discretization_method           [function]
+    state.unknowns                                 [Data]
+    state.initials                                 [Data]
+
+    Outputs:
+    marched                                        [boolean]
+    state.unknowns                                 [Data]
+    state.conditions                               [Data]
+    state.residuals                                [Data]
+    state.numerics.dimensionless                   [Data]
+    segment.state.numerics.converged               [boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    # unpack
+    state       = segment.state
+    numerics    = state.numerics
+    n_points    = int(numerics.number_control_points)
+    sub_points  = segment.settings.time_marching_control_points
+
+    if sub_points is None or n_points <= sub_points:
+        return False
+
+    # the unknowns and residuals must be marched point by point
+    unknown_keys  = marched_keys(state.unknowns,n_points)
+    residual_keys = marched_keys(state.residuals,n_points)
+    if unknown_keys is None or residual_keys is None:
+        print("Segment can not be time marched, the unknowns are not defined at every control point. Segment Tag: " + segment.tag)
+        return False
+
+    # boundary values that are split between the sub-intervals
+    boundaries = segment_boundaries(segment)
+    if boundaries is None:
+        print("Segment can not be time marched, the segment boundaries are not set. Segment Tag: " + segment.tag)
+        return False
+
+    # distribute the control points between the sub-intervals, neighbours share a point
+    n_intervals  = int(np.ceil((n_points-1)/(sub_points-1)))
+    steps        = np.full(n_intervals,(n_points-1)//n_intervals)
+    steps[:(n_points-1)%n_intervals] += 1
+    fractions    = np.concatenate([[0.],np.cumsum(steps)/(n_points-1)])
+
+    try:
+        root_finder = segment.settings.root_finder
+    except AttributeError:
+        root_finder = scipy.optimize.fsolve
+
+    # initial guess on the control points of the segment
+    x_guess      = numerics.dimensionless.control_points[:,0]
+    guess        = deepcopy(state.unknowns)
+    initials     = state.initials
+
+    solutions    = []
+    converged    = True
+    for k in range(n_intervals):
+        points = int(steps[k] + 1)
+        f0, f1 = fractions[k], fractions[k+1]
+
+        # boundaries of the sub-interval
+        for start_key, end_key, start, end in boundaries.pairs:
+            segment[start_key] = start + (end - start) * f0
+            segment[end_key]   = start + (end - start) * f1
+        for key, value in boundaries.extents:
+            segment[key] = value * (f1 - f0)
+
+        # guess from the unknowns of the whole segment
+        x,D,I = numerics.discretization_method(points,**numerics)
+        x     = f0 + (f1 - f0) * atleast_2d_col(x)[:,0]
+        for key in unknown_keys:
+            state.unknowns[key] = np.stack([np.interp(x,x_guess,column) for column in guess[key].T],axis=1)
+
+        # the sub-interval starts at the end of the previous one
+        numerics.number_control_points = points
+        state.initials                 = initials
+        state.expand_rows(points,override=True)
+        segment.process.initialize(segment)
+        if k == 0:
+            fixed = None
+        else:
+            fixed = Data()
+            for key in unknown_keys:
+                fixed[key] = solutions[-1].unknowns[key][-1]
+
+        # solve the remaining points of the sub-interval
+        unknowns = np.concatenate([state.unknowns[key][int(k > 0):].ravel() for key in unknown_keys])
+        unknowns,infodict,ier,msg = root_finder( iterate_sub_interval,
+                                                 unknowns,
+                                                 args = (segment,fixed,unknown_keys,residual_keys),
+                                                 xtol = numerics.tolerance_solution,
+                                                 maxfev = numerics.max_evaluations,
+                                                 epsfcn = numerics.step_size,
+                                                 full_output = 1)
+        iterate_sub_interval(unknowns,segment,fixed,unknown_keys,residual_keys)
+        converged = converged and ier == 1
+
+        solution            = Data()
+        solution.unknowns   = deepcopy(state.unknowns)
+        solution.conditions = deepcopy(state.conditions)
+        solution.residuals  = deepcopy(state.residuals)
+        solution.points     = points
+        solution.D          = D
+        solution.I          = I
+        solutions.append(solution)
+        initials = solution
+
+    # restore the segment
+    for start_key, end_key, start, end in boundaries.pairs:
+        segment[start_key] = boundaries.original[start_key]
+        segment[end_key]   = boundaries.original[end_key]
+    for key, value in boundaries.extents:
+        segment[key] = value
+    numerics.number_control_points = n_points
+    state.initials                 = boundaries.original.initials
+    state.expand_rows(n_points,override=True)
+
+    # stitch the sub-intervals together
+    points = [solution.points for solution in solutions]
+    for key in ['unknowns','conditions','residuals']:
+        stitch_rows(state[key],[solution[key] for solution in solutions],points)
+
+    # piecewise operators on the control points of the marched solution
+    time   = state.conditions.frames.inertial.time[:,0]
+    x      = (time - time[0]) / (time[-1] - time[0])
+    D      = np.zeros((n_points,n_points))
+    I      = np.zeros((n_points,n_points))
+    first  = 0
+    for solution in solutions:
+        last     = first + solution.points
+        dx       = x[last-1] - x[first]
+        rows     = slice(first if first == 0 else first + 1,last)
+        local    = slice(0 if first == 0 else 1,solution.points)
+        D[rows,first:last]   = solution.D[local] / dx
+        I[rows,first:last]  += solution.I[local] * dx
+        I[last:,first:last] += solution.I[-1] * dx
+        first    = last - 1
+
+    numerics.dimensionless.control_points = atleast_2d_col(x)
+    numerics.dimensionless.differentiate  = D
+    numerics.dimensionless.integrate      = I
+
+    if not converged:
+        print("Segment did not converge. Segment Tag: " + segment.tag)
+    numerics.converged = converged
+    segment.converged  = converged
+
+    return True
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def iterate_sub_interval(unknowns,segment,fixed,unknown_keys,residual_keys):
+    """Runs one iteration of all analyses for a time marching sub-interval. The unknowns of the
+    first point are fixed to the end of the previous sub-interval, if there is one.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                      [array]
+    fixed                         [Data]
+    unknown_keys                  [list]
+    residual_keys                 [list]
+    segment.process.iterate       [Data]
+
+    Outputs:
+    residuals                     [array]
+
+    Properties Used:
+    N/A
+    """
+
+    start = 0 if fixed is None else 1
+    index = 0
+    for key in unknown_keys:
+        values         = segment.state.unknowns[key]
+        size           = values[start:].size
+        values[start:] = np.reshape(unknowns[index:index+size],values[start:].shape)
+        if fixed is not None:
+            values[0]  = fixed[key]
+        index         += size
+
+    segment.process.iterate(segment)
+
+    residuals = np.concatenate([segment.state.residuals[key][start:].ravel() for key in residual_keys])
+
+    return residuals
+
+## @ingroup Methods-Missions-Segments
+def marched_keys(values,n_points):
+    """Lists the unknowns or residuals of a segment, which must all be defined at every control point
+    to be time marched.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    values                        [Data]
+    n_points                      [int]
+
+    Outputs:
+    keys                          [list], or None if a value is not defined at every control point
+
+    Properties Used:
+    N/A
+    """
+
+    keys = []
+    for key in values.keys():
+        if isinstance(values[key],str):
+            continue
+        if not isinstance(values[key],np.ndarray) or np.ndim(values[key]) != 2 or values[key].shape[0] != n_points:
+            return None
+        keys.append(key)
+
+    return keys
+
+## @ingroup Methods-Missions-Segments
+def segment_boundaries(segment):
+    """Finds the boundary values of a segment that are split between the time marching sub-intervals.
+
+    Assumptions:
+    An initial altitude that is not set is the final altitude of the previous segment
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.
+      <name>_start, <name>_end                 [Any]
+      <name>_initial, <name>_final             [Any]
+      distance                                 [meters]
+      time                                     [seconds]
+    state.initials                             [Data]
+
+    Outputs:
+    boundaries.
+      pairs                                    [list]
+      extents                                  [list]
+      original                                 [Data]
+    or None if the segment has no boundaries to split
+
+    Properties Used:
+    N/A
+    """
+
+    boundaries          = Data()
+    boundaries.pairs    = []
+    boundaries.extents  = []
+    boundaries.original = Data()
+    boundaries.original.initials = segment.state.initials
+
+    for start_suffix, end_suffix in [('_start','_end'),('_initial','_final')]:
+        for start_key in list(segment.keys()):
+            if not start_key.endswith(start_suffix):
+                continue
+            end_key = start_key[:-len(start_suffix)] + end_suffix
+            if end_key not in segment.keys():
+                continue
+            start = segment[start_key]
+            end   = segment[end_key]
+            if start is None and end is None:
+                continue
+            if start is None and start_key == 'altitude_start' and segment.state.initials:
+                start = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+            if start is None or end is None:
+                return None
+            boundaries.original[start_key] = segment[start_key]
+            boundaries.original[end_key]   = end
+            boundaries.pairs.append((start_key,end_key,start,end))
+
+    for key in ['distance','time']:
+        if key in segment.keys() and segment[key] is not None:
+            boundaries.extents.append((key,segment[key]))
+
+    if not (boundaries.pairs or boundaries.extents):
+        return None
+
+    return boundaries
+
+## @ingroup Methods-Missions-Segments
+def stitch_rows(target,sources,points):
+    """Joins the values of consecutive sub-intervals into the target. Arrays defined at every
+    control point are concatenated without the point shared by neighbouring sub-intervals,
+    all other values are taken from the last sub-interval.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    target                                     [Data]
+    sources                                    [list]
+    points   - control points of each source   [list]
+
+    Outputs:
+    target                                     [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    for key in sources[-1].keys():
+        if not all(key in source.keys() for source in sources):
+            target[key] = sources[-1][key]
+            continue
+        values = [source[key] for source in sources]
+        if isinstance(values[-1],Data):
+            if not isinstance(target.get(key,None),Data):
+                target[key] = deepcopy(values[-1])
+            stitch_rows(target[key],values,points)
+        elif all(isinstance(value,np.ndarray) and np.ndim(value) > 0 and value.shape[0] == p for value, p in zip(values,points)):
+            target[key] = np.concatenate([values[0]] + [value[1:] for value in values[1:]],axis=0)
+        else:
+            target[key] = values[-1]
+
+    return target
@@ -1,6 +1,7 @@
 ## @defgroup Methods-Noise-Certification Certification
 # @ingroup Methods-Noise
 
-from .approach_noise   import approach_noise
-from .flyover_noise    import flyover_noise
-from .sideline_noise   import sideline_noise
\ No newline at end of file
+from .approach_noise      import approach_noise
+from .flyover_noise       import flyover_noise
+from .sideline_noise      import sideline_noise
+from .certification_noise import certification_noise
\ No newline at end of file
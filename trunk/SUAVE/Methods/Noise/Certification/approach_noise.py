@@ -2,6 +2,7 @@
 # approach_noise.py
 # 
 # Created:  Oct 2020, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -9,6 +10,7 @@
 
 import numpy as np 
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.compute_noise import compute_noise
+from SUAVE.Methods.Missions.Segments.Common.Numerics            import refine_control_points
 
 # ----------------------------------------------------------------------        
 #   Approach noise
@@ -40,7 +42,10 @@ def approach_noise(analyses,noise_configs):
     approach_initialization                                       = mission.evaluate()   
     n_points                                                      = np.ceil(approach_initialization.segments.descent.conditions.frames.inertial.time[-1] /0.5 +1)
     mission.npoints_takeoff_sign                                  = np.sign(n_points) 
-    mission.segments.descent.state.numerics.number_control_points = int(np.minimum(200, np.abs(n_points))[0])
+    
+    # re-solve on the refined control points starting from the coarse solution
+    refine_control_points(mission.segments.descent,int(np.minimum(200, np.abs(n_points))[0]))
+    mission.evaluate()
 
     # Set up analysis 
     noise_segment                                  = mission.segments.descent 
@@ -0,0 +1,71 @@
+## @ingroup Methods-Noise-Certification
+# certification_noise.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from SUAVE.Core         import Data
+
+from .sideline_noise    import sideline_noise
+from .flyover_noise     import flyover_noise
+from .approach_noise    import approach_noise
+
+# ----------------------------------------------------------------------
+#   Certification noise
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Noise-Certification
+def certification_noise(analyses,noise_configs,number_of_workers=1):
+    """This method calculates the sideline, flyover and approach noise of a turbofan
+    aircraft and the cumulative certification noise level. The three procedures are
+    independent, by default they are evaluated in sequence in the calling process and
+    with more than one worker they are evaluated in separate worker processes.
+
+    Assumptions:
+        The worker processes operate on copies of the analyses and configurations, hence the
+        refined certification missions are not returned to the caller. With a single worker the
+        procedures are evaluated in sequence on the analyses passed in. The procedures leave
+        their noise flags set, so repeated calls should start from a fresh setup.
+
+    Source:
+        N/A
+
+    Inputs:
+        analyses          - data structure of SUAVE analyses                [None]
+        noise_configs     - data structure for SUAVE vehicle configurations [None]
+        number_of_workers - number of worker processes, 1 runs serially     [Unitless]
+
+    Outputs:
+        results.
+          sideline        - sideline effective perceived noise level        [EPNdB]
+          flyover         - flyover effective perceived noise level         [EPNdB]
+          approach        - approach effective perceived noise level        [EPNdB]
+          cumulative      - sum of the three noise levels                   [EPNdB]
+
+    Properties Used:
+        N/A
+
+    """
+
+    procedures = [sideline_noise, flyover_noise, approach_noise]
+
+    if number_of_workers > 1:
+        with ProcessPoolExecutor(max_workers=min(number_of_workers,len(procedures))) as executor:
+            futures = [executor.submit(procedure,analyses,noise_configs) for procedure in procedures]
+            levels  = [future.result() for future in futures]
+    else:
+        levels = [procedure(analyses,noise_configs) for procedure in procedures]
+
+    # pack
+    results            = Data()
+    results.sideline   = levels[0]
+    results.flyover    = levels[1]
+    results.approach   = levels[2]
+    results.cumulative = np.sum(levels,axis=0)
+
+    return results
@@ -2,6 +2,7 @@
 # flyover_noise.py
 # 
 # Created:  Oct 2020, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -9,6 +10,7 @@
 
 import numpy as np 
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.compute_noise import compute_noise
+from SUAVE.Methods.Missions.Segments.Common.Numerics            import refine_control_points
 
 # ----------------------------------------------------------------------        
 #   Flyover noise
@@ -40,7 +42,10 @@ def flyover_noise(analyses,noise_configs):
     takeoff_initialization                                      = mission.evaluate() 
     n_points                                                    = np.ceil(takeoff_initialization.segments.climb.conditions.frames.inertial.time[-1] /0.5 +1)
     mission.npoints_takeoff_sign                                = np.sign(n_points) 
-    mission.segments.climb.state.numerics.number_control_points = int(np.minimum(200, np.abs(n_points))[0])
+    
+    # re-solve on the refined control points starting from the coarse solution
+    refine_control_points(mission.segments.climb,int(np.minimum(200, np.abs(n_points))[0]))
+    mission.evaluate()
 
     # Set up analysis 
     noise_segment                                  = mission.segments.climb  
@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, Carlos Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -151,57 +152,60 @@ def noise_airframe_Fink(segment,analyses,config,settings,ioprint = 0, filename=0
     SPLt_dBA_history = np.zeros((nrange,num_f))  
     SPLt_dBA_max = np.zeros(nrange)    
     
-    #START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for i in range(nrange-1):
-        
-        # Emission angle theta   
-        theta = angle[i]
-        
-        # Distance from airplane to observer, evaluated at retarded time
-        distance = distance_vector[i]    
-       
-        # Atmospheric attenuation
-        delta_atmo=atmospheric_attenuation(distance)
+    # All positions of the aircraft are evaluated together, the last position is left empty
+    n     = nrange-1
+    theta = np.atleast_2d(angle[0:n]).T
+    
+    # Distance from airplane to observer, evaluated at retarded time
+    distance = np.atleast_2d(distance_vector[0:n]).T
+    
+    # Flight conditions at each position
+    visc = np.atleast_2d(viscosity[0:n]).T
+    Mach = np.atleast_2d(M[0:n]).T
+    azim = np.atleast_2d(phi[0:n]).T
+   
+    # Atmospheric attenuation
+    delta_atmo = atmospheric_attenuation(distance)
 
-        # Call each noise source model
-        SPL_wing = noise_clean_wing(Sw,bw,0,1,velocity,viscosity[i],M[i],phi[i],theta,distance,frequency) - delta_atmo    #Wing Noise
-        SPLht    = noise_clean_wing(Sht,bht,0,1,velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
-        SPLvt    = noise_clean_wing(Svt,bvt,0,0,velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
- 
-        SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,viscosity[i],M[i],phi[i],theta,distance,frequency) -delta_atmo        #Slat leading edge
- 
-        if (deltaf==0):
-            SPL_flap = np.zeros(num_f)
-        else:
-            SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M[i],phi[i],theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
- 
-        if gear=='up': #0
-            SPL_main_landing_gear = np.zeros(num_f)
-            SPL_nose_landing_gear = np.zeros(num_f)
-        else:
-            SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
-            SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
-        if main_units>1: # Incoherent summation of each main landing gear unit
-            SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
- 
- 
-        # Total Airframe Noise
-        SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
-             10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
-            
-        SPL_total_history[i][:]             = SPL_total[:]
-        SPL_wing_history[i][:]              = SPL_wing[:]
-        SPLvt_history[i][:]                 = SPLvt[:]
-        SPLht_history[i][:]                 = SPLht[:]
-        SPL_flap_history[i][:]              = SPL_flap[:]
-        SPL_slat_history[i][:]              = SPL_slat[:]
-        SPL_nose_landing_gear_history[i][:] = SPL_nose_landing_gear[:]
-        SPL_main_landing_gear_history[i][:] = SPL_main_landing_gear[:] 
+    # Call each noise source model
+    SPL_wing = noise_clean_wing(Sw,bw,0,1,velocity,visc,Mach,azim,theta,distance,frequency) - delta_atmo    #Wing Noise
+    SPLht    = noise_clean_wing(Sht,bht,0,1,velocity,visc,Mach,azim,theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
+    SPLvt    = noise_clean_wing(Svt,bvt,0,0,velocity,visc,Mach,azim,theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
+
+    SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,visc,Mach,azim,theta,distance,frequency) -delta_atmo        #Slat leading edge
+
+    if (deltaf==0):
+        SPL_flap = np.zeros((n,num_f))
+    else:
+        SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,Mach,azim,theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
+
+    if gear=='up': #0
+        SPL_main_landing_gear = np.zeros((n,num_f))
+        SPL_nose_landing_gear = np.zeros((n,num_f))
+    else:
+        SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,Mach,velocity,azim,theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
+        SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,Mach,velocity,azim,theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
+    if main_units>1: # Incoherent summation of each main landing gear unit
+        SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
+
+
+    # Total Airframe Noise
+    SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
+         10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
         
-        # Calculation of dBA based on the sound pressure time history
-        SPLt_dBA = dbA_noise(SPL_total)
-        SPLt_dBA_history[i][:] = SPLt_dBA[:]
-        SPLt_dBA_max[i] = max(SPLt_dBA)         
+    SPL_total_history[0:n]             = SPL_total
+    SPL_wing_history[0:n]              = SPL_wing
+    SPLvt_history[0:n]                 = SPLvt
+    SPLht_history[0:n]                 = SPLht
+    SPL_flap_history[0:n]              = SPL_flap
+    SPL_slat_history[0:n]              = SPL_slat
+    SPL_nose_landing_gear_history[0:n] = SPL_nose_landing_gear
+    SPL_main_landing_gear_history[0:n] = SPL_main_landing_gear
+    
+    # Calculation of dBA based on the sound pressure time history
+    SPLt_dBA_history[0:n] = dbA_noise(SPL_total)
+    SPLt_dBA_max[0:n]     = np.max(SPLt_dBA_history[0:n],axis=1)
+    SPLt_dBA              = SPLt_dBA_history[n-1]
           
     # Calculation of the Perceived Noise Level EPNL based on the sound time history 
     PNL_total             = pnl_noise(SPL_total_history)
@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -43,6 +44,9 @@ def noise_clean_wing(S,b,ND,IsHorz,velocity,viscosity,M,phi,theta,distance,frequ
             distance                   - Distance from airplane to observer, evaluated at retarded time [ft]
             frequency                  - Frequency array [Hz]
 
+            The flight conditions may be scalars or columns of shape (n_time,1), in which case
+            the spectra of every time step are returned as rows of shape (n_time,n_freq)
+
 
 
     Outputs: One Third Octave Band SPL [dB]
@@ -61,16 +65,16 @@ def noise_clean_wing(S,b,ND,IsHorz,velocity,viscosity,M,phi,theta,distance,frequ
     elif IsHorz==0:
         DIR = np.sin(phi)
 
+    # Positions with no directivity are silent
+    silent = (DIR==0)
+    DIR    = np.where(silent,1.,DIR)
 
-    if DIR==0:
-        SPL = np.zeros(24)
-    else:
-
-        fmax  = 0.1*(velocity/Units.ft)/(delta*(1-M*np.cos(theta))) 
+    fmax  = 0.1*(velocity/Units.ft)/(delta*(1-M*np.cos(theta))) 
 
-        OASPL = 50*np.log10((velocity/Units.kts)/100.0)+10*np.log10(delta*b/(distance**2.0))+8*ND+ \
-            20*np.log10(DIR*np.sin(theta)*np.cos(theta/2.0))+104.3
+    OASPL = 50*np.log10((velocity/Units.kts)/100.0)+10*np.log10(delta*b/(distance**2.0))+8*ND+ \
+        20*np.log10(DIR*np.sin(theta)*np.cos(theta/2.0))+104.3
 
-        SPL   = OASPL+10.0*np.log10(0.613*(frequency/fmax)**4*((frequency/fmax)**1.5+0.5)**(-4))-0.03*np.abs(((frequency/fmax)-1))**1.5
+    SPL   = OASPL+10.0*np.log10(0.613*(frequency/fmax)**4*((frequency/fmax)**1.5+0.5)**(-4))-0.03*np.abs(((frequency/fmax)-1))**1.5
+    SPL   = np.where(silent,0.,SPL)
 
     return SPL
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -15,7 +16,7 @@ import numpy as np
 # ---------------------------------------------------------------------- 
 
 ## @ingroup Methods-Noise-Fidelity_One-Engine
-def mixed_noise_component(SPL_m,Velocity_primary,theta_m,sound_ambient,Velocity_secondary,
+def mixed_noise_component(Velocity_primary,theta_m,sound_ambient,Velocity_secondary,
                           Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR):
     """This function calculates the noise contribution of the mixed jet component
     
@@ -26,7 +27,6 @@ def mixed_noise_component(SPL_m,Velocity_primary,theta_m,sound_ambient,Velocity_
         None
 
     Inputs:
-        SPL_m               [dB]
         Velocity_primary    [m/s]
         theta_m             [rad]
         sound_ambient       [SPL]
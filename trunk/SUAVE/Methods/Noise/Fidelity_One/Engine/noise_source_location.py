@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -15,10 +16,13 @@ import numpy as np
 # ----------------------------------------------------------------------   
 
 ## @ingroup Methods-Noise-Fidelity_One-Engine
-def noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,
+def noise_source_location(Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,
                            Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,
                            Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
-    """This function calculates the noise source location
+    """This function calculates the noise source location. The source location of each
+    jet component is found by a fixed point iteration on the emission angle, which is
+    carried out for every frequency band (and every time step) at once. Each band stops
+    iterating once its own source location has converged.
     
     Assumptions:
         None
@@ -27,18 +31,17 @@ def noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_sec
         None
 
     Inputs: 
-        B                         [-]
         Xo                        [-]
         zk                        [-]
         Diameter_primary          [m]
-        theta_p                   [rad]
+        theta_p                   [rad] initial guess
         Area_primary              [m^2]
         Area_secondary            [m^2]
         distance_microphone       [m]
         Diameter_secondary        [m]
         theta                     [rad]
-        theta_s                   [rad]
-        theta_m                   [rad]
+        theta_s                   [rad] initial guess
+        theta_m                   [rad] initial guess
         Diameter_mixed            [m]
         Velocity_primary          [m/s]
         Velocity_secondary        [m/s]
@@ -47,6 +50,9 @@ def noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_sec
         sound_ambient             [dB]
         Str_m                     [-]
         Str_s                     [-]
+        
+        Time dependent inputs are column vectors of shape (n_time,1) and the frequency
+        dependent inputs have shape (n_time,n_freq).
 
     Outputs: 
         theta_p  [rad]
@@ -58,108 +64,79 @@ def noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_sec
     
     """
     
-    # P rimary jet source location
-    XJ = np.zeros(24)
+    # Observer geometry
+    def emission_angle(XJ):
+        B = (1./np.sin(theta))*(((Xo+XJ)/distance_microphone)+np.cos(theta))
+        return np.where(B>=0.,np.arcsin((B**2.+1.)**(-0.5)),np.pi-np.arcsin((B**2.+1.)**(-0.5)))
     
-    for i in range(24):
-        residual = Diameter_primary
-        XJ[i]    = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if (B[i]>=0.):
-            theta_p[i]=np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_p[i]=np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i] = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        
-        while residual>(Diameter_primary/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_p[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_p[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_p[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_p[i]
-            theta_p[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-            residual   = np.abs(XJ_old-XJ[i])
-
-        # Secondary jet source location
-        residual = Diameter_secondary
-        XJ_old   = 0.0
-        XJ[i]    = (zk*Diameter_secondary)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i])) \
+    # Primary jet source location
+    def primary_location(theta_j):
+        return (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_j/np.pi)-9.)+(Area_secondary/Area_primary))
+    
+    theta_p = converge_source_location(primary_location(theta_p),primary_location,emission_angle,
+                                       Diameter_primary,Diameter_primary/200.)
+    
+    # Secondary jet source location
+    def secondary_location(theta_j,diameter=Diameter_mixed):
+        return (zk*diameter)*(2.+1.6*np.arctan((4.5*theta_j/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s)) \
             *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if B[i]>=0.:
-            theta_s[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-            
-        XJ[i] = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-            np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_s[i]
-            B[i]   = (1/np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_s[i] = np.arcsin((B[i]**2.+1.)**(-0.5))
-            else:
-                theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_s[i]
-            theta_s[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-                np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-            
-            residual = np.abs(XJ_old-XJ[i])
-
-        #Mixed jet source location
-        residual = Diameter_mixed
-        XJ_old   = 0.
-        XJ[i] = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+ \
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
+    
+    theta_s = converge_source_location(secondary_location(theta_s,Diameter_secondary),secondary_location,emission_angle,
+                                       Diameter_secondary,Diameter_mixed/200.)
+    
+    # Mixed jet source location
+    def mixed_location(theta_j):
+        return (zk*Diameter_mixed)*(3.+np.exp(-Str_m)+(2.+1.1*np.arctan((18.*theta_j/np.pi)-13.))+ \
+            (1.+0.5/np.sqrt(Str_m)))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
             (Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        B[i] = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        if B[i]>=0.:
-            theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i]=(zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-            *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_m[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-                
-            theta2     = theta_m[i]
-            theta_m[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-                (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-                *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-            
-            residual   = abs(XJ_old-XJ[i])
-   
+    
+    theta_m = converge_source_location(mixed_location(theta_m),mixed_location,emission_angle,
+                                       Diameter_mixed,Diameter_mixed/200.)
    
     source_location = Data()
     source_location.theta_p = theta_p
     source_location.theta_s = theta_s
     source_location.theta_m = theta_m
     
-    return source_location
\ No newline at end of file
+    return source_location
+
+## @ingroup Methods-Noise-Fidelity_One-Engine
+def converge_source_location(XJ,source_location,emission_angle,residual,tolerance):
+    """This function iterates the emission angle and the source location of a jet component
+    until the change in source location is below the tolerance. The new angle of each
+    iteration is the average of the previous and the updated angle.
+    
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs: 
+        XJ                        [m]   initial source location
+        source_location           function of the emission angle, returns the source location
+        emission_angle            function of the source location, returns the emission angle
+        residual                  [m]   initial residual
+        tolerance                 [m]
+
+    Outputs: 
+        theta_j                   [rad]
+    
+    Properties Used:
+        N/A 
+    
+    """
+    
+    theta_j = emission_angle(XJ)
+    XJ      = source_location(theta_j)
+    active  = np.broadcast_to(residual>tolerance,np.shape(XJ))
+    
+    while np.any(active):
+        XJ_old  = XJ
+        theta1  = theta_j
+        theta2  = emission_angle(XJ)
+        theta_j = np.where(active,(theta1+theta2)/2.,theta1)
+        XJ      = np.where(active,source_location(theta_j),XJ_old)
+        active  = np.abs(XJ_old-XJ)>tolerance
+    
+    return theta_j
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -15,7 +16,7 @@ import numpy as np
 # ---------------------------------------------------------------------- 
 
 ## @ingroup Methods-Noise-Fidelity_One-Engine
-def secondary_noise_component(SPL_s,Velocity_primary,theta_s,sound_ambient,Velocity_secondary,Velocity_aircraft,
+def secondary_noise_component(Velocity_primary,theta_s,sound_ambient,Velocity_secondary,Velocity_aircraft,
                               Area_primary,Area_secondary,DSPL_s,EX_s,Str_s):
     """This function calculates the noise contribution of the secondary jet component
     
@@ -26,7 +27,6 @@ def secondary_noise_component(SPL_s,Velocity_primary,theta_s,sound_ambient,Veloc
         None
 
     Inputs:
-        SPL_s               [dB]
         Velocity_primary    [m/s]
         theta_s             [rad]
         sound_ambient       [dB]
@@ -4,13 +4,13 @@
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
 # Modified: Apr 2021, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import SPL_arithmetic
 # ----------------------------------------------------------------------
 #  dbA Noise
 # ----------------------------------------------------------------------
@@ -50,18 +50,18 @@ def SPL_harmonic_to_third_octave(SPL,f,settings):
     dim_mic          = len(SPL[0,:,0,0])
     dim_prop         = len(SPL[0,0,:,0])
     num_cf           = len(cf)
-    num_f            = len(f[0,:])
     SPL_third_octave = np.zeros((dim_cpt,dim_mic,dim_prop,num_cf)) 
+    p_prefs          = 10**(SPL/10)
     
-    # loop through 1/3 octave spectra and sum up components 
-    for i in range(dim_cpt):  
-        for j in range(num_cf):
-            SPL_in_range = np.empty(shape=[dim_mic,dim_prop,0 ])
-            for k in range(num_f):  
-                if (lf[j] <= f[i,k]) and (f[i,k] <= uf[j]):   
-                    SPL_in_range = np.concatenate((SPL_in_range,np.atleast_3d(SPL[i,:,:,k])), axis = 2) 
-                if len(SPL_in_range[0,0,:]) > 0:  
-                    SPL_in_range[SPL_in_range != 0]  
-                    SPL_third_octave[i,:,:,j] = SPL_arithmetic(SPL_in_range)   
+    # [control point, 1/3 octave band, frequency] frequencies that fall in each band 
+    in_band = np.logical_and(lf[None,:,None] <= f[:,None,:],f[:,None,:] <= uf[None,:,None])
+    
+    # loop through 1/3 octave spectra and sum up components of all control points and microphones
+    for j in range(num_cf):
+        band = in_band[:,j,:]
+        if np.any(band):
+            p_band                         = np.sum(np.where(band[:,None,None,:],p_prefs,0.),axis = 3)
+            filled                         = np.any(band,axis = 1)
+            SPL_third_octave[filled,:,:,j] = 10*np.log10(p_band[filled])
                     
     return SPL_third_octave
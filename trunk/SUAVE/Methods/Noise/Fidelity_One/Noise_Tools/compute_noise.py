@@ -2,6 +2,7 @@
 # approach_noise.py
 # 
 # Created:  Oct 2020, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -48,6 +49,12 @@ def compute_noise(config,analyses,noise_segment,noise_settings):
     print_output      = config.print_output
     engine_flag       = config.engine_flag   
 
+    # jet velocities of the noise segment, the nozzles otherwise keep those of the last segment evaluated
+    sources = noise_segment.conditions.noise.sources
+    if 'turbofan' in sources.keys() and bool(sources.turbofan.core) and bool(sources.turbofan.fan):
+        turbofan.fan_nozzle.noise_speed  = sources.turbofan.fan.exit_velocity
+        turbofan.core_nozzle.noise_speed = sources.turbofan.core.exit_velocity
+
     geometric         = noise_geometric(noise_segment,analyses,config)
 
     airframe_noise    = noise_airframe_Fink(noise_segment,analyses,config,noise_settings,print_output,outputfile)
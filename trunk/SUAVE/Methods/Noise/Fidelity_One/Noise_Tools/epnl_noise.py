@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -27,6 +28,7 @@ def epnl_noise(PNLT):
 
     Inputs:
         PNLT - Perceived Noise Level with Tone Correction  [PNLdB]
+               shape (n_time,...), the time history is on the first axis
      
      Outputs:
         EPNL - Effective Perceived Noise Level in          [EPNdB]
@@ -34,41 +36,42 @@ def epnl_noise(PNLT):
     Properties Used:
         N/A  
     """           
-    # Maximum PNLT on the time history data    
-    PNLT_max = np.max(PNLT)
+    PNLT   = np.asarray(PNLT,dtype=float)
+    nsteps = np.shape(PNLT)[0]
+    time   = np.reshape(np.arange(nsteps),(nsteps,) + (1,)*(PNLT.ndim-1))
     
-    # Calculates the number of discrete points on the trajectory
-    nsteps   = len(PNLT)    
+    # Maximum PNLT on the time history data    
+    PNLT_max = np.max(PNLT,axis=0)
+    limit    = PNLT_max-10
     
-    # Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
-    if all(PNLT==0):
-        EPNL = 0
-        return(EPNL)
-
     # Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
-    i = 0
-    while PNLT[i]<=(PNLT_max-10) and i<=nsteps:
-        i = i+1
-    t1 = i #t1 is the first time interval
-    i  = i+1
-
+    t1 = np.argmax(PNLT>limit,axis=0) #t1 is the first time interval
+    
+    # t2 is the last time interval, before the first point after t1 that drops below the limit
+    below = np.logical_and(PNLT<limit,time>t1)
+    t2    = np.argmax(below,axis=0) - 1
+    
     # Correction for PNLTM-10 when it falls outside the limit of the data
-    if PNLT[nsteps-1]>=(PNLT_max-10):
-        t2=nsteps-2
-    else:
-        while i<=nsteps and PNLT[i]>=(PNLT_max-10):
-            i = i+1
-        t2 = i-1 #t2 is the last time interval 
+    t2 = np.where(PNLT[-1]>=limit,nsteps-2,t2)
+    
+    # Calculates the integral of the PNLT which between t1 and t2 points, starting one point
+    # before t1 (which wraps around to the last point when t1 is the first point)
+    window   = np.logical_and(time>=t1-1,time<=t2)
+    window   = np.logical_or(window,np.logical_and(t1==0,time==nsteps-1))
+    sumation = np.sum(np.where(window,10**(PNLT/10),0.),axis=0)
+    
+    # Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
+    silent   = np.all(PNLT==0,axis=0)
+    sumation = np.where(silent,1.,sumation)
     
-    # Calculates the integral of the PNLT which between t1 and t2 points
-    sumation = 0
-    for i in range (t1-1,t2+1):
-        sumation = 10**(PNLT[i]/10)+sumation
-        
     # Duration Correction calculation
     duration_correction = 10*np.log10(sumation)-PNLT_max-13
-                
+    
     # Final EPNL calculation
     EPNL = PNLT_max+duration_correction
+    EPNL = np.where(silent,0.,EPNL)
+    
+    if PNLT.ndim == 1:
+        EPNL = EPNL[()]
     
-    return EPNL   
\ No newline at end of file
+    return EPNL
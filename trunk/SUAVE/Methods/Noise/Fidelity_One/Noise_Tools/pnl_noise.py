@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -25,9 +26,11 @@ def pnl_noise (SPL):
  
     Inputs:
         SPL - Sound Pressure Level in 1/3 octave band  [dB]
+              shape (...,24), the bands are on the last axis, e.g. (n_time,n_mic,24)
    
     Outputs:
         PNL - Perceived Noise Level                    [dB]
+              shape (...), one level per spectrum
    
     Properties Used:
         N/A    
@@ -61,40 +64,38 @@ def pnl_noise (SPL):
             [24, 10000, 50.7, 41, 37, 21, 29, 0.042285,	0.02996, 0.05964, 0.043573]]
 
     
+    noy = np.array(noy)[0:23]
+    
     # Defining the necessary arrays for the calculation
-    nsteps  = len(SPL)
-    SPL_noy = np.zeros((nsteps,24))
-    PNL     = np.zeros(nsteps)
+    SPL     = np.asarray(SPL,dtype=float)
+    SPL_noy = np.zeros(np.shape(SPL)[:-1] + (24,))
+    S       = SPL[...,0:23]
     
     #-------------------------------------------
     # STEP 1 - Convert SPL to Perceived Noisiness
     #-------------------------------------------  
-    for j in range(0,nsteps):
+    # Where the segments overlap the lower segment is used
+    conditions = [np.logical_and(S>=noy[:,5],S<noy[:,6]),
+                  np.logical_and(S>=noy[:,6],S<noy[:,3]),
+                  np.logical_and(S>=noy[:,3],S<noy[:,2]),
+                  S>=noy[1,2]]
+    with np.errstate(over='ignore'):
+        choices = [0.1*(10**(noy[:,9]*(S-noy[:,5]))),
+                   0.3*(10**(noy[:,10]*(S-noy[:,6]))),
+                   10**(noy[:,7]*(S-noy[:,3])),
+                   10**(noy[:,8]*(S-noy[:,4]))]
+    SPL_noy[...,0:23] = np.select(conditions,choices,default=0.)
+    
+    #-------------------------------------------  
+    # STEP 2 - Combine perceived noiseness values  
+    #-------------------------------------------
+    max_noy             = np.max(SPL_noy,axis=-1)
+    Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy,axis=-1)
     
-        for i in range(0,23):
-            if SPL[j][i]>=noy[1][2]:
-                SPL_noy[j][i] = 10**(noy[i][8]*(SPL[j][i]-noy[i][4]))
-                
-            if SPL[j][i]>=noy[i][3] and SPL[j][i]<noy[i][2]:
-                SPL_noy[j][i] = 10**(noy[i][7]*(SPL[j][i]-noy[i][3]))
-                
-            if SPL[j][i]>=noy[i][6] and SPL[j][i]<noy[i][3]:
-                SPL_noy[j][i] = 0.3*(10**(noy[i][10]*(SPL[j][i]-noy[i][6])))
-                
-            if SPL[j][i]>=noy[i][5] and SPL[j][i]<noy[i][6]:
-                SPL_noy[j][i] = 0.1*(10**(noy[i][9]*(SPL[j][i]-noy[i][5])))
+    #-----------------------------------------------------------------
+    # STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
+    #------------------------------------------------------------------    
+    Perceived_noisinees = np.where(Perceived_noisinees==0,0.0625,Perceived_noisinees)
+    PNL = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
             
-        #-------------------------------------------  
-        # STEP 2 - Combine perceived noiseness values  
-        #-------------------------------------------
-        max_noy = np.max(SPL_noy[j][:])            
-        Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy[j][:])
-        
-        #-----------------------------------------------------------------
-        # STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
-        #------------------------------------------------------------------    
-        if Perceived_noisinees==0:
-            Perceived_noisinees = 0.0625
-        PNL[j] = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
-        
-    return PNL
\ No newline at end of file
+    return PNL
@@ -2,8 +2,9 @@
 # Correlation type methods for calculating noise
 # @ingroup Methods-Noise
   
-from .propeller_mid_fidelity      import propeller_mid_fidelity 
+from .propeller_mid_fidelity      import propeller_mid_fidelity, compute_microphone_chunk_noise
 from .compute_broadband_noise     import compute_broadband_noise
+from .compute_broadband_noise     import compute_trailing_edge_boundary_layer
 from .compute_harmonic_noise      import compute_harmonic_noise
 from .compute_source_coordinates  import compute_point_source_coordinates
 from .compute_source_coordinates  import compute_blade_section_source_coordinates
@@ -5,11 +5,13 @@
 # Modified:  Feb 2022, M. Clarke
 # Modified:  Sep 2022, M. Clarke
 # Modified:  Sep 2022, M. Clarke
+#            Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 import numpy as np 
+from SUAVE.Core                                                                 import Data
 from SUAVE.Core.Utilities                                                       import interp2d
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.dbA_noise                     import A_weighting
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.SPL_harmonic_to_third_octave  import SPL_harmonic_to_third_octave  
@@ -22,7 +24,7 @@ from scipy.special
 
 ## @ingroup Methods-Noise-Fidelity_One-Propeller   
 def compute_broadband_noise(freestream,angle_of_attack,bspv,
-                            velocity_vector,rotors,aeroacoustic_data,settings,res):
+                            velocity_vector,rotors,aeroacoustic_data,settings,res,boundary_layer=None):
     '''This computes the trailing edge noise compoment of broadband noise of a propeller or 
     lift-rotor in the frequency domain. Boundary layer properties are computed using SUAVE's 
     panel method.
@@ -44,6 +46,7 @@ def compute_broadband_noise(freestream,angle_of_attack,bspv,
         aeroacoustic_data                            - data structure of acoustic data                                                    [None] 
         settings                                     - accoustic settings                                                                 [None] 
         res                                          - results data structure                                                             [None] 
+        boundary_layer                               - (optional) output of compute_trailing_edge_boundary_layer                          [None] 
     
     Outputs 
        res.                                           *acoustic data is stored and passed in data structures*                                          
@@ -75,19 +78,9 @@ def compute_broadband_noise(freestream,angle_of_attack,bspv,
     rho                = freestream.density                 # air density 
     dyna_visc          = freestream.dynamic_viscosity
     kine_visc          = dyna_visc/rho                      # kinematic viscousity    
-    alpha_blade        = aeroacoustic_data.disc_effective_angle_of_attack 
-    Vt_2d              = aeroacoustic_data.disc_tangential_velocity  
-    Va_2d              = aeroacoustic_data.disc_axial_velocity                
     blade_chords       = rotor.chord_distribution           # blade chord    
     r                  = rotor.radius_distribution          # radial location 
-    airfoils           = rotor.Airfoils
-    a_loc              = rotor.airfoil_polar_stations 
-    num_sec            = len(r) 
     num_azi            = len(aeroacoustic_data.disc_effective_angle_of_attack[0,0,:])    
-    U_blade            = np.sqrt(Vt_2d**2 + Va_2d**2)
-    Re_blade           = U_blade*np.repeat(np.repeat(blade_chords[np.newaxis,:],num_cpt,axis=0)[:,:,np.newaxis],num_azi,axis=2)/\
-                          np.repeat(np.repeat((kine_visc),num_sec,axis=1)[:,:,np.newaxis],num_azi,axis=2)
-    rho_blade          = np.repeat(np.repeat(rho,num_sec,axis=1)[:,:,np.newaxis],num_azi,axis=2)
     U_inf              = np.atleast_2d(np.linalg.norm(velocity_vector,axis=1)).T
     M                  = U_inf/c_0                                             
     B                  = rotor.number_of_blades             # number of rotor blades
@@ -99,10 +92,6 @@ def compute_broadband_noise(freestream,angle_of_attack,bspv,
     delta_r[-1]        = 2*del_r[-1]
     delta_r[1:-1]      = (del_r[:-1]+ del_r[1:])/2
 
-
-    bstei   = 1      # bottom surface trailing edge index 
-    ustei   = -bstei # upper surface trailing edge index 
-
     if np.all(Omega == 0):
         res.p_pref_broadband                          = np.zeros((num_cpt,num_mic,num_rot,num_cf)) 
         res.SPL_prop_broadband_spectrum               = np.zeros_like(res.p_pref_broadband)
@@ -114,195 +103,42 @@ def compute_broadband_noise(freestream,angle_of_attack,bspv,
         res.SPL_prop_azimuthal_broadband_spectrum     = np.zeros_like(res.p_pref_azimuthal_broadband)
         res.SPL_prop_azimuthal_broadband_spectrum_dBA = np.zeros_like(res.p_pref_azimuthal_broadband)
     else:
-        delta        = np.zeros((num_cpt,num_mic,num_rot,num_sec,num_azi,num_cf,2)) #  control points ,  number rotors, number blades , number sections , sides of airfoil
-        delta_star   = np.zeros_like(delta)
-        dp_dx        = np.zeros_like(delta)
-        tau_w        = np.zeros_like(delta)
-        Ue           = np.zeros_like(delta)
-        Theta        = np.zeros_like(delta)
-
-        lower_surface_theta      = np.zeros((num_sec,num_azi))
-        lower_surface_delta      = np.zeros_like(lower_surface_theta)
-        lower_surface_delta_star = np.zeros_like(lower_surface_theta)
-        lower_surface_cf         = np.zeros_like(lower_surface_theta)
-        lower_surface_Ue         = np.zeros_like(lower_surface_theta)
-        lower_surface_dp_dx      = np.zeros_like(lower_surface_theta)
-        upper_surface_theta      = np.zeros_like(lower_surface_theta)
-        upper_surface_delta      = np.zeros_like(lower_surface_theta)
-        upper_surface_delta_star = np.zeros_like(lower_surface_theta)
-        upper_surface_cf         = np.zeros_like(lower_surface_theta)
-        upper_surface_Ue         = np.zeros_like(lower_surface_theta)
-        upper_surface_dp_dx      = np.zeros_like(lower_surface_theta)
-
-        if rotor.nonuniform_freestream: 
-
-            # return the 1D Cl and CDval of shape (ctrl_pts, Nr)
-            theta_ls         = np.zeros((num_cpt,num_sec,num_azi))
-            delta_ls         = np.zeros((num_cpt,num_sec,num_azi))
-            delta_star_ls    = np.zeros((num_cpt,num_sec,num_azi))
-            Ue_Vinf_ls       = np.zeros((num_cpt,num_sec,num_azi))
-            cf_ls            = np.zeros((num_cpt,num_sec,num_azi))
-            dcp_dx_ls        = np.zeros((num_cpt,num_sec,num_azi))
-            theta_us         = np.zeros((num_cpt,num_sec,num_azi))
-            delta_us         = np.zeros((num_cpt,num_sec,num_azi))
-            delta_star_us    = np.zeros((num_cpt,num_sec,num_azi))
-            Ue_Vinf_us       = np.zeros((num_cpt,num_sec,num_azi))
-            cf_us            = np.zeros((num_cpt,num_sec,num_azi))
-            dcp_dx_us        = np.zeros((num_cpt,num_sec,num_azi))
-
-            for i_azi in range(num_azi):
-                for jj,airfoil in enumerate(airfoils):
-                    bl                            = airfoil.polars.boundary_layer
-                    local_aoa                     = alpha_blade[:,:,i_azi]
-                    local_Re                      = Re_blade[:,:,i_azi]
-
-                    theta_ls_data                 = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.theta_lower_surface[:,:,bstei])     
-                    delta_ls_data                 = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_lower_surface[:,:,bstei])        
-                    delta_star_ls_data            = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_star_lower_surface[:,:,bstei])   
-                    Ue_Vinf_ls_data               = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.Ue_Vinf_lower_surface[:,:,bstei])      
-                    cf_ls_data                    = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.cf_lower_surface[:,:,bstei])           
-                    dcp_dx_ls_data                = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.dcp_dx_lower_surface[:,:,bstei])       
-                    theta_us_data                 = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.theta_upper_surface[:,:,ustei])        
-                    delta_us_data                 = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_upper_surface[:,:,ustei])       
-                    delta_star_us_data            = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_star_upper_surface[:,:,ustei])   
-                    Ue_Vinf_us_data               = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.Ue_Vinf_upper_surface[:,:,ustei])   
-                    cf_us_data                    = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.cf_upper_surface[:,:,ustei])          
-                    dcp_dx_us_data                = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.dcp_dx_upper_surface[:,:,ustei])      
-                    locs                          = np.where(np.array(a_loc) == jj )
-
-                    theta_ls[:,locs,i_azi]        = theta_ls_data[:,locs]
-                    delta_ls[:,locs,i_azi]        = delta_ls_data[:,locs]
-                    delta_star_ls[:,locs,i_azi]   = delta_star_ls_data[:,locs]
-                    Ue_Vinf_ls[:,locs,i_azi]      = Ue_Vinf_ls_data[:,locs]
-                    cf_ls[:,locs,i_azi]           = cf_ls_data[:,locs]
-                    dcp_dx_ls[:,locs,i_azi]       = dcp_dx_ls_data[:,locs]
-                    theta_us[:,locs,i_azi]        = theta_us_data[:,locs]
-                    delta_us[:,locs,i_azi]        = delta_us_data[:,locs]
-                    delta_star_us[:,locs,i_azi]   = delta_star_us_data[:,locs]
-                    Ue_Vinf_us[:,locs,i_azi]      = Ue_Vinf_us_data[:,locs]
-                    cf_us[:,locs,i_azi]           = cf_us_data[:,locs]
-                    dcp_dx_us[:,locs,i_azi]       = dcp_dx_us_data[:,locs]
-
-            blade_chords_3d           = np.tile(np.tile(blade_chords[None,:],(num_cpt,1))[:,:,None],(1,1,num_azi))
-            dP_dX_ls                  = dcp_dx_ls*(0.5*rho_blade*U_blade**2)/blade_chords_3d
-            dP_dX_us                  = dcp_dx_us*(0.5*rho_blade*U_blade**2)/blade_chords_3d
-
-            lower_surface_theta       = theta_ls
-            lower_surface_delta       = delta_ls
-            lower_surface_delta_star  = delta_star_ls
-            lower_surface_cf          = cf_ls
-            lower_surface_Ue          = Ue_Vinf_ls*U_blade
-            lower_surface_dp_dx       = dP_dX_ls
-            upper_surface_theta       = theta_us
-            upper_surface_delta       = delta_us
-            upper_surface_delta_star  = delta_star_us
-            upper_surface_cf          = cf_us
-            upper_surface_Ue          = Ue_Vinf_us*U_blade
-            upper_surface_dp_dx       = dP_dX_us
-
-        else:
-            theta_ls         = np.zeros((num_cpt,num_sec))
-            delta_ls         = np.zeros((num_cpt,num_sec))
-            delta_star_ls    = np.zeros((num_cpt,num_sec))
-            Ue_Vinf_ls       = np.zeros((num_cpt,num_sec))
-            cf_ls            = np.zeros((num_cpt,num_sec))
-            dcp_dx_ls        = np.zeros((num_cpt,num_sec))
-            theta_us         = np.zeros((num_cpt,num_sec))
-            delta_us         = np.zeros((num_cpt,num_sec))
-            delta_star_us    = np.zeros((num_cpt,num_sec))
-            Ue_Vinf_us       = np.zeros((num_cpt,num_sec))
-            cf_us            = np.zeros((num_cpt,num_sec))
-            dcp_dx_us        = np.zeros((num_cpt,num_sec))
-            local_aoa        = alpha_blade[:,:,0]
-            local_Re         = Re_blade[:,:,0]
-
-            for jj,airfoil in enumerate(airfoils):
-                bl                       = airfoil.polars.boundary_layer
-                theta_ls_data           = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.theta_lower_surface[:,:,bstei])     
-                delta_ls_data           = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_lower_surface[:,:,bstei])        
-                delta_star_ls_data      = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_star_lower_surface[:,:,bstei])   
-                Ue_Vinf_ls_data         = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.Ue_Vinf_lower_surface[:,:,bstei])      
-                cf_ls_data              = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.cf_lower_surface[:,:,bstei])           
-                dcp_dx_ls_data          = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.dcp_dx_lower_surface[:,:,bstei])       
-                theta_us_data           = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.theta_upper_surface[:,:,ustei])        
-                delta_us_data           = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_upper_surface[:,:,ustei])       
-                delta_star_us_data      = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_star_upper_surface[:,:,ustei])   
-                Ue_Vinf_us_data         = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.Ue_Vinf_upper_surface[:,:,ustei])   
-                cf_us_data              = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.cf_upper_surface[:,:,ustei])          
-                dcp_dx_us_data          = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.dcp_dx_upper_surface[:,:,ustei])      
-
-                locs                    = np.where(np.array(a_loc) == jj )
-
-                theta_ls[:,locs]        = theta_ls_data[:,locs]
-                delta_ls[:,locs]        = delta_ls_data[:,locs]
-                delta_star_ls[:,locs]   = delta_star_ls_data[:,locs]
-                Ue_Vinf_ls[:,locs]      = Ue_Vinf_ls_data[:,locs]
-                cf_ls[:,locs]           = cf_ls_data[:,locs]
-                dcp_dx_ls[:,locs]       = dcp_dx_ls_data[:,locs]
-                theta_us[:,locs]        = theta_us_data[:,locs]
-                delta_us[:,locs]        = delta_us_data[:,locs]
-                delta_star_us[:,locs]   = delta_star_us_data[:,locs]
-                Ue_Vinf_us[:,locs]      = Ue_Vinf_us_data[:,locs]
-                cf_us[:,locs]           = cf_us_data[:,locs]
-                dcp_dx_us[:,locs]       = dcp_dx_us_data[:,locs]
-
-            blade_chords_2d           = np.tile(blade_chords[None,:],(num_cpt,1))
-            dP_dX_ls                  = dcp_dx_ls*(0.5*rho_blade[:,:,0]*(U_blade[:,:,0]**2))/blade_chords_2d
-            dP_dX_us                  = dcp_dx_us*(0.5*rho_blade[:,:,0]*(U_blade[:,:,0]**2))/blade_chords_2d
-
-            lower_surface_theta       = np.tile(theta_ls[:,:,None],(1,1,num_azi))
-            lower_surface_delta       = np.tile((blade_chords_2d*delta_ls)[:,:,None],(1,1,num_azi))
-            lower_surface_delta_star  = np.tile(delta_star_ls[:,:,None],(1,1,num_azi))
-            lower_surface_cf          = np.tile(cf_ls[:,:,None],(1,1,num_azi))
-            lower_surface_Ue          = np.tile(Ue_Vinf_ls[:,:,None],(1,1,num_azi))*U_blade
-            lower_surface_dp_dx       = np.tile(dP_dX_ls[:,:,None],(1,1,num_azi))
-            upper_surface_theta       = np.tile(theta_us[:,:,None],(1,1,num_azi))
-            upper_surface_delta       = np.tile((blade_chords_2d*delta_us)[:,:,None],(1,1,num_azi))
-            upper_surface_delta_star  = np.tile(delta_star_us[:,:,None],(1,1,num_azi))
-            upper_surface_cf          = np.tile(cf_us[:,:,None],(1,1,num_azi))
-            upper_surface_Ue          = np.tile(Ue_Vinf_us[:,:,None],(1,1,num_azi))*U_blade
-            upper_surface_dp_dx       = np.tile(dP_dX_us[:,:,None],(1,1,num_azi))
         # ------------------------------------------------------------
         # ****** TRAILING EDGE BOUNDARY LAYER PROPERTY CALCULATIONS  ******
+        if boundary_layer is None:
+            boundary_layer = compute_trailing_edge_boundary_layer(freestream,rotors,aeroacoustic_data)
 
-        delta[:,:,:,:,:,:,0]        = np.tile(lower_surface_delta[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf))      # lower surface boundary layer thickness
-        delta[:,:,:,:,:,:,1]        = np.tile(upper_surface_delta[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf))      # upper surface boundary layer thickness
-        delta_star[:,:,:,:,:,:,0]   = np.tile(lower_surface_delta_star[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf)) # lower surface displacement thickness
-        delta_star[:,:,:,:,:,:,1]   = np.tile(upper_surface_delta_star[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf)) # upper surface displacement thickness
-        dp_dx[:,:,:,:,:,:,0]        = np.tile(lower_surface_dp_dx[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf))      # lower surface pressure differential
-        dp_dx[:,:,:,:,:,:,1]        = np.tile(upper_surface_dp_dx[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf))      # upper surface pressure differential
-        Ue[:,:,:,:,:,:,0]           = np.tile(lower_surface_Ue[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf))         # lower surface boundary layer edge velocity
-        Ue[:,:,:,:,:,:,1]           = np.tile(upper_surface_Ue[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf))         # upper surface boundary layer edge velocity
-        tau_w[:,:,:,:,:,:,0]        = np.tile((lower_surface_cf*(0.5*rho_blade*(U_blade**2)))[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf))       # lower surface wall shear stress
-        tau_w[:,:,:,:,:,:,1]        = np.tile((upper_surface_cf*(0.5*rho_blade*(U_blade**2)))[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf))      # upper surface wall shear stress
-        Theta[:,:,:,:,:,:,0]        = np.tile(lower_surface_theta[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf))      # lower surface momentum thickness
-        Theta[:,:,:,:,:,:,1]        = np.tile(upper_surface_theta[:,None,None,:,:,None],(1,num_mic,num_rot,1,1,num_cf))      # upper surface momentum thickness
+        # [control point, microphone, rotor, section, azimuth, frequency, airfoil surface], every 
+        # quantity is broadcast against these dimensions instead of being tiled over them
+        delta      = boundary_layer.delta        # boundary layer thickness
+        delta_star = boundary_layer.delta_star   # displacement thickness
+        dp_dx      = boundary_layer.dp_dx        # pressure differential
+        Ue         = boundary_layer.Ue           # boundary layer edge velocity
+        tau_w      = boundary_layer.tau_w        # wall shear stress
+        Theta      = boundary_layer.Theta        # momentum thickness
 
         # Update dimensions for computation
-        r         = np.tile(r[None,None,None,:,None,None],(num_cpt,num_mic,num_rot,1,num_azi,num_cf))
-        c         = np.tile(blade_chords[None,None,None,:,None,None],(num_cpt,num_mic,num_rot,1,num_azi,num_cf))
-        delta_r   = np.tile(delta_r[None,None,None,:,None,None],(num_cpt,num_mic,num_rot,1,num_azi,num_cf))
-        M         = np.tile(M[:,None,None,None,None,None,:],(1,num_mic,num_rot,num_sec,num_azi,num_cf,1))  
-        c_0       = np.tile(c_0[:,None,None,None,None,None,:],(1,num_mic,num_rot,num_sec,num_azi,num_cf,2))
-        beta_sq   = np.tile(beta_sq[:,None,None,None,None,None,:],(1,num_mic,num_rot,num_sec,num_azi,num_cf,2))
-        Omega     = np.tile(Omega[:,None,None,None,None,None,:],(1,num_mic,num_rot,num_sec,num_azi,num_cf,2))
-        U_inf     = np.tile(U_inf[:,None,None,None,None,None,:],(1,num_mic,num_rot,num_sec,num_azi,num_cf,2))
-        rho       = np.tile(rho[:,None,None,None,None,None,:],(1,num_mic,num_rot,num_sec,num_azi,num_cf,2))
-        kine_visc = np.tile(kine_visc[:,None,None,None,None,None,:],(1,num_mic,num_rot,num_sec,num_azi,num_cf,2))
+        r         = r[None,None,None,:,None,None,None]
+        c         = blade_chords[None,None,None,:,None,None,None]/2
+        delta_r   = delta_r[None,None,None,:,None,None,None]
+        M         = M[:,None,None,None,None,None,:]  
+        c_0       = c_0[:,None,None,None,None,None,:]
+        beta_sq   = beta_sq[:,None,None,None,None,None,:]
+        Omega     = Omega[:,None,None,None,None,None,:]
+        U_inf     = U_inf[:,None,None,None,None,None,:]
+        rho       = rho[:,None,None,None,None,None,:]
+        kine_visc = kine_visc[:,None,None,None,None,None,:]
 
-        X   = np.repeat(bspv.blade_section_coordinate_sys[:,:,:,:,:,:,0,:],2,axis = 6)
-        Y   = np.repeat(bspv.blade_section_coordinate_sys[:,:,:,:,:,:,1,:],2,axis = 6)
-        Z   = np.repeat(bspv.blade_section_coordinate_sys[:,:,:,:,:,:,2,:],2,axis = 6)
+        # the source positions are the same on both sides of the airfoil
+        X   = bspv.blade_section_coordinate_sys[:,:,:,:,:,:,0,:]
+        Y   = bspv.blade_section_coordinate_sys[:,:,:,:,:,:,1,:]
+        Z   = bspv.blade_section_coordinate_sys[:,:,:,:,:,:,2,:]
 
         # ------------------------------------------------------------
         # ****** BLADE MOTION CALCULATIONS ******
         # the rotational Mach number of the blade section
-        omega   = np.tile((2*np.pi*frequency)[None,None,None,None,None,:,None],(num_cpt,num_mic,num_rot,num_sec,num_azi,1,2))
-        r       = np.repeat(r[:,:,:,:,:,:,np.newaxis],2,axis = 6)
-        c       = np.repeat(c[:,:,:,:,:,:,np.newaxis],2,axis = 6)/2
-        delta_r = np.repeat(delta_r[:,:,:,:,:,:,np.newaxis],2,axis = 6)
-        M       = np.repeat(M,2,axis = 6)
-        R_s     = np.repeat(np.linalg.norm(bspv.blade_section_coordinate_sys,axis = 6),2,axis = 6)
+        omega   = (2*np.pi*frequency)[None,None,None,None,None,:,None]
+        R_s     = np.linalg.norm(bspv.blade_section_coordinate_sys,axis = 6)
         mu      = (omega/(1 +(Omega*r/c_0)*(X/R_s)))*M/(U_inf*beta_sq)
 
         # ------------------------------------------------------------
@@ -351,7 +187,98 @@ def compute_broadband_noise(freestream,angle_of_attack,bspv,
         res.SPL_prop_broadband_spectrum_dBA               = A_weighting(SPL_rotor,frequency) 
         res.SPL_prop_broadband_1_3_spectrum               = SPL_harmonic_to_third_octave(SPL_rotor,f,settings)
         res.SPL_prop_broadband_1_3_spectrum_dBA           = SPL_harmonic_to_third_octave(A_weighting(SPL_rotor,frequency),f,settings) 
-        res.SPL_prop_broadband_1_3_spectrum               = SPL_harmonic_to_third_octave(SPL_rotor,f,settings)
         
     return
 
+## @ingroup Methods-Noise-Fidelity_One-Propeller   
+def compute_trailing_edge_boundary_layer(freestream,rotors,aeroacoustic_data):
+    '''This computes the boundary layer properties at the trailing edge of the rotor blade sections
+    from the boundary layer data of the airfoil polars. The properties do not depend on the observer,
+    so they can be computed once and shared by every microphone.
+    
+    Assumptions:
+        The boundary layer thickness of uniform freestream rotors is scaled by the blade chord.
+        The properties of each airfoil are interpolated from the stacked table of its boundary layer data. 
+        
+    Source: 
+        Li, Sicheng Kevin, and Seongkyu Lee. "Prediction of Urban Air Mobility Multirotor VTOL Broadband Noise
+        Using UCD-QuietFly." Journal of the American Helicopter Society (2021).
+    
+    Inputs:  
+        freestream                     - freestream data structure                                      [None]
+        rotors                         - data structure of rotors                                       [None] 
+        aeroacoustic_data              - data structure of acoustic data                                [None] 
+    
+    Outputs 
+       boundary_layer.                 [control point, 1, 1, section, azimuth, 1, airfoil surface]
+           delta                       - boundary layer thickness                                       [m]
+           delta_star                  - displacement thickness                                         [m]
+           dp_dx                       - pressure gradient                                              [Pa/m]
+           Ue                          - boundary layer edge velocity                                   [m/s]
+           tau_w                       - wall shear stress                                              [Pa]
+           Theta                       - momentum thickness                                             [m]
+        
+    Properties Used:
+        N/A   
+    '''     
+    
+    rotor              = rotors[list(rotors.keys())[0]]
+    rho                = freestream.density                 # air density 
+    dyna_visc          = freestream.dynamic_viscosity
+    kine_visc          = dyna_visc/rho                      # kinematic viscousity    
+    alpha_blade        = aeroacoustic_data.disc_effective_angle_of_attack 
+    Vt_2d              = aeroacoustic_data.disc_tangential_velocity  
+    Va_2d              = aeroacoustic_data.disc_axial_velocity                
+    blade_chords       = rotor.chord_distribution           # blade chord    
+    airfoils           = rotor.Airfoils
+    a_loc              = rotor.airfoil_polar_stations 
+    num_cpt            = len(alpha_blade)
+    num_sec            = len(blade_chords) 
+    num_azi            = len(alpha_blade[0,0,:])    
+    U_blade            = np.sqrt(Vt_2d**2 + Va_2d**2)
+    Re_blade           = U_blade*np.repeat(np.repeat(blade_chords[np.newaxis,:],num_cpt,axis=0)[:,:,np.newaxis],num_azi,axis=2)/\
+                          np.repeat(np.repeat((kine_visc),num_sec,axis=1)[:,:,np.newaxis],num_azi,axis=2)
+    rho_blade          = np.repeat(np.repeat(rho,num_sec,axis=1)[:,:,np.newaxis],num_azi,axis=2)
+
+    # a uniform freestream gives the same boundary layer at every azimuth
+    if rotor.nonuniform_freestream: 
+        local_aoa = alpha_blade
+        local_Re  = Re_blade
+        q_blade   = 0.5*rho_blade*U_blade**2
+    else:
+        local_aoa = alpha_blade[:,:,0:1]
+        local_Re  = Re_blade[:,:,0:1]
+        q_blade   = 0.5*rho_blade[:,:,0:1]*(U_blade[:,:,0:1]**2)
+
+    # interpolate the stacked table of each airfoil, [control point, section, azimuth, airfoil surface, property]
+    properties = np.zeros(local_aoa.shape + (2,6))
+    for jj,airfoil in enumerate(airfoils):
+        bl                 = airfoil.polars.boundary_layer
+        locs               = np.where(np.array(a_loc) == jj )[0]
+        properties[:,locs] = interp2d(local_Re[:,locs],local_aoa[:,locs],bl.reynolds_numbers, bl.angle_of_attacks,bl.trailing_edge_properties)
+
+    theta      = properties[:,:,:,:,0]
+    delta      = properties[:,:,:,:,1]
+    delta_star = properties[:,:,:,:,2]
+    Ue_Vinf    = properties[:,:,:,:,3]
+    cf         = properties[:,:,:,:,4]
+    dcp_dx     = properties[:,:,:,:,5]
+
+    chords = blade_chords[None,:,None,None]
+    if not rotor.nonuniform_freestream: 
+        delta = chords*delta
+
+    # [control point, 1, 1, section, azimuth, 1, airfoil surface]
+    shape  = (num_cpt,num_sec,num_azi,2)
+    def expand(surface_property):
+        return np.broadcast_to(surface_property,shape)[:,None,None,:,:,None,:]
+
+    boundary_layer            = Data()
+    boundary_layer.delta      = expand(delta)
+    boundary_layer.delta_star = expand(delta_star)
+    boundary_layer.dp_dx      = expand(dcp_dx*q_blade[:,:,:,None]/chords)
+    boundary_layer.Ue         = expand(Ue_Vinf*U_blade[:,:,:,None])
+    boundary_layer.tau_w      = expand(cf*(0.5*rho_blade*(U_blade**2))[:,:,:,None])
+    boundary_layer.Theta      = expand(theta)
+
+    return boundary_layer
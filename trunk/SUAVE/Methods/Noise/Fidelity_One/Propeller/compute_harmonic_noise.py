@@ -4,6 +4,7 @@
 # Created:  Mar 2021, M. Clarke
 # Modified: Jul 2021, E. Botero
 #           Feb 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -54,6 +55,7 @@ def compute_harmonic_noise(harmonics,freestream,angle_of_attack,position_vector,
             SPL_prop_harmonic_1_3_spectrum_dBA   - dBA-Weighted harmonic noise in 1/3 octave spectrum              [dBA] 
             p_pref_harmonic                      - pressure ratio of harmonic noise                                [Unitless]
             p_pref_harmonic_dBA                  - pressure ratio of dBA-weighted harmonic noise                   [Unitless]
+            f                                    - harmonic frequencies, shape (control points,1,1,1,harmonics)    [Hz]
 
 
     Properties Used:
@@ -72,27 +74,28 @@ def compute_harmonic_noise(harmonics,freestream,angle_of_attack,position_vector,
     # Rotational Noise  Thickness and Loading Noise
     # ----------------------------------------------------------------------------------  
     # [control point ,microphones, rotors, radial distribution, harmonics]  
-    m              = np.tile(harmonics[None,None,None,None,:],(num_cpt,num_mic,num_rot,num_r,1))                 # harmonic number 
+    # quantities are broadcast against these dimensions instead of being tiled over them
+    m              = harmonics[None,None,None,None,:]                                        # harmonic number 
     m_1d           = harmonics                                                                                         
-    p_ref          = 2E-5                                                                                        # referece atmospheric pressure
-    a              = np.tile(freestream.speed_of_sound[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))      # speed of sound
-    rho            = np.tile(freestream.density[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))             # air density   
-    alpha          = np.tile((angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))           
-    x              = np.tile(position_vector[:,:,:,0][:,:,:,None,None],(1,1,1,num_r,num_h))                      # x component of position vector of rotor to microphone 
-    y              = np.tile(position_vector[:,:,:,1][:,:,:,None,None],(1,1,1,num_r,num_h))                      # y component of position vector of rotor to microphone
-    z              = np.tile(position_vector[:,:,:,2][:,:,:,None,None],(1,1,1,num_r,num_h))                      # z component of position vector of rotor to microphone
-    Vx             = np.tile(velocity_vector[:,0][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # x velocity of rotor  
-    Vy             = np.tile(velocity_vector[:,1][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # y velocity of rotor 
-    Vz             = np.tile(velocity_vector[:,2][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # z velocity of rotor 
-    B              = rotor.number_of_blades                                                                      # number of rotor blades
-    omega          = np.tile(aeroacoustic_data.omega[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # angular velocity       
-    dT_dr          = np.tile(aeroacoustic_data.blade_dT_dr[:,None,None,:,None],(1,num_mic,num_rot,1,num_h))      # nondimensionalized differential thrust distribution 
-    dQ_dr          = np.tile(aeroacoustic_data.blade_dQ_dr[:,None,None,:,None],(1,num_mic,num_rot,1,num_h))      # nondimensionalized differential torque distribution
-    R              = np.tile(rotor.radius_distribution[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h)) # radial location     
-    c              = np.tile(rotor.chord_distribution[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h))  # blade chord    
+    p_ref          = 2E-5                                                                    # referece atmospheric pressure
+    a              = freestream.speed_of_sound[:,:,None,None,None]                           # speed of sound
+    rho            = freestream.density[:,:,None,None,None]                                  # air density   
+    alpha          = (angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None,None]           
+    x              = position_vector[:,:,:,0][:,:,:,None,None]                               # x component of position vector of rotor to microphone 
+    y              = position_vector[:,:,:,1][:,:,:,None,None]                               # y component of position vector of rotor to microphone
+    z              = position_vector[:,:,:,2][:,:,:,None,None]                               # z component of position vector of rotor to microphone
+    Vx             = velocity_vector[:,0][:,None,None,None,None]                             # x velocity of rotor  
+    Vy             = velocity_vector[:,1][:,None,None,None,None]                             # y velocity of rotor 
+    Vz             = velocity_vector[:,2][:,None,None,None,None]                             # z velocity of rotor 
+    B              = rotor.number_of_blades                                                  # number of rotor blades
+    omega          = aeroacoustic_data.omega[:,:,None,None,None]                             # angular velocity       
+    dT_dr          = aeroacoustic_data.blade_dT_dr[:,None,None,:,None]                       # nondimensionalized differential thrust distribution 
+    dQ_dr          = aeroacoustic_data.blade_dQ_dr[:,None,None,:,None]                       # nondimensionalized differential torque distribution
+    R              = rotor.radius_distribution[None,None,None,:,None]                        # radial location     
+    c              = rotor.chord_distribution[None,None,None,:,None]                         # blade chord    
     R_tip          = rotor.tip_radius                                                     
-    t_c            = np.tile(rotor.thickness_to_chord[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h))  # thickness to chord ratio
-    MCA            = np.tile(rotor.mid_chord_alignment[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h)) # Mid Chord Alighment  
+    t_c            = rotor.thickness_to_chord[None,None,None,:,None]                         # thickness to chord ratio
+    MCA            = rotor.mid_chord_alignment[None,None,None,:,None]                        # Mid Chord Alighment  
     res.f          = B*omega*m/(2*np.pi) 
     D              = 2*R[0,0,0,-1,:]                                                                             # rotor diameter    
     r              = R/R[0,0,0,-1,:]                                                                             # non dimensional radius distribution  
@@ -3,6 +3,7 @@
 # 
 # Created:  Mar 2021, M. Clarke
 # Modified: Feb 2022, M. Clarke 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -114,50 +115,45 @@ def compute_blade_section_source_coordinates(AoA,acoustic_outputs,rotors,mls,set
  
     Outputs: 
         blade_section_position_vectors - position vector of rotor blade sections     [m]
+                                         [control point, microphone, rotor, section, azimuth, 1, 3, 1],
+                                         the other entries have broadcastable shapes
  
     Properties Used:
         N/A       
     """
     
-    # aquire dimension of matrix 
-    num_cpt     = len(AoA)
-    num_mic     = len(mls[0,:,0])   
-    num_rot     = len(rotors)  
+    # aquire rotor origins 
     rot_origins = []
     for rotor in rotors:
         rot_origins.append(rotor.origin[0])
     rot_origins = np.array(rot_origins) 
             
     rotor          = rotors[list(rotors.keys())[0]]
-    num_cf         = len(settings.center_frequencies)
-    r              = rotor.radius_distribution
-    num_sec        = len(r)
     phi_2d0        = acoustic_outputs.disc_azimuthal_distribution 
     alpha_eff0     = acoustic_outputs.disc_effective_angle_of_attack
-    num_azi        = len(phi_2d0[0,0,:])  
     orientation    = np.array(rotor.orientation_euler_angles) * 1 
     orientation[1] = orientation[1] + np.pi/2 # rotor tilt angle between the rotor hub plane and the vehicle hub plane
     body2thrust    = sp.spatial.transform.Rotation.from_rotvec(orientation).as_matrix()
 
-    # Update dimensions for computation   
-    r                    = np.tile(r[None,None,None,:,None,None],(num_cpt,num_mic,num_rot,1,num_azi,num_cf))
-    sin_phi              = np.tile(np.sin(phi_2d0)[:,None,None,:,:,None,None],(1,num_mic,num_rot,1,1,num_cf,1))
-    cos_phi              = np.tile(np.cos(phi_2d0)[:,None,None,:,:,None,None],(1,num_mic,num_rot,1,1,num_cf,1))
-    sin_alpha_eff        = np.tile(np.sin(alpha_eff0)[:,None,None,:,:,None,None],(1,num_mic,num_rot,1,1,num_cf,1))
-    cos_alpha_eff        = np.tile(np.cos(alpha_eff0)[:,None,None,:,:,None,None],(1,num_mic,num_rot,1,1,num_cf,1))
-    cos_t_v              = np.tile(np.cos(-AoA)[:,None,None,None,None,None,:],(1,num_mic,num_rot,num_sec,num_azi,num_cf,1))
-    sin_t_v              = np.tile(np.sin(-AoA)[:,None,None,None,None,None,:],(1,num_mic,num_rot,num_sec,num_azi,num_cf,1))  
-    cos_t_v_t_r          = np.tile(np.array([body2thrust[0,0]])[:,None,None,None,None,None,None],(num_cpt,num_mic,num_rot,num_sec,num_azi,num_cf,1))  
-    sin_t_v_t_r          = np.tile(np.array([body2thrust[0,2]])[:,None,None,None,None,None,None],(num_cpt,num_mic,num_rot,num_sec,num_azi,num_cf,1))  
-    M_hub                = np.tile(rot_origins[None,None,:,None,None,None,:,None],(num_cpt,num_mic,1,num_sec,num_azi,num_cf,1,1))
-    POS_2                = np.tile(mls[:,:,None,None,None,None,:,None],(1,1,num_rot,num_sec,num_azi,num_cf,1,1))
+    # Update dimensions for computation, [control point, microphone, rotor, section, azimuth, frequency, 3, 1] 
+    # the positions do not depend on the frequency and every quantity is broadcast rather than tiled   
+    sin_phi              = np.sin(phi_2d0)[:,None,None,:,:,None,None]
+    cos_phi              = np.cos(phi_2d0)[:,None,None,:,:,None,None]
+    sin_alpha_eff        = np.sin(alpha_eff0)[:,None,None,:,:,None,None]
+    cos_alpha_eff        = np.cos(alpha_eff0)[:,None,None,:,:,None,None]
+    cos_t_v              = np.cos(-AoA)[:,None,None,None,None,None,:]
+    sin_t_v              = np.sin(-AoA)[:,None,None,None,None,None,:]
+    cos_t_v_t_r          = np.array([body2thrust[0,0]])[:,None,None,None,None,None,None]
+    sin_t_v_t_r          = np.array([body2thrust[0,2]])[:,None,None,None,None,None,None]
+    M_hub                = rot_origins[None,None,:,None,None,None,:,None]
+    POS_2                = mls[:,:,None,None,None,None,:,None]
 
     # ------------------------------------------------------------
     # ****** COORDINATE TRANSFOMRATIONS ******  
-    M_t      = np.zeros((num_cpt,num_mic,num_rot,num_sec,num_azi,num_cf,3,3))
-    M_phi    = np.zeros((num_cpt,num_mic,num_rot,num_sec,num_azi,num_cf,3,3))
-    M_theta  = np.zeros((num_cpt,num_mic,num_rot,num_sec,num_azi,num_cf,3,3))
-    M_tv     = np.zeros((num_cpt,num_mic,num_rot,num_sec,num_azi,num_cf,3,3))
+    M_t      = np.zeros(cos_t_v_t_r.shape[:-1] + (3,3))
+    M_phi    = np.zeros(cos_phi.shape[:-1] + (3,3))
+    M_theta  = np.zeros(cos_alpha_eff.shape[:-1] + (3,3))
+    M_tv     = np.zeros(cos_t_v.shape[:-1] + (3,3))
 
     M_tv[:,:,:,:,:,:,0,0]    = cos_t_v[:,:,:,:,:,:,0]
     M_tv[:,:,:,:,:,:,0,2]    = sin_t_v[:,:,:,:,:,:,0]
@@ -4,17 +4,21 @@
 # Created:  Mar 2021, M. Clarke
 # Modified: Jul 2021, E. Botero
 #           Feb 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ---------------------------------------------------------------------- 
 from SUAVE.Core import  Data 
 import numpy as np   
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.decibel_arithmetic           import SPL_spectra_arithmetic  
 from SUAVE.Methods.Noise.Fidelity_One.Propeller.compute_source_coordinates     import compute_point_source_coordinates
 from SUAVE.Methods.Noise.Fidelity_One.Propeller.compute_source_coordinates     import compute_blade_section_source_coordinates 
 from SUAVE.Methods.Noise.Fidelity_One.Propeller.compute_harmonic_noise         import compute_harmonic_noise
 from SUAVE.Methods.Noise.Fidelity_One.Propeller.compute_broadband_noise        import compute_broadband_noise
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.compute_broadband_noise        import compute_trailing_edge_boundary_layer
 
 # -------------------------------------------------------------------------------------
 #  Medium Fidelity Frequency Domain Methods for Acoustic Noise Prediction
@@ -25,7 +29,10 @@ def propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings):
     and frequency spectrums of a system of rotating blades (i.e. propellers and lift_rotors)          
         
     Assumptions:
-    None
+    The microphones are processed in chunks of settings.microphone_chunk_size (all at once if None) so that
+    the peak memory is bounded for large microphone grids. The chunks are spread over a process pool when
+    settings.number_of_multiprocessing_workers is larger than one. The peak memory of each chunk is only
+    traced if settings.record_chunk_peak_memory is True.
 
     Source:
     None
@@ -49,6 +56,7 @@ def propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings):
                                              harmonic compoment of SPL                           [dB]
             SPL_harmonic_bpf_spectrum      - blade passing freqency spectrum of harmonic
                                              compoment of SPL                                    [dB] 
+            chunk_peak_memory              - (optional) largest peak memory of a microphone chunk [bytes]
      
     Properties Used:
         N/A   
@@ -57,6 +65,76 @@ def propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings):
     # unpack 
     conditions           = segment.state.conditions
     microphone_locations = conditions.noise.total_microphone_locations
+    num_mic              = len(microphone_locations[0,:,0])
+    chunk_size           = settings.get('microphone_chunk_size',None)
+    workers              = settings.get('number_of_multiprocessing_workers',1)
+    if chunk_size is None:
+        chunk_size = num_mic
+    chunk_size = max(int(chunk_size),1)
+    
+    # the trailing edge boundary layer does not depend on the microphones, compute it once
+    if np.all(aeroacoustic_data.omega == 0):
+        boundary_layer = None
+    else:
+        boundary_layer = compute_trailing_edge_boundary_layer(conditions.freestream,rotors,aeroacoustic_data)
+    
+    # split the microphones into chunks
+    chunks = [microphone_locations[:,i:i+chunk_size,:] for i in range(0,num_mic,chunk_size)]
+    
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures       = [executor.submit(compute_microphone_chunk_noise,rotors,aeroacoustic_data,conditions,mls,settings,boundary_layer) \
+                             for mls in chunks]
+            chunk_results = [future.result() for future in futures]
+    else:
+        chunk_results = [compute_microphone_chunk_noise(rotors,aeroacoustic_data,conditions,mls,settings,boundary_layer) for mls in chunks]
+    
+    # assemble the microphone chunks, the frequencies are the same for every chunk
+    Results = Data()
+    for key in chunk_results[0].keys():
+        if key in ['blade_passing_frequencies','one_third_frequency_spectrum']:
+            Results[key] = chunk_results[0][key]
+        elif key == 'chunk_peak_memory':
+            Results[key] = max([res[key] for res in chunk_results])
+        else:
+            Results[key] = np.concatenate([res[key] for res in chunk_results],axis=1)
+    
+    return Results
+
+## @ingroup Methods-Noise-Fidelity_One-Propeller
+def compute_microphone_chunk_noise(rotors,aeroacoustic_data,conditions,microphone_locations,settings,boundary_layer=None):
+    ''' This computes the acoustic signature of a system of rotating blades at a subset of the microphones. 
+    If settings.record_chunk_peak_memory is True, the peak memory used by the computation is traced and 
+    returned with the results.
+        
+    Assumptions:
+    If memory is already being traced by the caller, the trace is left untouched and its peak is returned,
+    which is an upper bound of the peak memory of the chunk.
+
+    Source:
+    None
+    
+    Inputs:
+        rotors                  - data structure of rotors                            [None]
+        aeroacoustic_data       - data structure of acoustic data                     [None]
+        conditions              - flight segment conditions                           [None] 
+        microphone_locations    - microphone locations of the chunk                   [m]
+        settings                - accoustic settings                                  [None]
+        boundary_layer          - (optional) trailing edge boundary layer properties  [None]
+                               
+    Outputs:
+        Results                 - see propeller_mid_fidelity, for the microphones of the chunk
+     
+    Properties Used:
+        N/A   
+    '''
+    
+    record_memory = settings.get('record_chunk_peak_memory',False)
+    start_tracing = record_memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    
+    # unpack 
     angle_of_attack      = conditions.aerodynamics.angle_of_attack 
     velocity_vector      = conditions.frames.inertial.velocity_vector
     freestream           = conditions.freestream  
@@ -76,7 +154,7 @@ def propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings):
     blade_section_position_vectors = compute_blade_section_source_coordinates(angle_of_attack,aeroacoustic_data,rotors,microphone_locations,settings)
     
     # Broadband Noise
-    compute_broadband_noise(freestream,angle_of_attack,blade_section_position_vectors,velocity_vector,rotors,aeroacoustic_data,settings,Noise)
+    compute_broadband_noise(freestream,angle_of_attack,blade_section_position_vectors,velocity_vector,rotors,aeroacoustic_data,settings,Noise,boundary_layer)
 
     # Combine Harmonic (periodic/tonal) and Broadband Noise
     Noise.SPL_total_1_3_spectrum  = 10*np.log10( 10**(Noise.SPL_prop_harmonic_1_3_spectrum/10) + 10**(Noise.SPL_prop_broadband_1_3_spectrum/10)) 
@@ -100,4 +178,9 @@ def propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings):
     Results.SPL_harmonic_1_3_spectrum                     = SPL_spectra_arithmetic(Noise.SPL_prop_harmonic_1_3_spectrum)       
     Results.SPL_broadband_1_3_spectrum                    = SPL_spectra_arithmetic(Noise.SPL_prop_broadband_1_3_spectrum) 
     
+    if record_memory:
+        Results.chunk_peak_memory = tracemalloc.get_traced_memory()[1]
+    if start_tracing:
+        tracemalloc.stop()
+    
     return Results
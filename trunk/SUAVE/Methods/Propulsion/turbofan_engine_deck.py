@@ -0,0 +1,292 @@
+## @ingroup Methods-Propulsion
+# turbofan_engine_deck.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+from SUAVE.Core import Data
+
+import os
+import hashlib
+import tempfile
+
+# outputs stored in the deck, in table order
+deck_quantities = ['thrust',
+                   'fuel_flow_rate',
+                   'core_exit_static_temperature',
+                   'core_exit_static_pressure',
+                   'core_exit_stagnation_temperature',
+                   'core_exit_velocity',
+                   'fan_exit_static_temperature',
+                   'fan_exit_static_pressure',
+                   'fan_exit_stagnation_temperature',
+                   'fan_exit_velocity']
+
+# network entries that do not change the cycle
+fingerprint_skip_keys = ['inputs','outputs','engine_deck','use_engine_deck','sealevel_static_thrust','cache_directory']
+
+# ----------------------------------------------------------------------
+#   Engine Deck
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def build_turbofan_engine_deck(turbofan):
+    """ Sweeps a sized turbofan over a grid of altitude, Mach number and throttle
+        and tabulates the network outputs. The deck is stored on disk under the
+        fingerprint of the engine and reloaded when the same engine is built again.
+
+        Assumptions:
+        The turbofan has already been sized.
+        The freestream follows the US Standard 1976 atmosphere with the temperature
+        deviation given in the deck settings.
+
+        Source:
+        N/A
+
+        Inputs:
+        turbofan.engine_deck_settings.
+          altitudes                  [m]
+          mach_numbers               [-]
+          throttles                  [-]
+          temperature_deviation      [K]
+          cache_directory            [string] (None disables the disk cache)
+
+        Outputs:
+        deck.
+          fingerprint                [string]
+          altitudes                  [m]
+          mach_numbers               [-]
+          throttles                  [-]
+          quantities                 [list of strings]
+          table                      [array] shape (n_altitudes,n_mach_numbers,n_throttles,n_quantities)
+
+        Properties Used:
+        N/A
+    """
+
+    settings    = turbofan.engine_deck_settings
+    fingerprint = turbofan_engine_deck_fingerprint(turbofan)
+
+    # try the disk cache first
+    cache_directory = settings.cache_directory
+    if cache_directory is not None:
+        deck_file = os.path.join(cache_directory,'turbofan_deck_' + fingerprint + '.npz')
+        if os.path.isfile(deck_file):
+            return load_turbofan_engine_deck(deck_file)
+
+    altitudes    = np.array(settings.altitudes,dtype=float)
+    mach_numbers = np.array(settings.mach_numbers,dtype=float)
+    throttles    = np.array(settings.throttles,dtype=float)
+
+    # every grid point is a row of a single cycle evaluation
+    alt_grid, mach_grid, throttle_grid = np.meshgrid(altitudes,mach_numbers,throttles,indexing='ij')
+    alt      = np.atleast_2d(alt_grid.flatten()).T
+    mach     = np.atleast_2d(mach_grid.flatten()).T
+    throttle = np.atleast_2d(throttle_grid.flatten()).T
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(alt,settings.temperature_deviation)
+    planet     = SUAVE.Attributes.Planets.Earth()
+
+    p   = atmo_data.pressure
+    T   = atmo_data.temperature
+    rho = atmo_data.density
+    a   = atmo_data.speed_of_sound
+    mu  = atmo_data.dynamic_viscosity
+
+    # setup conditions
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(len(alt))
+
+    # freestream conditions
+    conditions.freestream.altitude                    = alt
+    conditions.freestream.mach_number                 = mach
+    conditions.freestream.pressure                    = p
+    conditions.freestream.temperature                 = T
+    conditions.freestream.density                     = rho
+    conditions.freestream.dynamic_viscosity           = mu
+    conditions.freestream.gravity                     = planet.compute_gravity(alt)
+    conditions.freestream.isentropic_expansion_factor = turbofan.working_fluid.compute_gamma(T,p)
+    conditions.freestream.Cp                          = turbofan.working_fluid.compute_cp(T,p)
+    conditions.freestream.R                           = turbofan.working_fluid.gas_specific_constant*np.ones_like(alt)
+    conditions.freestream.speed_of_sound              = a
+    conditions.freestream.velocity                    = a*mach
+
+    # propulsion conditions
+    conditions.propulsion.throttle                    = throttle
+
+    state            = Data()
+    state.numerics   = Data()
+    state.conditions = conditions
+    results          = turbofan.evaluate_cycle(state)
+
+    core = conditions.noise.sources.turbofan.core
+    fan  = conditions.noise.sources.turbofan.fan
+    columns = [results.thrust_force_vector[:,0],
+               results.vehicle_mass_rate,
+               core.exit_static_temperature,
+               core.exit_static_pressure,
+               core.exit_stagnation_temperature,
+               core.exit_velocity,
+               fan.exit_static_temperature,
+               fan.exit_static_pressure,
+               fan.exit_stagnation_temperature,
+               fan.exit_velocity]
+
+    shape = (len(altitudes),len(mach_numbers),len(throttles))
+    table = np.zeros(shape + (len(deck_quantities),))
+    for i, column in enumerate(columns):
+        table[...,i] = np.reshape(np.broadcast_to(np.reshape(column,(-1,1)),alt.shape),shape)
+
+    # pack the deck
+    deck              = Data()
+    deck.fingerprint  = fingerprint
+    deck.altitudes    = altitudes
+    deck.mach_numbers = mach_numbers
+    deck.throttles    = throttles
+    deck.quantities   = list(deck_quantities)
+    deck.table        = table
+
+    if cache_directory is not None:
+        save_turbofan_engine_deck(deck,deck_file)
+
+    return deck
+
+## @ingroup Methods-Propulsion
+def turbofan_engine_deck_fingerprint(turbofan):
+    """ Hashes the design data of a turbofan network and its deck settings. Any change
+        to a component attribute, the sizing or the deck grid changes the fingerprint.
+
+        Assumptions:
+        Component inputs and outputs are run time data and do not define the engine.
+
+        Source:
+        N/A
+
+        Inputs:
+        turbofan                   [SUAVE.Components.Energy.Networks.Turbofan]
+
+        Outputs:
+        fingerprint                [string]
+
+        Properties Used:
+        N/A
+    """
+
+    sha = hashlib.sha1()
+    _hash_data(turbofan,sha)
+
+    return sha.hexdigest()
+
+## @ingroup Methods-Propulsion
+def save_turbofan_engine_deck(deck,deck_file):
+    """ Writes an engine deck to a binary .npz file. The file is moved into place
+        once it is complete so that concurrent processes never read a partial deck.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        deck                       [Data]
+        deck_file                  [string]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+    """
+
+    directory = os.path.dirname(os.path.abspath(deck_file))
+    if not os.path.isdir(directory):
+        os.makedirs(directory,exist_ok=True)
+
+    handle, temp_file = tempfile.mkstemp(dir=directory,suffix='.tmp')
+    with os.fdopen(handle,'wb') as f:
+        np.savez(f,
+                 fingerprint  = np.array(deck.fingerprint),
+                 altitudes    = deck.altitudes,
+                 mach_numbers = deck.mach_numbers,
+                 throttles    = deck.throttles,
+                 quantities   = np.array(deck.quantities),
+                 table        = deck.table)
+    os.replace(temp_file,deck_file)
+
+    return
+
+## @ingroup Methods-Propulsion
+def load_turbofan_engine_deck(deck_file):
+    """ Reads an engine deck written by save_turbofan_engine_deck.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        deck_file                  [string]
+
+        Outputs:
+        deck                       [Data]
+
+        Properties Used:
+        N/A
+    """
+
+    with np.load(deck_file) as data:
+        deck              = Data()
+        deck.fingerprint  = str(data['fingerprint'])
+        deck.altitudes    = data['altitudes']
+        deck.mach_numbers = data['mach_numbers']
+        deck.throttles    = data['throttles']
+        deck.quantities   = [str(key) for key in data['quantities']]
+        deck.table        = data['table']
+
+    return deck
+
+def _hash_data(data,sha):
+    """ Recursively feeds the contents of a Data tree into a hash.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        data                       [Data]
+        sha                        [hashlib hash]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+    """
+
+    for key in sorted(data.keys()):
+        if key in fingerprint_skip_keys:
+            continue
+        value = data[key]
+        sha.update(str(key).encode())
+        if isinstance(value,dict):
+            sha.update(type(value).__name__.encode())
+            _hash_data(value,sha)
+        elif isinstance(value,np.ndarray):
+            sha.update(str(value.shape).encode())
+            sha.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value,(bool,int,float,str,list,tuple,np.number)) or value is None:
+            sha.update(repr(value).encode())
+        else:
+            sha.update(type(value).__name__.encode())
+
+    return
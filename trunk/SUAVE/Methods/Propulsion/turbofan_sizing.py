@@ -4,6 +4,7 @@
 # Modified: Feb 2016, M. Vegh
 #           Jan 2016, E. Botero
 #           Jan 2020, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -255,8 +256,11 @@ def turbofan_sizing(turbofan,mach_number = None, altitude = None, delta_isa = 0,
     state_sls            = Data()
     state_sls.numerics   = Data()
     state_sls.conditions = conditions_sls   
-    results_sls          = turbofan.evaluate_thrust(state_sls)
+    results_sls          = turbofan.evaluate_cycle(state_sls)
     
     turbofan.sealevel_static_thrust = results_sls.thrust_force_vector[0,0] / number_of_engines
+    
+    # a resized engine invalidates any tabulated deck
+    turbofan.engine_deck = None
   
  
\ No newline at end of file
@@ -5,6 +5,9 @@
 
 import numpy as np
 
+# operators that have already been built, keyed by the number of points
+chebyshev_cache = {}
+
 # ----------------------------------------------------------------------
 #  Method
 # ----------------------------------------------------------------------
@@ -22,6 +25,9 @@ def chebyshev_data(N = 16, integration = True, **options):
         
     A full example is available in the function code.
 
+    The operators are cached by the number of points, so the
+    segments of a mission only build them once. Copies are returned.
+
     Assumptions:
     None
 
@@ -45,6 +51,41 @@ def chebyshev_data(N = 16, integration = True, **options):
     N = int(N)
     if N <= 0: raise RuntimeError("N = %i, must be > 0" % N)
     
+    # reuse the operators if they have been built before
+    key = (N,bool(integration))
+    if key not in chebyshev_cache:
+        chebyshev_cache[key] = build_chebyshev_data(N,integration)
+    x, D, I = chebyshev_cache[key]
+    
+    if I is not None:
+        I = I.copy()
+    
+    return x.copy(), D.copy(), I
+
+
+## @ingroup Methods-Utilities-Chebyshev
+def build_chebyshev_data(N,integration):
+    """Builds the control points, differentiation and integration matricies
+    for chebyshev_data.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    N                      [-]        Number of points
+    integration            <boolean>  Determines if the integration operator is calculated
+
+    Outputs:
+    x                      [-]        N-number of cosine spaced control points, in range [0,1]
+    D                      [-]        Differentiation operation matrix
+    I                      [-]        Integration operation matrix, or None if integration = False
+
+    Properties Used:
+    N/A
+    """
     
     # --- X vector
     
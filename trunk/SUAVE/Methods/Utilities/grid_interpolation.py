@@ -0,0 +1,281 @@
+## @ingroup Methods-Utilities
+# grid_interpolation.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from scipy.interpolate import RBFInterpolator
+
+# ----------------------------------------------------------------------
+#  Grid Interpolation
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def grid_interpolation(axes,values,points,method='linear',extrapolate=True):
+    """Interpolates tabulated data on a rectilinear grid at a set of points. All
+    of the tabulated quantities are interpolated together so that the cell search
+    and the interpolation weights are only computed once per point.
+
+    Assumptions:
+    The grid axes are strictly increasing and have at least two entries each.
+    Outside of the grid the data is linearly extrapolated from the edge cells
+    unless extrapolate is False, in which case the edge values are held.
+    The cubic method uses piecewise cubic Hermite polynomials with central
+    difference slopes (Catmull-Rom on non-uniform grids) in every dimension.
+
+    Source:
+    https://en.wikipedia.org/wiki/Multilinear_interpolation
+    https://en.wikipedia.org/wiki/Cubic_Hermite_spline
+
+    Inputs:
+    axes        [list of 1-D arrays]  grid coordinates, one array per dimension (d)
+    values      [array]               tabulated data, shape (n_1,...,n_d) or (n_1,...,n_d,n_outputs)
+    points      [array]               evaluation points, shape (n_points,d)
+    method      [string]              'linear' or 'cubic'
+    extrapolate [boolean]
+
+    Outputs:
+    results     [array]               interpolated data, shape (n_points,) or (n_points,n_outputs)
+
+    Properties Used:
+    N/A
+    """
+
+    points   = np.atleast_2d(points)
+    n_dims   = len(axes)
+    n_points = points.shape[0]
+
+    if method == 'linear':
+        stencil_weights = linear_stencil
+    elif method == 'cubic':
+        stencil_weights = cubic_stencil
+    else:
+        raise NotImplementedError('Selected interpolation method has not been implemented')
+
+    # find the stencil nodes and their weights in every dimension
+    shape    = values.shape[:n_dims]
+    trailing = values.shape[n_dims:]
+    flat     = np.zeros((1,n_points),dtype=int)
+    weights  = np.ones((1,n_points))
+    for d in range(n_dims):
+        axis = np.asarray(axes[d],dtype=float)
+        idx  = np.clip(np.searchsorted(axis,points[:,d],side='right') - 1,0,len(axis)-2)
+        t    = (points[:,d] - axis[idx])/(axis[idx+1] - axis[idx])
+        if not extrapolate:
+            t = np.clip(t,0.,1.)
+        stencil_indices, stencil_weight = stencil_weights(axis,idx,t)
+
+        # expand the tensor product stencil, nodes x points
+        stride  = int(np.prod(shape[d+1:]))
+        flat    = (flat[:,None,:] + np.array(stencil_indices)[None,:,:]*stride).reshape(-1,n_points)
+        weights = (weights[:,None,:]*np.array(stencil_weight)[None,:,:]).reshape(-1,n_points)
+
+    # gather the node values and sum the weighted contributions
+    node_values = np.reshape(values,(-1,) + trailing)[flat]
+    weights     = weights.reshape(weights.shape + (1,)*len(trailing))
+    results     = np.sum(weights*node_values,axis=0)
+
+    return results
+
+## @ingroup Methods-Utilities
+def linear_stencil(axis,idx,t):
+    """Nodes and weights of linear interpolation along one grid axis.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    axis      [array]  grid coordinates
+    idx       [array]  lower cell index of each point
+    t         [array]  local coordinate of each point in its cell
+
+    Outputs:
+    indices   [list of arrays]
+    weights   [list of arrays]
+
+    Properties Used:
+    N/A
+    """
+
+    return [idx,idx+1], [1. - t,t]
+
+## @ingroup Methods-Utilities
+def cubic_stencil(axis,idx,t):
+    """Nodes and weights of cubic Hermite interpolation along one grid axis. The
+    node slopes are central differences, one sided at the ends of the axis. Points
+    outside the axis fall back to linear extrapolation.
+
+    Assumptions:
+    None
+
+    Source:
+    https://en.wikipedia.org/wiki/Cubic_Hermite_spline
+
+    Inputs:
+    axis      [array]  grid coordinates
+    idx       [array]  lower cell index of each point
+    t         [array]  local coordinate of each point in its cell
+
+    Outputs:
+    indices   [list of arrays]
+    weights   [list of arrays]
+
+    Properties Used:
+    N/A
+    """
+
+    n   = len(axis)
+    im1 = np.maximum(idx-1,0)
+    ip1 = idx + 1
+    ip2 = np.minimum(idx+2,n-1)
+    h   = axis[ip1] - axis[idx]
+
+    # Hermite basis
+    h00 = 2*t**3 - 3*t**2 + 1
+    h10 = t**3 - 2*t**2 + t
+    h01 = -2*t**3 + 3*t**2
+    h11 = t**3 - t**2
+
+    # slopes expressed through the neighbouring nodes
+    c0 = h10*h/(axis[ip1] - axis[im1])
+    c1 = h11*h/(axis[ip2] - axis[idx])
+
+    w_im1 = -c0
+    w_i   = h00 - c1
+    w_ip1 = h01 + c0
+    w_ip2 = c1
+
+    # linear extrapolation outside of the axis
+    outside        = np.logical_or(t < 0.,t > 1.)
+    w_im1[outside] = 0.
+    w_i[outside]   = 1. - t[outside]
+    w_ip1[outside] = t[outside]
+    w_ip2[outside] = 0.
+
+    return [im1,idx,ip1,ip2], [w_im1,w_i,w_ip1,w_ip2]
+
+## @ingroup Methods-Utilities
+def resample_to_grid(points,values,axes):
+    """Resamples scattered data onto a rectilinear grid. If the scattered points
+    already fill the grid every node is copied directly, otherwise the data is fitted
+    with a thin plate spline radial basis function and evaluated at the nodes.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    points    [array]               scattered coordinates, shape (n_points,d)
+    values    [array]               scattered data, shape (n_points,n_outputs)
+    axes      [list of 1-D arrays]  grid coordinates, one array per dimension
+
+    Outputs:
+    table     [array]               gridded data, shape (n_1,...,n_d,n_outputs)
+
+    Properties Used:
+    N/A
+    """
+
+    points = np.atleast_2d(points)
+    values = np.reshape(values,(points.shape[0],-1))
+    shape  = tuple(len(axis) for axis in axes)
+
+    # try to place every point on a node
+    node_index = []
+    on_grid    = True
+    for d, axis in enumerate(axes):
+        idx = np.clip(np.searchsorted(axis,points[:,d]),0,len(axis)-1)
+        if not np.allclose(axis[idx],points[:,d]):
+            on_grid = False
+            break
+        node_index.append(idx)
+
+    if on_grid:
+        flat_index = np.ravel_multi_index(tuple(node_index),shape)
+        if len(np.unique(flat_index)) == np.prod(shape):
+            table             = np.zeros((np.prod(shape),values.shape[1]))
+            table[flat_index] = values
+            return np.reshape(table,shape + (values.shape[1],))
+
+    # scattered data
+    if points.shape[0] > 1000:
+        neighbors = 50
+    else:
+        neighbors = None
+    rbf   = RBFInterpolator(points,values,kernel='thin_plate_spline',neighbors=neighbors)
+    nodes = np.meshgrid(*axes,indexing='ij')
+    nodes = np.vstack([node.flatten() for node in nodes]).T
+    table = rbf(nodes)
+
+    return np.reshape(table,shape + (values.shape[1],))
+
+# ----------------------------------------------------------------------
+#  Grid Surrogate
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+class Grid_Surrogate():
+    """A tabulated surrogate with the same predict interface as the scikit-learn
+    regressors used elsewhere in SUAVE.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+    """
+
+    def __init__(self,axes,values,method='linear',extrapolate=True):
+        """Stores the grid and the tabulated data.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        axes        [list of 1-D arrays]
+        values      [array] shape (n_1,...,n_d,n_outputs)
+        method      [string]
+        extrapolate [boolean]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.axes        = [np.asarray(axis,dtype=float) for axis in axes]
+        self.values      = values
+        self.method      = method
+        self.extrapolate = extrapolate
+
+    def predict(self,points):
+        """Evaluates the surrogate.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        points      [array] shape (n_points,d)
+
+        Outputs:
+        results     [array] shape (n_points,n_outputs)
+
+        Properties Used:
+        N/A
+        """
+        return grid_interpolation(self.axes,self.values,points,self.method,self.extrapolate)
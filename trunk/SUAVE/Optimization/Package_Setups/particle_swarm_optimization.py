@@ -2,6 +2,7 @@
 # particle_swarm_optimization.py
 # 
 # Created:  Sep. 2019, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,14 +11,23 @@
 # suave imports
 import numpy as np
 import scipy as sp
+from concurrent.futures import ProcessPoolExecutor
+
+# problem of the swarm evaluated by the worker processes, set by the pool initializer
+_swarm_problem = {}
  
 ## @ingroup Optimization-Package_Setups
 def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(), kwargs={}, 
         swarmsize=100, omega=0.5, phip=0.5, phig=0.5, maxiter=100, 
-        minstep=1e-8, minfunc=1e-8, debug=False):
+        minstep=1e-8, minfunc=1e-8, debug=False, number_of_workers=1, batch_func=None):
     """
     This function perform a particle swarm optimization (PSO)
     
+    With more than one worker or a batch objective the swarm is updated synchronously: the 
+    velocities and positions of all particles are updated at once and the whole swarm is 
+    evaluated before the swarm's best position is updated. The workers are local processes 
+    that each hold a copy of the objective and constraint functions, these must be picklable.
+    
     Source:
         Pyswarm: https://github.com/tisimst/pyswarm
           
@@ -41,6 +51,10 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         minstep   : The minimum stepsize of swarm's best position before the search terminates (Default: 1e-8)      [scalar]
         minfunc   : The minimum change of swarm's best objective value before the search terminates (Default: 1e-8) [scalar]
         debug     : If True, progress statements will be displayed every iteration (Default: False)                 [boolean]
+        number_of_workers : The number of processes evaluating the swarm (Default: 1)                               [int]
+        batch_func : Returns the objective values of all particles from an array of positions,                      
+                    batch_func(X,*args,**kwargs) with X of shape (swarmsize,D). If given, it replaces                
+                    func and the swarm is evaluated in this process (Default: None)                                 [function]
    
     Outputs:
         g         : The swarm's best known position (optimal design)                                                [list] 
@@ -82,7 +96,7 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
     SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.'''
     
     assert len(lb)==len(ub), 'Lower- and upper-bounds must be the same length'
-    assert hasattr(func, '__call__'), 'Invalid function handle'
+    assert hasattr(func, '__call__') or hasattr(batch_func, '__call__'), 'Invalid function handle'
     lb = np.array(lb)
     ub = np.array(ub)
     assert np.all(ub>lb), 'All upper-bound values must be greater than lower-bound values'
@@ -90,6 +104,10 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
     vhigh = np.abs(ub - lb)
     vlow = -vhigh
     
+    if number_of_workers>1 or batch_func is not None:
+        return synchronous_swarm(func, lb, ub, vlow, vhigh, ieqcons, f_ieqcons, args, kwargs, swarmsize, 
+                                 omega, phip, phig, maxiter, minstep, minfunc, debug, number_of_workers, batch_func)
+    
     # Check for constraint function(s) #########################################
     obj = lambda x: func(x, *args, **kwargs)
     if f_ieqcons is None:
@@ -197,3 +215,220 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         print("However, the optimization couldn't find a feasible design. Sorry")
     return g, fg
 
+
+## @ingroup Optimization-Package_Setups
+def synchronous_swarm(func, lb, ub, vlow, vhigh, ieqcons, f_ieqcons, args, kwargs, swarmsize, 
+        omega, phip, phig, maxiter, minstep, minfunc, debug, number_of_workers, batch_func):
+    """
+    This function performs the particle swarm optimization with synchronous updates of the swarm. 
+    The particles of an iteration are evaluated together, either by a batch objective or by a pool 
+    of worker processes that each receive a contiguous chunk of the swarm.
+    
+    Source:
+        Pyswarm: https://github.com/tisimst/pyswarm
+          
+    Inputs: 
+        See particle_swarm_optimization, vlow and vhigh are the velocity bounds                             
+   
+    Outputs:
+        g         : The swarm's best known position (optimal design)                                                [array] 
+        f         : The objective value at ``g``                                                                    [float]
+         
+    Properties Used:
+        None
+    """
+    
+    S = swarmsize
+    D = len(lb)  # the number of dimensions each particle has
+    
+    # The random numbers are drawn in the same order as in the particle by particle swarm
+    x = lb + np.random.rand(S, D)*(ub - lb)  # particle positions
+    v = vlow + np.random.rand(S, D)*(vhigh - vlow)  # particle velocities
+    
+    problem = dict(func=func, ieqcons=ieqcons, f_ieqcons=f_ieqcons, args=args, kwargs=kwargs, batch_func=batch_func)
+    
+    set_swarm_problem(problem)
+    if batch_func is None:
+        executor  = ProcessPoolExecutor(max_workers=number_of_workers, initializer=set_swarm_problem, initargs=(problem,))
+        chunksize = int(np.ceil(S/number_of_workers))
+    else:
+        executor  = None
+        chunksize = S
+    
+    try:
+        # Initialize the particles' best known positions, the feasibility of every particle is checked
+        p = x.copy()  # best particle positions
+        fp, feasible = evaluate_swarm(executor, x, np.inf*np.ones(S), S, chunksize)
+        g = p[0, :].copy()  # best swarm position
+        fg = 1e100  # artificial best swarm position starting value
+        if np.any(feasible):
+            i_best = np.argmin(np.where(feasible, fp, np.inf))
+            if fp[i_best]<fg:
+                fg = fp[i_best]
+                g = p[i_best, :].copy()
+        
+        # Iterate until termination criterion met ##################################
+        it = 1
+        while it<=maxiter:
+            rp = np.random.uniform(size=(S, D))
+            rg = np.random.uniform(size=(S, D))
+            
+            # Update the particles' velocities and positions, correcting lower and upper bound violations
+            v = omega*v + phip*rp*(p - x) + phig*rg*(g - x)
+            x = np.clip(x + v, lb, ub)
+            
+            # Evaluate the swarm, the constraints are only checked for particles that improve
+            fx, improved = evaluate_swarm(executor, x, fp, S, chunksize)
+            
+            # Update the particles' best positions
+            p[improved, :] = x[improved, :]
+            fp[improved] = fx[improved]
+            
+            # Compare swarm's best position to the best improved particle
+            if np.any(improved):
+                i_best = np.argmin(np.where(improved, fx, np.inf))
+                if fx[i_best]<fg:
+                    if debug:
+                        print('New best for swarm at iteration {:}: {:} {:}'.format(it, x[i_best, :], fx[i_best]))
+                    
+                    tmp = x[i_best, :].copy()
+                    stepsize = np.sqrt(np.sum((g-tmp)**2))
+                    if np.abs(fg - fx[i_best])<=minfunc:
+                        print('Stopping search: Swarm best objective change less than {:}'.format(minfunc))
+                        return tmp, fx[i_best]
+                    elif stepsize<=minstep:
+                        print('Stopping search: Swarm best position change less than {:}'.format(minstep))
+                        return tmp, fx[i_best]
+                    else:
+                        g = tmp.copy()
+                        fg = fx[i_best]
+    
+            if debug:
+                print('Best after iteration {:}: {:} {:}'.format(it, g, fg))
+            it += 1
+    
+        print('Stopping search: maximum iterations reached --> {:}'.format(maxiter))
+        
+        if not swarm_feasibility(g):
+            print("However, the optimization couldn't find a feasible design. Sorry")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        _swarm_problem.clear()
+        
+    return g, fg
+
+## @ingroup Optimization-Package_Setups
+def evaluate_swarm(executor, x, fp, S, chunksize):
+    """
+    This function evaluates the objective of every particle of the swarm and the constraints of 
+    the particles whose objective is lower than their best known objective value.
+    
+    Source:
+        None
+          
+    Inputs: 
+        executor  : The pool of worker processes, None to evaluate the batch objective in this process    [ProcessPoolExecutor]
+        x         : The particle positions                                                                  [array]
+        fp        : The best known objective values of the particles                                        [array]
+        S         : The number of particles                                                                 [int]
+        chunksize : The number of particles sent to a worker at once                                        [int]
+   
+    Outputs:
+        fx        : The objective values of the particles                                                   [array]
+        improved  : True for feasible particles that improved on their best known position                  [array]
+         
+    Properties Used:
+        None
+    """
+    
+    if executor is None:
+        problem = _swarm_problem
+        fx = np.reshape(np.asarray(problem['batch_func'](x, *problem['args'], **problem['kwargs']), dtype=float), S)
+        improved = np.array([fx[i]<fp[i] and swarm_feasibility(x[i, :]) for i in range(S)], dtype=bool)
+    else:
+        results = list(executor.map(evaluate_particle, x, fp, chunksize=chunksize))
+        fx = np.array([res[0] for res in results], dtype=float)
+        improved = np.array([res[1] for res in results], dtype=bool)
+    
+    return fx, improved
+
+## @ingroup Optimization-Package_Setups
+def evaluate_particle(x, fp):
+    """
+    This function evaluates one particle in a worker process.
+    
+    Source:
+        None
+          
+    Inputs: 
+        x         : The particle position                                                                   [array]
+        fp        : The best known objective value of the particle                                          [float]
+   
+    Outputs:
+        fx        : The objective value of the particle                                                     [float]
+        improved  : True if the particle is feasible and improved on its best known position                [boolean]
+         
+    Properties Used:
+        None
+    """
+    
+    problem = _swarm_problem
+    fx = float(np.squeeze(problem['func'](x, *problem['args'], **problem['kwargs'])))
+    improved = bool(fx<fp and swarm_feasibility(x))
+    
+    return fx, improved
+
+## @ingroup Optimization-Package_Setups
+def swarm_feasibility(x):
+    """
+    This function checks the constraints of the swarm problem at a particle position.
+    
+    Source:
+        None
+          
+    Inputs: 
+        x         : The particle position                                                                   [array]
+   
+    Outputs:
+        check     : True if all constraints are satisfied                                                   [boolean]
+         
+    Properties Used:
+        None
+    """
+    
+    problem = _swarm_problem
+    args = problem['args']
+    kwargs = problem['kwargs']
+    if problem['f_ieqcons'] is not None:
+        cons = np.array(problem['f_ieqcons'](x, *args, **kwargs))
+    elif len(problem['ieqcons']):
+        cons = np.array([y(x, *args, **kwargs) for y in problem['ieqcons']])
+    else:
+        cons = np.array([0])
+    check = np.all(cons>=0)
+    
+    return check
+
+## @ingroup Optimization-Package_Setups
+def set_swarm_problem(problem):
+    """
+    This function stores the swarm problem in the module of a worker process.
+    
+    Source:
+        None
+          
+    Inputs: 
+        problem   : The objective, constraints and their arguments                                          [dict]
+   
+    Outputs:
+        None
+         
+    Properties Used:
+        None
+    """
+    
+    _swarm_problem.clear()
+    _swarm_problem.update(problem)
+    
+    return
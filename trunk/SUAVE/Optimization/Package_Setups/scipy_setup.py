@@ -6,6 +6,7 @@
 #           Mar 2020, E. Botero
 #           Jul 2020, M. Clarke
 #           May 2021, E. Botero 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,6 +15,7 @@
 # suave imports
 import numpy as np
 import scipy as sp
+from functools import partial
 from SUAVE.Optimization.Package_Setups.particle_swarm_optimization import particle_swarm_optimization 
 from scipy.optimize import NonlinearConstraint
 from SUAVE.Optimization import helper_functions as help_fun
@@ -23,12 +25,14 @@ from SUAVE.Optimization import helper_functions as help_fun
 # ----------------------------------------------------------------------
 
 ## @ingroup Optimization-Package_Setups
-def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, iter =200, tolerance = 1e-6, pop_size =  10 , prob_seed = None ):  
+def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, iter =200, tolerance = 1e-6, pop_size =  10 , prob_seed = None, number_of_workers = 1 ):  
     """ This converts your SUAVE Nexus problem into a SciPy optimization problem and solves it
         SciPy has many algorithms, they can be switched out by using the solver input. 
 
         Assumptions:
         1.4901161193847656e-08 is SLSQP default FD step in scipy
+        With more than one worker the particle swarm is evaluated in parallel processes, 
+        each holding its own copy of the problem
 
         Source:
         N/A
@@ -37,6 +41,7 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, ite
         problem                   [nexus()]
         solver                    [str]
         sense_step                [float]
+        number_of_workers         [int]
 
         Outputs:
         outputs                   [list]
@@ -50,7 +55,7 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, ite
     con = problem.optimization_problem.constraints
     
     # Have the optimizer call the wrapper
-    wrapper = lambda x:SciPy_Problem(problem,x)    
+    wrapper = partial(SciPy_Problem,problem)    
     
     # Set inputsq
     nam  = inp[:,0] # Names
@@ -110,7 +115,8 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, ite
         
     elif solver == 'particle_swarm_optimization':
         outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
-                                              omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False)    
+                                              omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False,\
+                                              number_of_workers=number_of_workers)    
     else:
         outputs = sp.optimize.minimize(wrapper,x,method=solver)
     
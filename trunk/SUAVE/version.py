@@ -0,0 +1,4 @@
+
+# THIS FILE IS GENERATED
+version = '2.5.2'
+